@@ -38,6 +38,9 @@ STONE_SPEED = 3
 STONE_SPAWN_INTERVAL_START = 90
 STONE_SPAWN_INTERVAL_MIN = 40
 
+# 충돌 설정
+PIXEL_PERFECT_COLLISION = True  # 사각형이 겹친 쌍만 마스크로 픽셀 단위 재확인
+
 # 미사일 설정
 MISSILE_WIDTH = 10
 MISSILE_HEIGHT = 30
@@ -58,6 +61,7 @@ ENEMY_LASER_CHARGE_TIME = 300  # 5초 충전 (60 FPS 기준)
 ENEMY_LASER_FIRE_TIME = 60  # 1초 발사
 ENEMY_LASER_COOLDOWN_TIME = 60  # 1초 쿨다운
 ENEMY_LASER_WIDTH = 8  # 레이저 빔 두께
+ENEMY_LASER_LENGTH = 1000  # 레이저 최대 길이 (화면 경계에서 잘림)
 ENEMY_LASER_COLOR = (255, 50, 50)  # 빨간색 레이저
 ENEMY_LASER_CHARGE_COLOR = (255, 200, 50)  # 노란색 충전 이펙트
 
@@ -66,6 +70,28 @@ ENEMY_LASER_CHARGE_COLOR = (255, 200, 50)  # 노란색 충전 이펙트
 INITIAL_HEALTH = 3
 SKILL_THRESHOLD = 10
 
+# 리플레이 설정
+CLIENT_VERSION = "2.0.0"  # 리플레이 헤더에 기록 (서버 APP_VERSION과 맞춤)
+REPLAY_DIR = os.path.join(PROJECT_ROOT, "replays")
+REPLAY_KEYFRAME_INTERVAL = 1800  # 키프레임 간격 (프레임, 60 FPS 기준 30초)
+REPLAY_KEEP = 20  # REPLAY_DIR에 남길 최근 리플레이 수 (새 게임을 시작할 때 오래된 것부터 정리)
+
+# 체크포인트 설정 (창을 닫거나 비정상 종료된 게임을 다음 시작 때 이어서 진행)
+CHECKPOINT_PATH = os.path.join(REPLAY_DIR, "checkpoint.sgc")
+CHECKPOINT_INTERVAL = 300  # 체크포인트 간격 (프레임, 60 FPS 기준 5초)
+
+# 고스트 설정 (랭킹 상위 검증된 리플레이를 받아 반투명 기체로 함께 재생)
+GHOST_ENABLED = True
+GHOST_ALPHA = 100  # 고스트 기체 투명도 (0-255)
+GHOST_CANDIDATES = 5  # 같은 난이도 리플레이를 찾을 랭킹 상위 항목 수
+GHOST_CHUNK_BYTES = 16 * 1024  # Range 요청 한 번에 받는 바이트
+GHOST_MAX_CATCHUP = 2  # 받기가 늦어 밀렸을 때 한 프레임에 따라잡는 최대 프레임 수
+
+# 프레임 프로파일러 설정 (게임 중 항상 기록, F3로 오버레이)
+PROFILER_EXPORT = False  # True면 게임이 끝날 때 최근 프레임 기록을 PROFILE_DIR에 CSV/JSON으로 (매번 덮어씀)
+PROFILER_FRAMES = 600  # 보관할 최근 프레임 수 (60 FPS 기준 10초)
+PROFILE_DIR = os.path.join(PROJECT_ROOT, "profiles")
+
 # 리소스 파일 경로
 class Resources:
     """리소스 파일 경로 관리"""
@@ -0,0 +1,236 @@
+"""Frame-time profiler: per-subsystem timings and counters in a fixed-size ring buffer"""
+import csv
+import json
+import math
+import os
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+# 게임 루프 구간 (lap() 순서와 상관없이 이 순서로 표시/내보내기)
+SECTIONS = ("input", "spawn", "update", "enemy_ai", "collision", "render", "hud", "flip", "tick")
+
+# 프레임마다 기록하는 값 (엔티티 수, 캐시 적중/실패 수, 전체 화면 갱신 여부)
+COUNTERS = (
+    "stones", "missiles", "enemies", "projectiles", "powerups",
+    "text_hits", "text_misses", "surface_hits", "surface_misses", "full_redraw",
+)
+
+TOTAL = "total"  # begin_frame()부터 end_frame()까지 (구간 합 + 측정하지 않은 부분)
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """
+    정렬된 값의 백분위수 (nearest-rank)
+
+    Args:
+        ordered: 오름차순 정렬된 값
+        p: 백분위 (0-100)
+
+    Returns:
+        float: 백분위수 (값이 없으면 0.0)
+    """
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class FrameProfiler:
+    """
+    프레임별 구간 시간과 카운터를 최근 capacity 프레임만 보관하는 프로파일러
+
+    begin_frame()으로 시작하고, 구간이 끝날 때마다 lap(구간)을 부르면 직전 lap 이후 시간이
+    그 구간에 더해집니다 (같은 구간을 여러 번 부르면 합산). end_frame()이 프레임을 링 버퍼에
+    넣으므로 오래 플레이해도 메모리는 고정이고, 기록 비용은 lap 한 번에 1us 이하입니다.
+    """
+
+    def __init__(self, capacity: int = 600, sections: Iterable[str] = SECTIONS,
+                 counters: Iterable[str] = COUNTERS):
+        """
+        FrameProfiler 초기화
+
+        Args:
+            capacity: 보관할 프레임 수 (60 FPS 기준 600이면 10초)
+            sections: 시간 구간 이름
+            counters: 카운터 이름
+        """
+        self.capacity = capacity
+        self.sections = tuple(sections)
+        self.counters = tuple(counters)
+        self.frames = 0  # 지금까지 기록한 프레임 수 (버퍼를 넘어간 것 포함)
+        self._section_index = {name: i for i, name in enumerate(self.sections)}
+        self._counter_index = {name: i for i, name in enumerate(self.counters)}
+        self._series = {name: array("d", bytes(8 * capacity))
+                        for name in self.sections + (TOTAL,) + self.counters}
+        self._times = [0.0] * len(self.sections)  # 이번 프레임 구간 시간 (초)
+        self._counts = [0.0] * len(self.counters)  # 이번 프레임 카운터
+        self._previous: Dict[str, float] = {}  # count_delta()의 직전 누적값
+        self._frame_start = 0.0
+        self._last = 0.0
+
+    def begin_frame(self):
+        """프레임 시작 (이번 프레임 구간 시간/카운터 초기화)"""
+        for i in range(len(self._times)):
+            self._times[i] = 0.0
+        for i in range(len(self._counts)):
+            self._counts[i] = 0.0
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, section: str):
+        """
+        직전 lap(또는 begin_frame) 이후 시간을 구간에 더하기
+
+        Args:
+            section: 구간 이름
+
+        Raises:
+            KeyError: 알 수 없는 구간일 때
+        """
+        now = time.perf_counter()
+        self._times[self._section_index[section]] += now - self._last
+        self._last = now
+
+    def count(self, counter: str, value: float):
+        """
+        이번 프레임 카운터 값 설정
+
+        Args:
+            counter: 카운터 이름
+            value: 값
+
+        Raises:
+            KeyError: 알 수 없는 카운터일 때
+        """
+        self._counts[self._counter_index[counter]] = value
+
+    def count_delta(self, counter: str, total: float):
+        """
+        누적값(캐시 적중 수 등)의 직전 프레임 대비 증가분을 이번 프레임 카운터로
+
+        Args:
+            counter: 카운터 이름
+            total: 지금까지의 누적값 (첫 호출은 기준만 잡고 0)
+        """
+        previous = self._previous.get(counter, total)
+        self._previous[counter] = total
+        self.count(counter, total - previous)
+
+    def end_frame(self):
+        """프레임 끝 (구간 시간은 ms로 링 버퍼에 기록)"""
+        now = time.perf_counter()
+        slot = self.frames % self.capacity
+        series = self._series
+        for name, seconds in zip(self.sections, self._times):
+            series[name][slot] = seconds * 1000
+        series[TOTAL][slot] = (now - self._frame_start) * 1000
+        for name, value in zip(self.counters, self._counts):
+            series[name][slot] = value
+        self.frames += 1
+
+    def __len__(self) -> int:
+        """보관 중인 프레임 수"""
+        return min(self.frames, self.capacity)
+
+    def samples(self, name: str) -> List[float]:
+        """
+        보관 중인 값 (오래된 프레임부터)
+
+        Args:
+            name: 구간, "total", 또는 카운터 이름
+
+        Returns:
+            List[float]: 프레임별 값 (구간은 ms)
+
+        Raises:
+            KeyError: 알 수 없는 이름일 때
+        """
+        values = self._series[name]
+        if self.frames <= self.capacity:
+            return values[:self.frames].tolist()
+        slot = self.frames % self.capacity
+        return values[slot:].tolist() + values[:slot].tolist()
+
+    def percentiles(self, name: str) -> Dict[str, float]:
+        """
+        보관 중인 값의 p50/p95/p99와 평균
+
+        Args:
+            name: 구간, "total", 또는 카운터 이름
+
+        Returns:
+            Dict[str, float]: {"p50", "p95", "p99", "mean"}
+        """
+        values = self.samples(name)
+        ordered = sorted(values)
+        result = {f"p{p}": percentile(ordered, p) for p in PERCENTILES}
+        result["mean"] = sum(values) / len(values) if values else 0.0
+        return result
+
+    def rate(self, hits: str, misses: str) -> Optional[float]:
+        """
+        보관 중인 프레임 동안의 적중률
+
+        Args:
+            hits: 적중 수 카운터
+            misses: 실패 수 카운터
+
+        Returns:
+            Optional[float]: 적중 / (적중 + 실패), 조회가 없었으면 None
+        """
+        hit_count = sum(self.samples(hits))
+        lookups = hit_count + sum(self.samples(misses))
+        return hit_count / lookups if lookups else None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        모든 구간/카운터의 백분위수
+
+        Returns:
+            Dict[str, Dict[str, float]]: 이름 -> percentiles() 결과
+        """
+        return {name: self.percentiles(name) for name in self._series}
+
+    def export_csv(self, path: str):
+        """
+        보관 중인 프레임을 CSV로 (프레임 번호, 구간 ms, total, 카운터)
+
+        Args:
+            path: 파일 경로
+
+        Raises:
+            OSError: 파일을 쓸 수 없을 때
+        """
+        names = list(self._series)
+        columns = [self.samples(name) for name in names]
+        first = self.frames - len(self)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + names)
+            for i, row in enumerate(zip(*columns)):
+                writer.writerow([first + i] + [round(value, 4) for value in row])
+
+    def export_json(self, path: str, extra: Optional[dict] = None):
+        """
+        요약(백분위수)을 JSON으로
+
+        Args:
+            path: 파일 경로
+            extra: 함께 기록할 값 (적중률, 할당 통계, 환경 정보 등)
+
+        Raises:
+            OSError: 파일을 쓸 수 없을 때
+        """
+        trace = {
+            "frames": self.frames,
+            "window": len(self),
+            "sections": list(self.sections),
+            "summary": self.summary(),
+        }
+        if extra:
+            trace.update(extra)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False, indent=2)
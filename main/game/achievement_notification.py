@@ -1,8 +1,143 @@
 """업적 알림 UI 시스템"""
 import pygame
-from typing import Optional, List
+from typing import Dict, Optional, List
 from game.achievements import AchievementChecker
 
+# 카드 색상
+CARD_BACKGROUND = (30, 30, 50)
+CARD_GOLD = (255, 215, 0)
+
+
+class AchievementCardRenderer:
+    """
+    업적 카드 렌더러
+
+    알림 카드와 게임 오버 화면의 업적 요약 박스를 서피스 한 장으로 미리 합성합니다.
+    폰트는 크기별로 한 번만 로드해 재사용합니다.
+    """
+
+    def __init__(self, font_name: str = None):
+        """
+        렌더러 초기화
+
+        Args:
+            font_name: 폰트 파일 경로 (None이면 기본 폰트)
+        """
+        self.font_name = font_name
+        self._fonts: Dict[int, pygame.font.Font] = {}
+
+    def font(self, size: int) -> pygame.font.Font:
+        """
+        크기별 폰트 (처음 요청할 때만 로드)
+
+        Args:
+            size: 폰트 크기
+
+        Returns:
+            pygame.font.Font: 폰트 (로드 실패 시 기본 폰트)
+        """
+        font = self._fonts.get(size)
+        if font is None:
+            try:
+                from utils import load_font
+                font = load_font(self.font_name, size) if self.font_name else pygame.font.Font(None, size)
+            except (FileNotFoundError, pygame.error):
+                font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+
+    def _box(self, width: int, height: int, alpha: int) -> pygame.Surface:
+        """반투명 배경 + 골드 테두리 박스"""
+        box = pygame.Surface((width, height), pygame.SRCALPHA)
+        box.fill((*CARD_BACKGROUND, alpha))
+        pygame.draw.rect(box, CARD_GOLD, box.get_rect(), 3)
+        return box
+
+    def render_card(self, name: str, description: str, width: int = 400, height: int = 100) -> pygame.Surface:
+        """
+        업적 알림 카드 (트로피 아이콘, 헤더, 이름, 설명)
+
+        Args:
+            name: 업적 이름
+            description: 업적 설명
+            width: 카드 너비
+            height: 카드 높이
+
+        Returns:
+            pygame.Surface: SRCALPHA 카드 서피스
+        """
+        card = self._box(width, height, 230)
+
+        # 상단 장식 라인
+        pygame.draw.rect(card, CARD_GOLD, (0, 0, width, 8))
+
+        # 업적 아이콘 (트로피 - 간단한 원과 사각형)
+        icon_x = 20
+        icon_y = height // 2
+        pygame.draw.circle(card, CARD_GOLD, (icon_x, icon_y - 10), 15)
+        pygame.draw.rect(card, CARD_GOLD, (icon_x - 8, icon_y + 5, 16, 12))
+
+        title_font = self.font(26)
+        desc_font = self.font(18)
+
+        # "업적 달성!" 텍스트, 업적 이름, 설명 (작은 글씨)
+        card.blit(title_font.render("🏆 업적 달성!", True, CARD_GOLD), (icon_x + 35, 15))
+        card.blit(title_font.render(name, True, (255, 255, 255)), (icon_x + 35, 45))
+        card.blit(desc_font.render(description, True, (200, 200, 200)), (icon_x + 35, 72))
+
+        return card
+
+    def render_summary(self, achievement_codes: List[str], checker: AchievementChecker,
+                       max_items: int = 4, width: int = 420) -> pygame.Surface:
+        """
+        게임 오버 화면의 업적 요약 박스 (최대 max_items개 + 나머지 개수)
+
+        Args:
+            achievement_codes: 달성한 업적 코드 목록
+            checker: 업적 체커 (이름/설명 가져오기용)
+            max_items: 표시할 최대 업적 수
+            width: 박스 너비
+
+        Returns:
+            pygame.Surface: SRCALPHA 박스 서피스 (높이 60 + 45 * 표시 개수)
+        """
+        shown = achievement_codes[:max_items]
+        box = self._box(width, 60 + len(shown) * 45, 200)
+
+        achievement_font = self.font(24)
+        small_font = self.font(18)
+        check_font = self.font(16)
+
+        # 제목
+        title = achievement_font.render("🏆 업적 달성!", True, CARD_GOLD)
+        box.blit(title, title.get_rect(center=(width // 2, 25)))
+
+        row_y = 55
+        for achievement_code in shown:
+            # 업적 아이콘 (골드 원 + 체크 마크)
+            icon_x = 30
+            pygame.draw.circle(box, CARD_GOLD, (icon_x, row_y), 12)
+            check_text = check_font.render("✓", True, (0, 0, 0))
+            box.blit(check_text, check_text.get_rect(center=(icon_x, row_y)))
+
+            # 업적 이름 및 설명
+            name = checker.get_achievement_display_name(achievement_code)
+            description = checker.get_achievement_description(achievement_code)
+            if len(description) > 45:
+                description = description[:45] + "..."
+
+            box.blit(achievement_font.render(name, True, CARD_GOLD), (icon_x + 25, row_y - 15))
+            box.blit(small_font.render(description, True, (180, 180, 180)), (icon_x + 25, row_y + 8))
+
+            row_y += 45
+
+        # 더 많은 업적이 있으면 표시
+        if len(achievement_codes) > max_items:
+            more_text = small_font.render(f"... 외 {len(achievement_codes) - max_items}개", True, (150, 150, 150))
+            box.blit(more_text, more_text.get_rect(center=(width // 2, row_y - 10)))
+
+        return box
+
 
 class AchievementNotification:
     """
@@ -11,13 +146,15 @@ class AchievementNotification:
     화면 상단 중앙에 슬라이드 인/아웃 애니메이션과 함께 표시됩니다.
     """
 
-    def __init__(self, achievement_code: str, checker: AchievementChecker):
+    def __init__(self, achievement_code: str, checker: AchievementChecker,
+                 renderer: AchievementCardRenderer = None):
         """
         알림 초기화
 
         Args:
             achievement_code: 업적 코드
             checker: 업적 체커 (이름/설명 가져오기용)
+            renderer: 카드 렌더러 (None이면 기본 폰트 렌더러)
         """
         self.achievement_code = achievement_code
         self.name = checker.get_achievement_display_name(achievement_code)
@@ -39,6 +176,10 @@ class AchievementNotification:
         self.current_x = self.target_x
         self.current_y = -self.height  # 화면 밖에서 시작
 
+        # 카드는 생성 시 한 번만 합성 (애니메이션 중에는 위치만 바뀜)
+        renderer = renderer or AchievementCardRenderer()
+        self.card = renderer.render_card(self.name, self.description, self.width, self.height)
+
     def update(self):
         """알림 업데이트 (애니메이션)"""
         self.timer += 1
@@ -71,71 +212,17 @@ class AchievementNotification:
         """
         return self.timer >= self.max_duration
 
-    def draw(self, screen: pygame.Surface, font_name: str = None):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
-        알림 그리기
+        알림 그리기 (미리 합성한 카드를 현재 위치에 blit)
 
         Args:
             screen: pygame 화면
-            font_name: 폰트 파일 경로 (선택사항)
-        """
-        # 알림 박스 배경
-        box_rect = pygame.Rect(
-            int(self.current_x),
-            int(self.current_y),
-            self.width,
-            self.height
-        )
-
-        # 테두리가 있는 반투명 박스
-        # 배경
-        box_surface = pygame.Surface((self.width, self.height))
-        box_surface.set_alpha(230)
-        box_surface.fill((30, 30, 50))
-        screen.blit(box_surface, (box_rect.x, box_rect.y))
-
-        # 테두리 (골드)
-        pygame.draw.rect(screen, (255, 215, 0), box_rect, 3)
 
-        # 상단 장식 라인
-        pygame.draw.rect(
-            screen,
-            (255, 215, 0),
-            (box_rect.x, box_rect.y, self.width, 8)
-        )
-
-        # 업적 아이콘 (트로피)
-        icon_x = box_rect.x + 20
-        icon_y = box_rect.y + self.height // 2
-
-        # 트로피 모양 (간단한 원과 사각형)
-        pygame.draw.circle(screen, (255, 215, 0), (icon_x, icon_y - 10), 15)
-        pygame.draw.rect(
-            screen,
-            (255, 215, 0),
-            (icon_x - 8, icon_y + 5, 16, 12)
-        )
-
-        # 텍스트
-        try:
-            from utils import load_font
-            title_font = load_font(font_name, 26) if font_name else pygame.font.Font(None, 26)
-            desc_font = load_font(font_name, 18) if font_name else pygame.font.Font(None, 18)
-        except:
-            title_font = pygame.font.Font(None, 26)
-            desc_font = pygame.font.Font(None, 18)
-
-        # "업적 달성!" 텍스트
-        header_text = title_font.render("🏆 업적 달성!", True, (255, 215, 0))
-        screen.blit(header_text, (icon_x + 35, box_rect.y + 15))
-
-        # 업적 이름
-        name_text = title_font.render(self.name, True, (255, 255, 255))
-        screen.blit(name_text, (icon_x + 35, box_rect.y + 45))
-
-        # 업적 설명 (작은 글씨)
-        desc_text = desc_font.render(self.description, True, (200, 200, 200))
-        screen.blit(desc_text, (icon_x + 35, box_rect.y + 72))
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        return screen.blit(self.card, (int(self.current_x), int(self.current_y)))
 
 
 class AchievementNotificationManager:
@@ -145,14 +232,16 @@ class AchievementNotificationManager:
     여러 업적이 연속으로 달성될 때 큐로 관리합니다.
     """
 
-    def __init__(self, checker: AchievementChecker):
+    def __init__(self, checker: AchievementChecker, font_name: str = None):
         """
         관리자 초기화
 
         Args:
             checker: 업적 체커
+            font_name: 알림 카드 폰트 파일 경로 (선택사항)
         """
         self.checker = checker
+        self.renderer = AchievementCardRenderer(font_name)
         self.notification_queue: List[AchievementNotification] = []
         self.current_notification: Optional[AchievementNotification] = None
 
@@ -163,7 +252,7 @@ class AchievementNotificationManager:
         Args:
             achievement_code: 업적 코드
         """
-        notification = AchievementNotification(achievement_code, self.checker)
+        notification = AchievementNotification(achievement_code, self.checker, self.renderer)
         self.notification_queue.append(notification)
 
     def update(self):
@@ -180,16 +269,19 @@ class AchievementNotificationManager:
             if self.current_notification.is_finished():
                 self.current_notification = None
 
-    def draw(self, screen: pygame.Surface, font_name: str = None):
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
         """
         알림 그리기
 
         Args:
             screen: pygame 화면
-            font_name: 폰트 파일 경로
+
+        Returns:
+            Optional[pygame.Rect]: 그린 영역 (알림이 없으면 None)
         """
         if self.current_notification:
-            self.current_notification.draw(screen, font_name)
+            return self.current_notification.draw(screen)
+        return None
 
     def has_active_notification(self) -> bool:
         """
@@ -0,0 +1,168 @@
+"""Crash-recovery checkpoints: the latest game snapshot written atomically off the game thread"""
+import logging
+import os
+import struct
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SGCK"
+
+# 헤더: 매직, 리플레이 경로 길이 (경로 UTF-8, 스냅샷이 뒤따름)
+HEADER = struct.Struct("<4sH")
+
+
+def write_checkpoint(path: str, snapshot: bytes, replay_path: Optional[str] = None):
+    """
+    체크포인트 파일 쓰기 (임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 이전 파일이 남음)
+
+    Args:
+        path: 체크포인트 파일 경로
+        snapshot: 게임 스냅샷 (GameSimulation.snapshot())
+        replay_path: 이 게임을 기록 중인 리플레이 파일 (이어서 기록할 때 앞부분 입력을 가져옴)
+    """
+    encoded = (replay_path or "").encode("utf-8")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded)) + encoded + snapshot)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: str) -> Optional[Tuple[bytes, Optional[str]]]:
+    """
+    체크포인트 파일 읽기
+
+    Args:
+        path: 체크포인트 파일 경로
+
+    Returns:
+        Optional[Tuple[bytes, Optional[str]]]: (스냅샷, 리플레이 파일 경로), 없거나 깨졌으면 None
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"체크포인트 읽기 실패: {e}")
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+    magic, length = HEADER.unpack_from(data)
+    if magic != MAGIC or len(data) < HEADER.size + length:
+        return None
+    replay_path = data[HEADER.size:HEADER.size + length].decode("utf-8", "replace") or None
+    return data[HEADER.size + length:], replay_path
+
+
+def discard_checkpoint(path: str):
+    """
+    체크포인트 파일 삭제 (게임이 정상적으로 끝났을 때)
+
+    Args:
+        path: 체크포인트 파일 경로
+    """
+    for target in (path, path + ".tmp"):
+        try:
+            os.remove(target)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"체크포인트 삭제 실패: {e}")
+
+
+class CheckpointWriter:
+    """
+    게임 스레드 대신 백그라운드 스레드에서 체크포인트를 쓰는 기록기
+
+    submit()은 최신 스냅샷만 보관하고 바로 돌아오므로 게임 루프가 디스크를 기다리지 않습니다.
+    쓰기가 밀리면 중간 스냅샷은 건너뛰고 가장 최근 것만 씁니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        CheckpointWriter 초기화 (기록 스레드 시작)
+
+        Args:
+            path: 체크포인트 파일 경로
+        """
+        self.path = path
+        self.written = 0  # 파일에 쓴 체크포인트 수
+        self.skipped = 0  # 더 새 스냅샷이 들어와 건너뛴 수
+        self._pending: Optional[Tuple[bytes, Optional[str]]] = None
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: bytes, replay_path: Optional[str] = None):
+        """
+        체크포인트 쓰기 예약 (바로 반환)
+
+        Args:
+            snapshot: 게임 스냅샷
+            replay_path: 이 게임을 기록 중인 리플레이 파일
+        """
+        with self._condition:
+            if self._closed:
+                return
+            if self._pending is not None:
+                self.skipped += 1
+            self._pending = (snapshot, replay_path)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        예약된 체크포인트를 다 쓸 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            bool: 다 썼으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._writing, timeout)
+
+    def close(self, discard: bool = False):
+        """
+        기록 스레드 종료
+
+        Args:
+            discard: True면 남은 예약을 버리고 체크포인트 파일도 삭제 (게임이 끝났을 때),
+                False면 남은 예약을 쓰고 종료
+        """
+        with self._condition:
+            if discard:
+                self._pending = None
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        if discard:
+            discard_checkpoint(self.path)
+
+    def _run(self):
+        """기록 스레드: 최신 스냅샷이 들어올 때마다 파일로 쓰기"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                pending, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                write_checkpoint(self.path, *pending)
+                self.written += 1
+            except OSError as e:
+                logger.warning(f"체크포인트 쓰기 실패: {e}")
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
@@ -1,19 +1,38 @@
 """Collision detection module"""
-from typing import List, Tuple, TYPE_CHECKING
+from __future__ import annotations
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from game.enemy import EnemyLaser
+from core.config import PIXEL_PERFECT_COLLISION
 
 if TYPE_CHECKING:
     from game.entities import Player, Stone, Missile
     from game.enemy import Enemy, EnemyProjectile
     from game.powerup import PowerUp
+    from game.spatial import SpatialGrid
 
 
 class CollisionDetector:
-    """충돌 감지 모듈"""
+    """
+    충돌 감지 모듈
+
+    결과는 리스트 위치가 아니라 엔티티 핸들(EntityList.add()가 붙인 entity.handle)로 돌려주므로
+    처리 중에 다른 엔티티를 제거해도 결과가 어긋나지 않습니다.
+    운석 공간 인덱스(SpatialGrid)를 넘기면 전체 운석 대신 같은 셀의 후보만 확인합니다.
+
+    use_masks가 켜져 있으면 사각형이 겹친 쌍(브로드페이즈 후보)만 미리 만든 충돌 마스크로
+    다시 확인해, 둥근 운석의 빈 모서리에 닿은 경우는 충돌로 치지 않습니다.
+    마스크 확인은 사각형이 겹친 쌍마다 실행되므로 함수 호출 없이 루프 안에서 바로 하고,
+    바깥 루프 엔티티의 마스크는 한 번만 읽습니다.
+    """
+
+    # 픽셀 단위 충돌 사용 여부 (마스크가 없는 엔티티는 사각형 결과 그대로)
+    use_masks = PIXEL_PERFECT_COLLISION
 
     @staticmethod
     def check_missile_stone_collision(
         missiles: List[Missile],
-        stones: List[Stone]
+        stones: List[Stone],
+        stone_grid: Optional[SpatialGrid] = None
     ) -> List[Tuple[int, int]]:
         """
         미사일과 운석의 충돌 확인
@@ -21,23 +40,36 @@ class CollisionDetector:
         Args:
             missiles: 미사일 리스트
             stones: 운석 리스트
+            stone_grid: 이번 프레임 운석 공간 인덱스 (선택사항)
 
         Returns:
-            List[Tuple[int, int]]: [(미사일 인덱스, 운석 인덱스), ...]
+            List[Tuple[int, int]]: [(미사일 핸들, 운석 핸들), ...]
         """
         collisions = []
-
-        for missile_idx, missile in enumerate(missiles):
-            for stone_idx, stone in enumerate(stones):
-                if missile.get_rect().colliderect(stone.get_rect()):
-                    collisions.append((missile_idx, stone_idx))
+        use_masks = CollisionDetector.use_masks
+
+        for missile in missiles:
+            missile_rect = missile.get_rect()
+            missile_mask = getattr(missile, "mask", None) if use_masks else None
+            candidates = stone_grid.query_rect(missile_rect) if stone_grid is not None else stones
+            for stone in candidates:
+                stone_rect = stone.get_rect()
+                if not missile_rect.colliderect(stone_rect):
+                    continue
+                if missile_mask is not None:
+                    stone_mask = getattr(stone, "mask", None)
+                    if stone_mask is not None and missile_mask.overlap(
+                            stone_mask, (stone_rect.x - missile_rect.x, stone_rect.y - missile_rect.y)) is None:
+                        continue
+                collisions.append((missile.handle, stone.handle))
 
         return collisions
 
     @staticmethod
     def check_player_stone_collision(
         player: Player,
-        stones: List[Stone]
+        stones: List[Stone],
+        stone_grid: Optional[SpatialGrid] = None
     ) -> List[int]:
         """
         플레이어와 운석의 충돌 확인
@@ -45,16 +77,26 @@ class CollisionDetector:
         Args:
             player: 플레이어
             stones: 운석 리스트
+            stone_grid: 이번 프레임 운석 공간 인덱스 (선택사항)
 
         Returns:
-            List[int]: 충돌한 운석의 인덱스 리스트
+            List[int]: 충돌한 운석의 핸들 리스트
         """
         collisions = []
         player_rect = player.get_rect()
-
-        for stone_idx, stone in enumerate(stones):
-            if player_rect.colliderect(stone.get_rect()):
-                collisions.append(stone_idx)
+        player_mask = getattr(player, "mask", None) if CollisionDetector.use_masks else None
+        candidates = stone_grid.query_rect(player_rect) if stone_grid is not None else stones
+
+        for stone in candidates:
+            stone_rect = stone.get_rect()
+            if not player_rect.colliderect(stone_rect):
+                continue
+            if player_mask is not None:
+                stone_mask = getattr(stone, "mask", None)
+                if stone_mask is not None and player_mask.overlap(
+                        stone_mask, (stone_rect.x - player_rect.x, stone_rect.y - player_rect.y)) is None:
+                    continue
+            collisions.append(stone.handle)
 
         return collisions
 
@@ -67,13 +109,13 @@ class CollisionDetector:
             missiles: 미사일 리스트
 
         Returns:
-            List[int]: 화면 범위를 벗어난 미사일의 인덱스 리스트
+            List[int]: 화면 범위를 벗어난 미사일의 핸들 리스트
         """
         out_of_bounds = []
 
-        for idx, missile in enumerate(missiles):
+        for missile in missiles:
             if missile.is_off_screen():
-                out_of_bounds.append(idx)
+                out_of_bounds.append(missile.handle)
 
         return out_of_bounds
 
@@ -86,13 +128,13 @@ class CollisionDetector:
             stones: 운석 리스트
 
         Returns:
-            List[int]: 화면 범위를 벗어난 운석의 인덱스 리스트
+            List[int]: 화면 범위를 벗어난 운석의 핸들 리스트
         """
         out_of_bounds = []
 
-        for idx, stone in enumerate(stones):
+        for stone in stones:
             if stone.is_off_screen():
-                out_of_bounds.append(idx)
+                out_of_bounds.append(stone.handle)
 
         return out_of_bounds
 
@@ -106,14 +148,24 @@ class CollisionDetector:
             enemies: 적 리스트
 
         Returns:
-            List[Tuple[int, int]]: [(미사일 인덱스, 적 인덱스), ...]
+            List[Tuple[int, int]]: [(미사일 핸들, 적 핸들), ...]
         """
         collisions = []
-
-        for missile_idx, missile in enumerate(missiles):
-            for enemy_idx, enemy in enumerate(enemies):
-                if missile.rect.colliderect(enemy.rect):
-                    collisions.append((missile_idx, enemy_idx))
+        use_masks = CollisionDetector.use_masks
+
+        for missile in missiles:
+            missile_rect = missile.rect
+            missile_mask = getattr(missile, "mask", None) if use_masks else None
+            for enemy in enemies:
+                enemy_rect = enemy.rect
+                if not missile_rect.colliderect(enemy_rect):
+                    continue
+                if missile_mask is not None:
+                    enemy_mask = getattr(enemy, "mask", None)
+                    if enemy_mask is not None and missile_mask.overlap(
+                            enemy_mask, (enemy_rect.x - missile_rect.x, enemy_rect.y - missile_rect.y)) is None:
+                        continue
+                collisions.append((missile.handle, enemy.handle))
 
         return collisions
 
@@ -127,14 +179,22 @@ class CollisionDetector:
             enemies: 적 리스트
 
         Returns:
-            List[int]: 충돌한 적의 인덱스 리스트
+            List[int]: 충돌한 적의 핸들 리스트
         """
         collisions = []
         player_rect = player.get_rect()
-
-        for enemy_idx, enemy in enumerate(enemies):
-            if player_rect.colliderect(enemy.rect):
-                collisions.append(enemy_idx)
+        player_mask = getattr(player, "mask", None) if CollisionDetector.use_masks else None
+
+        for enemy in enemies:
+            enemy_rect = enemy.rect
+            if not player_rect.colliderect(enemy_rect):
+                continue
+            if player_mask is not None:
+                enemy_mask = getattr(enemy, "mask", None)
+                if enemy_mask is not None and player_mask.overlap(
+                        enemy_mask, (enemy_rect.x - player_rect.x, enemy_rect.y - player_rect.y)) is None:
+                    continue
+            collisions.append(enemy.handle)
 
         return collisions
 
@@ -148,14 +208,14 @@ class CollisionDetector:
             enemy_projectiles: 적 발사체 리스트
 
         Returns:
-            List[int]: 충돌한 발사체의 인덱스 리스트
+            List[int]: 충돌한 발사체의 핸들 리스트
         """
         collisions = []
         player_rect = player.get_rect()
 
-        for proj_idx, projectile in enumerate(enemy_projectiles):
+        for projectile in enemy_projectiles:
             if player_rect.colliderect(projectile.rect):
-                collisions.append(proj_idx)
+                collisions.append(projectile.handle)
 
         return collisions
 
@@ -168,13 +228,13 @@ class CollisionDetector:
             enemies: 적 리스트
 
         Returns:
-            List[int]: 화면 범위를 벗어난 적의 인덱스 리스트
+            List[int]: 화면 범위를 벗어난 적의 핸들 리스트
         """
         out_of_bounds = []
 
-        for idx, enemy in enumerate(enemies):
+        for enemy in enemies:
             if enemy.is_off_screen():
-                out_of_bounds.append(idx)
+                out_of_bounds.append(enemy.handle)
 
         return out_of_bounds
 
@@ -187,13 +247,13 @@ class CollisionDetector:
             enemy_projectiles: 적 발사체 리스트
 
         Returns:
-            List[int]: 화면 범위를 벗어난 발사체의 인덱스 리스트
+            List[int]: 화면 범위를 벗어난 발사체의 핸들 리스트
         """
         out_of_bounds = []
 
-        for idx, projectile in enumerate(enemy_projectiles):
+        for projectile in enemy_projectiles:
             if projectile.is_off_screen():
-                out_of_bounds.append(idx)
+                out_of_bounds.append(projectile.handle)
 
         return out_of_bounds
 
@@ -207,14 +267,14 @@ class CollisionDetector:
             powerups: 파워업 리스트
 
         Returns:
-            List[int]: 충돌한 파워업의 인덱스 리스트
+            List[int]: 충돌한 파워업의 핸들 리스트
         """
         collisions = []
         player_rect = player.get_rect()
 
-        for powerup_idx, powerup in enumerate(powerups):
+        for powerup in powerups:
             if player_rect.colliderect(powerup.rect):
-                collisions.append(powerup_idx)
+                collisions.append(powerup.handle)
 
         return collisions
 
@@ -228,19 +288,21 @@ class CollisionDetector:
             enemies: 적 리스트
 
         Returns:
-            List[int]: 레이저를 발사 중인 적의 인덱스 리스트 (충돌한 경우)
+            List[int]: 레이저를 발사 중인 적의 핸들 리스트 (충돌한 경우)
         """
-        collisions = []
-        player_rect = player.get_rect()
-
-        for enemy_idx, enemy in enumerate(enemies):
+        # 활성 레이저를 모아 플레이어 사각형과 한 번에 확인
+        handles = []
+        lasers = []
+        for enemy in enemies:
             laser = enemy.get_laser()
             if laser and laser.is_active():
-                # 레이저와 플레이어 충돌 확인
-                if laser.collides_with(player_rect):
-                    collisions.append(enemy_idx)
+                handles.append(enemy.handle)
+                lasers.append(laser)
 
-        return collisions
+        if not lasers:
+            return []
+
+        return [handles[index] for index in EnemyLaser.find_hits(lasers, player.get_rect())]
 
     @staticmethod
     def check_all_collisions(
@@ -249,7 +311,8 @@ class CollisionDetector:
         stones: List,
         enemies: List = None,
         enemy_projectiles: List = None,
-        powerups: List = None
+        powerups: List = None,
+        stone_grid: Optional[SpatialGrid] = None
     ) -> dict:
         """
         모든 충돌 확인
@@ -261,21 +324,22 @@ class CollisionDetector:
             enemies: 적 리스트 (선택사항)
             enemy_projectiles: 적 발사체 리스트 (선택사항)
             powerups: 파워업 리스트 (선택사항)
+            stone_grid: 이번 프레임 운석 공간 인덱스 (선택사항)
 
         Returns:
             dict: 충돌 정보 딕셔너리
                 {
-                    'missile_stone': [(미사일_idx, 운석_idx), ...],
-                    'player_stone': [운석_idx, ...],
-                    'missile_out': [미사일_idx, ...],
-                    'stone_out': [운석_idx, ...],
-                    'missile_enemy': [(미사일_idx, 적_idx), ...],
-                    'player_enemy': [적_idx, ...],
-                    'player_enemy_projectile': [발사체_idx, ...],
-                    'player_enemy_laser': [적_idx, ...],
-                    'enemy_out': [적_idx, ...],
-                    'enemy_projectile_out': [발사체_idx, ...],
-                    'player_powerup': [파워업_idx, ...]
+                    'missile_stone': [(미사일_handle, 운석_handle), ...],
+                    'player_stone': [운석_handle, ...],
+                    'missile_out': [미사일_handle, ...],
+                    'stone_out': [운석_handle, ...],
+                    'missile_enemy': [(미사일_handle, 적_handle), ...],
+                    'player_enemy': [적_handle, ...],
+                    'player_enemy_projectile': [발사체_handle, ...],
+                    'player_enemy_laser': [적_handle, ...],
+                    'enemy_out': [적_handle, ...],
+                    'enemy_projectile_out': [발사체_handle, ...],
+                    'player_powerup': [파워업_handle, ...]
                 }
         """
         enemies = enemies or []
@@ -283,8 +347,8 @@ class CollisionDetector:
         powerups = powerups or []
 
         return {
-            'missile_stone': CollisionDetector.check_missile_stone_collision(missiles, stones),
-            'player_stone': CollisionDetector.check_player_stone_collision(player, stones),
+            'missile_stone': CollisionDetector.check_missile_stone_collision(missiles, stones, stone_grid),
+            'player_stone': CollisionDetector.check_player_stone_collision(player, stones, stone_grid),
             'missile_out': CollisionDetector.check_missile_out_of_bounds(missiles),
             'stone_out': CollisionDetector.check_stone_out_of_bounds(stones),
             'missile_enemy': CollisionDetector.check_missile_enemy_collision(missiles, enemies),
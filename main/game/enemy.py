@@ -3,13 +3,22 @@ import pygame
 import random
 import math
 from enum import Enum
+from typing import List, Optional
+from game.spatial import SpatialGrid
+from ui import surface_cache
 from core.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     ENEMY_LASER_CHARGE_TIME, ENEMY_LASER_FIRE_TIME, ENEMY_LASER_COOLDOWN_TIME,
-    ENEMY_LASER_WIDTH, ENEMY_LASER_COLOR, ENEMY_LASER_CHARGE_COLOR
+    ENEMY_LASER_WIDTH, ENEMY_LASER_LENGTH, ENEMY_LASER_COLOR, ENEMY_LASER_CHARGE_COLOR
 )
 
 
+# 위험 감지 범위 (px)
+STONE_DANGER_RADIUS = 80
+MISSILE_DANGER_RADIUS = 100
+MISSILE_DANGER_HORIZONTAL = 50
+
+
 class EnemyState(Enum):
     """적 AI 상태"""
     PATROL = "patrol"  # 순찰 (기본 이동)
@@ -28,7 +37,8 @@ class Enemy:
     운석과 미사일을 회피하는 지능적인 행동을 합니다.
     """
 
-    def __init__(self, image: pygame.Surface, enemy_speed: float = 2.0, evasion_skill: float = 0.8):
+    def __init__(self, image: pygame.Surface, enemy_speed: float = 2.0, evasion_skill: float = 0.8,
+                 rng=random):
         """
         Enemy 초기화
 
@@ -36,19 +46,28 @@ class Enemy:
             image: 적 이미지
             enemy_speed: 이동 속도
             evasion_skill: 회피 능력 (0.0 ~ 1.0, 높을수록 잘 피함)
+            rng: 시작 위치/회피 판정에 쓸 난수 생성기 (기본값: 전역 random 모듈)
         """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(image, enemy_speed, evasion_skill, rng)
+
+    def reset(self, image: pygame.Surface, enemy_speed: float = 2.0, evasion_skill: float = 0.8,
+              rng=random):
+        """적 상태 재설정 (오브젝트 풀 재사용용, 인자는 생성자와 같음)"""
+        self.rng = rng
         self.image = image
+        self.mask = surface_cache.get_mask(image)  # 픽셀 단위 충돌용
         self.speed = enemy_speed
         self.evasion_skill = evasion_skill
 
         # 랜덤 시작 위치 (화면 상단)
-        self.rect = self.image.get_rect()
-        self.rect.x = random.randint(0, SCREEN_WIDTH - self.rect.width)
+        self.rect.size = image.get_size()
+        self.rect.x = rng.randint(0, SCREEN_WIDTH - self.rect.width)
         self.rect.y = -self.rect.height
 
         # 이동 방향
-        self.horizontal_direction = random.choice([-1, 1])  # -1: 왼쪽, 1: 오른쪽
-        self.horizontal_speed = random.uniform(0.5, 1.5)
+        self.horizontal_direction = rng.choice([-1, 1])  # -1: 왼쪽, 1: 오른쪽
+        self.horizontal_speed = rng.uniform(0.5, 1.5)
 
         # AI 상태
         self.state = EnemyState.PATROL
@@ -61,14 +80,14 @@ class Enemy:
         # 타겟 (플레이어 추적용)
         self.target_player = None
 
-    def update(self, player, missiles: list = None, stones: list = None):
+    def update(self, player, missiles=None, stones=None):
         """
         적 업데이트 (AI 행동 및 레이저 시스템)
 
         Args:
             player: 플레이어 객체
-            missiles: 현재 화면의 미사일 리스트 (회피 판단용)
-            stones: 현재 화면의 운석 리스트 (회피 판단용)
+            missiles: 이번 프레임 미사일 공간 인덱스 (SpatialGrid, 회피 판단용)
+            stones: 이번 프레임 운석 공간 인덱스 (SpatialGrid, 회피 판단용)
         """
         self.target_player = player
         self.state_timer += 1
@@ -111,44 +130,41 @@ class Enemy:
         if self.laser:
             self.laser.update()
 
-    def _detect_danger(self, missiles: list, stones: list):
+    def _detect_danger(self, missiles, stones):
         """
         주변 위험 감지 (운석 및 미사일)
 
+        프레임마다 만든 공간 인덱스에 반경 질의를 해 주변 셀만 확인하고, 제곱 거리로 비교합니다.
+        운석과 미사일 중 더 가까운 위협을 고르며, 거리가 같으면 운석을 우선합니다.
+
         Args:
-            missiles: 미사일 리스트
-            stones: 운석 리스트
+            missiles: 미사일 공간 인덱스 (SpatialGrid, 리스트를 주면 인덱스를 만들어 사용)
+            stones: 운석 공간 인덱스 (SpatialGrid, 리스트를 주면 인덱스를 만들어 사용)
 
         Returns:
             위협 객체 (운석 또는 미사일) 또는 None
         """
-        danger_radius = 80  # 80px 이내 위험 감지
+        center_x, center_y = self.rect.center
+        top = self.rect.y
+        danger = None
 
-        # 운석 감지
+        # 운석 감지: 80px 이내이고 내 위에 있으면 위험
         if stones:
-            for stone in stones:
-                distance = math.sqrt(
-                    (self.rect.centerx - stone.rect.centerx) ** 2 +
-                    (self.rect.centery - stone.rect.centery) ** 2
-                )
-                # 운석이 내 위에 있고 가까우면 위험
-                if distance < danger_radius and stone.rect.y < self.rect.y:
-                    return stone
-
-        # 미사일 감지 (플레이어의 미사일)
+            danger = SpatialGrid.of(stones).nearest(
+                center_x, center_y, STONE_DANGER_RADIUS,
+                lambda stone: stone.rect.y < top
+            )
+
+        # 미사일 감지 (플레이어의 미사일): 100px 이내, 내 위쪽, 수평 거리 50px 미만이면 위험
         if missiles:
-            for missile in missiles:
-                distance = math.sqrt(
-                    (self.rect.centerx - missile.rect.centerx) ** 2 +
-                    (self.rect.centery - missile.rect.centery) ** 2
-                )
-                # 미사일이 내 아래에 있고 가까우면 위험
-                if distance < 100 and missile.rect.y < self.rect.y:
-                    horizontal_dist = abs(missile.rect.centerx - self.rect.centerx)
-                    if horizontal_dist < 50:  # 수평 거리가 가까우면 위험
-                        return missile
-
-        return None
+            missile_danger = SpatialGrid.of(missiles).nearest(
+                center_x, center_y, MISSILE_DANGER_RADIUS,
+                lambda missile: missile.rect.y < top and abs(missile.rect.centerx - center_x) < MISSILE_DANGER_HORIZONTAL
+            )
+            if missile_danger and (danger is None or missile_danger[1] < danger[1]):
+                danger = missile_danger
+
+        return danger[0] if danger else None
 
     def _evade(self, danger):
         """
@@ -158,7 +174,7 @@ class Enemy:
             danger: 위협 객체 (운석 또는 미사일)
         """
         # 회피 스킬 체크
-        if random.random() > self.evasion_skill:
+        if self.rng.random() > self.evasion_skill:
             return  # 회피 실패
 
         # 안전한 방향 계산 (위협 반대 방향)
@@ -228,11 +244,11 @@ class Enemy:
         if not self.target_player:
             return False
 
-        distance = math.sqrt(
+        distance_sq = (
             (self.rect.centerx - self.target_player.rect.centerx) ** 2 +
             (self.rect.centery - self.target_player.rect.centery) ** 2
         )
-        return distance < range_distance
+        return distance_sq < range_distance * range_distance
 
     def _start_charging(self):
         """레이저 충전 시작"""
@@ -303,30 +319,66 @@ class Enemy:
         """발사 중인지 확인"""
         return self.state == EnemyState.FIRING
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         적 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역 (충전 이펙트, 레이저 포함)
         """
         # 적 이미지 그리기
-        screen.blit(self.image, self.rect)
+        drawn = screen.blit(self.image, self.rect)
+
+        effects = self.draw_effects(screen)
+        if effects:
+            drawn.union_ip(effects)
+
+        return drawn
+
+    def has_effects(self) -> bool:
+        """
+        이미지 외에 그릴 이펙트(충전 바, 레이저)가 있는지 확인
+
+        Returns:
+            bool: 이펙트가 있으면 True
+        """
+        return self.state == EnemyState.CHARGING or self.laser is not None
+
+    def draw_effects(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        충전 이펙트와 레이저만 그리기 (이미지는 레이어 배치로 따로 그림)
+
+        Args:
+            screen: pygame 화면
+
+        Returns:
+            Optional[pygame.Rect]: 그린 영역 (이펙트가 없으면 None)
+        """
+        drawn = None
 
         # 충전 이펙트 그리기
         if self.state == EnemyState.CHARGING:
-            self._draw_charge_effect(screen)
+            drawn = self._draw_charge_effect(screen)
 
         # 레이저 그리기
         if self.laser:
-            self.laser.draw(screen)
+            laser_rect = self.laser.draw(screen)
+            drawn = laser_rect if drawn is None else drawn.union(laser_rect)
 
-    def _draw_charge_effect(self, screen: pygame.Surface):
+        return drawn
+
+    def _draw_charge_effect(self, screen: pygame.Surface) -> pygame.Rect:
         """
         충전 이펙트 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
         # 충전 진행도 바
         bar_width = self.rect.width
@@ -335,7 +387,7 @@ class Enemy:
         bar_y = self.rect.y - 15
 
         # 배경 (회색)
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+        drawn = pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
 
         # 충전 진행도 (노란색 -> 빨간색)
         progress_width = int(bar_width * self.laser_charge_progress)
@@ -346,13 +398,15 @@ class Enemy:
         if self.laser_charge_progress > 0.8:
             if (self.state_timer // 5) % 2 == 0:  # 깜빡임 효과
                 # 적 주변에 경고 원 그리기
-                pygame.draw.circle(
+                drawn.union_ip(pygame.draw.circle(
                     screen,
                     ENEMY_LASER_CHARGE_COLOR,
                     self.rect.center,
                     self.rect.width // 2 + 5,
                     2
-                )
+                ))
+
+        return drawn
 
     def is_off_screen(self) -> bool:
         """
@@ -364,11 +418,36 @@ class Enemy:
         return self.rect.y > SCREEN_HEIGHT
 
 
+def _clip_to_screen(x: float, y: float, dir_x: float, dir_y: float, max_length: float) -> float:
+    """
+    (x, y)에서 (dir_x, dir_y) 방향으로 나아가 화면을 벗어나는 지점까지의 길이
+
+    Args:
+        x: 시작 x
+        y: 시작 y
+        dir_x: 방향 단위 벡터 x
+        dir_y: 방향 단위 벡터 y
+        max_length: 최대 길이
+
+    Returns:
+        float: 0 ~ max_length (시작점이 이미 나가는 쪽 화면 밖이면 0)
+    """
+    length = max_length
+    for position, direction, limit in ((x, dir_x, SCREEN_WIDTH), (y, dir_y, SCREEN_HEIGHT)):
+        if direction > 0:
+            length = min(length, (limit - position) / direction)
+        elif direction < 0:
+            length = min(length, -position / direction)
+    return max(length, 0.0)
+
+
 class EnemyLaser:
     """
     적 레이저 빔
 
     직선으로 발사되며 일정 시간 동안 지속됩니다.
+    빔은 생성 시 화면 경계까지 자른 두께 있는 선분(방향/법선 벡터, 중심, 반길이, 반두께)으로
+    미리 계산해 두고, 충돌은 사각형과의 분리축 검사(SAT)로 상수 시간에 판정합니다.
     """
 
     def __init__(self, start_x: float, start_y: float, angle: float, duration: int):
@@ -387,10 +466,34 @@ class EnemyLaser:
         self.duration = duration
         self.timer = 0
 
-        # 레이저 끝 위치 계산 (화면 끝까지)
-        self.length = 1000  # 충분히 긴 레이저
-        self.end_x = start_x + math.cos(angle) * self.length
-        self.end_y = start_y + math.sin(angle) * self.length
+        # 방향/법선 단위 벡터
+        self.dir_x = math.cos(angle)
+        self.dir_y = math.sin(angle)
+        self.normal_x = -self.dir_y
+        self.normal_y = self.dir_x
+
+        # 레이저 끝 위치 계산 (화면 경계에서 자름)
+        self.length = _clip_to_screen(start_x, start_y, self.dir_x, self.dir_y, ENEMY_LASER_LENGTH)
+        self.end_x = start_x + self.dir_x * self.length
+        self.end_y = start_y + self.dir_y * self.length
+
+        # 분리축 검사용 값: 빔 중심, 반길이/반두께, x/y축 투영 반경
+        self.center_x = (start_x + self.end_x) / 2
+        self.center_y = (start_y + self.end_y) / 2
+        self.half_length = self.length / 2
+        self.half_width = ENEMY_LASER_WIDTH / 2
+        self.abs_dir_x = abs(self.dir_x)
+        self.abs_dir_y = abs(self.dir_y)
+        self.extent_x = self.abs_dir_x * self.half_length + self.abs_dir_y * self.half_width
+        self.extent_y = self.abs_dir_y * self.half_length + self.abs_dir_x * self.half_width
+
+        # 바운딩 박스 (한 번만 계산)
+        self.bounds = pygame.Rect(
+            math.floor(self.center_x - self.extent_x),
+            math.floor(self.center_y - self.extent_y),
+            math.ceil(self.extent_x * 2) + 1,
+            math.ceil(self.extent_y * 2) + 1
+        )
 
     def update(self):
         """레이저 업데이트"""
@@ -407,27 +510,41 @@ class EnemyLaser:
 
     def get_collision_rect(self) -> pygame.Rect:
         """
-        충돌 감지를 위한 사각형 반환
+        레이저 바운딩 박스 반환 (생성 시 계산한 값 - 수정하지 말 것)
 
         Returns:
-            pygame.Rect: 레이저 충돌 영역
-        """
-        # 레이저를 사각형으로 근사
-        min_x = min(self.start_x, self.end_x)
-        max_x = max(self.start_x, self.end_x)
-        min_y = min(self.start_y, self.end_y)
-        max_y = max(self.start_y, self.end_y)
-
-        return pygame.Rect(
-            min_x,
-            min_y,
-            max_x - min_x + ENEMY_LASER_WIDTH,
-            max_y - min_y + ENEMY_LASER_WIDTH
-        )
+            pygame.Rect: 레이저 영역을 감싸는 사각형
+        """
+        return self.bounds
+
+    def _overlaps(self, center_x: float, center_y: float, half_width: float, half_height: float) -> bool:
+        """
+        빔과 축 정렬 사각형의 분리축 검사 (x축, y축, 빔 방향, 빔 법선)
+
+        Args:
+            center_x: 사각형 중심 x
+            center_y: 사각형 중심 y
+            half_width: 사각형 반폭
+            half_height: 사각형 반높이
+
+        Returns:
+            bool: 겹치면 True (모서리가 닿기만 하면 False)
+        """
+        offset_x = center_x - self.center_x
+        offset_y = center_y - self.center_y
+        if abs(offset_x) >= half_width + self.extent_x:
+            return False
+        if abs(offset_y) >= half_height + self.extent_y:
+            return False
+        if abs(offset_x * self.dir_x + offset_y * self.dir_y) >= \
+                self.half_length + half_width * self.abs_dir_x + half_height * self.abs_dir_y:
+            return False
+        return abs(offset_x * self.normal_x + offset_y * self.normal_y) < \
+            self.half_width + half_width * self.abs_dir_y + half_height * self.abs_dir_x
 
     def collides_with(self, rect: pygame.Rect) -> bool:
         """
-        레이저가 사각형과 충돌하는지 확인 (선분-사각형 충돌)
+        레이저가 사각형과 충돌하는지 확인 (두께 있는 선분-사각형 분리축 검사)
 
         Args:
             rect: 충돌을 확인할 사각형
@@ -435,19 +552,43 @@ class EnemyLaser:
         Returns:
             bool: 충돌하면 True
         """
-        # 간단한 충돌 감지: 레이저의 바운딩 박스와 rect 충돌 확인
-        laser_rect = self.get_collision_rect()
-        return laser_rect.colliderect(rect)
+        half_width = rect.width / 2
+        half_height = rect.height / 2
+        return self._overlaps(rect.x + half_width, rect.y + half_height, half_width, half_height)
+
+    @staticmethod
+    def find_hits(lasers: List["EnemyLaser"], rect: pygame.Rect) -> List[int]:
+        """
+        여러 레이저를 한 사각형과 한 번에 충돌 확인 (사각형 값은 한 번만 계산)
+
+        Args:
+            lasers: 레이저 목록
+            rect: 충돌을 확인할 사각형
 
-    def draw(self, screen: pygame.Surface):
+        Returns:
+            List[int]: 충돌한 레이저의 목록 인덱스
+        """
+        half_width = rect.width / 2
+        half_height = rect.height / 2
+        center_x = rect.x + half_width
+        center_y = rect.y + half_height
+        return [
+            index for index, laser in enumerate(lasers)
+            if laser._overlaps(center_x, center_y, half_width, half_height)
+        ]
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         레이저 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
-        # 레이저 빔 그리기 (굵은 선)
-        pygame.draw.line(
+        # 레이저 빔 그리기 (굵은 선, 중심부는 빔 안쪽이므로 빔 영역이 전체 영역)
+        drawn = pygame.draw.line(
             screen,
             ENEMY_LASER_COLOR,
             (self.start_x, self.start_y),
@@ -464,6 +605,8 @@ class EnemyLaser:
             max(1, ENEMY_LASER_WIDTH // 2)
         )
 
+        return drawn
+
 
 # 하위 호환성을 위해 EnemyProjectile 클래스 유지 (사용하지 않음)
 class EnemyProjectile:
@@ -493,14 +636,17 @@ class EnemyProjectile:
         """발사체 업데이트 (하강)"""
         self.rect.y += self.speed
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         발사체 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def is_off_screen(self) -> bool:
         """
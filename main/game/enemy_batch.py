@@ -0,0 +1,244 @@
+"""Batched enemy AI update over NumPy arrays"""
+import math
+from typing import Iterable, List, Tuple
+from core.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    ENEMY_LASER_CHARGE_TIME, ENEMY_LASER_FIRE_TIME, ENEMY_LASER_COOLDOWN_TIME
+)
+from game.enemy import (
+    Enemy, EnemyLaser, EnemyState,
+    STONE_DANGER_RADIUS, MISSILE_DANGER_RADIUS, MISSILE_DANGER_HORIZONTAL
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 적마다 Enemy.update()로 처리
+    np = None
+
+# 이 수 미만이면 배열을 만드는 비용이 더 커서 적마다 Enemy.update()로 처리
+BATCH_MIN_ENEMIES = 32
+
+# EnemyState <-> 정수 코드 (배열 저장용, 코드는 STATES의 인덱스)
+STATES = list(EnemyState)
+PATROL, CHASE, EVADE, CHARGING, FIRING, COOLDOWN = (
+    STATES.index(state) for state in (
+        EnemyState.PATROL, EnemyState.CHASE, EnemyState.EVADE,
+        EnemyState.CHARGING, EnemyState.FIRING, EnemyState.COOLDOWN
+    )
+)
+
+# 상태 변경 이벤트 (적, 새 상태)
+StateChange = Tuple[Enemy, EnemyState]
+
+
+def _round(values):
+    """pygame.Rect 좌표 대입과 같은 반올림 (0.5는 0에서 먼 쪽으로)"""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+
+def _nearest_threats(threats, center_x, center_y, top, radius, can_evade, horizontal=None):
+    """
+    적마다 조건을 만족하는 가장 가까운 위협 (Enemy._detect_danger와 같은 조건과 동점 처리)
+
+    Args:
+        threats: 위협 엔티티 목록 또는 SpatialGrid (None 가능)
+        center_x: 적 중심 x 배열
+        center_y: 적 중심 y 배열
+        top: 적 윗변 y 배열 (이보다 위에 있는 위협만)
+        radius: 감지 반경 (중심 거리가 이 값보다 작아야 함)
+        can_evade: 회피할 수 있는 적 마스크
+        horizontal: 수평 거리 제한 (선택사항)
+
+    Returns:
+        Tuple: (핸들 순 위협 목록, 적별 위협 인덱스, 적별 제곱 거리 - 위협이 없으면 inf)
+    """
+    count = len(center_x)
+    entities = sorted(threats or (), key=lambda entity: getattr(entity, "handle", 0))
+    if not entities:
+        return entities, np.zeros(count, dtype=np.intp), np.full(count, np.inf)
+
+    positions = np.array([
+        (rect.centerx, rect.centery, rect.y) for rect in (entity.rect for entity in entities)
+    ], dtype=np.float64)
+    dx = positions[:, 0] - center_x[:, None]
+    distance_sq = dx * dx + (positions[:, 1] - center_y[:, None]) ** 2
+    valid = (distance_sq < radius * radius) & (positions[:, 2] < top[:, None]) & can_evade[:, None]
+    if horizontal is not None:
+        valid &= np.abs(dx) < horizontal
+
+    # 핸들 순으로 정렬했으므로 argmin(첫 최솟값)이 같은 거리에서 핸들이 작은 쪽
+    distance_sq = np.where(valid, distance_sq, np.inf)
+    nearest = distance_sq.argmin(axis=1)
+    return entities, nearest, distance_sq[np.arange(count), nearest]
+
+
+class EnemyBatchUpdater:
+    """
+    모든 적의 AI 상태 머신을 한 번에 갱신
+
+    위치, 크기, 속도, 상태, 타이머를 NumPy 배열로 모아 순찰/추적 이동, 사정거리 확인,
+    상태 전이를 마스크 연산으로 처리한 뒤 각 Enemy에 되돌려 씁니다.
+    결과는 적마다 Enemy.update()를 호출한 것과 같습니다 (좌표 반올림, 난수 호출 순서 포함).
+    위험 감지도 적 x 위협 거리 행렬로 한 번에 계산하고, 난수를 쓰는 회피와
+    레이저 생성/갱신만 해당 적에 대해 적 순서대로 수행합니다.
+    """
+
+    def __init__(self, min_batch: int = BATCH_MIN_ENEMIES):
+        """
+        EnemyBatchUpdater 초기화
+
+        Args:
+            min_batch: 배열 처리를 시작할 최소 적 수 (미만이면 적마다 Enemy.update())
+        """
+        self.min_batch = min_batch
+
+    @staticmethod
+    def is_vectorized() -> bool:
+        """
+        NumPy 배열 처리를 쓸 수 있는지 확인
+
+        Returns:
+            bool: NumPy가 있으면 True
+        """
+        return np is not None
+
+    def update(self, enemies: Iterable[Enemy], player, missiles=None, stones=None) -> List[StateChange]:
+        """
+        모든 적 업데이트
+
+        Args:
+            enemies: 적 목록
+            player: 플레이어 객체
+            missiles: 이번 프레임 미사일 공간 인덱스 (회피 판단용)
+            stones: 이번 프레임 운석 공간 인덱스 (회피 판단용)
+
+        Returns:
+            List[StateChange]: 이번 프레임에 상태가 바뀐 (적, 새 상태) 목록 (적 순서대로)
+        """
+        enemies = list(enemies)
+        previous = [enemy.state for enemy in enemies]
+
+        if np is None or len(enemies) < self.min_batch:
+            for enemy in enemies:
+                enemy.update(player, missiles, stones)
+        else:
+            self._update_batch(enemies, player, missiles, stones)
+
+        return [
+            (enemy, enemy.state)
+            for enemy, state in zip(enemies, previous)
+            if enemy.state is not state
+        ]
+
+    def _update_batch(self, enemies: List[Enemy], player, missiles, stones):
+        """배열로 모아 한 번에 갱신"""
+        # 1) 배열용 값 수집, 타이머 증가
+        code_of = STATES.index
+        data = np.array([
+            (rect.x, rect.y, rect.width, rect.height,
+             enemy.speed, enemy.horizontal_direction, enemy.horizontal_speed,
+             enemy.state_timer, code_of(enemy.state))
+            for enemy in enemies for rect in (enemy.rect,)
+        ], dtype=np.float64)
+        x, y, width, height = data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+        speed, direction, horizontal_speed = data[:, 4], data[:, 5], data[:, 6]
+        timer, state = data[:, 7] + 1, data[:, 8]
+        evading = np.zeros(len(enemies), dtype=bool)
+        max_x = SCREEN_WIDTH - width
+        player_x, player_y = player.rect.center
+
+        # 위험 감지: 적 x 위협 제곱 거리 행렬에서 조건을 만족하는 가장 가까운 위협 (충전/발사 중 제외)
+        can_evade = (state != CHARGING) & (state != FIRING)
+        center_x, center_y = x + width // 2, y + height // 2
+        stone_list, stone_index, stone_distance = _nearest_threats(
+            stones, center_x, center_y, y, STONE_DANGER_RADIUS, can_evade
+        )
+        missile_list, missile_index, missile_distance = _nearest_threats(
+            missiles, center_x, center_y, y, MISSILE_DANGER_RADIUS, can_evade,
+            horizontal=MISSILE_DANGER_HORIZONTAL
+        )
+
+        # 회피: 위협이 있는 적만 적 순서대로 (난수 호출 순서 유지), 같은 거리면 운석 우선
+        pick_missile = missile_distance < stone_distance
+        for index in np.flatnonzero(np.minimum(stone_distance, missile_distance) < np.inf).tolist():
+            if pick_missile[index]:
+                danger = missile_list[missile_index[index]]
+            else:
+                danger = stone_list[stone_index[index]]
+            enemy = enemies[index]
+            enemy.state = EnemyState.EVADE
+            enemy._evade(danger)
+            evading[index] = True
+            x[index], y[index], state[index] = enemy.rect.x, enemy.rect.y, EVADE
+        idle = ~evading
+
+        # 2) 순찰: 하강 + 좌우 이동, 벽에서 방향 전환
+        patrol = idle & (state == PATROL)
+        x = np.where(patrol, _round(x + direction * horizontal_speed), x)
+        y = np.where(patrol, _round(y + speed), y)
+        hit_left = patrol & (x <= 0)
+        hit_right = patrol & ~hit_left & (x >= max_x)
+        x = np.where(hit_left, 0, np.where(hit_right, max_x, x))
+        direction = np.where(hit_left, 1, np.where(hit_right, -1, direction))
+
+        # 3) 추적: 플레이어 방향 단위 벡터로 이동 후 화면 안으로 제한
+        chase = idle & (state == CHASE)
+        dx = player_x - (x + width // 2)
+        dy = player_y - (y + height // 2)
+        length = np.sqrt(dx * dx + dy * dy)
+        safe_length = np.where(length > 0, length, 1)
+        chase_x = _round(x + dx / safe_length * speed * 0.8)
+        chase_y = _round(y + dy / safe_length * speed * 0.8)
+        x = np.where(chase, np.clip(chase_x, 0, max_x), x)
+        y = np.where(chase, np.clip(chase_y, 50, SCREEN_HEIGHT - height), y)
+
+        # 4) 사정거리 확인 (이동 후 중심 기준, 제곱 거리) -> 충전 시작
+        distance_sq = (x + width // 2 - player_x) ** 2 + (y + height // 2 - player_y) ** 2
+        start_charging = (patrol & (distance_sq < 250 * 250)) | (chase & (distance_sq < 200 * 200))
+
+        # 5) 타이머 기반 전이
+        charging = state == CHARGING
+        start_firing = charging & (timer >= ENEMY_LASER_CHARGE_TIME)
+        end_firing = (state == FIRING) & (timer >= ENEMY_LASER_FIRE_TIME)
+        end_cooldown = idle & (state == COOLDOWN) & (timer >= ENEMY_LASER_COOLDOWN_TIME)
+        end_evade = idle & (state == EVADE) & (timer > 30)
+
+        new_state = state.copy()
+        new_state[start_charging] = CHARGING
+        new_state[start_firing] = FIRING
+        new_state[end_firing] = COOLDOWN
+        new_state[end_cooldown | end_evade] = CHASE
+        new_timer = np.where(start_charging | start_firing | end_firing | end_cooldown | end_evade, 0, timer)
+
+        # 6) 각 Enemy에 되돌려 쓰기
+        for enemy, new_x, new_y, new_direction, code, state_timer in zip(
+                enemies, x.tolist(), y.tolist(), direction.tolist(), new_state.tolist(), new_timer.tolist()):
+            enemy.target_player = player
+            enemy.rect.x = int(new_x)
+            enemy.rect.y = int(new_y)
+            enemy.horizontal_direction = int(new_direction)
+            enemy.state = STATES[int(code)]
+            enemy.state_timer = int(state_timer)
+
+        # 충전 진행도는 타이머를 초기화하기 전 값으로 계산
+        for index, charge_timer in zip(np.flatnonzero(charging).tolist(), timer[charging].tolist()):
+            enemies[index].laser_charge_progress = charge_timer / ENEMY_LASER_CHARGE_TIME
+        for index in np.flatnonzero(start_charging).tolist():
+            enemies[index].laser_charge_progress = 0
+        for index in np.flatnonzero(start_firing).tolist():
+            enemy = enemies[index]
+            enemy.laser = EnemyLaser(
+                enemy.rect.centerx,
+                enemy.rect.centery,
+                math.atan2(player.rect.centery - enemy.rect.centery,
+                           player.rect.centerx - enemy.rect.centerx),
+                ENEMY_LASER_FIRE_TIME
+            )
+        for index in np.flatnonzero(end_firing).tolist():
+            enemies[index].laser = None
+
+        # 레이저 업데이트 (레이저는 발사 상태에만 있음)
+        for index in np.flatnonzero(new_state == FIRING).tolist():
+            laser = enemies[index].laser
+            if laser:
+                laser.update()
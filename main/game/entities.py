@@ -1,6 +1,7 @@
 """Game entity classes"""
 import pygame
 import random
+from ui import surface_cache
 from core.config import (
     PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_START_X, PLAYER_START_Y,
     STONE_MIN_SIZE, STONE_MAX_SIZE, STONE_SPEED,
@@ -20,6 +21,7 @@ class Player:
             image: 플레이어 이미지
         """
         self.image = image
+        self.mask = surface_cache.get_mask(image)  # 픽셀 단위 충돌용
         self.rect = self.image.get_rect()
         self.rect.x = PLAYER_START_X
         self.rect.y = PLAYER_START_Y
@@ -45,14 +47,17 @@ class Player:
         if self.rect.y + self.rect.height < SCREEN_HEIGHT:
             self.rect.y += self.speed
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         플레이어 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def get_rect(self) -> pygame.Rect:
         """
@@ -67,7 +72,8 @@ class Player:
 class Stone:
     """운석 엔티티"""
 
-    def __init__(self, image: pygame.Surface, x: int = None, y: int = 0, speed_multiplier: float = 1.0):
+    def __init__(self, image: pygame.Surface, x: int = None, y: int = 0, speed_multiplier: float = 1.0,
+                 rng=random, size: int = None):
         """
         운석 초기화
 
@@ -76,11 +82,27 @@ class Stone:
             x: X 위치 (기본값: 무작위)
             y: Y 위치 (기본값: 0)
             speed_multiplier: 속도 배율 (스테이지별 난이도)
+            rng: 크기/위치를 뽑을 난수 생성기 (기본값: 전역 random 모듈)
+            size: 크기 (기본값: 무작위, 스냅샷 복원처럼 이미 정해진 운석용)
         """
-        self.size = random.randint(STONE_MIN_SIZE, STONE_MAX_SIZE)
-        self.image = pygame.transform.scale(image, (self.size, self.size))
-        self.rect = self.image.get_rect()
-        self.rect.x = x if x is not None else random.randint(0, SCREEN_WIDTH - self.size)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(image, x, y, speed_multiplier, rng, size)
+
+    def reset(self, image: pygame.Surface, x: int = None, y: int = 0, speed_multiplier: float = 1.0,
+              rng=random, size: int = None):
+        """
+        운석 상태 재설정 (오브젝트 풀 재사용용, 인자는 생성자와 같음)
+
+        크기별로 축소한 이미지와 충돌 마스크는 공유 캐시에서 가져와 운석마다 새로 만들지 않습니다.
+        """
+        self.size = size if size is not None else rng.randint(STONE_MIN_SIZE, STONE_MAX_SIZE)
+        self.image = surface_cache.cached(
+            ("stone", image, self.size),
+            lambda: pygame.transform.scale(image, (self.size, self.size))
+        )
+        self.mask = surface_cache.get_mask(self.image)  # 크기별 이미지마다 하나
+        self.rect.size = (self.size, self.size)
+        self.rect.x = x if x is not None else rng.randint(0, SCREEN_WIDTH - self.size)
         self.rect.y = y
         self.speed = STONE_SPEED * speed_multiplier
 
@@ -88,14 +110,17 @@ class Stone:
         """운석 업데이트"""
         self.rect.y += self.speed
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         운석 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def is_off_screen(self) -> bool:
         """
@@ -128,8 +153,14 @@ class Missile:
             x: 시작 X 위치
             y: 시작 Y 위치
         """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(image, x, y)
+
+    def reset(self, image: pygame.Surface, x: int, y: int):
+        """미사일 상태 재설정 (오브젝트 풀 재사용용, 인자는 생성자와 같음)"""
         self.image = image
-        self.rect = self.image.get_rect()
+        self.mask = surface_cache.get_mask(image)
+        self.rect.size = image.get_size()
         self.rect.x = x
         self.rect.y = y
         self.speed = MISSILE_SPEED
@@ -138,14 +169,17 @@ class Missile:
         """미사일 업데이트"""
         self.rect.y -= self.speed
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         미사일 그리기
 
         Args:
             screen: pygame 화면
+
+        Returns:
+            pygame.Rect: 그린 영역
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect)
 
     def is_off_screen(self) -> bool:
         """
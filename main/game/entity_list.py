@@ -0,0 +1,168 @@
+"""Entity container with stable handles and end-of-frame compaction"""
+from typing import Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+from game.pool import ObjectPool
+
+T = TypeVar("T")
+
+
+class EntityList(Generic[T]):
+    """
+    안정 핸들을 가진 엔티티 컨테이너
+
+    add()한 엔티티에는 다시 쓰지 않는 정수 핸들(entity.handle)이 붙습니다.
+    프레임 중 제거는 kill()로 표시(tombstone)만 하고, 프레임 끝 compact()에서
+    마지막 원소와 자리를 바꿔(swap-remove) O(1)로 한 번에 지운 뒤 풀로 반환합니다.
+    순회와 len()은 살아 있는 엔티티만 대상으로 하며, 순서는 compact() 때 바뀔 수 있습니다.
+    """
+
+    def __init__(self, create: Optional[Callable[..., T]] = None, pool: Optional[ObjectPool] = None):
+        """
+        EntityList 초기화
+
+        Args:
+            create: 엔티티 생성 함수 (주면 이 함수로 오브젝트 풀을 만듦)
+            pool: 제거된 엔티티를 반환할 오브젝트 풀 (create보다 우선)
+        """
+        self.pool = pool if pool is not None else (ObjectPool(create) if create else None)
+        self._items: List[T] = []
+        self._index: Dict[int, int] = {}  # 핸들 -> _items 위치
+        self._dead: List[int] = []  # 이번 프레임에 kill()된 핸들
+        self._next_handle = 1
+
+    def add(self, entity: T) -> int:
+        """
+        엔티티 추가
+
+        Args:
+            entity: 추가할 엔티티
+
+        Returns:
+            int: 새 핸들
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        entity.handle = handle
+        entity.alive = True
+        self._index[handle] = len(self._items)
+        self._items.append(entity)
+        return handle
+
+    def spawn(self, *args, **kwargs) -> T:
+        """
+        풀에서 엔티티를 가져와 추가
+
+        Args:
+            *args, **kwargs: 엔티티 생성자/reset()에 넘길 인자
+
+        Returns:
+            T: 추가된 엔티티
+        """
+        entity = self.pool.acquire(*args, **kwargs)
+        self.add(entity)
+        return entity
+
+    def get(self, handle: int) -> Optional[T]:
+        """
+        핸들로 엔티티 조회
+
+        Args:
+            handle: 엔티티 핸들
+
+        Returns:
+            Optional[T]: 엔티티 (이미 제거·압축된 핸들이면 None)
+        """
+        index = self._index.get(handle)
+        return self._items[index] if index is not None else None
+
+    def is_alive(self, handle: int) -> bool:
+        """
+        핸들의 엔티티가 살아 있는지 확인
+
+        Args:
+            handle: 엔티티 핸들
+
+        Returns:
+            bool: 살아 있으면 True
+        """
+        entity = self.get(handle)
+        return entity is not None and entity.alive
+
+    def kill(self, handle: int) -> bool:
+        """
+        엔티티 제거 표시 (실제 제거는 compact()에서)
+
+        Args:
+            handle: 엔티티 핸들
+
+        Returns:
+            bool: 이번 호출로 제거 표시되었으면 True (이미 제거됐거나 없는 핸들이면 False)
+        """
+        entity = self.get(handle)
+        if entity is None or not entity.alive:
+            return False
+        entity.alive = False
+        self._dead.append(handle)
+        return True
+
+    def kill_all(self):
+        """모든 엔티티 제거 표시"""
+        for entity in self._items:
+            if entity.alive:
+                entity.alive = False
+                self._dead.append(entity.handle)
+
+    def compact(self) -> int:
+        """
+        제거 표시된 엔티티를 swap-remove로 지우고 풀로 반환 (프레임 끝에 한 번)
+
+        Returns:
+            int: 지운 엔티티 수
+        """
+        removed = len(self._dead)
+        for handle in self._dead:
+            index = self._index.pop(handle)
+            entity = self._items[index]
+            last = self._items.pop()
+            if last is not entity:
+                self._items[index] = last
+                self._index[last.handle] = index
+            if self.pool is not None:
+                self.pool.release(entity)
+        self._dead.clear()
+        return removed
+
+    def clear(self):
+        """모든 엔티티를 즉시 지우고 풀로 반환"""
+        self.kill_all()
+        self.compact()
+
+    def restore(self, entities: List[T], next_handle: int):
+        """
+        저장해 둔 핸들/순서 그대로 내용 교체 (스냅샷 복원용)
+
+        순회 순서와 핸들이 진행 결과(충돌 처리 순서 등)에 영향을 주므로 둘 다 그대로 되살립니다.
+
+        Args:
+            entities: 순서대로 놓을 엔티티 (entity.handle이 이미 정해져 있어야 함)
+            next_handle: 다음에 붙일 핸들
+        """
+        self.clear()
+        for entity in entities:
+            entity.alive = True
+            self._index[entity.handle] = len(self._items)
+            self._items.append(entity)
+        self._next_handle = next_handle
+
+    def __iter__(self) -> Iterator[T]:
+        """살아 있는 엔티티 순회"""
+        if not self._dead:
+            return iter(self._items)
+        return (entity for entity in self._items if entity.alive)
+
+    def __len__(self) -> int:
+        """살아 있는 엔티티 수"""
+        return len(self._items) - len(self._dead)
+
+    def __bool__(self) -> bool:
+        """살아 있는 엔티티가 있는지 여부"""
+        return len(self) > 0
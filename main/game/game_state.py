@@ -0,0 +1,307 @@
+"""Per-game state: entities, score, systems and the seeded RNG stream"""
+import random
+from typing import Optional
+import pygame
+from core.config import INITIAL_HEALTH, SKILL_THRESHOLD, STONE_SPAWN_INTERVAL_START, Resources
+from game.entities import Stone, Missile
+from game.enemy import Enemy
+from game.combo import ComboSystem
+from game.powerup import PowerUpType, PowerUpManager
+from game.stage import StageManager
+from game.statistics import GameStatistics
+from game.achievements import AchievementChecker
+from game.achievement_notification import AchievementNotificationManager
+from game.pool import gc_pressure
+from game.entity_list import EntityList
+from game.spatial import SpatialGrid
+
+
+def new_seed() -> int:
+    """
+    새 게임용 난수 시드 (32비트)
+
+    Returns:
+        int: 시드
+    """
+    return random.SystemRandom().getrandbits(32)
+
+
+class GameState:
+    """
+    게임 상태 관리
+
+    운석/적 생성 위치, 회피 판정, 적/파워업 출현 등 게임 진행에 쓰는 난수는 모두
+    시드로 초기화한 rng(random.Random) 하나에서 뽑으므로, 같은 시드와 같은 입력이면
+    같은 게임이 재현됩니다 (전역 random 모듈은 쓰지 않음).
+    """
+
+    def __init__(self, difficulty_manager=None, api_client=None, seed: Optional[int] = None):
+        """
+        GameState 초기화
+
+        Args:
+            difficulty_manager: 난이도 관리자 (선택사항)
+            api_client: API 클라이언트 (업적 확인용, 선택사항)
+            seed: 난수 시드 (None이면 새로 생성)
+        """
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = random.Random(self.seed)
+        self.score = 0
+        self.health = INITIAL_HEALTH
+        self.game_over = False
+        self.skill_count = 0
+        self.skill_available = False
+        # 엔티티 컨테이너 (핸들 기반, 제거된 엔티티는 각 컨테이너의 오브젝트 풀로 반환)
+        self.stones = EntityList(Stone)
+        self.missiles = EntityList(Missile)
+        self.enemies = EntityList(Enemy)
+        self.enemy_projectiles = EntityList()
+        # 프레임별 공간 인덱스 (적 위험 감지와 충돌 감지가 공유)
+        self.stone_grid = SpatialGrid()
+        self.missile_grid = SpatialGrid()
+        self.stone_spawn_timer = 0
+        self.stone_spawn_interval = STONE_SPAWN_INTERVAL_START
+        self.current_frame = 0
+        self.combo_system = ComboSystem(timeout_frames=180)
+        self.difficulty_manager = difficulty_manager
+        self.powerup_manager = PowerUpManager(self.rng)
+
+        # 새로운 시스템들
+        self.stage_manager = StageManager()
+        difficulty_name = difficulty_manager.current_difficulty if difficulty_manager else "medium"
+
+        # 레이저 피해 쿨다운 (연속 피해 방지)
+        self.laser_damage_cooldown = 0  # 프레임 단위
+        self.statistics = GameStatistics(difficulty=difficulty_name)
+        self.achievement_checker = AchievementChecker(api_client)
+        self.achievement_notification_manager = AchievementNotificationManager(
+            self.achievement_checker, Resources.MAIN_FONT
+        )
+
+        # 적 관련 통계 (하위 호환성 유지)
+        self.enemies_destroyed = 0
+        self.missiles_fired = 0
+        self.missiles_hit = 0
+
+        # 플레이어 상태 (파워업 효과)
+        self.player_speed_multiplier = 1.0
+        self.is_invincible = False
+
+    def reset(self, seed: Optional[int] = None):
+        """
+        게임 상태 초기화
+
+        Args:
+            seed: 새 난수 시드 (None이면 기존 시드로 처음부터 다시)
+        """
+        if seed is not None:
+            self.seed = seed
+        self.rng.seed(self.seed)  # 파워업 관리자와 같은 객체를 공유하므로 제자리에서 다시 시드
+        self.score = 0
+        self.health = INITIAL_HEALTH
+        self.game_over = False
+        self.skill_count = 0
+        self.laser_damage_cooldown = 0
+        self.skill_available = False
+        self.stones.clear()
+        self.missiles.clear()
+        self.enemies.clear()
+        self.enemy_projectiles.clear()
+        self.stone_grid.clear()
+        self.missile_grid.clear()
+        self.stone_spawn_timer = 0
+        self.stone_spawn_interval = STONE_SPAWN_INTERVAL_START
+        self.current_frame = 0
+        self.combo_system.reset()
+        self.powerup_manager.clear_powerups()
+        self.stage_manager.reset()
+        self.statistics.reset()
+        self.achievement_checker.reset()
+        self.enemies_destroyed = 0
+        self.missiles_fired = 0
+        self.missiles_hit = 0
+        self.player_speed_multiplier = 1.0
+        self.is_invincible = False
+
+    def spawn_missile(self, image: pygame.Surface, x: float, y: float) -> Missile:
+        """
+        미사일 생성 (풀에서 재사용)
+
+        Args:
+            image: 미사일 이미지
+            x: 시작 X 위치
+            y: 시작 Y 위치
+
+        Returns:
+            Missile: 추가된 미사일
+        """
+        return self.missiles.spawn(image, x, y)
+
+    def spawn_stone(self, image: pygame.Surface, speed_multiplier: float = 1.0) -> Stone:
+        """
+        운석 생성 (풀에서 재사용)
+
+        Args:
+            image: 운석 원본 이미지
+            speed_multiplier: 속도 배율
+
+        Returns:
+            Stone: 추가된 운석
+        """
+        return self.stones.spawn(image, speed_multiplier=speed_multiplier, rng=self.rng)
+
+    def spawn_enemy(self, image: pygame.Surface, enemy_speed: float, evasion_skill: float) -> Enemy:
+        """
+        적 생성 (풀에서 재사용)
+
+        Args:
+            image: 적 이미지
+            enemy_speed: 이동 속도
+            evasion_skill: 회피 능력
+
+        Returns:
+            Enemy: 추가된 적
+        """
+        return self.enemies.spawn(image, enemy_speed, evasion_skill, rng=self.rng)
+
+    def index_threats(self):
+        """이번 프레임 운석/미사일 위치로 공간 인덱스 갱신 (이동이 끝난 뒤 한 번)"""
+        self.stone_grid.build(self.stones)
+        self.missile_grid.build(self.missiles)
+
+    def end_frame(self):
+        """프레임 끝 정리 - 이번 프레임에 제거 표시된 엔티티를 지우고 풀로 반환"""
+        self.stones.compact()
+        self.missiles.compact()
+        self.enemies.compact()
+        self.enemy_projectiles.compact()
+        self.powerup_manager.active_powerups.compact()
+
+    def allocation_stats(self) -> dict:
+        """
+        엔티티 할당/재사용 통계와 GC 압력 지표
+
+        Returns:
+            dict: 풀 이름별 통계 + "gc" (세대별 대기 수, 누적 수집 횟수)
+        """
+        return {
+            "stone": self.stones.pool.stats(),
+            "missile": self.missiles.pool.stats(),
+            "enemy": self.enemies.pool.stats(),
+            "powerup": self.powerup_manager.active_powerups.pool.stats(),
+            "gc": gc_pressure(),
+        }
+
+    def take_damage(self):
+        """플레이어 피해 입음 (무적 상태면 무시)"""
+        if self.is_invincible:
+            return  # 무적 상태에서는 피해 무시
+
+        self.health -= 1
+        self.statistics.on_damage_taken()  # 통계 기록
+        if self.health <= 0:
+            self.game_over = True
+
+    def add_missile_hit(self, is_enemy=False):
+        """
+        미사일 히트 카운트
+
+        Args:
+            is_enemy: 적을 파괴한 경우 True
+        """
+        self.skill_count += 1
+        self.missiles_hit += 1
+
+        # 통계 업데이트
+        self.statistics.on_missile_hit()
+        if is_enemy:
+            self.statistics.on_enemy_destroyed()
+        else:
+            self.statistics.on_stone_destroyed()
+
+        # 콤보 추가
+        self.combo_system.add_hit(self.current_frame)
+        self.statistics.on_combo_update(self.combo_system.get_combo_count())
+
+        # 콤보 배율 적용하여 점수 추가 (적은 2배 점수)
+        base_score = 2 if is_enemy else 1
+        multiplier = self.combo_system.get_multiplier()
+
+        # 점수 배율 파워업 적용
+        if self.powerup_manager.is_effect_active(PowerUpType.SCORE_MULTIPLIER):
+            multiplier *= 2.0
+
+        self.score += int(base_score * multiplier)
+
+        if is_enemy:
+            self.enemies_destroyed += 1
+
+        if self.skill_count >= SKILL_THRESHOLD:
+            self.skill_available = True
+
+    def use_skill(self):
+        """스킬 사용 (모든 돌과 적 제거)"""
+        if self.skill_available or self.skill_count >= SKILL_THRESHOLD:
+            # 스킬 사용 통계
+            self.statistics.on_skill_used()
+
+            # 모든 돌 제거 (콤보 유지하면서)
+            for stone in self.stones:
+                self.combo_system.add_hit(self.current_frame)
+                self.statistics.on_combo_update(self.combo_system.get_combo_count())
+                self.statistics.on_stone_destroyed()
+                multiplier = self.combo_system.get_multiplier()
+                self.score += int(1 * multiplier)
+
+            # 모든 적 제거 (적은 2배 점수)
+            for enemy in self.enemies:
+                self.combo_system.add_hit(self.current_frame)
+                self.statistics.on_combo_update(self.combo_system.get_combo_count())
+                self.statistics.on_enemy_destroyed()
+                multiplier = self.combo_system.get_multiplier()
+                self.score += int(2 * multiplier)
+                self.enemies_destroyed += 1
+
+            self.stones.clear()
+            self.enemies.clear()
+            self.enemy_projectiles.clear()  # 적 발사체도 제거
+            self.skill_available = False
+            self.skill_count = 0
+
+    def apply_powerup(self, powerup_type: PowerUpType):
+        """
+        파워업 효과 적용
+
+        Args:
+            powerup_type: 파워업 타입
+        """
+        # 아이템 수집 통계
+        self.statistics.on_item_collected()
+
+        if powerup_type == PowerUpType.HEALTH:
+            # 체력 회복 (최대치까지)
+            self.health = min(self.health + 1, INITIAL_HEALTH)
+        elif powerup_type == PowerUpType.SHIELD:
+            # 무적 효과
+            self.powerup_manager.activate_powerup(powerup_type)
+            self.is_invincible = True
+        elif powerup_type == PowerUpType.SPEED_BOOST:
+            # 속도 증가
+            self.powerup_manager.activate_powerup(powerup_type)
+            self.player_speed_multiplier = 1.5
+        elif powerup_type == PowerUpType.MULTI_SHOT:
+            # 3연발
+            self.powerup_manager.activate_powerup(powerup_type)
+        elif powerup_type == PowerUpType.SCORE_MULTIPLIER:
+            # 점수 2배
+            self.powerup_manager.activate_powerup(powerup_type)
+
+    def update_powerup_effects(self):
+        """파워업 효과 상태 업데이트"""
+        # 무적 효과 확인
+        if not self.powerup_manager.is_effect_active(PowerUpType.SHIELD):
+            self.is_invincible = False
+
+        # 속도 증가 효과 확인
+        if not self.powerup_manager.is_effect_active(PowerUpType.SPEED_BOOST):
+            self.player_speed_multiplier = 1.0
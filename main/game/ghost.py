@@ -0,0 +1,225 @@
+"""Ghost runs: a top leaderboard replay streamed from the server and played alongside live play"""
+import logging
+import threading
+from collections import deque
+from typing import Iterable, List, Optional
+import pygame
+from core.config import GHOST_ALPHA, GHOST_CANDIDATES, GHOST_CHUNK_BYTES, GHOST_MAX_CATCHUP, WHITE
+from game.replay import HEADER, ReplayStream
+from game.simulation import GameSimulation, Sprites
+
+logger = logging.getLogger(__name__)
+
+
+class GhostLoader:
+    """
+    랭킹 상위의 검증된 리플레이를 백그라운드 스레드에서 조금씩 받는 로더
+
+    첫 조각으로 헤더를 읽으면 stream/entry를 공개하고 (고스트를 바로 시작할 수 있음),
+    나머지는 GHOST_CHUNK_BYTES씩 Range 요청으로 받아 take_chunks()로 넘깁니다.
+    네트워크 오류나 받을 리플레이가 없으면 조용히 멈추고 stream은 None으로 남습니다.
+    """
+
+    def __init__(self, api_client, difficulty: Optional[str] = None):
+        """
+        GhostLoader 초기화 (받기 스레드 시작)
+
+        Args:
+            api_client: API 클라이언트 (get_top_scores, get_replay_range)
+            difficulty: 지금 게임의 난이도 이름 (같은 난이도 리플레이를 우선, 없으면 1위)
+        """
+        self.api_client = api_client
+        self.difficulty = difficulty
+        self.stream: Optional[ReplayStream] = None  # 헤더를 읽은 뒤 공개
+        self.entry: Optional[dict] = None  # 고스트의 랭킹 항목 (username, score, score_id)
+        self.done = False  # 다 받았거나 실패해서 스레드가 끝남
+        self._chunks = deque()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ghost-loader", daemon=True)
+        self._thread.start()
+
+    def take_chunks(self) -> List[bytes]:
+        """
+        지금까지 받은 조각 꺼내기 (받은 순서대로, 게임 스레드에서 호출)
+
+        Returns:
+            List[bytes]: 첫 조각 이후 받은 바이트 조각
+        """
+        chunks = []
+        while self._chunks:
+            chunks.append(self._chunks.popleft())
+        return chunks
+
+    def close(self, timeout: float = 0.5):
+        """
+        받기 중단 (요청 중이면 최대 timeout초만 기다림, 스레드는 데몬이라 남아도 종료를 막지 않음)
+
+        Args:
+            timeout: 최대 대기 시간(초)
+        """
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """받기 스레드"""
+        try:
+            self._load()
+        except Exception as e:
+            logger.warning(f"고스트 리플레이 받기 실패: {e}")
+        finally:
+            self.done = True
+
+    def _load(self):
+        """고를 리플레이를 정하고 끝까지 받기"""
+        success, entries, error = self.api_client.get_top_scores(GHOST_CANDIDATES, verified=True)
+        if not success:
+            logger.info(f"고스트 랭킹 조회 실패: {error}")
+            return
+
+        chosen = None
+        for entry in entries or []:
+            if self._stop.is_set():
+                return
+            if not entry.get("score_id"):
+                continue
+            opened = self._open(entry)
+            if opened is None:
+                continue
+            if chosen is None:
+                chosen = opened
+            if self.difficulty is None or opened[1].settings["difficulty"] == self.difficulty:
+                chosen = opened
+                break
+        if chosen is None:
+            return
+
+        entry, stream, offset, total = chosen
+        self.entry = entry
+        self.stream = stream
+        logger.info(f"고스트: {entry.get('username')} {entry.get('score')}점 ({total} 바이트)")
+
+        while offset < total and not self._stop.is_set():
+            success, data, error = self.api_client.get_replay_range(
+                entry["score_id"], offset, offset + GHOST_CHUNK_BYTES - 1)
+            if not success or not data["data"]:
+                logger.info(f"고스트 리플레이 받기 중단: {error}")
+                return
+            self._chunks.append(data["data"])
+            offset += len(data["data"])
+
+    def _open(self, entry: dict) -> Optional[tuple]:
+        """
+        리플레이 첫 조각을 받아 헤더 읽기
+
+        Args:
+            entry: 랭킹 항목
+
+        Returns:
+            Optional[tuple]: (항목, 스트림, 받은 바이트 수, 전체 크기), 받지 못했거나 리플레이가 아니면 None
+        """
+        first = max(GHOST_CHUNK_BYTES, HEADER.size)  # 첫 조각에는 헤더가 다 들어가도록
+        success, data, error = self.api_client.get_replay_range(entry["score_id"], 0, first - 1)
+        if not success:
+            logger.info(f"고스트 리플레이 {entry['score_id']} 받기 실패: {error}")
+            return None
+        stream = ReplayStream()
+        try:
+            stream.feed(data["data"])
+        except ValueError as e:
+            logger.info(f"고스트 리플레이 {entry['score_id']} 무시: {e}")
+            return None
+        if not stream.ready:
+            return None
+        return entry, stream, len(data["data"]), data["total"]
+
+
+class Ghost:
+    """
+    받은 리플레이를 자체 시뮬레이션으로 재생하는 반투명 기체
+
+    게임 루프가 한 프레임 진행할 때마다 advance()로 한 프레임씩 따라갑니다. 입력이 아직
+    도착하지 않았으면 기다렸다가, 도착하면 프레임당 GHOST_MAX_CATCHUP 프레임까지 진행해
+    따라잡습니다. 리플레이가 끝나거나 고스트의 게임이 끝나면 더 그리지 않습니다.
+    """
+
+    def __init__(self, sprites: Sprites, stream: ReplayStream, entry: Optional[dict] = None,
+                 font: Optional[pygame.font.Font] = None, start_frame: int = 0):
+        """
+        Ghost 초기화
+
+        Args:
+            sprites: 스프라이트 (충돌 판정이 같아야 하므로 실제 게임과 같은 이미지)
+            stream: 헤더를 읽은 리플레이 스트림
+            entry: 랭킹 항목 (이름/점수 표시용, 선택사항)
+            font: 이름표 폰트 (없으면 이름표 없이)
+            start_frame: 지금 게임의 프레임 (고스트가 이 프레임까지 따라잡음)
+        """
+        self.stream = stream
+        self.simulation = GameSimulation(sprites, stream.seed, stream.settings)
+        self.image = sprites.player.copy()
+        self.image.set_alpha(GHOST_ALPHA)
+        self.label = None
+        if font is not None and entry is not None:
+            self.label = font.render(f"{entry.get('username', '')} {entry.get('score', 0)}", True, WHITE)
+            self.label.set_alpha(GHOST_ALPHA * 2)
+        self.target_frame = start_frame  # 따라가야 할 프레임 (게임 루프의 프레임 수)
+        self.frames = 0  # 고스트가 진행한 프레임 수
+        self.finished = False
+
+    def feed(self, chunks: Iterable[bytes]):
+        """
+        받은 조각을 스트림에 추가
+
+        Args:
+            chunks: GhostLoader.take_chunks() 결과
+        """
+        for chunk in chunks:
+            self.stream.feed(chunk)
+
+    def advance(self) -> int:
+        """
+        게임 루프 한 프레임만큼 진행 (밀려 있으면 따라잡기)
+
+        Returns:
+            int: 이번에 진행한 프레임 수
+        """
+        if self.finished:
+            return 0
+        self.target_frame += 1
+        steps = 0
+        while self.frames < self.target_frame and steps < GHOST_MAX_CATCHUP:
+            try:
+                bits = self.stream.next_input()
+            except ValueError as e:
+                logger.warning(f"고스트 리플레이 손상: {e}")
+                self.finished = True
+                break
+            if bits is None:
+                self.finished = self.stream.ended
+                break
+            self.simulation.step(bits)
+            self.frames += 1
+            steps += 1
+            if self.simulation.state.game_over:
+                self.finished = True
+                break
+        return steps
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        고스트 기체와 이름표 그리기
+
+        Args:
+            screen: 그릴 화면
+
+        Returns:
+            Optional[pygame.Rect]: 그린 영역 (끝났으면 None)
+        """
+        if self.finished:
+            return None
+        rect = self.simulation.player.rect
+        drawn = screen.blit(self.image, rect)
+        if self.label is not None:
+            label_rect = self.label.get_rect(midbottom=(rect.centerx, rect.top - 2))
+            drawn = drawn.union(screen.blit(self.label, label_rect))
+        return drawn
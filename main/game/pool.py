@@ -0,0 +1,112 @@
+"""Free-list object pools for game entities"""
+import gc
+from typing import Callable, Dict, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+# 풀에 보관할 최대 객체 수 (급증 후 메모리를 계속 잡고 있지 않도록)
+DEFAULT_MAX_FREE = 256
+
+
+class ObjectPool(Generic[T]):
+    """
+    엔티티 오브젝트 풀
+
+    release()된 객체를 버리지 않고 보관했다가 acquire() 때 reset()으로 상태만 다시 설정해 재사용합니다.
+    풀링 대상 클래스는 생성자와 같은 인자를 받는 reset() 메서드를 가져야 합니다.
+    """
+
+    def __init__(self, create: Callable[..., T], max_free: int = DEFAULT_MAX_FREE):
+        """
+        ObjectPool 초기화
+
+        Args:
+            create: 풀이 비었을 때 새 객체를 만드는 함수 (보통 클래스 자체)
+            max_free: 보관할 최대 객체 수
+        """
+        self._create = create
+        self.max_free = max_free
+        self._free: List[T] = []
+
+        # 할당 통계
+        self.created = 0  # 새로 만든 객체 수
+        self.reused = 0  # 풀에서 꺼내 재사용한 횟수
+        self.released = 0  # 반환된 횟수
+        self.discarded = 0  # 풀이 가득 차 버린 횟수
+
+    def acquire(self, *args, **kwargs) -> T:
+        """
+        객체 가져오기 (풀에 있으면 재사용, 없으면 생성)
+
+        Args:
+            *args, **kwargs: 생성자/reset()에 넘길 인자
+
+        Returns:
+            T: 초기화된 객체
+        """
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+
+        self.created += 1
+        return self._create(*args, **kwargs)
+
+    def release(self, obj: T):
+        """
+        객체 반환
+
+        Args:
+            obj: 더 이상 쓰지 않는 객체
+        """
+        self.released += 1
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+        else:
+            self.discarded += 1
+
+    def release_all(self, objects: List[T]):
+        """
+        리스트의 객체를 모두 반환하고 리스트 비우기
+
+        Args:
+            objects: 반환할 객체 리스트 (비워짐)
+        """
+        for obj in objects:
+            self.release(obj)
+        objects.clear()
+
+    @property
+    def free_count(self) -> int:
+        """풀에 보관 중인 객체 수"""
+        return len(self._free)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        할당 통계
+
+        Returns:
+            Dict[str, int]: created, reused, released, discarded, free
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "free": len(self._free),
+        }
+
+
+def gc_pressure() -> Dict[str, int]:
+    """
+    GC 압력 지표 (세대별 대기 객체 수와 누적 수집 횟수)
+
+    Returns:
+        Dict[str, int]: gen0~2 대기 수, gen0~2 누적 수집 횟수
+    """
+    counts = gc.get_count()
+    stats = gc.get_stats()
+    pressure = {f"gen{generation}_pending": count for generation, count in enumerate(counts)}
+    pressure.update({f"gen{generation}_collections": stat["collections"] for generation, stat in enumerate(stats)})
+    return pressure
@@ -2,7 +2,10 @@
 import pygame
 import random
 from enum import Enum
+from typing import Dict, Optional
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.render_batch import blit_layer
+from game.entity_list import EntityList
 
 
 class PowerUpType(Enum):
@@ -49,7 +52,11 @@ class PowerUp:
         PowerUpType.SCORE_MULTIPLIER: 300,  # 5초
     }
 
-    def __init__(self, powerup_type: PowerUpType, x: float = None, y: float = -50):
+    # 아이콘 크기 (지름, 픽셀)
+    SIZE = 30
+
+    def __init__(self, powerup_type: PowerUpType, x: float = None, y: float = -50,
+                 image: pygame.Surface = None, rng=random):
         """
         PowerUp 초기화
 
@@ -57,42 +64,41 @@ class PowerUp:
             powerup_type: 파워업 타입
             x: 시작 x 좌표 (None이면 랜덤)
             y: 시작 y 좌표
+            image: 미리 그린 아이콘 (None이면 라벨 없는 아이콘을 새로 그림)
+            rng: x 좌표를 뽑을 난수 생성기 (기본값: 전역 random 모듈)
         """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(powerup_type, x, y, image, rng)
+
+    def reset(self, powerup_type: PowerUpType, x: float = None, y: float = -50,
+              image: pygame.Surface = None, rng=random):
+        """파워업 상태 재설정 (오브젝트 풀 재사용용, 인자는 생성자와 같음)"""
         self.type = powerup_type
         self.speed = 1.5  # 하강 속도
-        self.size = 30
+        self.size = self.SIZE
+        self.image = image if image is not None else render_icon(powerup_type)
 
         # 위치 설정
         if x is None:
-            x = random.randint(self.size, SCREEN_WIDTH - self.size)
+            x = rng.randint(self.size, SCREEN_WIDTH - self.size)
 
-        self.rect = pygame.Rect(x, y, self.size, self.size)
+        self.rect.update(x, y, self.size, self.size)
 
     def update(self):
         """파워업 업데이트 (하강)"""
         self.rect.y += self.speed
 
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font = None):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
-        파워업 그리기
+        파워업 그리기 (미리 그린 아이콘 blit)
 
         Args:
             screen: pygame 화면
-            font: 텍스트 렌더링용 폰트 (선택사항)
-        """
-        # 파워업 원 그리기
-        color = self.COLORS.get(self.type, (255, 255, 255))
-        pygame.draw.circle(screen, color, self.rect.center, self.size // 2)
-
-        # 테두리
-        pygame.draw.circle(screen, (255, 255, 255), self.rect.center, self.size // 2, 2)
 
-        # 아이콘/텍스트 (폰트가 있으면)
-        if font:
-            label = self.LABELS.get(self.type, "?")
-            text_surface = font.render(label, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=self.rect.center)
-            screen.blit(text_surface, text_rect)
+        Returns:
+            pygame.Rect: 그린 영역
+        """
+        return screen.blit(self.image, self.rect)
 
     def is_off_screen(self) -> bool:
         """
@@ -113,6 +119,33 @@ class PowerUp:
         return self.DURATIONS.get(self.type, 0)
 
 
+def render_icon(powerup_type: PowerUpType, font: pygame.font.Font = None,
+                size: int = PowerUp.SIZE) -> pygame.Surface:
+    """
+    파워업 아이콘 그리기 (색상 원 + 흰 테두리 + 라벨)
+
+    Args:
+        powerup_type: 파워업 타입
+        font: 라벨 폰트 (None이면 라벨 생략)
+        size: 아이콘 지름
+
+    Returns:
+        pygame.Surface: SRCALPHA 아이콘 서피스
+    """
+    icon = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = (size // 2, size // 2)
+    color = PowerUp.COLORS.get(powerup_type, (255, 255, 255))
+
+    pygame.draw.circle(icon, color, center, size // 2)
+    pygame.draw.circle(icon, (255, 255, 255), center, size // 2, 2)
+
+    if font:
+        label = font.render(PowerUp.LABELS.get(powerup_type, "?"), True, (255, 255, 255))
+        icon.blit(label, label.get_rect(center=center))
+
+    return icon
+
+
 class PowerUpManager:
     """
     파워업 관리자
@@ -120,9 +153,15 @@ class PowerUpManager:
     파워업 생성, 활성 효과 관리, 타이머 추적 등을 담당합니다.
     """
 
-    def __init__(self):
-        """PowerUpManager 초기화"""
-        self.active_powerups = []  # 화면의 파워업 아이템 리스트
+    def __init__(self, rng=random):
+        """
+        PowerUpManager 초기화
+
+        Args:
+            rng: 파워업 종류/위치를 뽑을 난수 생성기 (기본값: 전역 random 모듈)
+        """
+        self.rng = rng
+        self.active_powerups = EntityList(PowerUp)  # 화면의 파워업 아이템 (사라지면 풀로 반환)
         self.active_effects = {}  # 활성 효과 {PowerUpType: 남은_프레임}
 
         # 생성 확률 (각 타입의 상대적 확률)
@@ -134,6 +173,26 @@ class PowerUpManager:
             PowerUpType.SCORE_MULTIPLIER: 15,
         }
 
+        # 미리 그린 아이콘 (bake_icons에서 생성, 없으면 처음 쓸 때 생성)
+        self.icons: Dict[PowerUpType, pygame.Surface] = {}
+        self.effect_icons: Dict[PowerUpType, pygame.Surface] = {}
+
+        # 남은 초 -> 타이머 라벨 (초 값이 바뀔 때만 새로 렌더링)
+        self._timer_labels: Dict[int, pygame.Surface] = {}
+
+    def bake_icons(self, font: Optional[pygame.font.Font], effect_font: Optional[pygame.font.Font] = None):
+        """
+        파워업 아이템/활성 효과 아이콘을 타입별로 미리 그리기 (게임 시작 시 한 번)
+
+        Args:
+            font: 아이템 라벨 폰트
+            effect_font: 활성 효과 UI 라벨 폰트 (기본값: font)
+        """
+        effect_font = effect_font or font
+        self.icons = {powerup_type: render_icon(powerup_type, font) for powerup_type in PowerUpType}
+        self.effect_icons = {powerup_type: render_icon(powerup_type, effect_font) for powerup_type in PowerUpType}
+        self._timer_labels.clear()
+
     def spawn_random_powerup(self) -> PowerUp:
         """
         랜덤 파워업 생성
@@ -143,19 +202,36 @@ class PowerUpManager:
         """
         types = list(self.spawn_weights.keys())
         weights = list(self.spawn_weights.values())
-        powerup_type = random.choices(types, weights=weights)[0]
+        powerup_type = self.rng.choices(types, weights=weights)[0]
 
-        powerup = PowerUp(powerup_type)
-        self.active_powerups.append(powerup)
-        return powerup
+        return self.active_powerups.spawn(powerup_type, image=self.icons.get(powerup_type), rng=self.rng)
 
     def update_powerups(self):
         """모든 파워업 업데이트"""
         for powerup in self.active_powerups:
             powerup.update()
 
-        # 화면 밖 파워업 제거
-        self.active_powerups = [p for p in self.active_powerups if not p.is_off_screen()]
+            # 화면 밖 파워업 제거 표시
+            if powerup.is_off_screen():
+                self.active_powerups.kill(powerup.handle)
+
+        # 제거 표시된 파워업 정리 (swap-remove, 풀로 반환)
+        self.active_powerups.compact()
+
+    def remove_powerup(self, handle: int) -> Optional[PowerUp]:
+        """
+        파워업 아이템 제거 표시 (획득 시, 프레임 끝 정리 때 풀로 반환)
+
+        Args:
+            handle: 파워업 핸들
+
+        Returns:
+            Optional[PowerUp]: 제거된 파워업 (이미 제거된 핸들이면 None)
+        """
+        powerup = self.active_powerups.get(handle)
+        if not self.active_powerups.kill(handle):
+            return None
+        return powerup
 
     def update_effects(self):
         """활성 효과 타이머 업데이트"""
@@ -215,16 +291,34 @@ class PowerUpManager:
         self.active_powerups.clear()
         self.active_effects.clear()
 
-    def draw_powerups(self, screen: pygame.Surface, font: pygame.font.Font = None):
+    def draw_powerups(self, screen: pygame.Surface) -> list:
         """
-        모든 파워업 그리기
+        모든 파워업 그리기 (아이콘 레이어 배치)
 
         Args:
             screen: pygame 화면
-            font: 텍스트 렌더링용 폰트
+
+        Returns:
+            list: 그린 영역 목록
         """
-        for powerup in self.active_powerups:
-            powerup.draw(screen, font)
+        return blit_layer(screen, [(powerup.image, powerup.rect) for powerup in self.active_powerups])
+
+    def _timer_label(self, font: pygame.font.Font, remaining_seconds: int) -> pygame.Surface:
+        """
+        남은 시간 라벨 (초 값별로 한 번만 렌더링)
+
+        Args:
+            font: 폰트
+            remaining_seconds: 남은 시간 (초)
+
+        Returns:
+            pygame.Surface: "Ns" 텍스트 서피스
+        """
+        label = self._timer_labels.get(remaining_seconds)
+        if label is None:
+            label = font.render(f"{remaining_seconds}s", True, (255, 255, 255))
+            self._timer_labels[remaining_seconds] = label
+        return label
 
     def draw_active_effects_ui(self, screen: pygame.Surface, font: pygame.font.Font, x: int = 10, y: int = 100):
         """
@@ -235,35 +329,33 @@ class PowerUpManager:
             font: 폰트
             x: 시작 x 좌표
             y: 시작 y 좌표
+
+        Returns:
+            list: 그린 영역 목록
         """
+        drawn = []
         offset_y = 0
 
         for effect_type, remaining_frames in self.active_effects.items():
-            # 아이콘
-            label = PowerUp.LABELS.get(effect_type, "?")
-            color = PowerUp.COLORS.get(effect_type, (255, 255, 255))
-
-            # 배경 원
-            pygame.draw.circle(screen, color, (x + 15, y + offset_y + 15), 15)
-            pygame.draw.circle(screen, (255, 255, 255), (x + 15, y + offset_y + 15), 15, 2)
-
-            # 아이콘 텍스트
-            icon_text = font.render(label, True, (255, 255, 255))
-            icon_rect = icon_text.get_rect(center=(x + 15, y + offset_y + 15))
-            screen.blit(icon_text, icon_rect)
+            # 아이콘 (미리 그린 것이 없으면 한 번 그려서 보관)
+            icon = self.effect_icons.get(effect_type)
+            if icon is None:
+                icon = self.effect_icons[effect_type] = render_icon(effect_type, font)
+            drawn.append(screen.blit(icon, (x, y + offset_y)))
 
             # 남은 시간 (초)
             remaining_seconds = remaining_frames // 60
-            time_text = font.render(f"{remaining_seconds}s", True, (255, 255, 255))
-            screen.blit(time_text, (x + 35, y + offset_y + 5))
+            drawn.append(screen.blit(self._timer_label(font, remaining_seconds), (x + 35, y + offset_y + 5)))
 
             offset_y += 35
 
-    def get_active_powerups(self) -> list:
+        return drawn
+
+    def get_active_powerups(self) -> EntityList:
         """
-        활성 파워업 아이템 리스트 반환
+        활성 파워업 아이템 컨테이너 반환
 
         Returns:
-            list: 파워업 리스트
+            EntityList: 파워업 컨테이너 (순회 시 살아 있는 파워업만)
         """
         return self.active_powerups
@@ -0,0 +1,26 @@
+"""Batched entity layer rendering"""
+import pygame
+from typing import List, Sequence, Tuple
+
+# (이미지, 위치 사각형) - Surface.blits에 그대로 넘기는 항목
+BlitItem = Tuple[pygame.Surface, pygame.Rect]
+
+
+def blit_layer(screen: pygame.Surface, layer: Sequence[BlitItem]) -> List[pygame.Rect]:
+    """
+    엔티티 레이어를 Surface.blits 한 번으로 그리기
+
+    엔티티마다 draw()를 호출하는 대신 업데이트 루프에서 (image, rect)를 모아 한 번에 넘깁니다.
+    blits가 만드는 Rect 목록은 쓰지 않고(doreturn=False) 엔티티 rect를 그대로 그린 영역으로 돌려줍니다.
+
+    Args:
+        screen: pygame 화면
+        layer: (이미지, 위치 사각형) 목록
+
+    Returns:
+        List[pygame.Rect]: 그린 영역 목록 (엔티티 rect 참조 - 보관하려면 복사)
+    """
+    if not layer:
+        return []
+    screen.blits(layer, doreturn=False)
+    return [rect for _, rect in layer]
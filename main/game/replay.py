@@ -0,0 +1,557 @@
+"""Compact binary replay files: RLE input stream in deflate segments with a keyframe index"""
+import io
+import logging
+import os
+import struct
+import zlib
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+from core.config import CLIENT_VERSION, REPLAY_KEYFRAME_INTERVAL
+from game.simulation import INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SGRP"
+EXTENSION = ".sgr"
+FORMAT_VERSION = 1
+
+# 헤더: 매직, 포맷 버전, 시드, 적 속도/생성 확률/회피 능력, 난이도 이름, 클라이언트 버전,
+#       최종 점수, 프레임 수, 키프레임 색인 위치 (마지막 셋은 close() 때 채움)
+HEADER = struct.Struct("<4sBIddd12s16siII")
+UNFINISHED = -1  # close()하지 않은 파일의 최종 점수 자리
+
+# 키프레임 색인 항목: (프레임, 세그먼트 시작 위치)
+INDEX_ENTRY = struct.Struct("<II")
+
+# 레코드 첫 바이트
+INPUT_MASK = 0x3F  # 입력 레코드 하위 6비트: 첫 프레임 입력 비트
+RUN_REPEAT = 0x40  # 이 비트가 있으면 varint(n - 1)가 뒤따르고, 다음 n 프레임은 누르고 있는 키만 이어짐
+HELD_MASK = INPUT_UP | INPUT_DOWN | INPUT_LEFT | INPUT_RIGHT  # 누르고 있는 동안 이어지는 입력
+RECORD_KEYFRAME = 0x80  # varint(프레임), varint(스냅샷 길이), 스냅샷
+RECORD_END = 0x81
+
+DEFLATE_WBITS = -15  # 헤더 없는 raw deflate (세그먼트 경계에서 바로 풀 수 있음)
+INFLATE_STEP = 4096  # ReplayStream이 한 번에 풀어내는 최대 바이트 (프레임당 비용을 고르게)
+
+
+def _varint(value: int) -> bytes:
+    """LEB128 부호 없는 가변 길이 정수"""
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """(값, 다음 위치)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayWriter:
+    """
+    게임 중 리플레이를 파일로 바로 쓰는 기록기 (InputRecorder와 같은 record() 인터페이스)
+
+    방향키가 바뀌지 않는 프레임은 한 레코드로 묶고(RLE), 한 프레임만 켜지는 발사/스킬은
+    묶음의 첫 프레임에 함께 적어 연사 중에도 발사마다 레코드 하나로 끝납니다.
+    레코드 스트림은 deflate로 압축해 나오는 대로 파일에 쓰므로 메모리에는 지금 묶고 있는
+    레코드 하나만 남습니다.
+    keyframe_interval 프레임마다 압축기를 full flush해 새 세그먼트를 시작하고 그 앞에
+    키프레임 레코드(프레임 번호 + snapshot()이 돌려준 상태)를 넣으므로, 읽을 때는 색인으로
+    원하는 세그먼트부터 바로 풀 수 있습니다.
+    """
+
+    def __init__(self, file: Union[str, BinaryIO], seed: int, settings: dict,
+                 client_version: str = CLIENT_VERSION,
+                 keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL,
+                 snapshot: Optional[Callable[[], bytes]] = None):
+        """
+        ReplayWriter 초기화 (헤더 자리를 쓰고 0번 키프레임 기록)
+
+        Args:
+            file: 파일 경로 또는 쓰기/탐색 가능한 바이너리 파일 객체
+            seed: 게임 난수 시드
+            settings: 난이도 값 (difficulty_settings() 결과)
+            client_version: 클라이언트 버전
+            keyframe_interval: 키프레임 간격 (프레임)
+            snapshot: 키프레임에 넣을 게임 상태를 돌려주는 함수 (선택사항, 없으면 빈 스냅샷)
+        """
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        if self._owns_file:
+            os.makedirs(os.path.dirname(os.path.abspath(file)), exist_ok=True)
+        self.file = open(file, "wb") if self._owns_file else file
+        self.path = os.fspath(file) if self._owns_file else None
+        self.seed = seed
+        self.settings = dict(settings)
+        self.client_version = client_version
+        self.keyframe_interval = keyframe_interval
+        self.snapshot = snapshot
+        self.frame_count = 0
+        self.closed = False
+
+        self._start = self.file.tell()
+        self._compressor = zlib.compressobj(9, zlib.DEFLATED, DEFLATE_WBITS)
+        self._run_input: Optional[int] = None  # 묶고 있는 레코드의 첫 프레임 입력
+        self._run_length = 0  # 첫 프레임 뒤로 이어진 프레임 수
+        self._index: List[Tuple[int, int]] = []
+
+        self._write_header(UNFINISHED, 0)
+        self._keyframe()
+
+    def record(self, inputs: int):
+        """
+        한 프레임 입력 추가 (step() 처음에 호출되므로 키프레임은 이 프레임을 진행하기 전 상태)
+
+        Args:
+            inputs: 입력 비트
+        """
+        if self.frame_count and self.frame_count % self.keyframe_interval == 0:
+            self._keyframe()
+
+        if self._run_input is not None and inputs == self._run_input & HELD_MASK:
+            self._run_length += 1
+        else:
+            self._flush_run()
+            self._run_input = inputs
+        self.frame_count += 1
+
+    def close(self, final_score: int):
+        """
+        스트림을 마치고 색인과 헤더(최종 점수, 프레임 수)를 채움
+
+        Args:
+            final_score: 최종 점수
+        """
+        if self.closed:
+            return
+        self._flush_run()
+        self.file.write(self._compressor.compress(bytes([RECORD_END])) + self._compressor.flush())
+
+        index_offset = self.file.tell() - self._start
+        self.file.write(struct.pack("<I", len(self._index)))
+        self.file.write(b"".join(INDEX_ENTRY.pack(frame, offset) for frame, offset in self._index))
+        end = self.file.tell()
+
+        self.file.seek(self._start)
+        self._write_header(final_score, index_offset)
+        self.file.seek(end)
+        self.closed = True
+        if self._owns_file:
+            self.file.close()
+
+    def __len__(self) -> int:
+        """기록한 프레임 수"""
+        return self.frame_count
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.closed:
+            self.close(UNFINISHED)
+
+    def _write_header(self, final_score: int, index_offset: int):
+        """헤더 쓰기 (처음에는 빈 자리, close() 때 다시)"""
+        settings = self.settings
+        self.file.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.seed,
+            settings["enemy_speed"], settings["enemy_spawn_chance"], settings["enemy_evasion_skill"],
+            settings.get("difficulty", "").encode("utf-8"), self.client_version.encode("utf-8"),
+            final_score, self.frame_count, index_offset
+        ))
+
+    def _emit(self, record: bytes):
+        """레코드를 압축기에 넣고 나온 만큼 파일에 쓰기"""
+        compressed = self._compressor.compress(record)
+        if compressed:
+            self.file.write(compressed)
+
+    def _flush_run(self):
+        """묶고 있던 입력 레코드 내보내기"""
+        if self._run_input is None:
+            return
+        if self._run_length:
+            self._emit(bytes([self._run_input | RUN_REPEAT]) + _varint(self._run_length - 1))
+        else:
+            self._emit(bytes([self._run_input]))
+        self._run_input = None
+        self._run_length = 0
+
+    def _keyframe(self):
+        """새 세그먼트를 시작하고 키프레임 레코드 기록"""
+        self._flush_run()
+        if self._index:
+            # full flush: 바이트 정렬 + 압축 사전 초기화 -> 이 위치부터 따로 풀 수 있음
+            self.file.write(self._compressor.flush(zlib.Z_FULL_FLUSH))
+        self._index.append((self.frame_count, self.file.tell() - self._start))
+
+        state = self.snapshot() if self.snapshot else b""
+        self._emit(bytes([RECORD_KEYFRAME]) + _varint(self.frame_count) + _varint(len(state)) + state)
+
+
+class ReplayReader:
+    """
+    리플레이 파일 읽기 (InputRecorder처럼 seed, settings, 입력 순회 제공)
+
+    파일 전체(수 KB)를 메모리에 두고 필요한 세그먼트만 풉니다.
+    close()하지 못한 파일(게임 중 종료)은 색인 없이 처음부터 끝까지 읽습니다.
+    """
+
+    def __init__(self, data: bytes, max_frames: Optional[int] = None):
+        """
+        ReplayReader 초기화
+
+        Args:
+            data: 리플레이 파일 내용
+            max_frames: 풀어낼 최대 프레임 수 (믿을 수 없는 파일용, 넘으면 ValueError)
+
+        Raises:
+            ValueError: 리플레이 파일이 아니거나 지원하지 않는 포맷 버전일 때
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("리플레이 헤더가 잘렸습니다")
+        (magic, version, self.seed, enemy_speed, spawn_chance, evasion_skill, difficulty,
+         client_version, final_score, frame_count, index_offset) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("리플레이 파일이 아닙니다")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 포맷 버전: {version}")
+
+        self.data = data
+        self.max_frames = max_frames
+        self.settings = {
+            "difficulty": difficulty.rstrip(b"\0").decode("utf-8"),
+            "enemy_speed": enemy_speed,
+            "enemy_spawn_chance": spawn_chance,
+            "enemy_evasion_skill": evasion_skill,
+        }
+        self.client_version = client_version.rstrip(b"\0").decode("utf-8")
+        self.finished = index_offset != 0
+        self.final_score = None if final_score == UNFINISHED else final_score
+
+        if self.finished:
+            count = struct.unpack_from("<I", data, index_offset)[0]
+            self.keyframes = [
+                INDEX_ENTRY.unpack_from(data, index_offset + 4 + i * INDEX_ENTRY.size) for i in range(count)
+            ]
+            self._stream_end = index_offset
+            self.frame_count = frame_count
+        else:
+            self.keyframes = [(0, HEADER.size)]
+            self._stream_end = len(data)
+            self.frame_count = None
+
+        self._inputs: Optional[bytearray] = None
+
+    @classmethod
+    def open(cls, path: str) -> "ReplayReader":
+        """
+        파일 경로로 열기
+
+        Args:
+            path: 리플레이 파일 경로
+
+        Returns:
+            ReplayReader: 리더
+        """
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def _segment_end(self, position: int) -> int:
+        """색인의 position번째 세그먼트 끝 위치"""
+        if position + 1 < len(self.keyframes):
+            return self.keyframes[position + 1][1]
+        return self._stream_end
+
+    def _decode(self, position: int, end: int) -> Tuple[int, bytes, bytearray]:
+        """
+        색인의 position번째 세그먼트 시작부터 end 위치까지 풀기
+
+        Returns:
+            Tuple: (첫 키프레임 프레임, 그 스냅샷, 키프레임부터의 입력)
+        """
+        raw = zlib.decompressobj(DEFLATE_WBITS).decompress(self.data[self.keyframes[position][1]:end])
+
+        inputs = bytearray()
+        keyframe = None
+        pos, size = 0, len(raw)
+        try:
+            while pos < size:
+                byte = raw[pos]
+                pos += 1
+                if byte < RECORD_KEYFRAME:
+                    inputs.append(byte & INPUT_MASK)
+                    if byte & RUN_REPEAT:
+                        count, pos = _read_varint(raw, pos)
+                        if self.max_frames is not None and len(inputs) + count >= self.max_frames:
+                            raise ValueError(f"리플레이가 최대 프레임 수({self.max_frames})를 넘습니다")
+                        inputs += bytes((byte & HELD_MASK,)) * (count + 1)
+                elif byte == RECORD_KEYFRAME:
+                    frame, pos = _read_varint(raw, pos)
+                    length, pos = _read_varint(raw, pos)
+                    if keyframe is None:
+                        keyframe = (frame, bytes(raw[pos:pos + length]))
+                    pos += length
+                elif byte == RECORD_END:
+                    break
+                else:
+                    raise ValueError(f"알 수 없는 리플레이 레코드: {byte:#x}")
+        except IndexError:
+            pass  # 게임 중 종료된 파일: 잘린 마지막 레코드는 버림
+
+        keyframe_frame, snapshot = keyframe or (0, b"")
+        return keyframe_frame, snapshot, inputs
+
+    def inputs(self) -> bytearray:
+        """
+        전체 프레임 입력 (처음 한 번만 풀고 보관)
+
+        Returns:
+            bytearray: 프레임별 입력 비트
+        """
+        if self._inputs is None:
+            self._inputs = self._decode(0, self._stream_end)[2]
+            if self.frame_count is None:
+                self.frame_count = len(self._inputs)
+        return self._inputs
+
+    def seek(self, frame: int) -> Tuple[int, bytes, bytearray]:
+        """
+        frame 이하의 가장 가까운 키프레임 세그먼트만 풀기
+
+        키프레임 스냅샷으로 상태를 복원한 뒤 돌려준 입력을 진행하면 frame 시작 상태가 됩니다.
+
+        Args:
+            frame: 목표 프레임
+
+        Returns:
+            Tuple[int, bytes, bytearray]: (키프레임 프레임, 스냅샷, 키프레임부터 frame 전까지의 입력)
+        """
+        position = 0
+        for index, (keyframe_frame, _) in enumerate(self.keyframes):
+            if keyframe_frame > frame:
+                break
+            position = index
+
+        keyframe_frame, snapshot, inputs = self._decode(position, self._segment_end(position))
+        del inputs[frame - keyframe_frame:]
+        return keyframe_frame, snapshot, inputs
+
+    def __iter__(self) -> Iterator[int]:
+        """프레임 순서대로 입력 비트 순회"""
+        return iter(self.inputs())
+
+    def __len__(self) -> int:
+        """프레임 수"""
+        return len(self.inputs()) if self.frame_count is None else self.frame_count
+
+
+def strip_snapshots(data: bytes) -> bytes:
+    """
+    키프레임 스냅샷을 뺀 같은 포맷의 리플레이 (업로드/고스트 스트리밍용)
+
+    스냅샷은 대부분이 압축되지 않는 난수 상태(약 2.5KB)라 30분 게임이 입력만으로는 십수 KB인데
+    스냅샷을 담으면 200KB 가까이 됩니다. 서버 검증과 고스트 재생은 처음부터 입력만 진행하므로
+    키프레임 위치(색인)는 그대로 두고 스냅샷만 비웁니다. 로컬 파일은 빠른 탐색용으로 그대로 둡니다.
+
+    Args:
+        data: 리플레이 파일 내용
+
+    Returns:
+        bytes: 스냅샷이 빈 리플레이
+
+    Raises:
+        ValueError: 리플레이 파일이 아니거나 지원하지 않는 포맷 버전일 때
+    """
+    reader = ReplayReader(data)
+    interval = reader.keyframes[1][0] if len(reader.keyframes) > 1 else REPLAY_KEYFRAME_INTERVAL
+    out = io.BytesIO()
+    writer = ReplayWriter(out, reader.seed, reader.settings, reader.client_version, interval)
+    for bits in reader:
+        writer.record(bits)
+    writer.close(UNFINISHED if reader.final_score is None else reader.final_score)
+    return out.getvalue()
+
+
+def prune_replays(directory: str, keep: int) -> int:
+    """
+    오래된 리플레이 파일 정리 (수정 시각이 최근인 keep개만 남김)
+
+    Args:
+        directory: 리플레이 디렉토리
+        keep: 남길 파일 수
+
+    Returns:
+        int: 지운 파일 수
+    """
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(EXTENSION)]
+    except FileNotFoundError:
+        return 0
+
+    def modified(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    paths = sorted((os.path.join(directory, name) for name in names), key=modified, reverse=True)
+    removed = 0
+    for path in paths[max(keep, 0):]:
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError as e:
+            logger.warning(f"오래된 리플레이 삭제 실패: {e}")
+    return removed
+
+
+class ReplayStream:
+    """
+    받는 만큼씩 푸는 리플레이 (고스트 재생용, 파일 전체를 기다리지 않음)
+
+    feed()로 받은 바이트를 넣고 next_input()으로 한 프레임씩 꺼냅니다. 압축은 입력이
+    모자랄 때만 INFLATE_STEP 바이트씩 풀고, 묶음(RLE) 레코드는 펼치지 않고 남은 프레임 수만
+    세므로 프레임당 비용이 파일 크기와 상관없이 일정합니다. 키프레임 스냅샷은 건너뜁니다.
+    """
+
+    def __init__(self):
+        """ReplayStream 초기화 (헤더를 받기 전에는 seed/settings가 None)"""
+        self.seed: Optional[int] = None
+        self.settings: Optional[dict] = None
+        self.client_version: Optional[str] = None
+        self.final_score: Optional[int] = None
+        self.frame_count: Optional[int] = None
+        self.received = 0  # 받은 바이트 수
+        self.frames_read = 0  # next_input()으로 꺼낸 프레임 수
+        self.ended = False  # 끝 레코드까지 읽음
+
+        self._header = bytearray()
+        self._compressed = bytearray()  # 아직 압축기에 넣지 않은 바이트
+        self._decompressor = zlib.decompressobj(DEFLATE_WBITS)
+        self._raw = bytearray()  # 풀었지만 아직 읽지 않은 레코드
+        self._pos = 0
+        self._run_bits = 0  # 묶음 레코드에서 이어지는 입력
+        self._run_left = 0  # 묶음 레코드에 남은 프레임 수
+
+    @property
+    def ready(self) -> bool:
+        """헤더를 읽었는지 여부"""
+        return self.seed is not None
+
+    def feed(self, chunk: bytes):
+        """
+        받은 바이트 추가 (파일 앞에서부터 순서대로, 풀기는 next_input()에서)
+
+        Args:
+            chunk: 이어서 받은 바이트
+
+        Raises:
+            ValueError: 리플레이 파일이 아니거나 지원하지 않는 포맷 버전일 때
+        """
+        self.received += len(chunk)
+        if self.ready:
+            self._compressed += chunk
+            return
+
+        self._header += chunk
+        if len(self._header) < HEADER.size:
+            return
+        (magic, version, seed, enemy_speed, spawn_chance, evasion_skill, difficulty,
+         client_version, final_score, frame_count, _) = HEADER.unpack_from(self._header)
+        if magic != MAGIC:
+            raise ValueError("리플레이 파일이 아닙니다")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 리플레이 포맷 버전: {version}")
+
+        self.seed = seed
+        self.settings = {
+            "difficulty": difficulty.rstrip(b"\0").decode("utf-8"),
+            "enemy_speed": enemy_speed,
+            "enemy_spawn_chance": spawn_chance,
+            "enemy_evasion_skill": evasion_skill,
+        }
+        self.client_version = client_version.rstrip(b"\0").decode("utf-8")
+        self.final_score = None if final_score == UNFINISHED else final_score
+        self.frame_count = frame_count if final_score != UNFINISHED else None
+        self._compressed += self._header[HEADER.size:]
+        self._header = bytearray()
+
+    def next_input(self) -> Optional[int]:
+        """
+        다음 프레임 입력
+
+        Returns:
+            Optional[int]: 입력 비트 (아직 받지 못했거나 끝났으면 None - ended로 구분)
+
+        Raises:
+            ValueError: 알 수 없는 레코드가 있을 때
+        """
+        if self._run_left:
+            self._run_left -= 1
+            self.frames_read += 1
+            return self._run_bits
+
+        while not self.ended:
+            record = self._read_record()
+            if record is None:
+                if not self._inflate():
+                    return None
+            elif record >= 0:
+                self.frames_read += 1
+                return record
+        return None
+
+    def _read_record(self) -> Optional[int]:
+        """
+        레코드 하나 읽기
+
+        Returns:
+            Optional[int]: 입력 비트, 키프레임/끝 레코드면 -1, 레코드가 아직 다 풀리지 않았으면 None
+        """
+        raw, pos = self._raw, self._pos
+        try:
+            byte = raw[pos]
+            pos += 1
+            if byte < RECORD_KEYFRAME:
+                if byte & RUN_REPEAT:
+                    count, pos = _read_varint(raw, pos)
+                    self._run_bits = byte & HELD_MASK
+                    self._run_left = count + 1
+                self._pos = pos
+                return byte & INPUT_MASK
+            if byte == RECORD_KEYFRAME:
+                _, pos = _read_varint(raw, pos)
+                length, pos = _read_varint(raw, pos)
+                if pos + length > len(raw):
+                    return None
+                self._pos = pos + length
+                return -1
+            if byte == RECORD_END:
+                self._pos = pos
+                self.ended = True
+                return -1
+        except IndexError:
+            return None
+        raise ValueError(f"알 수 없는 리플레이 레코드: {byte:#x}")
+
+    def _inflate(self) -> bool:
+        """받아 둔 압축 바이트를 최대 INFLATE_STEP만큼 더 풀기 (더 푼 것이 있으면 True)"""
+        if self._decompressor.eof:
+            return False
+        out = self._decompressor.decompress(bytes(self._compressed), INFLATE_STEP)
+        self._compressed = bytearray(self._decompressor.unconsumed_tail)
+        if self._decompressor.eof:
+            self._compressed.clear()  # 압축 스트림 뒤는 키프레임 색인
+
+        del self._raw[:self._pos]
+        self._pos = 0
+        self._raw += out
+        return bool(out)
@@ -0,0 +1,526 @@
+"""Headless fixed-step game simulation with per-frame input recording"""
+from typing import Iterable, List, Optional, Tuple
+import pygame
+from core.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED,
+    STONE_MAX_SIZE, STONE_SPAWN_INTERVAL_MIN, MISSILE_WIDTH, MISSILE_HEIGHT,
+    ENEMY_WIDTH, ENEMY_HEIGHT, Resources
+)
+from game.collision import CollisionDetector
+from game.enemy_batch import EnemyBatchUpdater, StateChange
+from game.entities import Player
+from game.game_state import GameState
+from game.powerup import PowerUpType
+from game.snapshot import read_header, restore_snapshot, take_snapshot
+
+# 프레임 입력 비트 (한 프레임 입력이 한 바이트에 들어감)
+INPUT_UP = 1 << 0
+INPUT_DOWN = 1 << 1
+INPUT_LEFT = 1 << 2
+INPUT_RIGHT = 1 << 3
+INPUT_FIRE = 1 << 4  # 이번 프레임에 SPACE를 누름
+INPUT_SKILL = 1 << 5  # 이번 프레임에 F를 누름
+
+# 누르고 있는 동안 적용되는 키
+HELD_KEYS = (
+    (pygame.K_UP, INPUT_UP),
+    (pygame.K_DOWN, INPUT_DOWN),
+    (pygame.K_LEFT, INPUT_LEFT),
+    (pygame.K_RIGHT, INPUT_RIGHT),
+)
+
+
+def read_input(events: Iterable, keys) -> int:
+    """
+    이번 프레임의 pygame 입력을 입력 비트로 변환
+
+    한 프레임에 SPACE/F를 여러 번 눌러도 한 번으로 처리합니다.
+
+    Args:
+        events: 이번 프레임 이벤트 목록 (pygame.event.get())
+        keys: 키 상태 (pygame.key.get_pressed())
+
+    Returns:
+        int: 입력 비트 (INPUT_* 조합)
+    """
+    inputs = 0
+    for key, bit in HELD_KEYS:
+        if keys[key]:
+            inputs |= bit
+
+    for event in events:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                inputs |= INPUT_FIRE
+            elif event.key == pygame.K_f or event.unicode == "ㄹ":
+                inputs |= INPUT_SKILL
+
+    return inputs
+
+
+def difficulty_settings(difficulty_manager=None) -> dict:
+    """
+    게임 진행에 쓰는 난이도 값 (리플레이에 함께 기록)
+
+    Args:
+        difficulty_manager: 난이도 관리자 (없으면 config 기본값)
+
+    Returns:
+        dict: difficulty, enemy_speed, enemy_spawn_chance, enemy_evasion_skill
+    """
+    if difficulty_manager:
+        settings = difficulty_manager.get_current_settings()
+        return {
+            "difficulty": difficulty_manager.current_difficulty,
+            "enemy_speed": settings.get('enemy_speed', 2.5),
+            "enemy_spawn_chance": settings.get('enemy_spawn_chance', 0.2),
+            "enemy_evasion_skill": settings.get('enemy_evasion_skill', 0.8),
+        }
+
+    from core.config import ENEMY_SPEED, ENEMY_SPAWN_CHANCE, ENEMY_EVASION_SKILL
+    return {
+        "difficulty": "medium",
+        "enemy_speed": ENEMY_SPEED,
+        "enemy_spawn_chance": ENEMY_SPAWN_CHANCE,
+        "enemy_evasion_skill": ENEMY_EVASION_SKILL,
+    }
+
+
+class Sprites:
+    """시뮬레이션에 쓰는 스프라이트 (크기와 충돌 마스크가 결과에 영향을 줌)"""
+
+    def __init__(self, player: pygame.Surface, stone: pygame.Surface,
+                 missile: pygame.Surface, enemy: pygame.Surface):
+        """
+        Sprites 초기화
+
+        Args:
+            player: 플레이어 이미지
+            stone: 운석 원본 이미지
+            missile: 미사일 이미지
+            enemy: 적 이미지
+        """
+        self.player = player
+        self.stone = stone
+        self.missile = missile
+        self.enemy = enemy
+
+    @classmethod
+    def load(cls) -> "Sprites":
+        """
+        게임과 같은 리소스/크기로 로드 (화면 없이 사용 가능, 게임 화면과 같은 서피스를 공유)
+
+        Returns:
+            Sprites: 로드된 스프라이트
+
+        Raises:
+            FileNotFoundError: 파일이 존재하지 않을 때
+            pygame.error: 이미지 로드 실패 시
+        """
+        from ui.surface_cache import get_image
+        return cls(
+            get_image(Resources.PLAYER, (PLAYER_WIDTH, PLAYER_HEIGHT)),
+            get_image(Resources.STONE, (STONE_MAX_SIZE, STONE_MAX_SIZE)),
+            get_image(Resources.MISSILE, (MISSILE_WIDTH, MISSILE_HEIGHT)),
+            get_image(Resources.ENEMY, (ENEMY_WIDTH, ENEMY_HEIGHT)),
+        )
+
+    @classmethod
+    def blank(cls) -> "Sprites":
+        """
+        텍스처 없이 게임과 같은 크기의 불투명 사각형 (텍스처가 없는 헤드리스 검증/테스트용)
+
+        Returns:
+            Sprites: 사각형 스프라이트
+        """
+        return cls(
+            pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT)),
+            pygame.Surface((STONE_MAX_SIZE, STONE_MAX_SIZE)),
+            pygame.Surface((MISSILE_WIDTH, MISSILE_HEIGHT)),
+            pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT)),
+        )
+
+
+class InputRecorder:
+    """
+    프레임별 입력 기록
+
+    시드, 난이도 값과 함께 있으면 게임 전체를 재현할 수 있습니다 (프레임당 1바이트).
+    """
+
+    def __init__(self, seed: int, settings: dict):
+        """
+        InputRecorder 초기화
+
+        Args:
+            seed: 게임 난수 시드
+            settings: 난이도 값 (difficulty_settings() 결과)
+        """
+        self.seed = seed
+        self.settings = dict(settings)
+        self.frames = bytearray()
+
+    def record(self, inputs: int):
+        """
+        한 프레임 입력 추가
+
+        Args:
+            inputs: 입력 비트
+        """
+        self.frames.append(inputs)
+
+    def __iter__(self):
+        """프레임 순서대로 입력 비트 순회"""
+        return iter(self.frames)
+
+    def __len__(self) -> int:
+        """기록한 프레임 수"""
+        return len(self.frames)
+
+
+class FrameEvents:
+    """한 프레임 진행 결과 중 그리기/사운드에 필요한 것"""
+
+    def __init__(self):
+        self.missiles_fired = 0
+        self.state_changes: List[StateChange] = []  # 상태가 바뀐 (적, 새 상태)
+        self.explosions: List[Tuple[int, int]] = []  # 충돌 이펙트 위치 (파괴된 엔티티 좌상단)
+
+
+class GameSimulation:
+    """
+    화면 없이 한 프레임씩 진행하는 게임 시뮬레이션
+
+    입력 비트와 GameState.rng만으로 진행하므로 같은 시드, 난이도 값, 입력 기록이면
+    점수까지 똑같이 재현됩니다. 실제 게임(gameStart)도 같은 step()으로 진행하고
+    그리기와 사운드만 따로 처리합니다.
+    """
+
+    def __init__(self, sprites: Sprites, seed: Optional[int] = None, settings: Optional[dict] = None,
+                 difficulty_manager=None, api_client=None, recorder=None):
+        """
+        GameSimulation 초기화
+
+        Args:
+            sprites: 스프라이트
+            seed: 난수 시드 (None이면 새로 생성)
+            settings: 난이도 값 (None이면 difficulty_manager에서)
+            difficulty_manager: 난이도 관리자 (선택사항)
+            api_client: API 클라이언트 (업적 확인용, 선택사항)
+            recorder: 입력 기록기 (record(inputs)를 가진 객체, 기본값: 메모리의 InputRecorder)
+        """
+        self.sprites = sprites
+        self.settings = dict(settings) if settings else difficulty_settings(difficulty_manager)
+        self.state = GameState(difficulty_manager, api_client, seed)
+        self.player = Player(sprites.player)
+        self.enemy_updater = EnemyBatchUpdater()
+        self.recorder = recorder if recorder is not None else InputRecorder(self.state.seed, self.settings)
+        self.profiler = None  # 구간 시간 프로파일러 (core.profiler.FrameProfiler, 선택사항)
+
+    @classmethod
+    def from_snapshot(cls, sprites: Sprites, data: bytes, difficulty_manager=None, api_client=None,
+                      recorder=None) -> "GameSimulation":
+        """
+        스냅샷에서 이어 가는 시뮬레이션 (시드/난이도 값은 스냅샷의 것)
+
+        Args:
+            sprites: 스프라이트 (스냅샷을 만들 때와 같은 이미지)
+            data: snapshot() 결과
+            difficulty_manager: 난이도 관리자 (선택사항)
+            api_client: API 클라이언트 (업적 확인용, 선택사항)
+            recorder: 입력 기록기 (기본값: 메모리의 InputRecorder)
+
+        Returns:
+            GameSimulation: 스냅샷 시점 상태의 시뮬레이션
+
+        Raises:
+            ValueError: 스냅샷이 아니거나 다른 버전이거나 손상되었을 때
+        """
+        seed, settings = read_header(data)
+        simulation = cls(sprites, seed, settings, difficulty_manager, api_client, recorder)
+        simulation.restore(data)
+        return simulation
+
+    def snapshot(self) -> bytes:
+        """
+        지금 상태를 바이너리로 저장 (일시정지/체크포인트/리플레이 키프레임용)
+
+        Returns:
+            bytes: 스냅샷 (game.snapshot 참고)
+        """
+        return take_snapshot(self)
+
+    def restore(self, data: bytes):
+        """
+        snapshot() 시점 상태로 되돌리기 (입력 기록기는 그대로)
+
+        Args:
+            data: snapshot() 결과
+
+        Raises:
+            ValueError: 스냅샷이 아니거나 다른 버전이거나 손상되었을 때
+        """
+        restore_snapshot(self, data)
+
+    def step(self, inputs: int) -> FrameEvents:
+        """
+        한 프레임 진행 (입력은 recorder에 기록)
+
+        Args:
+            inputs: 이번 프레임 입력 비트
+
+        Returns:
+            FrameEvents: 그리기/사운드용 결과
+        """
+        state = self.state
+        profiler = self.profiler
+        events = FrameEvents()
+        self.recorder.record(inputs)
+
+        # 이번 프레임에 누른 키 (발사 -> 스킬 순)
+        if inputs & INPUT_FIRE and not state.game_over:
+            events.missiles_fired = self._fire()
+        if inputs & INPUT_SKILL:
+            state.use_skill()
+
+        # 프레임 카운터 및 콤보/파워업/스테이지 업데이트
+        if not state.game_over:
+            state.current_frame += 1
+            state.combo_system.update(state.current_frame)
+            state.powerup_manager.update_effects()
+            state.update_powerup_effects()
+            state.stage_manager.update_notification()
+
+            # 스테이지 진행 체크
+            if state.stage_manager.check_advance(state.score):
+                state.statistics.on_stage_advanced(state.stage_manager.current_stage_number)
+
+            self._move_player(inputs)
+
+        for missile in state.missiles:
+            missile.update()
+        if profiler is not None:
+            profiler.lap("update")
+
+        if not state.game_over:
+            self._spawn()
+        if profiler is not None:
+            profiler.lap("spawn")
+
+        for stone in state.stones:
+            stone.update()
+        if profiler is not None:
+            profiler.lap("update")
+
+        # 이동이 끝난 운석/미사일로 공간 인덱스 갱신 (적 AI와 충돌 감지가 공유)
+        state.index_threats()
+        events.state_changes = self.enemy_updater.update(
+            state.enemies, self.player, state.missile_grid, state.stone_grid
+        )
+        if profiler is not None:
+            profiler.lap("enemy_ai")
+
+        for projectile in state.enemy_projectiles:
+            projectile.update()
+        state.powerup_manager.update_powerups()
+        if profiler is not None:
+            profiler.lap("update")
+
+        self._resolve_collisions(events)
+        if profiler is not None:
+            profiler.lap("collision")
+
+        # 프레임 끝: 제거 표시된 엔티티를 한 번에 정리 (swap-remove, 풀로 반환)
+        state.end_frame()
+        if profiler is not None:
+            profiler.lap("update")
+        return events
+
+    def _fire(self) -> int:
+        """미사일 발사 (멀티샷 파워업이면 3연발), 발사한 수 반환"""
+        state = self.state
+        missile_x = self.player.rect.x + PLAYER_WIDTH / 2 - MISSILE_WIDTH / 2
+        missile_y = self.player.rect.y
+
+        if state.powerup_manager.is_effect_active(PowerUpType.MULTI_SHOT):
+            offsets = (0, -15, 15)  # 중앙, 왼쪽, 오른쪽
+        else:
+            offsets = (0,)
+
+        for offset in offsets:
+            state.spawn_missile(self.sprites.missile, missile_x + offset, missile_y)
+        state.missiles_fired += len(offsets)
+        state.statistics.on_missile_fired(len(offsets))
+        return len(offsets)
+
+    def _move_player(self, inputs: int):
+        """방향키 입력으로 플레이어 이동 (속도 파워업 적용, 화면 안으로 제한)"""
+        rect = self.player.rect
+        speed = PLAYER_SPEED * self.state.player_speed_multiplier
+
+        if inputs & INPUT_UP:
+            rect.y -= speed
+            if rect.y < 0:
+                rect.y = 0
+        if inputs & INPUT_DOWN:
+            rect.y += speed
+            if rect.y > SCREEN_HEIGHT - PLAYER_HEIGHT:
+                rect.y = SCREEN_HEIGHT - PLAYER_HEIGHT
+        if inputs & INPUT_LEFT:
+            rect.x -= speed
+            if rect.x < 0:
+                rect.x = 0
+        if inputs & INPUT_RIGHT:
+            rect.x += speed
+            if rect.x > SCREEN_WIDTH - PLAYER_WIDTH:
+                rect.x = SCREEN_WIDTH - PLAYER_WIDTH
+
+    def _spawn(self):
+        """운석(간격), 적/파워업(확률) 생성 - 확률은 게임 rng에서"""
+        state = self.state
+        stage = state.stage_manager
+
+        # 운석: 스테이지 배율 적용한 스폰 간격과 속도
+        state.stone_spawn_timer += 1
+        adjusted_interval = int(state.stone_spawn_interval * stage.get_stone_spawn_multiplier())
+        if state.stone_spawn_timer >= adjusted_interval:
+            state.spawn_stone(self.sprites.stone, stage.get_stone_speed_multiplier())
+            state.stone_spawn_timer = 0
+            state.stone_spawn_interval = max(state.stone_spawn_interval - 1, STONE_SPAWN_INTERVAL_MIN)
+
+        # 적: 스테이지 배율 적용, 프레임당 확률로 조정
+        settings = self.settings
+        adjusted_spawn_chance = settings["enemy_spawn_chance"] * stage.get_enemy_spawn_multiplier()
+        if state.rng.random() < adjusted_spawn_chance / 60:
+            state.spawn_enemy(self.sprites.enemy, settings["enemy_speed"], settings["enemy_evasion_skill"])
+
+        # 파워업: 약 0.3% 확률 (60 FPS 기준 약 5초마다 1개)
+        if state.rng.random() < 0.003:
+            state.powerup_manager.spawn_random_powerup()
+
+    def _resolve_collisions(self, events: FrameEvents):
+        """
+        충돌 감지 및 처리
+
+        충돌 결과는 엔티티 핸들 - 제거는 표시만 하고 프레임 끝에 한 번에 정리합니다.
+        """
+        state = self.state
+        collisions = CollisionDetector.check_all_collisions(
+            self.player,
+            state.missiles,
+            state.stones,
+            state.enemies,
+            state.enemy_projectiles,
+            state.powerup_manager.get_active_powerups(),
+            state.stone_grid
+        )
+
+        # 플레이어-운석 충돌
+        for stone_handle in collisions['player_stone']:
+            stone = state.stones.get(stone_handle)
+            if state.stones.kill(stone_handle):
+                state.take_damage()
+                events.explosions.append((stone.rect.x, stone.rect.y))
+
+        # 플레이어-적 충돌
+        for enemy_handle in collisions['player_enemy']:
+            enemy = state.enemies.get(enemy_handle)
+            if state.enemies.kill(enemy_handle):
+                state.take_damage()
+                events.explosions.append((enemy.rect.x, enemy.rect.y))
+
+        # 플레이어-적 발사체 충돌
+        for proj_handle in collisions['player_enemy_projectile']:
+            if state.enemy_projectiles.kill(proj_handle):
+                state.take_damage()
+
+        # 플레이어-적 레이저 충돌 (무적이 아니고 쿨다운이 끝났을 때만, 30 프레임 = 0.5초)
+        if collisions['player_enemy_laser'] and not state.powerup_manager.is_effect_active(PowerUpType.SHIELD):
+            if state.laser_damage_cooldown <= 0:
+                state.take_damage()
+                state.laser_damage_cooldown = 30
+
+        # 레이저 피해 쿨다운 감소
+        if state.laser_damage_cooldown > 0:
+            state.laser_damage_cooldown -= 1
+
+        # 플레이어-파워업 충돌
+        for powerup_handle in collisions['player_powerup']:
+            powerup = state.powerup_manager.remove_powerup(powerup_handle)
+            if powerup:
+                state.apply_powerup(powerup.type)  # 내부에서 통계 업데이트
+
+        # 미사일-운석 충돌 (운석 하나는 한 번만 점수)
+        for missile_handle, stone_handle in collisions['missile_stone']:
+            stone = state.stones.get(stone_handle)
+            if state.stones.kill(stone_handle):
+                state.add_missile_hit(is_enemy=False)
+                events.explosions.append((stone.rect.x, stone.rect.y))
+            state.missiles.kill(missile_handle)
+
+        # 미사일-적 충돌
+        for missile_handle, enemy_handle in collisions['missile_enemy']:
+            enemy = state.enemies.get(enemy_handle)
+            if state.enemies.kill(enemy_handle):
+                state.add_missile_hit(is_enemy=True)
+                events.explosions.append((enemy.rect.x, enemy.rect.y))
+            state.missiles.kill(missile_handle)
+
+        # 범위 벗어난 객체 제거
+        for missile_handle in collisions['missile_out']:
+            state.missiles.kill(missile_handle)
+        for stone_handle in collisions['stone_out']:
+            state.stones.kill(stone_handle)
+        for enemy_handle in collisions['enemy_out']:
+            state.enemies.kill(enemy_handle)
+        for proj_handle in collisions['enemy_projectile_out']:
+            state.enemy_projectiles.kill(proj_handle)
+
+
+def replay(recording: InputRecorder, sprites: Sprites) -> GameSimulation:
+    """
+    기록한 시드/난이도 값/입력으로 게임을 처음부터 다시 진행
+
+    Args:
+        recording: 입력 기록
+        sprites: 스프라이트 (기록할 때와 같은 이미지)
+
+    Returns:
+        GameSimulation: 마지막 프레임까지 진행한 시뮬레이션 (state.score 등으로 결과 확인)
+    """
+    simulation = GameSimulation(sprites, recording.seed, recording.settings)
+    for inputs in recording:
+        if simulation.state.game_over:
+            break
+        simulation.step(inputs)
+    return simulation
+
+
+def seek(recording, frame: int, sprites: Sprites) -> GameSimulation:
+    """
+    리플레이의 frame번째 프레임을 진행하기 직전 상태로 이동
+
+    frame 이하의 가장 가까운 키프레임 스냅샷에서 시작해 그 뒤 입력만 진행합니다.
+    스냅샷이 없는 키프레임(0번, 스냅샷 없이 기록한 파일)은 처음부터 진행합니다.
+
+    Args:
+        recording: 리플레이 (ReplayReader)
+        frame: 목표 프레임
+        sprites: 스프라이트 (기록할 때와 같은 이미지)
+
+    Returns:
+        GameSimulation: frame 시작 상태의 시뮬레이션 (게임 오버면 그 자리에서 멈춤)
+    """
+    keyframe, snapshot, inputs = recording.seek(frame)
+    if snapshot:
+        simulation = GameSimulation.from_snapshot(sprites, snapshot)
+    else:
+        simulation = GameSimulation(sprites, recording.seed, recording.settings)
+        inputs = recording.inputs()[:frame]
+
+    for bits in inputs:
+        if simulation.state.game_over:
+            break
+        simulation.step(bits)
+    return simulation
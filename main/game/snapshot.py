@@ -0,0 +1,332 @@
+"""Compact binary snapshots of a running game for pause/resume, checkpoints and replay keyframes"""
+import random
+import struct
+import time
+from typing import List, Tuple
+from core.config import CLIENT_VERSION
+from game.enemy import EnemyLaser, EnemyState
+from game.powerup import PowerUpType
+from game.stage import Stage
+
+MAGIC = b"SGSS"
+SNAPSHOT_VERSION = 1
+
+# 헤더: 매직, 버전, 시드, 적 속도/생성 확률/회피 능력, 난이도 이름, 클라이언트 버전
+HEADER = struct.Struct("<4sBIddd12s16s")
+
+# GameState 값: 프레임, 점수, 체력, 게임 오버, 스킬 카운트/사용 가능, 운석 스폰 타이머/간격,
+#              레이저 피해 쿨다운, 적 파괴/미사일 발사/명중 수, 이동 속도 배율, 무적, 플레이어 x/y
+STATE = struct.Struct("<Iii?i?iiiiiid?ii")
+
+# random.Random 상태: 버전, Mersenne Twister 상태 624개 + 위치, gauss_next 유무/값
+RNG = struct.Struct("<B625I?d")
+
+# ComboSystem: 콤보 수, 마지막 히트 프레임, 타이머, 최고 콤보
+COMBO = struct.Struct("<iiii")
+
+# StageManager: 스테이지 번호, 진행 횟수, 알림 표시 여부/타이머
+STAGE = struct.Struct("<ii?i")
+
+# GameStatistics: 카운터 8개, 최고 스테이지, 보스 처치 수, 플레이 시간(초)
+STATISTICS = struct.Struct("<10id")
+
+# 활성 효과: (파워업 타입, 남은 프레임)
+EFFECT = struct.Struct("<Bi")
+
+# 엔티티 목록: 다음 핸들, 엔티티 수
+ENTITY_LIST = struct.Struct("<II")
+STONE = struct.Struct("<Iiiid")  # 핸들, x, y, 크기, 속도
+MISSILE = struct.Struct("<Iii")  # 핸들, x, y
+# 적: 핸들, x, y, 속도, 회피 능력, 좌우 방향/속도, AI 상태/타이머, 충전 진행도, 추적 대상 유무,
+#     레이저 유무, 레이저 시작 x/y, 각도, 지속 시간, 타이머
+ENEMY = struct.Struct("<IiiddbdBid??dddii")
+POWERUP = struct.Struct("<IBii")  # 핸들, 타입, x, y
+
+COUNT = struct.Struct("<H")
+
+ENEMY_STATES = list(EnemyState)
+POWERUP_TYPES = list(PowerUpType)
+STATISTIC_COUNTERS = (
+    "stones_destroyed", "enemies_destroyed", "missiles_fired", "missiles_hit",
+    "max_combo", "skills_used", "items_collected", "damage_taken", "max_stage", "boss_defeated",
+)
+
+# 적 복원용 난수 생성기 (Enemy.reset()이 뽑는 값은 저장한 값으로 덮어쓰므로 게임 rng를 건드리지 않게)
+_scratch_rng = random.Random(0)
+
+
+def _pack_codes(codes: List[str]) -> bytes:
+    """업적 코드 목록 (개수 + 줄바꿈으로 이은 UTF-8)"""
+    encoded = "\n".join(codes).encode("utf-8")
+    return COUNT.pack(len(codes)) + COUNT.pack(len(encoded)) + encoded
+
+
+def _unpack_codes(data: bytes, pos: int) -> Tuple[List[str], int]:
+    """(업적 코드 목록, 다음 위치)"""
+    count = COUNT.unpack_from(data, pos)[0]
+    length = COUNT.unpack_from(data, pos + COUNT.size)[0]
+    pos += 2 * COUNT.size
+    codes = data[pos:pos + length].decode("utf-8").split("\n") if count else []
+    return codes, pos + length
+
+
+def take_snapshot(simulation) -> bytes:
+    """
+    시뮬레이션 상태를 바이너리로 저장 (보통 step() 사이, 수 KB)
+
+    게임 진행에 영향을 주는 값(엔티티, 타이머, 콤보, 파워업 효과, 스테이지, 통계,
+    게임 rng 상태, 이번 게임에 확인한 업적)을 모두 담습니다. 스프라이트와 공간 인덱스는
+    담지 않고 복원할 때 다시 만듭니다. 적 발사체는 현재 게임에서 생성되지 않아 제외합니다.
+
+    Args:
+        simulation: GameSimulation
+
+    Returns:
+        bytes: 스냅샷
+    """
+    state = simulation.state
+    settings = simulation.settings
+    rect = simulation.player.rect
+    rng_version, mt_state, gauss_next = state.rng.getstate()
+    combo = state.combo_system
+    stage = state.stage_manager
+    statistics = state.statistics
+    checker = state.achievement_checker
+    effects = state.powerup_manager.active_effects
+    powerups = state.powerup_manager.active_powerups
+
+    parts = [
+        HEADER.pack(
+            MAGIC, SNAPSHOT_VERSION, state.seed,
+            settings["enemy_speed"], settings["enemy_spawn_chance"], settings["enemy_evasion_skill"],
+            settings.get("difficulty", "").encode("utf-8"), CLIENT_VERSION.encode("utf-8")
+        ),
+        STATE.pack(
+            state.current_frame, state.score, state.health, state.game_over,
+            state.skill_count, state.skill_available, state.stone_spawn_timer, state.stone_spawn_interval,
+            state.laser_damage_cooldown, state.enemies_destroyed, state.missiles_fired, state.missiles_hit,
+            state.player_speed_multiplier, state.is_invincible, rect.x, rect.y
+        ),
+        RNG.pack(rng_version, *mt_state, gauss_next is not None, gauss_next or 0.0),
+        COMBO.pack(combo.combo_count, combo.last_hit_frame, combo.combo_timer, combo.max_combo),
+        STAGE.pack(
+            stage.current_stage_number, stage.stage_advanced_count,
+            stage.show_stage_notification, stage.notification_timer
+        ),
+        STATISTICS.pack(
+            *(getattr(statistics, name) for name in STATISTIC_COUNTERS),
+            time.time() - statistics.start_time
+        ),
+        COUNT.pack(len(effects)),
+    ]
+    parts.extend(EFFECT.pack(POWERUP_TYPES.index(effect), frames) for effect, frames in effects.items())
+
+    parts.append(ENTITY_LIST.pack(state.stones._next_handle, len(state.stones)))
+    parts.extend(
+        STONE.pack(stone.handle, stone.rect.x, stone.rect.y, stone.size, stone.speed)
+        for stone in state.stones
+    )
+
+    parts.append(ENTITY_LIST.pack(state.missiles._next_handle, len(state.missiles)))
+    parts.extend(MISSILE.pack(missile.handle, missile.rect.x, missile.rect.y) for missile in state.missiles)
+
+    parts.append(ENTITY_LIST.pack(state.enemies._next_handle, len(state.enemies)))
+    for enemy in state.enemies:
+        laser = enemy.laser
+        parts.append(ENEMY.pack(
+            enemy.handle, enemy.rect.x, enemy.rect.y, enemy.speed, enemy.evasion_skill,
+            enemy.horizontal_direction, enemy.horizontal_speed,
+            ENEMY_STATES.index(enemy.state), enemy.state_timer, enemy.laser_charge_progress,
+            enemy.target_player is not None, laser is not None,
+            *((laser.start_x, laser.start_y, laser.angle, laser.duration, laser.timer) if laser else (0, 0, 0, 0, 0))
+        ))
+
+    parts.append(ENTITY_LIST.pack(powerups._next_handle, len(powerups)))
+    parts.extend(
+        POWERUP.pack(powerup.handle, POWERUP_TYPES.index(powerup.type), powerup.rect.x, powerup.rect.y)
+        for powerup in powerups
+    )
+
+    parts.append(_pack_codes(sorted(checker.checked_achievements)))
+    parts.append(_pack_codes(checker.unlocked_this_game))
+    return b"".join(parts)
+
+
+def read_header(data: bytes) -> Tuple[int, dict]:
+    """
+    스냅샷의 시드와 난이도 값 (복원할 시뮬레이션을 만들 때 사용)
+
+    Args:
+        data: 스냅샷
+
+    Returns:
+        Tuple[int, dict]: (시드, 난이도 값)
+
+    Raises:
+        ValueError: 스냅샷이 아니거나 다른 버전(포맷/클라이언트)의 스냅샷일 때
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("스냅샷 헤더가 잘렸습니다")
+    (magic, version, seed, enemy_speed, spawn_chance, evasion_skill,
+     difficulty, client_version) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("게임 스냅샷이 아닙니다")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {version}")
+    client_version = client_version.rstrip(b"\0").decode("utf-8")
+    if client_version != CLIENT_VERSION:
+        # 게임 규칙이 다를 수 있으므로 다른 클라이언트의 상태는 이어가지 않음
+        raise ValueError(f"다른 클라이언트 버전의 스냅샷입니다: {client_version}")
+
+    return seed, {
+        "difficulty": difficulty.rstrip(b"\0").decode("utf-8"),
+        "enemy_speed": enemy_speed,
+        "enemy_spawn_chance": spawn_chance,
+        "enemy_evasion_skill": evasion_skill,
+    }
+
+
+def restore_snapshot(simulation, data: bytes):
+    """
+    스냅샷 상태로 시뮬레이션 되돌리기 (같은 입력을 이어 주면 끊김 없이 진행한 것과 같은 결과)
+
+    Args:
+        simulation: GameSimulation (스냅샷과 같은 스프라이트)
+        data: take_snapshot() 결과
+
+    Raises:
+        ValueError: 스냅샷이 아니거나 다른 버전이거나 잘렸을 때
+    """
+    seed, settings = read_header(data)
+    try:
+        _restore(simulation, data, seed, settings)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"스냅샷이 손상되었습니다: {e}") from e
+
+
+def _restore(simulation, data: bytes, seed: int, settings: dict):
+    """헤더 이후 값 복원"""
+    state = simulation.state
+    sprites = simulation.sprites
+    pos = HEADER.size
+
+    simulation.settings = settings
+    state.seed = seed
+    (state.current_frame, state.score, state.health, state.game_over,
+     state.skill_count, state.skill_available, state.stone_spawn_timer, state.stone_spawn_interval,
+     state.laser_damage_cooldown, state.enemies_destroyed, state.missiles_fired, state.missiles_hit,
+     state.player_speed_multiplier, state.is_invincible,
+     simulation.player.rect.x, simulation.player.rect.y) = STATE.unpack_from(data, pos)
+    pos += STATE.size
+
+    rng_values = RNG.unpack_from(data, pos)
+    pos += RNG.size
+    rng_state = (rng_values[0], rng_values[1:626], rng_values[627] if rng_values[626] else None)
+
+    combo = state.combo_system
+    combo.combo_count, combo.last_hit_frame, combo.combo_timer, combo.max_combo = COMBO.unpack_from(data, pos)
+    pos += COMBO.size
+
+    stage = state.stage_manager
+    (stage.current_stage_number, stage.stage_advanced_count,
+     stage.show_stage_notification, stage.notification_timer) = STAGE.unpack_from(data, pos)
+    stage.stage = Stage(stage.current_stage_number)
+    stage.stage_start_time = time.time()
+    pos += STAGE.size
+
+    statistics = state.statistics
+    values = STATISTICS.unpack_from(data, pos)
+    pos += STATISTICS.size
+    for name, value in zip(STATISTIC_COUNTERS, values):
+        setattr(statistics, name, value)
+    statistics.start_time = time.time() - values[-1]
+    statistics.difficulty = settings["difficulty"]
+    statistics.pop_dirty()
+
+    effects = state.powerup_manager.active_effects
+    effects.clear()
+    count = COUNT.unpack_from(data, pos)[0]
+    pos += COUNT.size
+    for effect, frames in EFFECT.iter_unpack(data[pos:pos + count * EFFECT.size]):
+        effects[POWERUP_TYPES[effect]] = frames
+    pos += count * EFFECT.size
+
+    # 엔티티: 지금 있는 것을 풀로 돌려놓고 풀에서 다시 꺼내 저장한 핸들/순서대로 채움
+    stones = state.stones
+    next_handle, count = ENTITY_LIST.unpack_from(data, pos)
+    pos += ENTITY_LIST.size
+    stones.clear()
+    restored = []
+    for handle, x, y, size, speed in STONE.iter_unpack(data[pos:pos + count * STONE.size]):
+        stone = stones.pool.acquire(sprites.stone, x, y, size=size)
+        stone.speed = speed
+        stone.handle = handle
+        restored.append(stone)
+    stones.restore(restored, next_handle)
+    pos += count * STONE.size
+
+    missiles = state.missiles
+    next_handle, count = ENTITY_LIST.unpack_from(data, pos)
+    pos += ENTITY_LIST.size
+    missiles.clear()
+    restored = []
+    for handle, x, y in MISSILE.iter_unpack(data[pos:pos + count * MISSILE.size]):
+        missile = missiles.pool.acquire(sprites.missile, x, y)
+        missile.handle = handle
+        restored.append(missile)
+    missiles.restore(restored, next_handle)
+    pos += count * MISSILE.size
+
+    enemies = state.enemies
+    next_handle, count = ENTITY_LIST.unpack_from(data, pos)
+    pos += ENTITY_LIST.size
+    enemies.clear()
+    restored = []
+    for (handle, x, y, speed, evasion_skill, direction, horizontal_speed, state_index, state_timer,
+         charge_progress, has_target, has_laser, laser_x, laser_y, angle, duration,
+         laser_timer) in ENEMY.iter_unpack(data[pos:pos + count * ENEMY.size]):
+        enemy = enemies.pool.acquire(sprites.enemy, speed, evasion_skill, rng=_scratch_rng)
+        enemy.rng = state.rng
+        enemy.handle = handle
+        enemy.rect.x, enemy.rect.y = x, y
+        enemy.horizontal_direction = direction
+        enemy.horizontal_speed = horizontal_speed
+        enemy.state = ENEMY_STATES[state_index]
+        enemy.state_timer = state_timer
+        enemy.laser_charge_progress = charge_progress
+        enemy.target_player = simulation.player if has_target else None
+        if has_laser:
+            enemy.laser = EnemyLaser(laser_x, laser_y, angle, duration)
+            enemy.laser.timer = laser_timer
+        restored.append(enemy)
+    enemies.restore(restored, next_handle)
+    pos += count * ENEMY.size
+
+    manager = state.powerup_manager
+    powerups = manager.active_powerups
+    next_handle, count = ENTITY_LIST.unpack_from(data, pos)
+    pos += ENTITY_LIST.size
+    powerups.clear()
+    restored = []
+    for handle, type_index, x, y in POWERUP.iter_unpack(data[pos:pos + count * POWERUP.size]):
+        powerup_type = POWERUP_TYPES[type_index]
+        powerup = powerups.pool.acquire(powerup_type, x, y, image=manager.icons.get(powerup_type))
+        powerup.handle = handle
+        restored.append(powerup)
+    powerups.restore(restored, next_handle)
+    pos += count * POWERUP.size
+
+    state.enemy_projectiles.clear()
+    state.stone_grid.clear()
+    state.missile_grid.clear()
+
+    checker = state.achievement_checker
+    checked, pos = _unpack_codes(data, pos)
+    unlocked, pos = _unpack_codes(data, pos)
+    checker.checked_achievements = set(checked)
+    checker.unlocked_this_game = unlocked
+    checker.notification_queue.clear()
+    checker._last_score = state.score
+
+    # rng는 마지막에: 엔티티 복원 중에 뽑힌 값이 없도록 (게임 rng는 파워업 관리자/적과 공유하는 같은 객체)
+    state.rng.setstate(rng_state)
@@ -0,0 +1,169 @@
+"""Uniform-grid spatial index for per-frame neighbour queries"""
+import pygame
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 셀 크기 (px) - 적 위험 감지 최대 반경(100px)과 비슷하게 잡아 반경 질의가 3x3 셀 안에서 끝나도록
+DEFAULT_CELL_SIZE = 100
+
+
+class SpatialGrid:
+    """
+    균일 격자 공간 인덱스
+
+    프레임마다 엔티티 rect로 build()해 두고, 반경/사각형 질의 때 겹치는 셀만 확인합니다.
+    엔티티는 rect 중심이 속한 셀 하나에만 들어가고, 사각형 질의는 지금까지 넣은 엔티티의
+    최대 반폭/반높이만큼 넓혀서 셀을 찾으므로 중복 제거가 필요 없습니다.
+    적 AI의 위험 감지와 충돌 감지가 같은 인덱스를 공유하므로, 인덱스를 만든 뒤
+    엔티티를 움직이면 다음 build() 전까지 결과가 어긋날 수 있습니다.
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        """
+        SpatialGrid 초기화
+
+        Args:
+            cell_size: 셀 한 변 길이 (px)
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List] = {}
+        self._count = 0
+        self._half_width = 0  # 넣은 엔티티 중 최대 반폭
+        self._half_height = 0  # 넣은 엔티티 중 최대 반높이
+
+    @classmethod
+    def of(cls, entities: Iterable) -> "SpatialGrid":
+        """
+        엔티티 목록으로 바로 인덱스 만들기 (이미 SpatialGrid면 그대로 반환)
+
+        Args:
+            entities: rect 속성을 가진 엔티티 목록 또는 SpatialGrid
+
+        Returns:
+            SpatialGrid: 인덱스
+        """
+        if isinstance(entities, SpatialGrid):
+            return entities
+        grid = cls()
+        grid.build(entities or ())
+        return grid
+
+    def clear(self):
+        """인덱스 비우기"""
+        self._cells.clear()
+        self._count = 0
+        self._half_width = 0
+        self._half_height = 0
+
+    def insert(self, entity):
+        """
+        엔티티 추가 (rect 중심이 속한 셀에 등록)
+
+        Args:
+            entity: rect 속성을 가진 엔티티
+        """
+        rect = entity.rect
+        size = self.cell_size
+        key = (rect.centerx // size, rect.centery // size)
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [entity]
+        else:
+            bucket.append(entity)
+
+        if rect.width > self._half_width * 2:
+            self._half_width = (rect.width + 1) // 2
+        if rect.height > self._half_height * 2:
+            self._half_height = (rect.height + 1) // 2
+        self._count += 1
+
+    def build(self, entities: Iterable):
+        """
+        인덱스를 비우고 엔티티 목록으로 다시 만들기 (프레임마다 한 번)
+
+        Args:
+            entities: rect 속성을 가진 엔티티 목록
+        """
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def _buckets(self, left: float, top: float, right: float, bottom: float) -> List[List]:
+        """중심이 영역 안에 있을 수 있는 셀의 엔티티 목록들"""
+        size = self.cell_size
+        cells = self._cells
+        first_x, last_x = int(left // size), int(right // size)
+        first_y, last_y = int(top // size), int(bottom // size)
+
+        # 엔티티가 든 셀이 질의 범위의 셀보다 적으면 든 셀만 확인 (한산한 화면)
+        if len(cells) <= (last_x - first_x + 1) * (last_y - first_y + 1):
+            return [
+                bucket for (cell_x, cell_y), bucket in cells.items()
+                if first_x <= cell_x <= last_x and first_y <= cell_y <= last_y
+            ]
+
+        buckets = []
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    buckets.append(bucket)
+        return buckets
+
+    def query_rect(self, rect: pygame.Rect) -> List:
+        """
+        사각형과 겹칠 수 있는 후보 엔티티 (실제 충돌 판정은 호출자가)
+
+        Args:
+            rect: 질의 사각형
+
+        Returns:
+            List: 후보 엔티티 목록 (셀 순서와 삽입 순서 기준으로 결정적)
+        """
+        buckets = self._buckets(
+            rect.left - self._half_width, rect.top - self._half_height,
+            rect.right + self._half_width, rect.bottom + self._half_height
+        )
+        if len(buckets) == 1:
+            return list(buckets[0])
+        return [entity for bucket in buckets for entity in bucket]
+
+    def nearest(self, x: float, y: float, radius: float,
+                accept: Optional[Callable] = None) -> Optional[Tuple[object, float]]:
+        """
+        반경 안에서 중심이 가장 가까운 엔티티 (제곱 거리로 비교)
+
+        거리가 같으면 핸들이 작은 쪽을 골라 셀 순회 순서와 관계없이 결과가 항상 같습니다.
+
+        Args:
+            x: 질의 중심 x
+            y: 질의 중심 y
+            radius: 반경 (중심 거리가 이 값보다 작아야 함)
+            accept: 추가 조건 함수 (entity -> bool, 선택사항)
+
+        Returns:
+            Optional[Tuple[object, float]]: (엔티티, 제곱 거리) 또는 None
+        """
+        best = None
+        best_distance_sq = radius * radius  # 이보다 작아야 후보
+        for bucket in self._buckets(x - radius, y - radius, x + radius, y + radius):
+            for entity in bucket:
+                center_x, center_y = entity.rect.center
+                distance_sq = (center_x - x) ** 2 + (center_y - y) ** 2
+                if distance_sq > best_distance_sq:
+                    continue
+                if distance_sq == best_distance_sq and (
+                        best is None or getattr(entity, "handle", 0) >= getattr(best, "handle", 0)):
+                    continue
+                if accept is not None and not accept(entity):
+                    continue
+                best, best_distance_sq = entity, distance_sq
+        return (best, best_distance_sq) if best is not None else None
+
+    def __iter__(self) -> Iterator:
+        """인덱스에 든 엔티티 순회 (셀 순서)"""
+        for bucket in self._cells.values():
+            yield from bucket
+
+    def __len__(self) -> int:
+        """인덱스에 든 엔티티 수"""
+        return self._count
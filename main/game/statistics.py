@@ -1,6 +1,21 @@
 """게임 통계 수집 시스템"""
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
+
+# 속성 이름과 다른 지표 (지표 이름은 to_dict 의 키를 따름)
+_DERIVED_METRICS = {
+    'difficulty': lambda s: s.difficulty,
+    'play_time': lambda s: s.get_play_time(),
+    'accuracy': lambda s: s.get_accuracy(),
+    'max_stage_reached': lambda s: s.max_stage,
+    'boss_defeated': lambda s: s.boss_defeated > 0,
+}
+
+# 속성 이름이 곧 지표 이름인 카운터
+_COUNTER_METRICS = (
+    'stones_destroyed', 'enemies_destroyed', 'missiles_fired', 'missiles_hit',
+    'max_combo', 'skills_used', 'items_collected', 'damage_taken',
+)
 
 
 class GameStatistics:
@@ -36,13 +51,18 @@ class GameStatistics:
         # 피해 통계
         self.damage_taken = 0
 
+        # 마지막 확인 이후 바뀐 지표 (업적 증분 판정용)
+        self._dirty: Set[str] = set()
+
     def on_stone_destroyed(self):
         """운석 파괴 시 호출"""
         self.stones_destroyed += 1
+        self._dirty.add('stones_destroyed')
 
     def on_enemy_destroyed(self):
         """적 파괴 시 호출"""
         self.enemies_destroyed += 1
+        self._dirty.add('enemies_destroyed')
 
     def on_missile_fired(self, count: int = 1):
         """
@@ -52,10 +72,12 @@ class GameStatistics:
             count: 발사한 미사일 수 (기본값: 1)
         """
         self.missiles_fired += count
+        self._dirty.update(('missiles_fired', 'accuracy'))
 
     def on_missile_hit(self):
         """미사일 명중 시 호출"""
         self.missiles_hit += 1
+        self._dirty.update(('missiles_hit', 'accuracy'))
 
     def on_combo_update(self, combo: int):
         """
@@ -64,15 +86,19 @@ class GameStatistics:
         Args:
             combo: 현재 콤보 수
         """
-        self.max_combo = max(self.max_combo, combo)
+        if combo > self.max_combo:
+            self.max_combo = combo
+            self._dirty.add('max_combo')
 
     def on_skill_used(self):
         """스킬 사용 시 호출"""
         self.skills_used += 1
+        self._dirty.add('skills_used')
 
     def on_item_collected(self):
         """아이템 획득 시 호출"""
         self.items_collected += 1
+        self._dirty.add('items_collected')
 
     def on_stage_advanced(self, stage: int):
         """
@@ -81,15 +107,19 @@ class GameStatistics:
         Args:
             stage: 진행한 스테이지 번호
         """
-        self.max_stage = max(self.max_stage, stage)
+        if stage > self.max_stage:
+            self.max_stage = stage
+            self._dirty.add('max_stage_reached')
 
     def on_boss_defeated(self):
         """보스 처치 시 호출"""
         self.boss_defeated += 1
+        self._dirty.add('boss_defeated')
 
     def on_damage_taken(self):
         """피해 입을 시 호출"""
         self.damage_taken += 1
+        self._dirty.add('damage_taken')
 
     def get_play_time(self) -> int:
         """
@@ -120,6 +150,34 @@ class GameStatistics:
         """
         return self.damage_taken == 0
 
+    def get_metric(self, name: str):
+        """
+        지표 값 조회
+
+        Args:
+            name: 지표 이름 (to_dict 의 키)
+
+        Returns:
+            지표 값 (알 수 없는 지표면 None)
+        """
+        getter = _DERIVED_METRICS.get(name)
+        if getter is not None:
+            return getter(self)
+        if name in _COUNTER_METRICS:
+            return getattr(self, name)
+        return None
+
+    def pop_dirty(self) -> Set[str]:
+        """
+        마지막 호출 이후 바뀐 지표 이름을 반환하고 초기화
+
+        Returns:
+            Set[str]: 바뀐 지표 이름
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        return dirty
+
     def to_dict(self) -> Dict:
         """
         딕셔너리 변환 (서버 전송용)
@@ -140,6 +198,7 @@ class GameStatistics:
             'items_collected': self.items_collected,
             'max_stage_reached': self.max_stage,
             'boss_defeated': self.boss_defeated > 0,
+            'damage_taken': self.damage_taken,
         }
 
     def get_summary_text(self) -> str:
@@ -171,3 +230,4 @@ class GameStatistics:
         self.max_stage = 1
         self.boss_defeated = 0
         self.damage_taken = 0
+        self._dirty.clear()
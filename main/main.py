@@ -4,7 +4,7 @@ import pygame
 import sys
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, Resources, UI
 from core.logging_config import setup_logging
-from utils import load_image, load_music, load_font, create_button_rect, show_error_dialog
+from utils import load_music, load_font, create_button_rect, show_error_dialog
 from services.api_service import GameAPIClient
 from screens.auth_screen import show_auth_screen
 from screens.ranking_screen import show_ranking_screen
@@ -14,6 +14,8 @@ from screens.stats_screen import show_stats_screen
 from screens.achievement_screen import show_achievement_screen
 from screens import game_screen as gameview
 from game.difficulty import DifficultyManager
+from game.achievement_rules import load_catalog
+from ui import surface_cache
 
 # 로깅 설정
 setup_logging(log_level="INFO")
@@ -50,6 +52,17 @@ def startView():
         except Exception as e:
             logger.error(f"난이도 설정 로드 중 오류: {str(e)}")
 
+        # 서버에서 업적 카탈로그 가져오기 (실패 시 기본 카탈로그 사용)
+        try:
+            success, achievements, error = api_client.get_achievements()
+            if success and achievements:
+                load_catalog(achievements)
+                logger.info(f"업적 카탈로그 {len(achievements)}개 로드 완료")
+            else:
+                logger.warning(f"업적 카탈로그 로드 실패, 기본값 사용: {error}")
+        except Exception as e:
+            logger.error(f"업적 카탈로그 로드 중 오류: {str(e)}")
+
         # 화면 설정
         startScr = pygame.display.set_mode([SCREEN_WIDTH, SCREEN_HEIGHT])
         pygame.display.set_caption('원석 부수기')
@@ -65,7 +78,7 @@ def startView():
 
         # 리소스 로드
         try:
-            backGImg = load_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            backGImg = surface_cache.get_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
             load_music(Resources.BACKGROUND_MUSIC)
             pygame.mixer.music.play(-1)
             font = load_font(Resources.MAIN_FONT, UI.FONT_SIZE_LARGE)
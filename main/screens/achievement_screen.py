@@ -1,8 +1,10 @@
 """업적 화면"""
 import pygame
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, Resources, UI
-from utils import load_image, load_font, create_button_rect, show_error_dialog
+from utils import load_font, create_button_rect, show_error_dialog
 from game.achievements import AchievementChecker
+from ui import surface_cache
+from ui.retained import RetainedPresenter
 
 
 def show_achievement_screen(api_client):
@@ -19,10 +21,11 @@ def show_achievement_screen(api_client):
         back_button = create_button_rect(UI.INFO_BACK_BUTTON)
 
         try:
-            background_img = load_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            background_img = surface_cache.get_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
             title_font = load_font(Resources.MAIN_FONT, 48)
             font = load_font(Resources.MAIN_FONT, 24)
             small_font = load_font(Resources.MAIN_FONT, 18)
+            icon_font = load_font(Resources.MAIN_FONT, 24)
         except (FileNotFoundError, pygame.error) as e:
             show_error_dialog("업적 화면 로드 오류", str(e))
             return
@@ -30,23 +33,12 @@ def show_achievement_screen(api_client):
         # 업적 목록 가져오기
         checker = AchievementChecker(api_client)
 
-        # 모든 업적 코드
-        all_achievements = [
-            'first_game',
-            'perfect_aim',
-            'immortal',
-            'speedrunner',
-            'combo_master',
-            'stone_breaker_single',
-            'enemy_hunter_single',
-            'boss_slayer',
-            'stage_master',
-            'expert_player',
-            'item_collector',
-        ]
+        # 모든 업적 코드 (카탈로그 순서)
+        all_achievements = list(checker.rules.rules)
 
         # 서버에서 잠금 해제된 업적 가져오기
         unlocked_achievements = set()
+        achievement_progress = {}  # 누적 업적 진행도 (%)
         if api_client and api_client.is_logged_in():
             try:
                 success, achievements, error = api_client.get_my_achievements()
@@ -55,35 +47,16 @@ def show_achievement_screen(api_client):
                     unlocked_achievements = {ach.get('achievement', {}).get('code')
                                             for ach in achievements
                                             if ach.get('completed')}
+                    achievement_progress = {ach.get('achievement', {}).get('code'): ach.get('progress') or 0
+                                            for ach in achievements
+                                            if not ach.get('completed')}
             except Exception as e:
                 print(f"업적 로드 실패: {e}")
 
-        running = True
-        scroll_offset = 0
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if back_button.collidepoint(event.pos):
-                        running = False
-
-                    # 마우스 휠 스크롤
-                    if event.button == 4:  # 위로 스크롤
-                        scroll_offset = min(scroll_offset + 20, 0)
-                    elif event.button == 5:  # 아래로 스크롤
-                        scroll_offset = max(scroll_offset - 20, -400)
-
-            # 배경 그리기
-            gameScr.blit(background_img, [0, 0])
-
-            # 반투명 오버레이
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            gameScr.blit(overlay, (0, 0))
+        def render():
+            """화면 전체 그리기 (presenter가 무효화된 영역으로 클립)"""
+            # 배경 + 반투명 오버레이 (미리 합성)
+            gameScr.blit(surface_cache.get_backdrop(background_img, (0, 0, 0), 200), (0, 0))
 
             # BACK 버튼
             mouse_pos = pygame.mouse.get_pos()
@@ -116,6 +89,8 @@ def show_achievement_screen(api_client):
                     # 업적 이름
                     name = checker.get_achievement_display_name(achievement_code)
                     description = checker.get_achievement_description(achievement_code)
+                    if not is_unlocked and achievement_progress.get(achievement_code):
+                        description = f"{description} ({achievement_progress[achievement_code]}%)"
 
                     # 색상 (잠금 해제 여부)
                     name_color = (255, 215, 0) if is_unlocked else (150, 150, 150)
@@ -128,7 +103,6 @@ def show_achievement_screen(api_client):
                     pygame.draw.circle(gameScr, icon_color, (icon_x, icon_y), 20)
 
                     # 체크 표시 또는 자물쇠
-                    icon_font = load_font(Resources.MAIN_FONT, 24)
                     icon_symbol = "✓" if is_unlocked else "🔒"
                     icon_text = icon_font.render(icon_symbol, True, (0, 0, 0) if is_unlocked else WHITE)
                     icon_text_rect = icon_text.get_rect(center=(icon_x, icon_y))
@@ -157,7 +131,33 @@ def show_achievement_screen(api_client):
                 hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
                 gameScr.blit(hint_text, hint_rect)
 
-            pygame.display.update()
+        running = True
+        scroll_offset = 0
+
+        presenter = RetainedPresenter(gameScr)
+        clock = pygame.time.Clock()
+
+        while running:
+            # 바뀐 것이 없으면 입력이 올 때까지 대기
+            presenter.wait()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if back_button.collidepoint(event.pos):
+                        running = False
+
+                    # 마우스 휠 스크롤
+                    if event.button == 4:  # 위로 스크롤
+                        scroll_offset = min(scroll_offset + 20, 0)
+                    elif event.button == 5:  # 아래로 스크롤
+                        scroll_offset = max(scroll_offset - 20, -400)
+
+            presenter.track_hover([back_button], pygame.mouse.get_pos())
+            presenter.present(render)
+            clock.tick(30)
 
     except Exception as e:
         show_error_dialog("업적 화면 오류", f"업적 화면 실행 중 오류 발생:\n{str(e)}")
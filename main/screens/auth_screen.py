@@ -5,6 +5,7 @@ from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, Resources, UI
 from utils import load_font
 from services.api_service import GameAPIClient
 from screens.base_screen import BaseScreen
+from ui import surface_cache
 
 
 class AuthScreen(BaseScreen):
@@ -51,6 +52,7 @@ class AuthScreen(BaseScreen):
         self.input_focus_glow = {"username": 0, "password": 0}
 
         self._calculate_positions()
+        self._bake_static_surfaces()
 
     def _calculate_positions(self):
         """UI 위치 계산 - 더 넓고 여유로운 레이아웃"""
@@ -85,6 +87,40 @@ class AuthScreen(BaseScreen):
         self.submit_button = pygame.Rect(button_x, self.container_y + 400, button_width, 60)
         self.skip_button = pygame.Rect(button_x, self.container_y + 480, button_width, 48)
 
+    def _bake_static_surfaces(self):
+        """매 프레임 같은 모양인 배경/타이틀/텍스트를 미리 그려 둠 (프레임마다 blit만 수행)"""
+        # 배경 + 어두운 오버레이
+        self._backdrop = self.background_img.copy()
+        self._backdrop.blit(self._build_dark_overlay(), (0, 0))
+
+        # 타이틀 (글로우 포함)과 서브타이틀
+        self._title_layers = self._build_title()
+
+        # 고정 텍스트
+        self._tab_labels = {
+            (mode, is_active): self.font_large.render(
+                text, True, self.COLOR_NEON_BLUE if is_active else self.COLOR_TEXT_DIM
+            )
+            for mode, text in (("login", "로그인"), ("register", "회원가입"))
+            for is_active in (True, False)
+        }
+        self._button_labels = {
+            text: self.font_large.render(text, True, self.COLOR_TEXT)
+            for text in ("로그인", "회원가입", "건너뛰기")
+        }
+        self._field_labels = {
+            (label, is_active): self.font_small.render(
+                label, True, self.COLOR_NEON_BLUE if is_active else self.COLOR_TEXT_DIM
+            )
+            for label in ("아이디", "비밀번호")
+            for is_active in (True, False)
+        }
+        self._placeholder = self.font_medium.render("입력하세요...", True, (120, 120, 140))
+
+        help_text = "Tab: 전환  •  Enter: 확인  •  ESC: 나가기"
+        self._help_surface = self.font_small.render(help_text, True, (120, 120, 140))
+        self._help_rect = self._help_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
+
     def handle_events(self) -> bool:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -202,10 +238,8 @@ class AuthScreen(BaseScreen):
             self.message_alpha = max(0, self.message_alpha - 2)
 
     def render(self):
-        self.draw_background()
-
-        # 어두운 오버레이 (부드러운 그라데이션)
-        self._draw_dark_overlay()
+        # 배경 + 어두운 오버레이 (미리 합성)
+        self.screen.blit(self._backdrop, (0, 0))
 
         # 배경 애니메이션 파티클
         self._draw_particles()
@@ -257,18 +291,17 @@ class AuthScreen(BaseScreen):
         # 하단 도움말
         self._draw_help_text()
 
-    def _draw_dark_overlay(self):
-        """부드러운 어두운 오버레이"""
+    def _build_dark_overlay(self) -> pygame.Surface:
+        """부드러운 어두운 오버레이 (한 번만 생성)"""
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         overlay.set_alpha(200)
 
         # 중앙이 밝은 방사형 그라데이션
         for r in range(max(SCREEN_WIDTH, SCREEN_HEIGHT) // 2, 0, -5):
-            alpha = int(200 * (r / (max(SCREEN_WIDTH, SCREEN_HEIGHT) // 2)))
             color = (10, 10, 25)
             pygame.draw.circle(overlay, color, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), r)
 
-        self.screen.blit(overlay, (0, 0))
+        return overlay
 
     def _draw_particles(self):
         """배경 떠다니는 파티클"""
@@ -280,18 +313,25 @@ class AuthScreen(BaseScreen):
 
             size = 3 + math.sin(self.time * 0.05 + i * 0.7) * 2
 
-            # 네온 글로우
-            glow_surf = pygame.Surface((size * 8, size * 8), pygame.SRCALPHA)
+            # 네온 글로우 (크기별로 미리 그린 스프라이트)
             color = self.COLOR_NEON_BLUE if i % 2 == 0 else self.COLOR_NEON_PURPLE
+            glow_surf = surface_cache.get_glow_sprite(size, color)
+            half = glow_surf.get_width() // 2
 
-            for r in range(int(size * 4), 0, -1):
-                alpha = int(30 * (1 - r / (size * 4)))
-                pygame.draw.circle(glow_surf, (*color, alpha), (size * 4, size * 4), r)
-
-            self.screen.blit(glow_surf, (x - size * 4, y - size * 4))
+            self.screen.blit(glow_surf, (x - half, y - half))
 
     def _draw_title(self):
         """타이틀 - 네온 효과"""
+        for surface, pos in self._title_layers:
+            self.screen.blit(surface, pos)
+
+    def _build_title(self) -> list:
+        """
+        타이틀 글로우/타이틀/서브타이틀 레이어 생성 (한 번만)
+
+        Returns:
+            list: (서피스, 위치) 목록
+        """
         title = "SPACE DEFENDER"
 
         # 네온 글로우
@@ -306,14 +346,16 @@ class AuthScreen(BaseScreen):
             glow_rect = glow_text.get_rect(center=(glow_surf.get_width() // 2, glow_surf.get_height() // 2))
             glow_surf.blit(glow_text, (glow_rect.x + i - 5, glow_rect.y + i - 5))
 
-        self.screen.blit(glow_surf, (title_rect.x - 20, title_rect.y - 20))
-        self.screen.blit(title_surface, title_rect)
-
         # 서브타이틀
         subtitle = "로그인하여 게임을 시작하세요"
         sub_surface = self.font_small.render(subtitle, True, self.COLOR_TEXT_DIM)
         sub_rect = sub_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y + 50))
-        self.screen.blit(sub_surface, sub_rect)
+
+        return [
+            (glow_surf, (title_rect.x - 20, title_rect.y - 20)),
+            (title_surface, title_rect.topleft),
+            (sub_surface, sub_rect.topleft),
+        ]
 
     def _draw_tabs(self):
         """언더라인 스타일 탭"""
@@ -324,8 +366,7 @@ class AuthScreen(BaseScreen):
             is_active = self.mode == mode
 
             # 텍스트
-            color = self.COLOR_NEON_BLUE if is_active else self.COLOR_TEXT_DIM
-            tab_text = self.font_large.render(text, True, color)
+            tab_text = self._tab_labels[(mode, is_active)]
             text_rect = tab_text.get_rect(center=tab_rect.center)
             self.screen.blit(tab_text, text_rect)
 
@@ -357,16 +398,16 @@ class AuthScreen(BaseScreen):
         is_hovered = rect.collidepoint(mouse_pos)
         glow_intensity = self.input_focus_glow[field_name]
 
-        # 글로우 효과
-        if glow_intensity > 0:
-            glow_surf = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
-            glow_color = (*self.COLOR_NEON_BLUE, int(80 * glow_intensity))
-            pygame.draw.rect(glow_surf, glow_color, glow_surf.get_rect(), border_radius=35)
+        # 글로우 효과 (알파를 단계별로 양자화해 캐시된 패널 사용)
+        glow_alpha = surface_cache.quantize_alpha(80 * glow_intensity)
+        if glow_alpha > 0:
+            glow_surf = surface_cache.get_panel(
+                (rect.width + 20, rect.height + 20), (*self.COLOR_NEON_BLUE, glow_alpha), border_radius=35
+            )
             self.screen.blit(glow_surf, (rect.x - 10, rect.y - 10))
 
         # 글래스 배경
-        glass_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        glass_surf.fill((40, 40, 60, 120))
+        glass_surf = surface_cache.get_panel(rect.size, (40, 40, 60, 120))
         self.screen.blit(glass_surf, rect.topleft)
 
         # 테두리
@@ -377,8 +418,7 @@ class AuthScreen(BaseScreen):
         pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius=32)
 
         # 라벨 (필드 내부 상단)
-        label_color = self.COLOR_NEON_BLUE if is_active else self.COLOR_TEXT_DIM
-        label_surf = self.font_small.render(label, True, label_color)
+        label_surf = self._field_labels[(label, is_active)]
         self.screen.blit(label_surf, (rect.x + 20, rect.y + 8))
 
         # 입력 텍스트
@@ -387,8 +427,7 @@ class AuthScreen(BaseScreen):
         if display_text:
             text_surf = self.font_medium.render(display_text, True, self.COLOR_TEXT)
         else:
-            placeholder = "입력하세요..."
-            text_surf = self.font_medium.render(placeholder, True, (120, 120, 140))
+            text_surf = self._placeholder
 
         self.screen.blit(text_surf, (rect.x + 20, rect.y + 32))
 
@@ -410,38 +449,28 @@ class AuthScreen(BaseScreen):
         if is_primary:
             # 메인 버튼 - 네온 그라데이션
             if is_hovered:
-                # 글로우
-                glow_surf = pygame.Surface((rect.width + 30, rect.height + 30), pygame.SRCALPHA)
-                for i in range(15, 0, -1):
-                    alpha = int(40 * (1 - i / 15))
-                    pygame.draw.rect(
-                        glow_surf,
-                        (*self.COLOR_NEON_BLUE, alpha),
-                        glow_surf.get_rect(),
-                        border_radius=35
-                    )
+                # 글로우 (같은 크기의 사각형을 겹쳐 그리면 마지막 알파만 남음)
+                glow_surf = surface_cache.get_panel(
+                    (rect.width + 30, rect.height + 30),
+                    (*self.COLOR_NEON_BLUE, int(40 * (1 - 1 / 15))),
+                    border_radius=35
+                )
                 self.screen.blit(glow_surf, (rect.x - 15, rect.y - 15))
 
             # 버튼 배경 (그라데이션 효과)
-            button_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            for y in range(rect.height):
-                progress = y / rect.height
-                r = int(self.COLOR_NEON_PURPLE[0] * (1 - progress) + self.COLOR_NEON_BLUE[0] * progress)
-                g = int(self.COLOR_NEON_PURPLE[1] * (1 - progress) + self.COLOR_NEON_BLUE[1] * progress)
-                b = int(self.COLOR_NEON_PURPLE[2] * (1 - progress) + self.COLOR_NEON_BLUE[2] * progress)
-                pygame.draw.line(button_surf, (r, g, b, 200), (0, y), (rect.width, y))
-
+            button_surf = surface_cache.get_vertical_gradient(
+                rect.size, self.COLOR_NEON_PURPLE, self.COLOR_NEON_BLUE, 200
+            )
             self.screen.blit(button_surf, rect.topleft)
             pygame.draw.rect(self.screen, self.COLOR_GLASS_BORDER, rect, 2, border_radius=30)
         else:
             # 보조 버튼 - 투명
-            glass_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            glass_surf.fill((60, 60, 80, 80 if is_hovered else 50))
+            glass_surf = surface_cache.get_panel(rect.size, (60, 60, 80, 80 if is_hovered else 50))
             self.screen.blit(glass_surf, rect.topleft)
             pygame.draw.rect(self.screen, (120, 120, 140), rect, 1, border_radius=24)
 
         # 텍스트
-        text_surf = self.font_large.render(text, True, self.COLOR_TEXT)
+        text_surf = self._button_labels[text]
         text_rect = text_surf.get_rect(center=rect.center)
         self.screen.blit(text_surf, text_rect)
 
@@ -452,8 +481,9 @@ class AuthScreen(BaseScreen):
 
         # 배경
         bg_rect = msg_rect.inflate(40, 24)
-        bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surf.fill((20, 20, 30, int(self.message_alpha * 0.9)))
+        bg_surf = surface_cache.get_panel(
+            bg_rect.size, (20, 20, 30, surface_cache.quantize_alpha(self.message_alpha * 0.9))
+        )
         self.screen.blit(bg_surf, bg_rect.topleft)
 
         # 테두리
@@ -465,10 +495,7 @@ class AuthScreen(BaseScreen):
 
     def _draw_help_text(self):
         """하단 도움말"""
-        help_text = "Tab: 전환  •  Enter: 확인  •  ESC: 나가기"
-        help_surf = self.font_small.render(help_text, True, (120, 120, 140))
-        help_rect = help_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        self.screen.blit(help_surf, help_rect)
+        self.screen.blit(self._help_surface, self._help_rect)
 
     def on_exit(self) -> bool:
         return self.login_success
@@ -1,11 +1,16 @@
 """Abstract base screen class"""
 from abc import ABC, abstractmethod
 import pygame
+from ui import surface_cache
+from ui.retained import RetainedPresenter
 
 
 class BaseScreen(ABC):
     """모든 화면의 기본 추상 클래스"""
 
+    # True면 변경된 영역만 다시 그리고 유휴 시 이벤트를 기다림 (정적인 메뉴 화면용)
+    retained = False
+
     def __init__(self, screen: pygame.Surface, background_img: pygame.Surface):
         """
         기본 화면 초기화
@@ -18,6 +23,7 @@ class BaseScreen(ABC):
         self.background_img = background_img
         self.running = True
         self.clock = pygame.time.Clock()
+        self.presenter = RetainedPresenter(screen)
 
     @abstractmethod
     def handle_events(self) -> bool:
@@ -46,9 +52,12 @@ class BaseScreen(ABC):
         Returns:
             bool: 다음 화면으로 진행할지 여부
         """
+        if self.retained:
+            return self._run_retained()
+
         self.running = True
         while self.running:
-            self.running = self.handle_events()
+            self.running = self.handle_events() and self.running
             self.update()
             self.render()
             pygame.display.flip()
@@ -56,6 +65,43 @@ class BaseScreen(ABC):
 
         return self.on_exit()
 
+    def _run_retained(self) -> bool:
+        """
+        retained 모드 메인 루프 (무효화된 영역만 다시 그림)
+
+        Returns:
+            bool: 다음 화면으로 진행할지 여부
+        """
+        self.running = True
+        self.presenter.invalidate()
+        while self.running:
+            self.presenter.wait()
+            self.running = self.handle_events() and self.running
+            self.update()
+            self.presenter.track_hover(self.hover_rects(), pygame.mouse.get_pos())
+            self.presenter.present(self.render)
+            self.clock.tick(30)
+
+        return self.on_exit()
+
+    def hover_rects(self) -> list:
+        """
+        호버 시 모양이 바뀌는 영역 목록 (retained 모드에서 호버 변경 감지용)
+
+        Returns:
+            list: pygame.Rect 목록
+        """
+        return []
+
+    def invalidate(self, rect: pygame.Rect = None):
+        """
+        다음 프레임에 다시 그릴 영역 표시 (retained 모드)
+
+        Args:
+            rect: 다시 그릴 영역 (None이면 화면 전체)
+        """
+        self.presenter.invalidate(rect)
+
     def on_exit(self) -> bool:
         """
         화면 종료 시 처리
@@ -69,6 +115,16 @@ class BaseScreen(ABC):
         """배경 이미지 그리기"""
         self.screen.blit(self.background_img, [0, 0])
 
+    def draw_backdrop(self, alpha: int = 200, color: tuple = (0, 0, 0)):
+        """
+        배경 이미지 + 반투명 오버레이 그리기 (미리 합성한 서피스 사용)
+
+        Args:
+            alpha: 오버레이 알파 (0~255)
+            color: 오버레이 RGB 색상
+        """
+        self.screen.blit(surface_cache.get_backdrop(self.background_img, color, alpha), (0, 0))
+
     def quit(self):
         """화면 종료"""
         self.running = False
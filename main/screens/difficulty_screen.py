@@ -9,6 +9,8 @@ from game.difficulty import DifficultyManager, DifficultyLevel
 class DifficultyScreen(BaseScreen):
     """난이도 선택 화면 클래스"""
 
+    retained = True
+
     def __init__(self, screen: pygame.Surface, background_img: pygame.Surface, difficulty_manager: DifficultyManager):
         """
         DifficultyScreen 초기화
@@ -104,15 +106,14 @@ class DifficultyScreen(BaseScreen):
         """상태 업데이트 (현재 필요 없음)"""
         pass
 
+    def hover_rects(self) -> list:
+        """호버 시 모양이 바뀌는 영역"""
+        return [self.easy_button, self.medium_button, self.hard_button, self.confirm_button, self.back_button]
+
     def render(self):
         """화면 렌더링"""
-        self.draw_background()
-
-        # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # 배경 + 반투명 오버레이 (미리 합성)
+        self.draw_backdrop(200)
 
         mouse_pos = pygame.mouse.get_pos()
 
@@ -145,7 +146,7 @@ class DifficultyScreen(BaseScreen):
             color = info["color"]
             border_width = 3
         else:
-            color = (color_val // 2 for color_val in info["color"])
+            color = tuple(color_val // 2 for color_val in info["color"])
             border_width = 2
 
         # 버튼 배경
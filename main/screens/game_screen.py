@@ -1,38 +1,47 @@
 """게임 플레이 및 정보 화면"""
+import os
+import platform
+import time
 import pygame
-import random
 import logging
+from typing import Callable, Optional
 from core.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED,
-    PLAYER_WIDTH, PLAYER_HEIGHT, PLAYER_SPEED, PLAYER_START_X, PLAYER_START_Y,
-    STONE_MIN_SIZE, STONE_MAX_SIZE, STONE_SPEED, STONE_SPAWN_INTERVAL_START, STONE_SPAWN_INTERVAL_MIN,
-    MISSILE_WIDTH, MISSILE_HEIGHT, MISSILE_SPEED,
-    INITIAL_HEALTH, SKILL_THRESHOLD, FPS, Resources, UI
+    PLAYER_WIDTH, PLAYER_HEIGHT, STONE_MAX_SIZE, MISSILE_WIDTH, MISSILE_HEIGHT, ENEMY_WIDTH, ENEMY_HEIGHT,
+    INITIAL_HEALTH, SKILL_THRESHOLD, FPS, REPLAY_DIR, REPLAY_KEEP, CHECKPOINT_PATH, CHECKPOINT_INTERVAL,
+    GHOST_ENABLED, PROFILER_EXPORT, PROFILER_FRAMES, PROFILE_DIR, CLIENT_VERSION, Resources, UI
 )
 from utils import (
-    load_image, load_sound, load_music, load_font, create_button_rect,
-    is_off_screen, safe_remove_from_list, show_error_dialog, render_text_centered
+    load_sound, load_music, load_font, create_button_rect, show_error_dialog
 )
 from services.api_service import GameAPIClient
-from game.entities import Player, Stone, Missile
-from game.collision import CollisionDetector
-from game.combo import ComboSystem
-from game.difficulty import DifficultyManager
-from game.enemy import Enemy, EnemyProjectile, EnemyState
-from game.powerup import PowerUp, PowerUpType, PowerUpManager
-from game.stage import StageManager
-from game.statistics import GameStatistics
+from game.enemy import EnemyState
 from game.achievements import AchievementChecker
-from game.achievement_notification import AchievementNotificationManager
+from game.achievement_notification import AchievementCardRenderer
+from core.profiler import FrameProfiler
+from ui import surface_cache
+from ui.dirty_rects import DirtyRectTracker
+from ui.retained import RetainedPresenter
+from ui.profiler_overlay import ProfilerOverlay
+from ui.text_cache import TextCache
+from game.render_batch import blit_layer
+from game.simulation import GameSimulation, FrameEvents, Sprites, read_input, difficulty_settings
+from game.game_state import new_seed
+from game.replay import ReplayReader, ReplayWriter, prune_replays
+from game.checkpoint import CheckpointWriter, discard_checkpoint, load_checkpoint
+from game.ghost import Ghost, GhostLoader
 
 logger = logging.getLogger(__name__)
 
 
 def show_game_over_screen(screen, font, score, background_img, api_client, max_combo=0,
-                          statistics=None, achievements_unlocked=None):
+                          statistics=None, achievements_unlocked=None, replay_path=None):
     """
     게임 오버 화면 및 점수 저장
 
+    점수/통계 저장은 백그라운드에서 진행하고, 화면은 한 번 합성한 뒤
+    저장 상태 메시지가 바뀔 때만 다시 합성합니다.
+
     Args:
         screen: pygame 화면
         font: 폰트 객체
@@ -42,47 +51,155 @@ def show_game_over_screen(screen, font, score, background_img, api_client, max_c
         max_combo: 최대 콤보 수
         statistics: 게임 통계 (GameStatistics 객체)
         achievements_unlocked: 이번 게임에서 달성한 업적 리스트
+        replay_path: 이번 게임 리플레이 파일 (점수 저장 후 검증용으로 업로드)
 
     Returns:
         bool: True면 재시작, False면 메뉴로
     """
     score_saved = False
-    stats_saved = False
-    save_message = ""
+    pending_score = None  # 점수 저장 Future
+    pending_rank = None  # 저장 후 랭킹 조회 Future
+    pending_stat = None  # 상세 통계 저장 Future
+    pending_replay = None  # 리플레이 업로드 Future
 
-    # 로그인되어 있으면 자동으로 점수 및 통계 저장 시도
+    # 로그인되어 있으면 자동으로 점수 및 통계 저장 시도 (비동기)
     if api_client.is_logged_in():
-        result = api_client.save_score(score)
-        if result:
-            save_message = f"점수가 저장되었습니다! (#{score})"
-            score_saved = True
-
-            # 통계 조회
-            user_stats = api_client.get_my_stats()
-            if user_stats:
-                save_message += f" | 랭킹: {user_stats['rank']}위"
-        else:
-            save_message = "점수 저장 실패 (서버 오류)"
+        save_message = "점수 저장 중..."
+        pending_score = api_client.save_score_async(score)
 
         # 상세 통계 저장
         if statistics:
-            try:
-                stats_data = statistics.to_dict()
-                stats_data['final_score'] = score
-                success, data, error = api_client.save_game_stat(stats_data)
-                if success:
-                    stats_saved = True
-                    logger.info("게임 통계 저장 성공")
-                else:
-                    logger.warning(f"게임 통계 저장 실패: {error}")
-            except Exception as e:
-                logger.error(f"통계 저장 실패: {e}")
+            stats_data = statistics.to_dict()
+            stats_data['final_score'] = score
+            pending_stat = api_client.save_game_stat_async(stats_data)
     else:
         save_message = "오프라인 모드 (점수 저장 안됨)"
 
+    # 폰트와 업적 요약 박스는 한 번만 준비 (업적 박스는 알림 카드와 같은 렌더러)
+    stats_font = load_font(Resources.MAIN_FONT, 24)
+    small_font = load_font(Resources.MAIN_FONT, 20)
+    hint_font = load_font(Resources.MAIN_FONT, 18)
+
+    achievement_box = None
+    if achievements_unlocked:
+        achievement_box = AchievementCardRenderer(Resources.MAIN_FONT).render_summary(
+            achievements_unlocked, AchievementChecker()
+        )
+
+    def compose() -> pygame.Surface:
+        """게임 오버 화면 전체를 서피스 한 장으로 합성"""
+        # 배경 + 반투명 오버레이 (미리 합성)
+        frame = surface_cache.get_backdrop(background_img, (0, 0, 0), 180).copy()
+
+        # 게임 오버 텍스트
+        game_over_text = font.render("GAME OVER", True, RED)
+        frame.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 200)))
+
+        # 점수 표시
+        score_text = font.render(f"Score: {score}", True, WHITE)
+        frame.blit(score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, 280)))
+
+        # 통계 표시
+        y_offset = 320
+        lines = []
+        if statistics:
+            accuracy_color = (0, 255, 0) if statistics.get_accuracy() >= 70 else (255, 255, 100)
+            lines = [
+                (f"Max Combo: {max_combo}", (255, 215, 0)),  # 최대 콤보
+                (f"Stage: {statistics.max_stage}", (100, 200, 255)),  # 스테이지
+                (f"Accuracy: {statistics.get_accuracy():.1f}%", accuracy_color),  # 명중률
+            ]
+        elif max_combo > 1:
+            lines = [(f"Max Combo: {max_combo}", (255, 215, 0))]
+
+        for text, color in lines:
+            line_text = stats_font.render(text, True, color)
+            frame.blit(line_text, line_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset)))
+            y_offset += 35
+
+        # 업적 표시 (강화된 버전)
+        if achievement_box:
+            y_offset += 10
+            frame.blit(achievement_box, ((SCREEN_WIDTH - achievement_box.get_width()) // 2, y_offset - 10))
+            y_offset += achievement_box.get_height()
+
+        # 사용자 이름 표시 (로그인된 경우)
+        y_offset += 10
+        if api_client.is_logged_in():
+            user_text = stats_font.render(f"플레이어: {api_client.session_manager.username}", True, WHITE)
+            frame.blit(user_text, user_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset)))
+            y_offset += 40
+
+        # 저장 메시지
+        message_color = (0, 255, 0) if score_saved else (255, 200, 0)
+        save_text = small_font.render(save_message, True, message_color)
+        frame.blit(save_text, save_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset)))
+
+        # 종료 안내
+        hint_text = hint_font.render("아무 키나 눌러 메뉴로...", True, (150, 150, 150))
+        frame.blit(hint_text, hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50)))
+
+        return frame
+
+    def poll_saves() -> bool:
+        """
+        도착한 저장 결과 반영
+
+        Returns:
+            bool: 저장 메시지가 바뀌었으면 True
+        """
+        nonlocal pending_score, pending_rank, pending_stat, pending_replay, save_message, score_saved
+        changed = False
+
+        if pending_score is not None and pending_score.done():
+            success, saved, error = _future_result(pending_score)
+            pending_score = None
+            if success:
+                save_message = f"점수가 저장되었습니다! (#{score})"
+                score_saved = True
+                # 저장된 점수를 반영한 랭킹 조회
+                pending_rank = api_client.get_my_stats_async()
+                # 서버 검증용 리플레이 업로드
+                if replay_path and saved and saved.get('id') is not None:
+                    pending_replay = api_client.upload_replay_async(saved['id'], replay_path)
+            else:
+                logger.warning(f"점수 저장 실패: {error}")
+                save_message = "점수 저장 실패 (서버 오류)"
+            changed = True
+
+        if pending_rank is not None and pending_rank.done():
+            success, user_stats, _ = _future_result(pending_rank)
+            pending_rank = None
+            if success and user_stats and user_stats.get('rank'):
+                save_message += f" | 랭킹: {user_stats['rank']}위"
+                changed = True
+
+        if pending_replay is not None and pending_replay.done():
+            success, _, error = _future_result(pending_replay)
+            pending_replay = None
+            if success:
+                logger.info("리플레이 업로드 성공 (서버 검증 대기)")
+            else:
+                logger.warning(f"리플레이 업로드 실패: {error}")
+
+        if pending_stat is not None and pending_stat.done():
+            success, _, error = _future_result(pending_stat)
+            pending_stat = None
+            if success:
+                logger.info("게임 통계 저장 성공")
+            else:
+                logger.warning(f"게임 통계 저장 실패: {error}")
+
+        return changed
+
+    frame = compose()
+    presenter = RetainedPresenter(screen)
     clock = pygame.time.Clock()
 
     while True:
+        # 다시 그릴 것이 없으면 입력이 올 때까지 대기 (저장 결과는 대기 주기마다 확인)
+        presenter.wait()
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -95,319 +212,215 @@ def show_game_over_screen(screen, font, score, background_img, api_client, max_c
                 # 아무 곳이나 클릭해도 메뉴로
                 return False
 
-        # 화면 그리기
-        screen.blit(background_img, [0, 0])
-
-        # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        if poll_saves():
+            frame = compose()
+            presenter.invalidate()
 
-        # 게임 오버 텍스트
-        game_over_text = font.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        screen.blit(game_over_text, game_over_rect)
-
-        # 점수 표시
-        score_text = font.render(f"Score: {score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 280))
-        screen.blit(score_text, score_rect)
+        presenter.present(lambda: screen.blit(frame, (0, 0)))
+        clock.tick(30)
 
-        # 통계 표시
-        y_offset = 320
-        stats_font = load_font(Resources.MAIN_FONT, 24)
 
-        if statistics:
-            # 최대 콤보
-            combo_display = stats_font.render(f"Max Combo: {max_combo}", True, (255, 215, 0))
-            combo_rect = combo_display.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(combo_display, combo_rect)
-            y_offset += 35
+def _future_result(future) -> tuple:
+    """
+    완료된 API Future 결과 (예외는 실패 튜플로 변환)
 
-            # 스테이지
-            stage_text = stats_font.render(f"Stage: {statistics.max_stage}", True, (100, 200, 255))
-            stage_rect = stage_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(stage_text, stage_rect)
-            y_offset += 35
+    Args:
+        future: (성공 여부, 데이터, 에러 메시지) 튜플을 반환하는 Future
 
-            # 명중률
-            accuracy_color = (0, 255, 0) if statistics.get_accuracy() >= 70 else (255, 255, 100)
-            accuracy_text = stats_font.render(f"Accuracy: {statistics.get_accuracy():.1f}%", True, accuracy_color)
-            accuracy_rect = accuracy_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(accuracy_text, accuracy_rect)
-            y_offset += 35
-        elif max_combo > 1:
-            combo_display = stats_font.render(f"Max Combo: {max_combo}", True, (255, 215, 0))
-            combo_rect = combo_display.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(combo_display, combo_rect)
-            y_offset += 35
+    Returns:
+        tuple: (성공 여부, 데이터, 에러 메시지)
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return False, None, str(e)
 
-        # 업적 표시 (강화된 버전)
-        if achievements_unlocked and len(achievements_unlocked) > 0:
-            y_offset += 10
-            achievement_font = load_font(Resources.MAIN_FONT, 24)
-            small_ach_font = load_font(Resources.MAIN_FONT, 18)
 
-            # 업적 박스 배경
-            box_width = 420
-            box_height = 60 + len(achievements_unlocked[:4]) * 45
-            box_x = (SCREEN_WIDTH - box_width) // 2
-            box_y = y_offset - 10
+def _open_replay_writer(seed: int, settings: dict) -> Optional[ReplayWriter]:
+    """
+    이번 게임 리플레이 파일 열기 (REPLAY_DIR/replay_<시각>.sgr)
 
-            # 반투명 박스
-            achievement_box = pygame.Surface((box_width, box_height))
-            achievement_box.set_alpha(200)
-            achievement_box.fill((30, 30, 50))
-            screen.blit(achievement_box, (box_x, box_y))
+    파일이 계속 쌓이지 않도록 이번 파일까지 REPLAY_KEEP개만 남기고 오래된 것부터 지웁니다.
 
-            # 테두리 (골드)
-            pygame.draw.rect(screen, (255, 215, 0), (box_x, box_y, box_width, box_height), 3)
+    Args:
+        seed: 게임 난수 시드
+        settings: 난이도 값
 
-            # 제목
-            achievement_title = achievement_font.render("🏆 업적 달성!", True, (255, 215, 0))
-            achievement_title_rect = achievement_title.get_rect(center=(SCREEN_WIDTH // 2, y_offset + 15))
-            screen.blit(achievement_title, achievement_title_rect)
-            y_offset += 45
+    Returns:
+        Optional[ReplayWriter]: 기록기 (파일을 열 수 없으면 None - 메모리에만 기록)
+    """
+    prune_replays(REPLAY_DIR, REPLAY_KEEP - 1)
+    path = os.path.join(REPLAY_DIR, time.strftime("replay_%Y%m%d_%H%M%S.sgr"))
+    try:
+        return ReplayWriter(path, seed, settings)
+    except OSError as e:
+        logger.warning(f"리플레이 파일을 열 수 없습니다: {e}")
+        return None
 
-            from game.achievements import AchievementChecker
-            checker = AchievementChecker()
 
-            for achievement_code in achievements_unlocked[:4]:  # 최대 4개 표시
-                # 업적 아이콘 (골드 원)
-                icon_x = box_x + 30
-                icon_y = y_offset
-                pygame.draw.circle(screen, (255, 215, 0), (icon_x, icon_y), 12)
+def _ask_resume(screen, font, background_img, simulation: GameSimulation) -> bool:
+    """
+    끝내지 못한 게임을 이어서 할지 묻기
 
-                # 체크 마크
-                check_font = load_font(Resources.MAIN_FONT, 16)
-                check_text = check_font.render("✓", True, (0, 0, 0))
-                check_rect = check_text.get_rect(center=(icon_x, icon_y))
-                screen.blit(check_text, check_rect)
+    창을 닫으면 QUIT 이벤트를 되돌려 두고 이어서 시작하므로, 게임 루프가 바로 같은 상태의
+    체크포인트를 다시 남기고 종료합니다 (다음 시작 때 다시 물음).
 
-                # 업적 이름 및 설명
-                ach_name = checker.get_achievement_display_name(achievement_code)
-                ach_desc = checker.get_achievement_description(achievement_code)
+    Args:
+        screen: pygame 화면
+        font: 폰트 객체
+        background_img: 배경 이미지
+        simulation: 체크포인트에서 복원한 시뮬레이션
 
-                name_text = achievement_font.render(ach_name, True, (255, 215, 0))
-                screen.blit(name_text, (icon_x + 25, y_offset - 15))
+    Returns:
+        bool: True면 이어서 (Y/Enter), False면 새 게임 (N/ESC)
+    """
+    state = simulation.state
+    frame = surface_cache.get_backdrop(background_img, (0, 0, 0), 180).copy()
+    lines = [
+        ("끝내지 못한 게임이 있습니다. 이어서 할까요?", WHITE),
+        (f"점수 {state.score} · 스테이지 {state.stage_manager.current_stage_number} · "
+         f"{state.current_frame // FPS // 60}분 {state.current_frame // FPS % 60}초", (200, 200, 200)),
+        ("Y / Enter: 이어서    N / ESC: 새 게임", (150, 150, 150)),
+    ]
+    y_offset = SCREEN_HEIGHT // 2 - 60
+    for text, color in lines:
+        line_text = font.render(text, True, color)
+        frame.blit(line_text, line_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset)))
+        y_offset += 60
+    screen.blit(frame, (0, 0))
+    pygame.display.flip()
 
-                desc_text = small_ach_font.render(ach_desc[:45] + "..." if len(ach_desc) > 45 else ach_desc, True, (180, 180, 180))
-                screen.blit(desc_text, (icon_x + 25, y_offset + 8))
+    while True:
+        event = pygame.event.wait()
+        if event.type == pygame.QUIT:
+            pygame.event.post(event)
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_y, pygame.K_RETURN):
+                return True
+            if event.key in (pygame.K_n, pygame.K_ESCAPE):
+                return False
 
-                y_offset += 45
 
-            # 더 많은 업적이 있으면 표시
-            if len(achievements_unlocked) > 4:
-                more_text = small_ach_font.render(f"... 외 {len(achievements_unlocked) - 4}개", True, (150, 150, 150))
-                more_rect = more_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset - 10))
-                screen.blit(more_text, more_rect)
+def _resume_from_checkpoint(sprites: Sprites, difficulty_manager=None, api_client=None,
+                            confirm: Optional[Callable[[GameSimulation], bool]] = None) -> Optional[GameSimulation]:
+    """
+    지난번에 끝내지 못한 게임(창을 닫았거나 비정상 종료)을 체크포인트에서 이어서 시작
 
-            y_offset += 15
+    이전 리플레이 파일의 앞부분 입력을 새 리플레이에 옮겨 적으므로, 이어서 진행한 게임도
+    처음부터 재현(서버 검증)할 수 있습니다. 앞부분 입력이 없으면 리플레이 없이 진행합니다.
+    지금 고른 난이도와 다르거나 confirm이 거절하면 체크포인트를 지우고 새 게임을 시작합니다.
 
-        # 사용자 이름 표시 (로그인된 경우)
-        y_offset += 10
-        if api_client.is_logged_in():
-            user_text = stats_font.render(f"플레이어: {api_client.session_manager.username}", True, WHITE)
-            user_rect = user_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(user_text, user_rect)
-            y_offset += 40
+    Args:
+        sprites: 스프라이트
+        difficulty_manager: 난이도 관리자 (선택사항)
+        api_client: API 클라이언트 (선택사항)
+        confirm: 복원한 시뮬레이션을 받아 이어서 할지 정하는 함수 (선택사항, 없으면 묻지 않고 이어서)
 
-        # 저장 메시지
-        message_color = (0, 255, 0) if score_saved else (255, 200, 0)
-        small_font = load_font(Resources.MAIN_FONT, 20)
-        save_text = small_font.render(save_message, True, message_color)
-        save_rect = save_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-        screen.blit(save_text, save_rect)
+    Returns:
+        Optional[GameSimulation]: 이어서 진행할 시뮬레이션 (체크포인트가 없거나 쓸 수 없거나 거절하면 None)
+    """
+    checkpoint = load_checkpoint(CHECKPOINT_PATH)
+    if checkpoint is None:
+        return None
 
-        # 종료 안내
-        hint_font = load_font(Resources.MAIN_FONT, 18)
-        hint_text = hint_font.render("아무 키나 눌러 메뉴로...", True, (150, 150, 150))
-        hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-        screen.blit(hint_text, hint_rect)
+    snapshot, old_replay_path = checkpoint
+    try:
+        simulation = GameSimulation.from_snapshot(sprites, snapshot, difficulty_manager, api_client)
+    except ValueError as e:
+        logger.warning(f"체크포인트에서 이어갈 수 없습니다: {e}")
+        discard_checkpoint(CHECKPOINT_PATH)
+        return None
+
+    selected = difficulty_settings(difficulty_manager)["difficulty"]
+    if simulation.settings["difficulty"] != selected:
+        logger.info(f"체크포인트 난이도({simulation.settings['difficulty']})가 "
+                    f"고른 난이도({selected})와 달라 새 게임을 시작합니다")
+        discard_checkpoint(CHECKPOINT_PATH)
+        return None
+    if confirm is not None and not confirm(simulation):
+        discard_checkpoint(CHECKPOINT_PATH)
+        return None
+
+    frame = simulation.state.current_frame
+    try:
+        inputs = ReplayReader.open(old_replay_path).inputs() if old_replay_path else b""
+    except (OSError, ValueError) as e:
+        logger.warning(f"이전 리플레이를 읽을 수 없습니다: {e}")
+        inputs = b""
+
+    if len(inputs) >= frame:
+        replay_writer = _open_replay_writer(simulation.state.seed, simulation.settings)
+        if replay_writer is not None:
+            for bits in inputs[:frame]:
+                replay_writer.record(bits)
+            simulation.recorder = replay_writer
+            # 새 리플레이에 모두 옮겼으므로 이어서 진행하기 전까지만 기록된 이전 파일은 정리
+            if old_replay_path and os.path.abspath(old_replay_path) != os.path.abspath(replay_writer.path):
+                try:
+                    os.remove(old_replay_path)
+                except OSError:
+                    pass
+    else:
+        logger.warning("이전 리플레이 입력이 모자라 이어서 진행하는 게임은 리플레이를 남기지 않습니다")
 
-        pygame.display.flip()
-        clock.tick(30)
+    logger.info(f"체크포인트에서 이어서 시작: 프레임 {frame}, 점수 {simulation.state.score}")
+    return simulation
 
 
-class GameState:
-    """게임 상태 관리"""
-
-    def __init__(self, difficulty_manager=None, api_client=None):
-        self.score = 0
-        self.health = INITIAL_HEALTH
-        self.game_over = False
-        self.skill_count = 0
-        self.skill_available = False
-        self.stones = []
-        self.missiles = []
-        self.enemies = []
-        self.enemy_projectiles = []
-        self.stone_spawn_timer = 0
-        self.stone_spawn_interval = STONE_SPAWN_INTERVAL_START
-        self.current_frame = 0
-        self.combo_system = ComboSystem(timeout_frames=180)
-        self.difficulty_manager = difficulty_manager
-        self.powerup_manager = PowerUpManager()
-
-        # 새로운 시스템들
-        self.stage_manager = StageManager()
-        difficulty_name = difficulty_manager.current_difficulty if difficulty_manager else "medium"
-
-        # 레이저 피해 쿨다운 (연속 피해 방지)
-        self.laser_damage_cooldown = 0  # 프레임 단위
-        self.statistics = GameStatistics(difficulty=difficulty_name)
-        self.achievement_checker = AchievementChecker(api_client)
-        self.achievement_notification_manager = AchievementNotificationManager(self.achievement_checker)
-
-        # 적 관련 통계 (하위 호환성 유지)
-        self.enemies_destroyed = 0
-        self.missiles_fired = 0
-        self.missiles_hit = 0
-
-        # 플레이어 상태 (파워업 효과)
-        self.player_speed_multiplier = 1.0
-        self.is_invincible = False
-
-    def reset(self):
-        """게임 상태 초기화"""
-        self.score = 0
-        self.health = INITIAL_HEALTH
-        self.game_over = False
-        self.skill_count = 0
-        self.laser_damage_cooldown = 0
-        self.skill_available = False
-        self.stones.clear()
-        self.missiles.clear()
-        self.enemies.clear()
-        self.enemy_projectiles.clear()
-        self.stone_spawn_timer = 0
-        self.stone_spawn_interval = STONE_SPAWN_INTERVAL_START
-        self.current_frame = 0
-        self.combo_system.reset()
-        self.powerup_manager.clear_powerups()
-        self.stage_manager.reset()
-        self.statistics.reset()
-        self.achievement_checker.reset()
-        self.enemies_destroyed = 0
-        self.missiles_fired = 0
-        self.missiles_hit = 0
-        self.player_speed_multiplier = 1.0
-        self.is_invincible = False
-
-    def take_damage(self):
-        """플레이어 피해 입음 (무적 상태면 무시)"""
-        if self.is_invincible:
-            return  # 무적 상태에서는 피해 무시
-
-        self.health -= 1
-        self.statistics.on_damage_taken()  # 통계 기록
-        if self.health <= 0:
-            self.game_over = True
-
-    def add_missile_hit(self, is_enemy=False):
-        """
-        미사일 히트 카운트
+def _count_frame(profiler: FrameProfiler, game_state, tracker: DirtyRectTracker, hud_text: TextCache):
+    """
+    이번 프레임 엔티티 수와 캐시/화면 갱신 통계를 프로파일러 카운터로 기록
 
-        Args:
-            is_enemy: 적을 파괴한 경우 True
-        """
-        self.skill_count += 1
-        self.missiles_hit += 1
+    Args:
+        profiler: 프레임 프로파일러
+        game_state: 게임 상태
+        tracker: 화면 갱신 추적기 (이번 프레임이 전체 갱신이었는지)
+        hud_text: HUD 텍스트 캐시
+    """
+    profiler.count("stones", len(game_state.stones))
+    profiler.count("missiles", len(game_state.missiles))
+    profiler.count("enemies", len(game_state.enemies))
+    profiler.count("projectiles", len(game_state.enemy_projectiles))
+    profiler.count("powerups", len(game_state.powerup_manager.active_powerups))
+    profiler.count_delta("text_hits", hud_text.hits)
+    profiler.count_delta("text_misses", hud_text.misses)
+    surfaces = surface_cache.stats()
+    profiler.count_delta("surface_hits", surfaces["hits"])
+    profiler.count_delta("surface_misses", surfaces["misses"])
+    profiler.count("full_redraw", tracker.last_frame_full)
+
+
+def _export_profile(profiler: FrameProfiler, game_state=None):
+    """
+    최근 프레임 기록 내보내기 (PROFILE_DIR/last_game.csv 프레임별, .json 요약)
 
-        # 통계 업데이트
-        self.statistics.on_missile_hit()
-        if is_enemy:
-            self.statistics.on_enemy_destroyed()
-        else:
-            self.statistics.on_stone_destroyed()
-
-        # 콤보 추가
-        self.combo_system.add_hit(self.current_frame)
-        self.statistics.on_combo_update(self.combo_system.get_combo_count())
-
-        # 콤보 배율 적용하여 점수 추가 (적은 2배 점수)
-        base_score = 2 if is_enemy else 1
-        multiplier = self.combo_system.get_multiplier()
-
-        # 점수 배율 파워업 적용
-        if self.powerup_manager.is_effect_active(PowerUpType.SCORE_MULTIPLIER):
-            multiplier *= 2.0
-
-        self.score += int(base_score * multiplier)
-
-        if is_enemy:
-            self.enemies_destroyed += 1
-
-        if self.skill_count >= SKILL_THRESHOLD:
-            self.skill_available = True
-
-    def use_skill(self):
-        """스킬 사용 (모든 돌과 적 제거)"""
-        if self.skill_available or self.skill_count >= SKILL_THRESHOLD:
-            # 스킬 사용 통계
-            self.statistics.on_skill_used()
-
-            # 모든 돌 제거 (콤보 유지하면서)
-            for stone in self.stones:
-                self.combo_system.add_hit(self.current_frame)
-                self.statistics.on_combo_update(self.combo_system.get_count())
-                self.statistics.on_stone_destroyed()
-                multiplier = self.combo_system.get_multiplier()
-                self.score += int(1 * multiplier)
-
-            # 모든 적 제거 (적은 2배 점수)
-            for enemy in self.enemies:
-                self.combo_system.add_hit(self.current_frame)
-                self.statistics.on_combo_update(self.combo_system.get_count())
-                self.statistics.on_enemy_destroyed()
-                multiplier = self.combo_system.get_multiplier()
-                self.score += int(2 * multiplier)
-                self.enemies_destroyed += 1
-
-            self.stones.clear()
-            self.enemies.clear()
-            self.enemy_projectiles.clear()  # 적 발사체도 제거
-            self.skill_available = False
-            self.skill_count = 0
-
-    def apply_powerup(self, powerup_type: PowerUpType):
-        """
-        파워업 효과 적용
+    파일이 쌓이지 않도록 게임마다 같은 파일을 덮어씁니다.
 
-        Args:
-            powerup_type: 파워업 타입
-        """
-        # 아이템 수집 통계
-        self.statistics.on_item_collected()
-
-        if powerup_type == PowerUpType.HEALTH:
-            # 체력 회복 (최대치까지)
-            self.health = min(self.health + 1, INITIAL_HEALTH)
-        elif powerup_type == PowerUpType.SHIELD:
-            # 무적 효과
-            self.powerup_manager.activate_powerup(powerup_type)
-            self.is_invincible = True
-        elif powerup_type == PowerUpType.SPEED_BOOST:
-            # 속도 증가
-            self.powerup_manager.activate_powerup(powerup_type)
-            self.player_speed_multiplier = 1.5
-        elif powerup_type == PowerUpType.MULTI_SHOT:
-            # 3연발
-            self.powerup_manager.activate_powerup(powerup_type)
-        elif powerup_type == PowerUpType.SCORE_MULTIPLIER:
-            # 점수 2배
-            self.powerup_manager.activate_powerup(powerup_type)
-
-    def update_powerup_effects(self):
-        """파워업 효과 상태 업데이트"""
-        # 무적 효과 확인
-        if not self.powerup_manager.is_effect_active(PowerUpType.SHIELD):
-            self.is_invincible = False
-
-        # 속도 증가 효과 확인
-        if not self.powerup_manager.is_effect_active(PowerUpType.SPEED_BOOST):
-            self.player_speed_multiplier = 1.0
+    Args:
+        profiler: 프레임 프로파일러
+        game_state: 게임 상태 (할당 통계 기록용, 선택사항)
+    """
+    path = os.path.join(PROFILE_DIR, "last_game")
+    extra = {
+        "client_version": CLIENT_VERSION,
+        "fps": FPS,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "cache_hit_rates": {
+            "text": profiler.rate("text_hits", "text_misses"),
+            "surface": profiler.rate("surface_hits", "surface_misses"),
+        },
+    }
+    if game_state is not None:
+        extra["allocation"] = game_state.allocation_stats()
+    try:
+        profiler.export_csv(path + ".csv")
+        profiler.export_json(path + ".json", extra)
+        logger.info(f"프레임 프로파일 저장: {path}.csv, {path}.json")
+    except OSError as e:
+        logger.warning(f"프레임 프로파일을 저장할 수 없습니다: {e}")
 
 
 def gameStart(api_client=None, difficulty_manager=None):
@@ -418,6 +431,12 @@ def gameStart(api_client=None, difficulty_manager=None):
         api_client: API 클라이언트 (선택사항, 없으면 오프라인 모드)
         difficulty_manager: 난이도 관리자 (선택사항)
     """
+    replay_writer = None
+    game_state = None
+    checkpoints = None
+    ghost_loader = None
+    profiler = None
+    finished = False  # 게임 오버/BACK/오류로 끝났으면 체크포인트를 지움 (창을 닫으면 남겨 다음에 이어서)
     try:
         # API 클라이언트가 없으면 생성 (오프라인 모드)
         if api_client is None:
@@ -431,35 +450,18 @@ def gameStart(api_client=None, difficulty_manager=None):
         # 버튼 생성
         back_button = create_button_rect(UI.BACK_BUTTON)
 
-        # 난이도 설정 가져오기
-        if difficulty_manager:
-            difficulty_settings = difficulty_manager.get_current_settings()
-            enemy_speed = difficulty_settings.get('enemy_speed', 2.5)
-            enemy_spawn_chance = difficulty_settings.get('enemy_spawn_chance', 0.2)
-            enemy_evasion_skill = difficulty_settings.get('enemy_evasion_skill', 0.8)
-            enemy_attack_rate = difficulty_settings.get('enemy_attack_rate', 90)
-        else:
-            # 기본값 사용
-            from core.config import ENEMY_SPEED, ENEMY_SPAWN_CHANCE, ENEMY_EVASION_SKILL, ENEMY_ATTACK_RATE
-            enemy_speed = ENEMY_SPEED
-            enemy_spawn_chance = ENEMY_SPAWN_CHANCE
-            enemy_evasion_skill = ENEMY_EVASION_SKILL
-            enemy_attack_rate = ENEMY_ATTACK_RATE
-
         # 리소스 로드
         try:
-            from core.config import ENEMY_WIDTH, ENEMY_HEIGHT, ENEMY_PROJECTILE_SPEED
-
-            background_img = load_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            player_img = load_image(Resources.PLAYER, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            stone_img = load_image(Resources.STONE, (STONE_MAX_SIZE, STONE_MAX_SIZE))
-            missile_img = load_image(Resources.MISSILE, (MISSILE_WIDTH, MISSILE_HEIGHT))
-            collision_img = load_image(Resources.COLLISION, (STONE_MAX_SIZE, STONE_MAX_SIZE))
-            heart_full_img = load_image(Resources.HEART_FULL, (UI.HEART_SIZE, UI.HEART_SIZE))
-            heart_empty_img = load_image(Resources.HEART_EMPTY, (UI.HEART_SIZE, UI.HEART_SIZE))
-            skill_icon = load_image(Resources.SKILL_ICON, (UI.SKILL_ICON_SIZE, UI.SKILL_ICON_SIZE))
-            enemy_img = load_image(Resources.ENEMY, (ENEMY_WIDTH, ENEMY_HEIGHT))
-            enemy_proj_img = load_image(Resources.ENEMY_PROJECTILE, (MISSILE_WIDTH, MISSILE_HEIGHT))
+            background_img = surface_cache.get_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            player_img = surface_cache.get_image(Resources.PLAYER, (PLAYER_WIDTH, PLAYER_HEIGHT))
+            stone_img = surface_cache.get_image(Resources.STONE, (STONE_MAX_SIZE, STONE_MAX_SIZE))
+            missile_img = surface_cache.get_image(Resources.MISSILE, (MISSILE_WIDTH, MISSILE_HEIGHT))
+            collision_img = surface_cache.get_image(Resources.COLLISION, (STONE_MAX_SIZE, STONE_MAX_SIZE))
+            heart_full_img = surface_cache.get_image(Resources.HEART_FULL, (UI.HEART_SIZE, UI.HEART_SIZE))
+            heart_empty_img = surface_cache.get_image(Resources.HEART_EMPTY, (UI.HEART_SIZE, UI.HEART_SIZE))
+            skill_icon = surface_cache.get_image(Resources.SKILL_ICON, (UI.SKILL_ICON_SIZE, UI.SKILL_ICON_SIZE))
+            enemy_img = surface_cache.get_image(Resources.ENEMY, (ENEMY_WIDTH, ENEMY_HEIGHT))
+            enemy_proj_img = surface_cache.get_image(Resources.ENEMY_PROJECTILE, (MISSILE_WIDTH, MISSILE_HEIGHT))
 
             missile_sound = load_sound(Resources.MISSILE_SOUND)
             load_music(Resources.BACKGROUND_MUSIC)
@@ -469,7 +471,6 @@ def gameStart(api_client=None, difficulty_manager=None):
             enemy_laser_charge_sound = None
             enemy_laser_fire_sound = None
             try:
-                import os
                 if os.path.exists(Resources.ENEMY_LASER_CHARGE_SOUND):
                     enemy_laser_charge_sound = load_sound(Resources.ENEMY_LASER_CHARGE_SOUND)
                 if os.path.exists(Resources.ENEMY_LASER_FIRE_SOUND):
@@ -478,339 +479,214 @@ def gameStart(api_client=None, difficulty_manager=None):
                 logger.warning(f"적 레이저 사운드 로드 실패 (선택사항): {e}")
 
             font = load_font(Resources.MAIN_FONT, UI.FONT_SIZE_MEDIUM)
+
+            # HUD 폰트 (매 프레임 파일에서 다시 읽지 않도록 한 번만 로드)
+            powerup_font = load_font(Resources.MAIN_FONT, 20)
+            effect_font = load_font(Resources.MAIN_FONT, 18)
+            combo_font = load_font(Resources.MAIN_FONT, 48)
+            mult_font = load_font(Resources.MAIN_FONT, 32)
+            stage_noti_font = load_font(Resources.MAIN_FONT, 56)
+            pause_text = stage_noti_font.render("PAUSED - P 키로 계속", True, WHITE)
         except (FileNotFoundError, pygame.error) as e:
             show_error_dialog("게임 리소스 로드 오류", str(e))
             return
 
-        # 게임 상태 초기화
-        game_state = GameState(difficulty_manager, api_client)
-        player = Player(player_img)
-
-        # 적 상태 추적 (사운드 재생용)
-        enemy_states = {}  # {enemy_id: previous_state}
+        # 게임 상태 초기화 (게임 진행은 시뮬레이션이, 그리기와 사운드는 여기서)
+        # 입력은 리플레이 파일에 게임 중 바로 기록, 끝내지 못한 게임이 있으면 체크포인트에서 이어서
+        sprites = Sprites(player_img, stone_img, missile_img, enemy_img)
+        simulation = _resume_from_checkpoint(
+            sprites, difficulty_manager, api_client,
+            confirm=lambda resumed: _ask_resume(gameScr, font, background_img, resumed)
+        )
+        if simulation is not None:
+            replay_writer = simulation.recorder if isinstance(simulation.recorder, ReplayWriter) else None
+        else:
+            seed = new_seed()
+            settings = difficulty_settings(difficulty_manager)
+            replay_writer = _open_replay_writer(seed, settings)
+            simulation = GameSimulation(
+                sprites, seed, settings,
+                difficulty_manager=difficulty_manager,
+                api_client=api_client,
+                recorder=replay_writer
+            )
+        if replay_writer is not None:
+            replay_writer.snapshot = simulation.snapshot  # 이후 키프레임에 상태를 담아 빠르게 탐색
+        checkpoints = CheckpointWriter(CHECKPOINT_PATH)
+        replay_path = replay_writer.path if replay_writer is not None else None
+        game_state = simulation.state
+        player = simulation.player
+        game_state.powerup_manager.bake_icons(powerup_font, effect_font)
+
+        # 랭킹 상위 리플레이를 받아 고스트로 함께 재생 (받는 동안에도 게임은 바로 시작)
+        if GHOST_ENABLED:
+            ghost_loader = GhostLoader(api_client, simulation.settings["difficulty"])
+        ghost = None
+
+        # 변경된 영역만 지우고 화면에 반영
+        tracker = DirtyRectTracker(gameScr, background_img)
+        hud_text = TextCache()
+
+        # 프레임 구간 시간 기록 (F3로 오버레이, 끝나면 파일로)
+        profiler = FrameProfiler(PROFILER_FRAMES)
+        simulation.profiler = profiler
+        profiler_overlay = ProfilerOverlay(profiler, effect_font)
 
         # 메인 게임 루프
         running = True
+        paused = False
         while running:
-            for event in pygame.event.get():
+            profiler.begin_frame()
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
+                    # 창을 닫으면 지금 상태를 남겨 다음 시작 때 이어서 진행
+                    checkpoints.submit(simulation.snapshot(), replay_path)
                     running = False
 
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                    paused = not paused
+                    if paused:
+                        checkpoints.submit(simulation.snapshot(), replay_path)
+
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler_overlay.toggle()
+
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if back_button.collidepoint(event.pos):
+                        finished = True
                         running = False
 
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        # 미사일 발사
-                        if not game_state.game_over:
-                            # 멀티샷 파워업 확인
-                            if game_state.powerup_manager.is_effect_active(PowerUpType.MULTI_SHOT):
-                                # 3연발
-                                missile_x = player.rect.x + PLAYER_WIDTH / 2 - MISSILE_WIDTH / 2
-                                missile_y = player.rect.y
-
-                                # 중앙
-                                missile_center = Missile(missile_img, missile_x, missile_y)
-                                game_state.missiles.append(missile_center)
-
-                                # 왼쪽
-                                missile_left = Missile(missile_img, missile_x - 15, missile_y)
-                                game_state.missiles.append(missile_left)
-
-                                # 오른쪽
-                                missile_right = Missile(missile_img, missile_x + 15, missile_y)
-                                game_state.missiles.append(missile_right)
-
-                                game_state.missiles_fired += 3
-                                game_state.statistics.on_missile_fired(3)
-                            else:
-                                # 일반 발사
-                                missile_x = player.rect.x + PLAYER_WIDTH / 2 - MISSILE_WIDTH / 2
-                                missile_y = player.rect.y
-                                missile = Missile(missile_img, missile_x, missile_y)
-                                game_state.missiles.append(missile)
-                                game_state.missiles_fired += 1
-                                game_state.statistics.on_missile_fired(1)
-
-                            try:
-                                missile_sound.play()
-                            except pygame.error:
-                                pass
-
-                    elif event.key == pygame.K_f or event.unicode == "ㄹ":
-                        # 스킬 사용
-                        game_state.use_skill()
-
-            # 프레임 카운터 및 콤보 시스템 업데이트
-            if not game_state.game_over:
-                game_state.current_frame += 1
-                game_state.combo_system.update(game_state.current_frame)
-                game_state.powerup_manager.update_effects()
-                game_state.update_powerup_effects()
-                game_state.stage_manager.update_notification()
-
-                # 스테이지 진행 체크
-                if game_state.stage_manager.check_advance(game_state.score):
-                    # 스테이지 진행 시 통계 업데이트
-                    game_state.statistics.on_stage_advanced(game_state.stage_manager.current_stage_number)
-
-            # 플레이어 움직임 (속도 파워업 적용)
-            if not game_state.game_over:
-                keys = pygame.key.get_pressed()
-                # 원래 속도에 multiplier 적용
-                if keys[pygame.K_UP]:
-                    player.rect.y -= PLAYER_SPEED * game_state.player_speed_multiplier
-                    if player.rect.y < 0:
-                        player.rect.y = 0
-                if keys[pygame.K_DOWN]:
-                    player.rect.y += PLAYER_SPEED * game_state.player_speed_multiplier
-                    if player.rect.y > SCREEN_HEIGHT - PLAYER_HEIGHT:
-                        player.rect.y = SCREEN_HEIGHT - PLAYER_HEIGHT
-                if keys[pygame.K_LEFT]:
-                    player.rect.x -= PLAYER_SPEED * game_state.player_speed_multiplier
-                    if player.rect.x < 0:
-                        player.rect.x = 0
-                if keys[pygame.K_RIGHT]:
-                    player.rect.x += PLAYER_SPEED * game_state.player_speed_multiplier
-                    if player.rect.x > SCREEN_WIDTH - PLAYER_WIDTH:
-                        player.rect.x = SCREEN_WIDTH - PLAYER_WIDTH
+            inputs = read_input(events, pygame.key.get_pressed())
+            profiler.lap("input")
 
-            # 배경 그리기
-            gameScr.blit(background_img, [0, 0])
+            if paused:
+                # 일시정지 중에는 진행하지 않고 (입력도 기록하지 않음) 같은 상태를 다시 그림
+                frame_events = FrameEvents()
+            else:
+                # 이번 프레임 입력으로 한 프레임 진행 (입력은 리플레이에 기록)
+                frame_events = simulation.step(inputs)
+
+                # 주기적으로 체크포인트 (스냅샷만 여기서, 파일 쓰기는 백그라운드 스레드)
+                if not game_state.game_over and game_state.current_frame % CHECKPOINT_INTERVAL == 0:
+                    checkpoints.submit(simulation.snapshot(), replay_path)
+
+                # 고스트도 같은 고정 프레임 루프에서 한 프레임씩 (받은 입력만큼)
+                if ghost is None and ghost_loader is not None and ghost_loader.stream is not None:
+                    ghost = Ghost(sprites, ghost_loader.stream, ghost_loader.entry, effect_font,
+                                  start_frame=game_state.current_frame)
+                if ghost is not None:
+                    ghost.feed(ghost_loader.take_chunks())
+                    ghost.advance()
+
+            if frame_events.missiles_fired:
+                try:
+                    missile_sound.play()
+                except pygame.error:
+                    pass
+
+            # 상태 변경 시 사운드 재생
+            for enemy, current_state in frame_events.state_changes:
+                # 충전 시작 시 충전 사운드 재생
+                if current_state == EnemyState.CHARGING and enemy_laser_charge_sound:
+                    enemy_laser_charge_sound.play()
+
+                # 발사 시작 시 발사 사운드 재생
+                elif current_state == EnemyState.FIRING and enemy_laser_fire_sound:
+                    enemy_laser_fire_sound.play()
+            profiler.lap("update")
+
+            # 지난 프레임에 그린 영역을 배경으로 지우기
+            tracker.begin_frame()
 
             # 플레이어 그리기
-            player.draw(gameScr)
+            if ghost is not None:
+                tracker.add(ghost.draw(gameScr))
+            tracker.add(player.draw(gameScr))
 
-            # 미사일 업데이트 및 그리기
-            for missile in game_state.missiles:
-                missile.update()
-                missile.draw(gameScr)
+            # 미사일, 운석 그리기 (레이어 배치)
+            tracker.add_all(blit_layer(gameScr, [(missile.image, missile.rect) for missile in game_state.missiles]))
+            tracker.add_all(blit_layer(gameScr, [(stone.image, stone.rect) for stone in game_state.stones]))
 
-            # 돌 생성
-            if not game_state.game_over:
-                game_state.stone_spawn_timer += 1
-                # 스테이지 배율 적용한 스폰 간격
-                adjusted_interval = int(game_state.stone_spawn_interval *
-                                       game_state.stage_manager.get_stone_spawn_multiplier())
-                if game_state.stone_spawn_timer >= adjusted_interval:
-                    # 스테이지 배율 적용한 운석 속도
-                    speed_multiplier = game_state.stage_manager.get_stone_speed_multiplier()
-                    stone = Stone(stone_img, speed_multiplier=speed_multiplier)
-                    game_state.stones.append(stone)
-                    game_state.stone_spawn_timer = 0
-                    game_state.stone_spawn_interval = max(
-                        game_state.stone_spawn_interval - 1,
-                        STONE_SPAWN_INTERVAL_MIN
-                    )
-
-            # 적 생성 (확률적, 스테이지 배율 적용)
-            if not game_state.game_over:
-                # 스테이지 배율 적용
-                adjusted_spawn_chance = enemy_spawn_chance * game_state.stage_manager.get_enemy_spawn_multiplier()
-                if random.random() < adjusted_spawn_chance / 60:  # 프레임당 확률 조정
-                    enemy = Enemy(enemy_img, enemy_speed, enemy_evasion_skill)
-                    game_state.enemies.append(enemy)
-
-            # 파워업 생성 (확률적, 약 5초마다 1개)
-            if not game_state.game_over:
-                if random.random() < 0.003:  # 약 0.3% 확률 (60 FPS 기준 약 5초마다 1개)
-                    game_state.powerup_manager.spawn_random_powerup()
+            # 적 그리기 (레이저/충전 이펙트는 이미지 위에 따로, 이미지는 레이어 배치)
+            enemy_layer = []
+            effect_enemies = []
+            for enemy in game_state.enemies:
+                enemy_layer.append((enemy.image, enemy.rect))
+                if enemy.has_effects():
+                    effect_enemies.append(enemy)
 
-            # 돌 업데이트 및 그리기
-            for stone in game_state.stones:
-                stone.update()
-                stone.draw(gameScr)
+            tracker.add_all(blit_layer(gameScr, enemy_layer))
+            for enemy in effect_enemies:
+                tracker.add(enemy.draw_effects(gameScr))
 
-            # 적 업데이트 및 그리기 (레이저 시스템)
-            for enemy in game_state.enemies:
-                enemy_id = id(enemy)  # 적의 고유 ID
-                prev_state = enemy_states.get(enemy_id, None)
-
-                # 적 업데이트 (플레이어, 미사일, 운석 전달하여 AI 로직 실행)
-                enemy.update(player, game_state.missiles, game_state.stones)
-
-                # 상태 변경 감지 및 사운드 재생
-                current_state = enemy.state
-                if prev_state != current_state:
-                    # 충전 시작 시 충전 사운드 재생
-                    if current_state == EnemyState.CHARGING and enemy_laser_charge_sound:
-                        enemy_laser_charge_sound.play()
-
-                    # 발사 시작 시 발사 사운드 재생
-                    elif current_state == EnemyState.FIRING and enemy_laser_fire_sound:
-                        enemy_laser_fire_sound.play()
-
-                    # 상태 업데이트
-                    enemy_states[enemy_id] = current_state
-
-                # 적 그리기 (레이저 포함)
-                enemy.draw(gameScr)
-
-            # 화면 밖으로 나간 적의 상태 추적 정리
-            current_enemy_ids = {id(enemy) for enemy in game_state.enemies}
-            enemy_states = {eid: state for eid, state in enemy_states.items() if eid in current_enemy_ids}
-
-            # 적 발사체 업데이트 및 그리기
-            for projectile in game_state.enemy_projectiles:
-                projectile.update()
-                projectile.draw(gameScr)
-
-            # 파워업 업데이트 및 그리기
-            game_state.powerup_manager.update_powerups()
-            game_state.powerup_manager.draw_powerups(gameScr, load_font(Resources.MAIN_FONT, 20))
-
-            # 충돌 감지
-            collisions = CollisionDetector.check_all_collisions(
-                player,
-                game_state.missiles,
-                game_state.stones,
-                game_state.enemies,
-                game_state.enemy_projectiles,
-                game_state.powerup_manager.get_active_powerups()
-            )
+            # 적 발사체, 파워업 그리기
+            tracker.add_all(blit_layer(
+                gameScr, [(projectile.image, projectile.rect) for projectile in game_state.enemy_projectiles]
+            ))
+            tracker.add_all(game_state.powerup_manager.draw_powerups(gameScr))
 
-            # 플레이어-운석 충돌 처리
-            unique_player_stones = sorted(set(collisions['player_stone']), reverse=True)
-            for stone_idx in unique_player_stones:
-                game_state.take_damage()
-                gameScr.blit(collision_img, (game_state.stones[stone_idx].rect.x, game_state.stones[stone_idx].rect.y))
-                del game_state.stones[stone_idx]
-
-            # 플레이어-적 충돌 처리
-            unique_player_enemies = sorted(set(collisions['player_enemy']), reverse=True)
-            for enemy_idx in unique_player_enemies:
-                game_state.take_damage()
-                gameScr.blit(collision_img, (game_state.enemies[enemy_idx].rect.x, game_state.enemies[enemy_idx].rect.y))
-                del game_state.enemies[enemy_idx]
-
-            # 플레이어-적 발사체 충돌 처리
-            unique_player_projectiles = sorted(set(collisions['player_enemy_projectile']), reverse=True)
-            for proj_idx in unique_player_projectiles:
-                game_state.take_damage()
-                del game_state.enemy_projectiles[proj_idx]
-
-            # 플레이어-적 레이저 충돌 처리 (쿨다운 적용)
-            unique_player_lasers = set(collisions['player_enemy_laser'])
-            if unique_player_lasers and not game_state.powerup_manager.has_active_powerup(PowerUpType.SHIELD):
-                # 레이저에 맞으면 피해 (무적 상태가 아닌 경우)
-                # 쿨다운이 끝났을 때만 피해 적용 (30 프레임 = 0.5초)
-                if game_state.laser_damage_cooldown <= 0:
-                    game_state.take_damage()
-                    game_state.laser_damage_cooldown = 30  # 0.5초 쿨다운
-
-            # 레이저 피해 쿨다운 감소
-            if game_state.laser_damage_cooldown > 0:
-                game_state.laser_damage_cooldown -= 1
-
-            # 플레이어-파워업 충돌 처리
-            unique_player_powerups = sorted(set(collisions['player_powerup']), reverse=True)
-            for powerup_idx in unique_player_powerups:
-                powerup = game_state.powerup_manager.get_active_powerups()[powerup_idx]
-                game_state.apply_powerup(powerup.type)  # 내부에서 통계 업데이트
-                del game_state.powerup_manager.active_powerups[powerup_idx]
-
-            # 미사일-운석 충돌 처리
-            stones_to_remove = set()
-            missiles_to_remove = set()
-            for missile_idx, stone_idx in collisions['missile_stone']:
-                if stone_idx not in stones_to_remove:
-                    game_state.add_missile_hit(is_enemy=False)
-                    gameScr.blit(collision_img, (game_state.stones[stone_idx].rect.x, game_state.stones[stone_idx].rect.y))
-                stones_to_remove.add(stone_idx)
-                missiles_to_remove.add(missile_idx)
-
-            # 미사일-적 충돌 처리
-            enemies_to_remove = set()
-            for missile_idx, enemy_idx in collisions['missile_enemy']:
-                if enemy_idx not in enemies_to_remove:
-                    game_state.add_missile_hit(is_enemy=True)
-                    gameScr.blit(collision_img, (game_state.enemies[enemy_idx].rect.x, game_state.enemies[enemy_idx].rect.y))
-                enemies_to_remove.add(enemy_idx)
-                missiles_to_remove.add(missile_idx)
-
-            # 큰 인덱스부터 삭제
-            for stone_idx in sorted(stones_to_remove, reverse=True):
-                del game_state.stones[stone_idx]
-            for enemy_idx in sorted(enemies_to_remove, reverse=True):
-                del game_state.enemies[enemy_idx]
-            for missile_idx in sorted(missiles_to_remove, reverse=True):
-                del game_state.missiles[missile_idx]
-
-            # 범위 벗어난 객체 제거
-            for missile_idx in sorted(collisions['missile_out'], reverse=True):
-                del game_state.missiles[missile_idx]
-
-            for stone_idx in sorted(collisions['stone_out'], reverse=True):
-                del game_state.stones[stone_idx]
-
-            for enemy_idx in sorted(collisions['enemy_out'], reverse=True):
-                del game_state.enemies[enemy_idx]
-
-            for proj_idx in sorted(collisions['enemy_projectile_out'], reverse=True):
-                del game_state.enemy_projectiles[proj_idx]
+            # 이번 프레임 충돌 이펙트
+            for position in frame_events.explosions:
+                tracker.add(gameScr.blit(collision_img, position))
+            profiler.lap("render")
 
             # UI 그리기 - 체력
             if not game_state.game_over:
                 for i in range(game_state.health):
-                    gameScr.blit(heart_full_img, [UI.HEART_START_X + i * UI.HEART_SPACING, UI.HEART_START_Y])
+                    tracker.add(gameScr.blit(heart_full_img, [UI.HEART_START_X + i * UI.HEART_SPACING, UI.HEART_START_Y]))
                 for i in range(game_state.health, INITIAL_HEALTH):
-                    gameScr.blit(heart_empty_img, [UI.HEART_START_X + i * UI.HEART_SPACING, UI.HEART_START_Y])
+                    tracker.add(gameScr.blit(heart_empty_img, [UI.HEART_START_X + i * UI.HEART_SPACING, UI.HEART_START_Y]))
 
             # UI 그리기 - 점수
-            score_text = font.render(f"Score: {game_state.score}", True, WHITE)
+            score_text = hud_text.render(font, f"Score: {game_state.score}", WHITE)
             score_rect = score_text.get_rect(center=(70, 60))
-            gameScr.blit(score_text, score_rect)
+            tracker.add(gameScr.blit(score_text, score_rect))
 
             # UI 그리기 - 스테이지
-            stage_text = font.render(f"Stage: {game_state.stage_manager.current_stage_number}", True, (100, 200, 255))
+            stage_text = hud_text.render(font, f"Stage: {game_state.stage_manager.current_stage_number}", (100, 200, 255))
             stage_rect = stage_text.get_rect(center=(SCREEN_WIDTH - 70, 60))
-            gameScr.blit(stage_text, stage_rect)
+            tracker.add(gameScr.blit(stage_text, stage_rect))
 
             # 스테이지 진행 알림
             if game_state.stage_manager.show_stage_notification:
-                stage_noti_font = load_font(Resources.MAIN_FONT, 56)
-                stage_noti_text = stage_noti_font.render(
+                stage_noti_text = hud_text.render(
+                    stage_noti_font,
                     game_state.stage_manager.get_stage_info(),
-                    True,
                     (255, 215, 0) if game_state.stage_manager.is_boss_stage() else (100, 200, 255)
                 )
                 stage_noti_rect = stage_noti_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
                 # 반투명 배경
-                overlay = pygame.Surface((SCREEN_WIDTH, 100))
-                overlay.set_alpha(150)
-                overlay.fill((0, 0, 0))
-                gameScr.blit(overlay, (0, SCREEN_HEIGHT // 2 - 50))
-                gameScr.blit(stage_noti_text, stage_noti_rect)
+                overlay = surface_cache.get_overlay((SCREEN_WIDTH, 100), (0, 0, 0), 150)
+                tracker.add(gameScr.blit(overlay, (0, SCREEN_HEIGHT // 2 - 50)))
+                tracker.add(gameScr.blit(stage_noti_text, stage_noti_rect))
 
             # UI 그리기 - 스킬
             if game_state.skill_available:
-                gameScr.blit(skill_icon, [UI.SKILL_ICON_X, UI.SKILL_ICON_Y])
-                skill_text = font.render("스킬: F 키 사용 가능", True, WHITE)
-                gameScr.blit(skill_text, [10, 650])
+                tracker.add(gameScr.blit(skill_icon, [UI.SKILL_ICON_X, UI.SKILL_ICON_Y]))
+                skill_text = hud_text.render(font, "스킬: F 키 사용 가능", WHITE)
+                tracker.add(gameScr.blit(skill_text, [10, 650]))
             else:
-                skill_text = font.render(
+                skill_text = hud_text.render(
+                    font,
                     f"스킬: {game_state.skill_count} / {SKILL_THRESHOLD}",
-                    True,
                     WHITE
                 )
-                gameScr.blit(skill_text, [10, 650])
+                tracker.add(gameScr.blit(skill_text, [10, 650]))
 
             # UI 그리기 - 콤보 시스템
             combo_text = game_state.combo_system.get_display_text()
             if combo_text:
                 # 콤보 텍스트 (화면 중앙 상단)
-                combo_font = load_font(Resources.MAIN_FONT, 48)
-                combo_surface = combo_font.render(combo_text, True, (255, 215, 0))  # 골드 색상
+                combo_surface = hud_text.render(combo_font, combo_text, (255, 215, 0))  # 골드 색상
                 combo_rect = combo_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
-                gameScr.blit(combo_surface, combo_rect)
+                tracker.add(gameScr.blit(combo_surface, combo_rect))
 
                 # 배율 텍스트
                 multiplier_text = game_state.combo_system.get_multiplier_text()
-                mult_font = load_font(Resources.MAIN_FONT, 32)
-                mult_surface = mult_font.render(multiplier_text, True, (255, 165, 0))  # 오렌지 색상
+                mult_surface = hud_text.render(mult_font, multiplier_text, (255, 165, 0))  # 오렌지 색상
                 mult_rect = mult_surface.get_rect(center=(SCREEN_WIDTH // 2, 145))
-                gameScr.blit(mult_surface, mult_rect)
+                tracker.add(gameScr.blit(mult_surface, mult_rect))
 
                 # 타이머 바 (콤보 아래)
                 timer_percent = game_state.combo_system.get_timer_percent()
@@ -820,7 +696,7 @@ def gameStart(api_client=None, difficulty_manager=None):
                 bar_y = 170
 
                 # 배경 바
-                pygame.draw.rect(gameScr, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+                tracker.add(pygame.draw.rect(gameScr, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height)))
 
                 # 진행 바 (시간이 줄어들면 색상도 변경)
                 if timer_percent > 0.5:
@@ -834,12 +710,12 @@ def gameStart(api_client=None, difficulty_manager=None):
                 pygame.draw.rect(gameScr, bar_color, (bar_x, bar_y, current_bar_width, bar_height))
 
             # UI 그리기 - 활성 파워업 효과
-            effect_font = load_font(Resources.MAIN_FONT, 18)
-            game_state.powerup_manager.draw_active_effects_ui(gameScr, effect_font, 10, 100)
+            tracker.add_all(game_state.powerup_manager.draw_active_effects_ui(gameScr, effect_font, 10, 100))
 
             # 무적 상태 표시 (화면 테두리)
             if game_state.is_invincible:
                 pygame.draw.rect(gameScr, (100, 200, 255), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), 5)
+                tracker.add_border(gameScr.get_rect(), 5)
 
             # 실시간 업적 체크 (게임 중)
             if not game_state.game_over:
@@ -850,7 +726,7 @@ def gameStart(api_client=None, difficulty_manager=None):
 
             # 업적 알림 업데이트 및 그리기
             game_state.achievement_notification_manager.update()
-            game_state.achievement_notification_manager.draw(gameScr, Resources.MAIN_FONT)
+            tracker.add(game_state.achievement_notification_manager.draw(gameScr))
 
             # 업적 체커에서 대기 중인 알림 확인 및 추가
             while game_state.achievement_checker.has_notifications():
@@ -858,17 +734,31 @@ def gameStart(api_client=None, difficulty_manager=None):
                 if achievement_code:
                     game_state.achievement_notification_manager.add_achievement(achievement_code)
 
+            # 일시정지 표시
+            if paused:
+                tracker.add(gameScr.blit(pause_text, pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))))
+
             # UI 그리기 - BACK 버튼
             mouse_pos = pygame.mouse.get_pos()
-            back_text = font.render("BACK", True, RED if back_button.collidepoint(mouse_pos) else WHITE)
-            gameScr.blit(back_text, [back_button.x, back_button.y])
+            back_text = hud_text.render(font, "BACK", RED if back_button.collidepoint(mouse_pos) else WHITE)
+            tracker.add(gameScr.blit(back_text, [back_button.x, back_button.y]))
+
+            # 프레임 프로파일러 오버레이 (F3)
+            tracker.add(profiler_overlay.draw(gameScr))
+            profiler.lap("hud")
 
             # 게임 오버 처리
             if game_state.game_over:
+                finished = True
+
                 # 게임 오버 화면 표시 및 점수 저장
                 pygame.display.flip()
                 pygame.time.wait(1000)  # 1초 대기
 
+                # 리플레이 마무리 (최종 점수 기록)
+                if replay_writer:
+                    replay_writer.close(game_state.score)
+
                 # 통계 및 업적 체크
                 max_combo = game_state.combo_system.get_max_combo()
                 achievements_unlocked = game_state.achievement_checker.check_achievements(
@@ -878,17 +768,40 @@ def gameStart(api_client=None, difficulty_manager=None):
 
                 show_game_over_screen(
                     gameScr, font, game_state.score, background_img, api_client,
-                    max_combo, game_state.statistics, achievements_unlocked
+                    max_combo, game_state.statistics, achievements_unlocked,
+                    replay_path
                 )
                 running = False  # 메인 메뉴로 돌아가기
 
-            pygame.display.flip()
+            tracker.present()
+            profiler.lap("flip")
             fps.tick(FPS)
+            profiler.lap("tick")
+
+            # 게임 오버 화면을 띄운 프레임은 대기 시간이 섞이므로 기록하지 않음
+            if running:
+                _count_frame(profiler, game_state, tracker, hud_text)
+                profiler.end_frame()
 
     except Exception as e:
+        # 같은 체크포인트에서 이어가면 같은 오류가 반복될 수 있으므로 남기지 않음
+        finished = True
         show_error_dialog("게임 실행 오류", f"게임 플레이 중 오류 발생:\n{str(e)}")
 
     finally:
+        # 남은 체크포인트 쓰기 (끝난 게임이면 체크포인트 삭제, 창을 닫았으면 마지막 체크포인트를 남김)
+        if checkpoints:
+            checkpoints.close(discard=finished)
+        elif finished:
+            discard_checkpoint(CHECKPOINT_PATH)  # 체크포인트에서 이어가는 도중 오류
+        if ghost_loader is not None:
+            ghost_loader.close()
+        if profiler is not None and PROFILER_EXPORT and len(profiler):
+            _export_profile(profiler, game_state)
+
+        # 중간에 나간 게임도 그때까지의 리플레이를 남김
+        if replay_writer is not None and not replay_writer.closed:
+            replay_writer.close(game_state.score if game_state else 0)
         pygame.mixer.music.stop()
 
 
@@ -901,7 +814,7 @@ def gameinform():
         back_button = create_button_rect(UI.INFO_BACK_BUTTON)
 
         try:
-            background_img = load_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            background_img = surface_cache.get_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
             font = load_font(Resources.MAIN_FONT, UI.FONT_SIZE_MEDIUM)
         except (FileNotFoundError, pygame.error) as e:
             show_error_dialog("정보 화면 로드 오류", str(e))
@@ -3,12 +3,20 @@ import pygame
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, Resources, UI
 from utils import load_font
 from services.api_service import GameAPIClient
+from services.paged_loader import PagedLoader
 from screens.base_screen import BaseScreen
 
+# 최근 기록 목록
+SCORE_PAGE_SIZE = 10
+VISIBLE_SCORE_ROWS = 5
+SCORE_ROW_HEIGHT = 35
+
 
 class ProfileScreen(BaseScreen):
     """프로필 및 통계 화면 클래스"""
 
+    retained = True
+
     def __init__(self, screen: pygame.Surface, background_img: pygame.Surface, api_client: GameAPIClient):
         """
         ProfileScreen 초기화
@@ -32,7 +40,8 @@ class ProfileScreen(BaseScreen):
         # 데이터
         self.error_message = ""
         self.stats = None
-        self.my_scores = []
+        self.score_loader = None  # 최근 기록 (스크롤 시 다음 페이지 로드)
+        self.scroll_index = 0
 
         # 초기 데이터 로드
         self._load_data()
@@ -47,14 +56,15 @@ class ProfileScreen(BaseScreen):
             if not self.api_client.check_connection():
                 self.error_message = "서버에 연결할 수 없습니다"
             else:
-                self.stats = self.api_client.get_my_stats()
-                self.my_scores = self.api_client.get_my_scores()
-
-                if not self.stats:
-                    self.error_message = "통계 데이터를 불러올 수 없습니다"
+                success, self.stats, error = self.api_client.get_my_stats()
 
-                # 최근 5개만 표시
-                self.my_scores = self.my_scores[:5] if self.my_scores else []
+                if not success:
+                    self.error_message = error or "통계 데이터를 불러올 수 없습니다"
+                else:
+                    self.score_loader = PagedLoader(
+                        lambda cursor: self.api_client.get_my_scores_page_async(SCORE_PAGE_SIZE, cursor)
+                    )
+                    self.score_loader.request_more()
 
     def handle_events(self) -> bool:
         """이벤트 처리"""
@@ -66,6 +76,14 @@ class ProfileScreen(BaseScreen):
                 if self.back_button.collidepoint(event.pos):
                     return False
 
+                # 마우스 휠로 최근 기록 스크롤
+                if self.score_loader:
+                    if event.button == 4:  # 위로 스크롤
+                        self.scroll_index = max(self.scroll_index - 1, 0)
+                    elif event.button == 5:  # 아래로 스크롤
+                        max_index = max(len(self.score_loader.items) - VISIBLE_SCORE_ROWS, 0)
+                        self.scroll_index = min(self.scroll_index + 1, max_index)
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
@@ -74,17 +92,19 @@ class ProfileScreen(BaseScreen):
 
     def update(self):
         """상태 업데이트"""
-        pass
+        if self.score_loader:
+            if self.score_loader.poll():  # 빈 페이지/실패로 끝나도 다시 그림
+                self.invalidate()
+            self.score_loader.ensure_visible(self.scroll_index + VISIBLE_SCORE_ROWS - 1)
+
+    def hover_rects(self) -> list:
+        """호버 시 모양이 바뀌는 영역"""
+        return [self.back_button]
 
     def render(self):
         """화면 렌더링"""
-        self.draw_background()
-
-        # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # 배경 + 반투명 오버레이 (미리 합성)
+        self.draw_backdrop(220)
 
         mouse_pos = pygame.mouse.get_pos()
 
@@ -143,15 +163,17 @@ class ProfileScreen(BaseScreen):
             self.screen.blit(avg_text, (80, y_offset))
 
             # 최근 기록
-            if self.my_scores:
-                recent_title = self.font_medium.render("📜 최근 기록 (최대 5개)", True, WHITE)
+            if self.score_loader and self.score_loader.items:
+                recent_title = self.font_medium.render("📜 최근 기록 (휠로 스크롤)", True, WHITE)
                 self.screen.blit(recent_title, (70, 490))
 
                 pygame.draw.line(self.screen, WHITE, (70, 525), (SCREEN_WIDTH - 70, 525), 2)
 
-                # 최근 점수 표시
-                for i, score_data in enumerate(self.my_scores):
-                    y_pos = 545 + i * 35
+                # 보이는 범위의 점수만 표시
+                visible = self.score_loader.items[self.scroll_index:self.scroll_index + VISIBLE_SCORE_ROWS]
+                for offset, score_data in enumerate(visible):
+                    i = self.scroll_index + offset
+                    y_pos = 545 + offset * SCORE_ROW_HEIGHT
 
                     # 점수
                     score_text = self.font_small.render(f"{i+1}. {score_data['score']}점", True, WHITE)
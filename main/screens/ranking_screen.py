@@ -5,10 +5,37 @@ from utils import load_font
 from services.api_service import GameAPIClient
 from screens.base_screen import BaseScreen
 
+# 기간 탭 (API window 값, 표시 이름)
+RANKING_WINDOWS = [
+    ("all", "전체"),
+    ("daily", "일간"),
+    ("weekly", "주간"),
+    ("season", "시즌"),
+]
+TAB_Y = 160
+TAB_HEIGHT = 34
+
+# 난이도 선택 (API difficulty 값, 표시 이름) - 난이도별 랭킹은 전체 기간만 제공
+RANKING_DIFFICULTIES = [
+    (None, "모든 난이도"),
+    ("easy", "초급"),
+    ("medium", "중급"),
+    ("hard", "고급"),
+]
+DIFFICULTY_Y = 202
+DIFFICULTY_HEIGHT = 28
+
+# 랭킹 표 배치
+HEADER_Y = 245
+ROW_START_Y = 285
+ROW_SPACING = 44
+
 
 class RankingScreen(BaseScreen):
     """랭킹 표시 화면"""
 
+    retained = True
+
     def __init__(self, screen: pygame.Surface, background_img: pygame.Surface, api_client: GameAPIClient):
         """
         RankingScreen 초기화
@@ -29,24 +56,65 @@ class RankingScreen(BaseScreen):
         # BACK 버튼
         self.back_button = pygame.Rect(20, 50, 100, 50)
 
-        # 랭킹 데이터
+        # 기간 탭
+        tab_width = (SCREEN_WIDTH - 60) // len(RANKING_WINDOWS)
+        self.tabs = [
+            (window, label, pygame.Rect(30 + i * tab_width, TAB_Y, tab_width - 6, TAB_HEIGHT))
+            for i, (window, label) in enumerate(RANKING_WINDOWS)
+        ]
+        self.window = RANKING_WINDOWS[0][0]
+
+        # 난이도 선택
+        selector_width = (SCREEN_WIDTH - 60) // len(RANKING_DIFFICULTIES)
+        self.difficulty_buttons = [
+            (difficulty, label, pygame.Rect(30 + i * selector_width, DIFFICULTY_Y, selector_width - 6, DIFFICULTY_HEIGHT))
+            for i, (difficulty, label) in enumerate(RANKING_DIFFICULTIES)
+        ]
+        self.difficulty = None
+
+        # 랭킹 데이터 ((기간, 난이도)별로 한 번만 로드)
         self.rankings = []
+        self.my_rank = None
+        self.rankings_by_board = {}
         self.error_message = ""
         self.loading = True
+        self.connected = self.api_client.check_connection()
 
         # 초기 데이터 로드
         self._load_rankings()
 
     def _load_rankings(self):
-        """랭킹 데이터 로드"""
-        if not self.api_client.check_connection():
+        """현재 기간/난이도의 랭킹 데이터와 내 순위 로드"""
+        self.error_message = ""
+        board = (self.window, self.difficulty)
+        if not self.connected:
             self.error_message = "서버에 연결할 수 없습니다"
-            self.loading = False
+        elif board in self.rankings_by_board:
+            self.rankings, self.my_rank = self.rankings_by_board[board]
         else:
-            self.rankings = self.api_client.get_top_scores(limit=10)
-            if not self.rankings:
-                self.error_message = "랭킹 데이터를 불러올 수 없습니다"
-            self.loading = False
+            success, rankings, error = self.api_client.get_top_scores(
+                limit=10, window=self.window, difficulty=self.difficulty
+            )
+            if success:
+                self.rankings = rankings
+                self.my_rank = self._load_my_rank(rankings)
+                self.rankings_by_board[board] = (self.rankings, self.my_rank)
+            else:
+                self.rankings = []
+                self.my_rank = None
+                self.error_message = error or "랭킹 데이터를 불러올 수 없습니다"
+        self.loading = False
+
+    def _load_my_rank(self, rankings):
+        """TOP 10 밖에 있을 때만 내 순위 조회"""
+        if not self.api_client.is_logged_in():
+            return None
+        username = self.api_client.session_manager.username
+        if any(ranking['username'] == username for ranking in rankings):
+            return None
+
+        success, my_rank, _ = self.api_client.get_my_rank(window=self.window, difficulty=self.difficulty)
+        return my_rank if success else None
 
     def handle_events(self) -> bool:
         """이벤트 처리"""
@@ -58,6 +126,20 @@ class RankingScreen(BaseScreen):
                 if self.back_button.collidepoint(event.pos):
                     return False
 
+                for window, _, rect in self.tabs:
+                    if rect.collidepoint(event.pos) and window != self.window:
+                        self.window = window
+                        if window != RANKING_WINDOWS[0][0]:
+                            self.difficulty = None
+                        self._load_rankings()
+
+                for difficulty, _, rect in self.difficulty_buttons:
+                    if rect.collidepoint(event.pos) and difficulty != self.difficulty:
+                        self.difficulty = difficulty
+                        if difficulty is not None:
+                            self.window = RANKING_WINDOWS[0][0]
+                        self._load_rankings()
+
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
@@ -68,15 +150,14 @@ class RankingScreen(BaseScreen):
         """상태 업데이트"""
         pass
 
+    def hover_rects(self) -> list:
+        """호버 시 모양이 바뀌는 영역"""
+        return [self.back_button]
+
     def render(self):
         """화면 렌더링"""
-        self.draw_background()
-
-        # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # 배경 + 반투명 오버레이 (미리 합성)
+        self.draw_backdrop(220)
 
         mouse_pos = pygame.mouse.get_pos()
 
@@ -93,6 +174,23 @@ class RankingScreen(BaseScreen):
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         self.screen.blit(title_text, title_rect)
 
+        # 기간 탭
+        for window, label, rect in self.tabs:
+            selected = window == self.window
+            tab_color = (70, 70, 140) if selected else (40, 40, 60)
+            pygame.draw.rect(self.screen, tab_color, rect)
+            pygame.draw.rect(self.screen, (255, 215, 0) if selected else (120, 120, 120), rect, 2)
+            tab_text = self.font_small.render(label, True, WHITE)
+            self.screen.blit(tab_text, tab_text.get_rect(center=rect.center))
+
+        # 난이도 선택
+        for difficulty, label, rect in self.difficulty_buttons:
+            selected = difficulty == self.difficulty
+            pygame.draw.rect(self.screen, (60, 90, 60) if selected else (35, 45, 35), rect)
+            pygame.draw.rect(self.screen, (0, 255, 0) if selected else (100, 100, 100), rect, 1)
+            label_text = self.font_small.render(label, True, WHITE if selected else (180, 180, 180))
+            self.screen.blit(label_text, label_text.get_rect(center=rect.center))
+
         if self.loading:
             # 로딩 중
             loading_text = self.font_medium.render("로딩 중...", True, WHITE)
@@ -107,7 +205,7 @@ class RankingScreen(BaseScreen):
 
         else:
             # 헤더
-            header_y = 180
+            header_y = HEADER_Y
             rank_header = self.font_small.render("순위", True, (200, 200, 200))
             self.screen.blit(rank_header, (50, header_y))
 
@@ -121,9 +219,8 @@ class RankingScreen(BaseScreen):
             pygame.draw.line(self.screen, WHITE, (30, header_y + 35), (SCREEN_WIDTH - 30, header_y + 35), 2)
 
             # 랭킹 표시
-            start_y = 230
             for i, ranking in enumerate(self.rankings):
-                y_pos = start_y + i * 50
+                y_pos = ROW_START_Y + i * ROW_SPACING
 
                 # 순위에 따른 색상
                 if ranking['rank'] == 1:
@@ -143,7 +240,7 @@ class RankingScreen(BaseScreen):
                 is_my_rank = (self.api_client.is_logged_in() and
                              ranking['username'] == self.api_client.session_manager.username)
                 if is_my_rank:
-                    highlight = pygame.Rect(30, y_pos - 5, SCREEN_WIDTH - 60, 45)
+                    highlight = pygame.Rect(30, y_pos - 5, SCREEN_WIDTH - 60, ROW_SPACING - 3)
                     pygame.draw.rect(self.screen, (50, 100, 50), highlight)
                     pygame.draw.rect(self.screen, (0, 255, 0), highlight, 2)
 
@@ -163,9 +260,20 @@ class RankingScreen(BaseScreen):
                 score_display = self.font_small.render(str(ranking['score']), True, rank_color)
                 self.screen.blit(score_display, (350, y_pos))
 
+            if not self.rankings:
+                empty_text = self.font_medium.render("아직 기록이 없습니다", True, (180, 180, 180))
+                self.screen.blit(empty_text, empty_text.get_rect(center=(SCREEN_WIDTH // 2, 400)))
+
+            # TOP 10 밖의 내 순위
+            if self.my_rank:
+                my_rank_text = self.font_small.render(
+                    f"내 순위: {self.my_rank['rank']}위 · {self.my_rank['score']}점", True, (0, 255, 0)
+                )
+                self.screen.blit(my_rank_text, my_rank_text.get_rect(center=(SCREEN_WIDTH // 2, 735)))
+
             # 안내 문구
             hint_text = self.font_small.render("ESC: 뒤로가기", True, (150, 150, 150))
-            self.screen.blit(hint_text, (SCREEN_WIDTH // 2 - 80, 750))
+            self.screen.blit(hint_text, (SCREEN_WIDTH // 2 - 80, 760))
 
 
 # 하위호환성을 위한 함수
@@ -1,7 +1,13 @@
 """통계 화면"""
 import pygame
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, Resources, UI
-from utils import load_image, load_font, create_button_rect, show_error_dialog
+from utils import load_font, create_button_rect, show_error_dialog
+from services.paged_loader import PagedLoader
+from ui import surface_cache
+from ui.retained import RetainedPresenter
+
+# 최근 게임 기록 페이지 크기
+HISTORY_PAGE_SIZE = 10
 
 
 def show_stats_screen(api_client):
@@ -18,7 +24,7 @@ def show_stats_screen(api_client):
         back_button = create_button_rect(UI.INFO_BACK_BUTTON)
 
         try:
-            background_img = load_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            background_img = surface_cache.get_image(Resources.BACKGROUND, (SCREEN_WIDTH, SCREEN_HEIGHT))
             title_font = load_font(Resources.MAIN_FONT, 48)
             font = load_font(Resources.MAIN_FONT, 28)
             small_font = load_font(Resources.MAIN_FONT, 22)
@@ -29,6 +35,7 @@ def show_stats_screen(api_client):
         # 통계 데이터 가져오기
         stats_data = None
         error_message = None
+        history_loader = None  # 최근 게임 기록 (스크롤 시 다음 페이지 로드)
 
         if api_client and api_client.is_logged_in():
             try:
@@ -36,6 +43,10 @@ def show_stats_screen(api_client):
                 success, data, error = api_client.get_my_stats_summary()
                 if success and data:
                     stats_data = data
+                    history_loader = PagedLoader(
+                        lambda cursor: api_client.get_my_game_history_page_async(HISTORY_PAGE_SIZE, cursor)
+                    )
+                    history_loader.request_more()
                 else:
                     error_message = error or "통계 로드 실패"
             except Exception as e:
@@ -43,32 +54,11 @@ def show_stats_screen(api_client):
         else:
             error_message = "로그인이 필요합니다"
 
-        running = True
-        scroll_offset = 0
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if back_button.collidepoint(event.pos):
-                        running = False
-
-                    # 마우스 휠 스크롤
-                    if event.button == 4:  # 위로 스크롤
-                        scroll_offset = min(scroll_offset + 20, 0)
-                    elif event.button == 5:  # 아래로 스크롤
-                        scroll_offset = max(scroll_offset - 20, -200)
-
-            # 배경 그리기
-            gameScr.blit(background_img, [0, 0])
-
-            # 반투명 오버레이
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            gameScr.blit(overlay, (0, 0))
+        def render():
+            """화면 전체 그리기 (presenter가 무효화된 영역으로 클립)"""
+            nonlocal max_scroll
+            # 배경 + 반투명 오버레이 (미리 합성)
+            gameScr.blit(surface_cache.get_backdrop(background_img, (0, 0, 0), 200), (0, 0))
 
             # BACK 버튼
             mouse_pos = pygame.mouse.get_pos()
@@ -124,13 +114,76 @@ def show_stats_screen(api_client):
                     else:
                         y_pos += 45 if label else 30
 
+                # 최근 게임 기록
+                if history_loader:
+                    y_pos += 20
+                    if y_pos > 100 and y_pos < SCREEN_HEIGHT - 50:
+                        history_title = font.render("최근 게임", True, WHITE)
+                        gameScr.blit(history_title, history_title.get_rect(center=(SCREEN_WIDTH // 2, y_pos)))
+                    y_pos += 45
+
+                    last_visible = -1
+                    for index, game in enumerate(history_loader.items):
+                        if y_pos > 100 and y_pos < SCREEN_HEIGHT - 50:  # 화면 범위 내에만 표시
+                            row_text = small_font.render(
+                                f"{game.get('final_score', 0):,}점 · {game.get('difficulty', '')} · "
+                                f"스테이지 {game.get('max_stage_reached', 1)} · {game.get('play_time', 0) // 60}분",
+                                True,
+                                (200, 200, 200)
+                            )
+                            gameScr.blit(row_text, row_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos)))
+                        if y_pos < SCREEN_HEIGHT:
+                            last_visible = index
+                        y_pos += 35
+
+                    # 목록 끝이 보이기 시작하면 다음 페이지 요청
+                    history_loader.ensure_visible(last_visible)
+
+                    if history_loader.loading and y_pos < SCREEN_HEIGHT - 50:
+                        loading_text = small_font.render("불러오는 중...", True, (150, 150, 150))
+                        gameScr.blit(loading_text, loading_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos)))
+                        y_pos += 35
+
+                max_scroll = max(y_pos - scroll_offset - (SCREEN_HEIGHT - 60), 0)
+
             # 스크롤 힌트
             if stats_data and y_pos > SCREEN_HEIGHT:
                 hint_text = small_font.render("마우스 휠로 스크롤", True, (150, 150, 150))
                 hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
                 gameScr.blit(hint_text, hint_rect)
 
-            pygame.display.update()
+        running = True
+        scroll_offset = 0
+        max_scroll = 200  # 내용 높이에 따라 그릴 때마다 갱신
+
+        presenter = RetainedPresenter(gameScr)
+        clock = pygame.time.Clock()
+
+        while running:
+            # 바뀐 것이 없으면 입력이 올 때까지 대기
+            presenter.wait()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if back_button.collidepoint(event.pos):
+                        running = False
+
+                    # 마우스 휠 스크롤
+                    if event.button == 4:  # 위로 스크롤
+                        scroll_offset = min(scroll_offset + 20, 0)
+                    elif event.button == 5:  # 아래로 스크롤
+                        scroll_offset = max(scroll_offset - 20, -max_scroll)
+
+            # 최근 게임 기록 요청이 끝남 (빈 페이지/실패여도 "불러오는 중..." 을 지우도록 다시 그림)
+            if history_loader and history_loader.poll():
+                presenter.invalidate()
+
+            presenter.track_hover([back_button], pygame.mouse.get_pos())
+            presenter.present(render)
+            clock.tick(30)
 
     except Exception as e:
         show_error_dialog("통계 화면 오류", f"통계 화면 실행 중 오류 발생:\n{str(e)}")
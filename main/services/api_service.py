@@ -8,6 +8,9 @@ from core.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# 서버가 다음 페이지 커서를 담아 보내는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class GameAPIClient:
     """API 통신을 위한 게임 API 클라이언트"""
@@ -135,19 +138,75 @@ class GameAPIClient:
         except requests.exceptions.RequestException as e:
             return False, None, f"네트워크 오류: {str(e)}"
 
-    def get_top_scores(self, limit: int = 10) -> tuple[bool, Optional[List], Optional[str]]:
+    def upload_replay(self, score_id: int, path: str) -> tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        저장한 점수의 리플레이 업로드 (서버가 재시뮬레이션해 점수 검증)
+
+        키프레임 스냅샷은 로컬 탐색용이라 빼고 입력만 보냅니다 (서버가 고스트로도 그대로 내려줌).
+
+        Args:
+            score_id: 점수 ID (save_score 응답의 id)
+            path: 리플레이 파일 경로
+
+        Returns:
+            tuple: (성공 여부, 응답 데이터(검증 상태 포함), 에러 메시지)
+        """
+        if not self.session_manager.is_logged_in():
+            return False, None, "로그인이 필요합니다"
+
+        from game.replay import strip_snapshots
+        try:
+            with open(path, "rb") as f:
+                data = strip_snapshots(f.read())
+        except OSError as e:
+            return False, None, f"리플레이 파일을 읽을 수 없습니다: {str(e)}"
+        except ValueError as e:
+            return False, None, f"리플레이 파일이 올바르지 않습니다: {str(e)}"
+
+        try:
+            headers = self._get_headers()
+            headers["Content-Type"] = "application/octet-stream"
+            response = requests.post(
+                f"{self.base_url}/api/scores/{score_id}/replay",
+                data=data,
+                headers=headers,
+                timeout=10
+            )
+
+            if response.status_code == 202:
+                return True, response.json(), None
+            else:
+                error_msg = response.json().get("detail", "리플레이 업로드 실패")
+                return False, None, error_msg
+
+        except requests.exceptions.RequestException as e:
+            return False, None, f"네트워크 오류: {str(e)}"
+
+    def get_top_scores(self, limit: int = 10, window: str = "all",
+                       difficulty: Optional[str] = None,
+                       verified: bool = False) -> tuple[bool, Optional[List], Optional[str]]:
         """
         상위 점수 조회
 
         Args:
             limit: 조회할 개수
+            window: 기간 ('all', 'daily', 'weekly', 'season')
+            difficulty: 난이도 (지정하면 해당 난이도의 전체 기간 랭킹)
+            verified: True면 리플레이로 검증된 점수만 (전체 기간 랭킹만, 항목에 score_id 포함)
 
         Returns:
             tuple: (성공 여부, 점수 리스트, 에러 메시지)
         """
+        params = {"limit": limit, "window": window}
+        if difficulty:
+            params["difficulty"] = difficulty
+        if verified:
+            params["verified"] = "true"
+
         try:
             response = requests.get(
-                f"{self.base_url}/api/scores/top?limit={limit}",
+                f"{self.base_url}/api/scores/top",
+                params=params,
                 headers=self._get_headers(),
                 timeout=5
             )
@@ -161,32 +220,148 @@ class GameAPIClient:
         except requests.exceptions.RequestException as e:
             return False, None, f"네트워크 오류: {str(e)}"
 
-    def get_my_scores(self) -> tuple[bool, Optional[List], Optional[str]]:
+    def get_replay_range(self, score_id: int, start: int,
+                         end: int) -> tuple[bool, Optional[Dict], Optional[str]]:
         """
-        내 점수 조회
+        검증된 점수의 리플레이 일부 받기 (Range 요청, 고스트 재생용)
+
+        Args:
+            score_id: 점수 ID (랭킹 항목의 score_id)
+            start: 시작 위치
+            end: 끝 위치 (포함)
 
         Returns:
-            tuple: (성공 여부, 점수 리스트, 에러 메시지)
+            tuple: (성공 여부, {"data": 받은 바이트, "total": 전체 크기}, 에러 메시지)
+        """
+        try:
+            headers = self._get_headers()
+            headers["Range"] = f"bytes={start}-{end}"
+            response = requests.get(
+                f"{self.base_url}/api/scores/{score_id}/replay",
+                headers=headers,
+                timeout=5
+            )
+
+            if response.status_code == 206:
+                total = int(response.headers.get("Content-Range", "").rpartition("/")[2] or 0)
+                return True, {"data": response.content, "total": total}, None
+            elif response.status_code == 200:
+                # 서버가 범위를 무시하고 전체를 보낸 경우
+                return True, {"data": response.content[start:end + 1], "total": len(response.content)}, None
+            else:
+                error_msg = response.json().get("detail", "리플레이 다운로드 실패")
+                return False, None, error_msg
+
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return False, None, f"네트워크 오류: {str(e)}"
+
+    def get_my_rank(self, window: str = "all",
+                    difficulty: Optional[str] = None) -> tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        리더보드에서 내 순위 조회 (로그인 필요)
+
+        Args:
+            window: 기간 ('all', 'daily', 'weekly', 'season')
+            difficulty: 난이도 (지정하면 해당 난이도의 전체 기간 랭킹)
+
+        Returns:
+            tuple: (성공 여부, 순위 정보, 에러 메시지) - 기록이 없으면 (True, None, None)
         """
         if not self.session_manager.is_logged_in():
             return False, None, "로그인이 필요합니다"
 
+        params = {"window": window}
+        if difficulty:
+            params["difficulty"] = difficulty
+
         try:
             response = requests.get(
-                f"{self.base_url}/api/scores/my",
+                f"{self.base_url}/api/scores/rank",
+                params=params,
                 headers=self._get_headers(),
                 timeout=5
             )
 
             if response.status_code == 200:
                 return True, response.json(), None
+            elif response.status_code == 404:
+                return True, None, None
             else:
-                error_msg = response.json().get("detail", "점수 조회 실패")
+                error_msg = response.json().get("detail", "순위 조회 실패")
                 return False, None, error_msg
 
         except requests.exceptions.RequestException as e:
             return False, None, f"네트워크 오류: {str(e)}"
 
+    def _get_page(self, path: str, limit: int, cursor: Optional[str],
+                  default_error: str) -> tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        커서 기반 목록 페이지 조회 (로그인 필요)
+
+        Args:
+            path: API 경로
+            limit: 페이지 크기
+            cursor: 이전 페이지의 다음 커서 (없으면 첫 페이지)
+            default_error: 기본 에러 메시지
+
+        Returns:
+            tuple: (성공 여부, {'items': 목록, 'next_cursor': 다음 커서 또는 None}, 에러 메시지)
+        """
+        if not self.session_manager.is_logged_in():
+            return False, None, "로그인이 필요합니다"
+
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+
+        try:
+            response = requests.get(
+                f"{self.base_url}{path}",
+                params=params,
+                headers=self._get_headers(),
+                timeout=5
+            )
+
+            if response.status_code == 200:
+                page = {
+                    "items": response.json(),
+                    "next_cursor": response.headers.get(NEXT_CURSOR_HEADER)
+                }
+                return True, page, None
+            else:
+                error_msg = response.json().get("detail", default_error)
+                return False, None, error_msg
+
+        except requests.exceptions.RequestException as e:
+            return False, None, f"네트워크 오류: {str(e)}"
+
+    def get_my_scores(self, limit: int = 20) -> tuple[bool, Optional[List], Optional[str]]:
+        """
+        내 점수 조회 (최근 기록 첫 페이지)
+
+        Args:
+            limit: 조회할 개수
+
+        Returns:
+            tuple: (성공 여부, 점수 리스트, 에러 메시지)
+        """
+        success, page, error = self.get_my_scores_page(limit)
+        return success, page["items"] if success else None, error
+
+    def get_my_scores_page(self, limit: int = 20,
+                           cursor: Optional[str] = None) -> tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        내 점수 페이지 조회
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            tuple: (성공 여부, {'items': 점수 리스트, 'next_cursor': 다음 커서}, 에러 메시지)
+        """
+        return self._get_page("/api/scores/my", limit, cursor, "점수 조회 실패")
+
     def get_my_stats(self) -> tuple[bool, Optional[Dict], Optional[str]]:
         """
         내 통계 조회
@@ -360,7 +535,7 @@ class GameAPIClient:
 
     def get_my_game_history(self, limit: int = 10) -> tuple[bool, Optional[List], Optional[str]]:
         """
-        내 게임 기록 조회
+        내 게임 기록 조회 (최근 기록 첫 페이지)
 
         Args:
             limit: 조회할 게임 수
@@ -368,24 +543,22 @@ class GameAPIClient:
         Returns:
             tuple: (성공 여부, 게임 기록 리스트, 에러 메시지)
         """
-        if not self.session_manager.is_logged_in():
-            return False, None, "로그인이 필요합니다"
+        success, page, error = self.get_my_game_history_page(limit)
+        return success, page["items"] if success else None, error
 
-        try:
-            response = requests.get(
-                f"{self.base_url}/api/stats/my?limit={limit}",
-                headers=self._get_headers(),
-                timeout=5
-            )
+    def get_my_game_history_page(self, limit: int = 10,
+                                 cursor: Optional[str] = None) -> tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        내 게임 기록 페이지 조회
 
-            if response.status_code == 200:
-                return True, response.json(), None
-            else:
-                error_msg = response.json().get("detail", "게임 기록 조회 실패")
-                return False, None, error_msg
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 다음 커서
 
-        except requests.exceptions.RequestException as e:
-            return False, None, f"네트워크 오류: {str(e)}"
+        Returns:
+            tuple: (성공 여부, {'items': 게임 기록 리스트, 'next_cursor': 다음 커서}, 에러 메시지)
+        """
+        return self._get_page("/api/stats/my", limit, cursor, "게임 기록 조회 실패")
 
     def unlock_achievement(self, achievement_code: str) -> tuple[bool, Optional[Dict], Optional[str]]:
         """
@@ -473,17 +646,34 @@ class GameAPIClient:
         """
         return self._executor.submit(self.save_score, score)
 
-    def get_top_scores_async(self, limit: int = 10) -> Future:
+    def upload_replay_async(self, score_id: int, path: str) -> Future:
+        """
+        비동기 리플레이 업로드
+
+        Args:
+            score_id: 점수 ID
+            path: 리플레이 파일 경로
+
+        Returns:
+            Future: (성공 여부, 응답 데이터, 에러 메시지) 튜플을 반환하는 Future
+        """
+        return self._executor.submit(self.upload_replay, score_id, path)
+
+    def get_top_scores_async(self, limit: int = 10, window: str = "all",
+                             difficulty: Optional[str] = None, verified: bool = False) -> Future:
         """
         비동기 상위 점수 조회
 
         Args:
             limit: 조회할 개수
+            window: 기간 ('all', 'daily', 'weekly', 'season')
+            difficulty: 난이도 (지정하면 해당 난이도의 전체 기간 랭킹)
+            verified: True면 리플레이로 검증된 점수만
 
         Returns:
             Future: (성공 여부, 점수 리스트, 에러 메시지) 튜플을 반환하는 Future
         """
-        return self._executor.submit(self.get_top_scores, limit)
+        return self._executor.submit(self.get_top_scores, limit, window, difficulty, verified)
 
     def get_my_scores_async(self) -> Future:
         """
@@ -494,6 +684,32 @@ class GameAPIClient:
         """
         return self._executor.submit(self.get_my_scores)
 
+    def get_my_scores_page_async(self, limit: int = 20, cursor: Optional[str] = None) -> Future:
+        """
+        비동기 내 점수 페이지 조회
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            Future: (성공 여부, 페이지, 에러 메시지) 튜플을 반환하는 Future
+        """
+        return self._executor.submit(self.get_my_scores_page, limit, cursor)
+
+    def get_my_game_history_page_async(self, limit: int = 10, cursor: Optional[str] = None) -> Future:
+        """
+        비동기 내 게임 기록 페이지 조회
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            Future: (성공 여부, 페이지, 에러 메시지) 튜플을 반환하는 Future
+        """
+        return self._executor.submit(self.get_my_game_history_page, limit, cursor)
+
     def get_my_stats_async(self) -> Future:
         """
         비동기 내 통계 조회
@@ -503,6 +719,18 @@ class GameAPIClient:
         """
         return self._executor.submit(self.get_my_stats)
 
+    def save_game_stat_async(self, stat_data: Dict) -> Future:
+        """
+        비동기 게임 통계 저장
+
+        Args:
+            stat_data: 게임 통계 데이터
+
+        Returns:
+            Future: (성공 여부, 응답 데이터, 에러 메시지) 튜플을 반환하는 Future
+        """
+        return self._executor.submit(self.save_game_stat, stat_data)
+
     def check_connection_async(self) -> Future:
         """
         비동기 서버 연결 확인
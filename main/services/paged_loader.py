@@ -0,0 +1,88 @@
+"""커서 기반 목록 지연 로더"""
+import logging
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PagedLoader:
+    """
+    커서 기반 목록 지연 로더
+
+    스크롤로 목록 끝에 가까워질 때만 다음 페이지를 비동기로 요청합니다.
+    화면 루프에서 매 프레임 poll() 을 호출해 도착한 페이지를 반영합니다.
+    """
+
+    def __init__(self, fetch_page_async: Callable[[Optional[str]], Future], prefetch_margin: int = 3):
+        """
+        PagedLoader 초기화
+
+        Args:
+            fetch_page_async: 커서를 받아 (성공 여부, 페이지, 에러 메시지) Future 를 반환하는 함수
+            prefetch_margin: 남은 항목이 이 수 이하가 되면 다음 페이지 요청
+        """
+        self._fetch_page_async = fetch_page_async
+        self.prefetch_margin = prefetch_margin
+
+        self.items: List[Dict] = []
+        self.error: Optional[str] = None
+        self._next_cursor: Optional[str] = None
+        self._exhausted = False
+        self._pending: Optional[Future] = None
+
+    @property
+    def loading(self) -> bool:
+        """페이지 요청 중인지 여부"""
+        return self._pending is not None
+
+    @property
+    def exhausted(self) -> bool:
+        """모든 페이지를 받았는지 여부"""
+        return self._exhausted
+
+    def request_more(self):
+        """다음 페이지 요청 (요청 중이거나 끝났으면 무시)"""
+        if self._pending is None and not self._exhausted:
+            self._pending = self._fetch_page_async(self._next_cursor)
+
+    def ensure_visible(self, last_visible_index: int):
+        """
+        화면에 보이는 마지막 항목 기준으로 필요하면 다음 페이지 요청
+
+        Args:
+            last_visible_index: 화면에 보이는 마지막 항목의 인덱스
+        """
+        if last_visible_index >= len(self.items) - self.prefetch_margin:
+            self.request_more()
+
+    def poll(self) -> bool:
+        """
+        도착한 페이지 반영
+
+        빈 페이지나 실패로 끝난 요청도 loading 이 바뀌므로 True 를 반환합니다.
+        항목이 추가되었는지는 items 길이로 확인하세요.
+
+        Returns:
+            bool: 대기 중이던 요청이 끝났으면 True (화면을 다시 그려야 함)
+        """
+        if self._pending is None or not self._pending.done():
+            return False
+
+        future, self._pending = self._pending, None
+        try:
+            success, page, error = future.result()
+        except Exception as e:
+            success, page, error = False, None, str(e)
+
+        if not success:
+            # 실패하면 더 요청하지 않음 (무한 재시도 방지)
+            logger.warning(f"페이지 로드 실패: {error}")
+            self.error = error
+            self._exhausted = True
+            return True
+
+        self.items.extend(page["items"])
+        self._next_cursor = page["next_cursor"]
+        self._exhausted = self._next_cursor is None
+        return True
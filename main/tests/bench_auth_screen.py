@@ -0,0 +1,61 @@
+"""
+로그인 화면 렌더 마이크로 벤치마크 (pytest 수집 대상 아님)
+
+실행: cd main && SDL_VIDEODRIVER=dummy python -m tests.bench_auth_screen [프레임 수]
+
+"미리 그림"은 지금 AuthScreen의 update()+render(), "매 프레임 다시 그림"은 프레임마다
+서피스 캐시를 비우고 정적 레이어를 다시 만드는 경우입니다 (미리 그리기 전 동작에 해당).
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import timeit
+import pygame
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, Resources
+from screens import auth_screen
+from ui import surface_cache
+
+
+class OfflineClient:
+    """화면 생성에 필요한 만큼만 있는 API 클라이언트"""
+
+    def is_logged_in(self) -> bool:
+        return False
+
+
+def main(frames: int = 200):
+    """미리 그린 레이어를 쓰는 프레임과 매 프레임 다시 만드는 프레임의 시간 비교"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if not os.path.exists(Resources.MAIN_FONT):
+        # 폰트 파일이 없는 체크아웃에서는 기본 폰트로 (글자 모양만 다르고 그리는 양은 같음)
+        auth_screen.load_font = lambda path, size: pygame.font.Font(None, size)
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill((20, 20, 40))
+
+    construct = min(timeit.repeat(
+        lambda: auth_screen.AuthScreen(screen, background, OfflineClient()), number=1, repeat=5))
+    view = auth_screen.AuthScreen(screen, background, OfflineClient())
+    view.username, view.message, view.message_alpha = "player1", "로그인 실패", 255
+
+    def baked():
+        view.update()
+        view.render()
+
+    def rebuilt():
+        surface_cache.clear()
+        view._bake_static_surfaces()
+        view.update()
+        view.render()
+
+    print(f"화면 생성 (미리 그리기 포함): {construct * 1000:.2f} ms")
+    for name, frame in (("미리 그림", baked), ("매 프레임 다시 그림", rebuilt)):
+        seconds = min(timeit.repeat(frame, number=frames, repeat=3))
+        print(f"{name:>12}: {seconds / frames * 1000:.3f} ms/frame")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,111 @@
+"""
+픽셀 단위 충돌(마스크) 추가 비용 벤치마크 (pytest 수집 대상 아님)
+
+운석/미사일 수를 계속 채워 유지하는 실제 게임 프레임(GameSimulation.step - 이동, 생성,
+공간 인덱스, 적 AI, 충돌 감지와 처리, 프레임 끝 정리)을 진행하면서, 매 프레임 같은 상태에서
+충돌 감지(check_all_collisions)를 마스크 없이/있이 재서 step() 시간 대비 추가 비용을 비교합니다.
+(마스크를 켜면 맞는 운석이 달라져 두 모드의 게임 진행이 갈라지므로 step() 시간끼리 빼지 않음)
+모든 미사일이 이미 운석과 겹쳐 있는 첫 프레임(최악의 경우)도 따로 잽니다.
+
+실행: cd main && SDL_VIDEODRIVER=dummy python -m tests.bench_collision_masks [운석 수] [미사일 수]
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import random
+import sys
+import time
+import timeit
+import pygame
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game.collision import CollisionDetector
+from game.simulation import GameSimulation, Sprites
+from tests.test_simulation import SETTINGS, round_sprite
+
+
+def crowded_game(stone_count: int, missile_count: int) -> GameSimulation:
+    """화면 전체에 운석/미사일을 흩어 놓은 시뮬레이션 (플레이어는 무적이라 끝나지 않음)"""
+    sprites = Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+    simulation = GameSimulation(sprites, seed=0, settings=SETTINGS)
+    state = simulation.state
+    state.is_invincible = True
+
+    rng = random.Random(0)
+    for _ in range(stone_count):
+        stone = state.spawn_stone(sprites.stone)
+        stone.rect.y = rng.randint(0, SCREEN_HEIGHT - stone.rect.height)
+    for index in range(missile_count):
+        state.spawn_missile(sprites.missile, index * 37 % SCREEN_WIDTH, rng.randint(0, SCREEN_HEIGHT))
+    return simulation
+
+
+def top_up(simulation: GameSimulation, rng: random.Random, stone_count: int, missile_count: int):
+    """부서지거나 화면을 벗어난 만큼 운석은 위에서, 미사일은 아래에서 다시 채움"""
+    state = simulation.state
+    sprites = simulation.sprites
+    while len(state.stones) < stone_count:
+        state.spawn_stone(sprites.stone)
+    while len(state.missiles) < missile_count:
+        state.spawn_missile(sprites.missile, rng.randrange(SCREEN_WIDTH), SCREEN_HEIGHT - 30)
+
+
+def main(stone_count: int = 300, missile_count: int = 150, frames: int = 60, rounds: int = 10):
+    """마스크 사용 여부별 프레임당 충돌 감지 시간과 step() 대비 추가 비용 비율 (유지 상태, 최악의 첫 프레임)"""
+    enabled = CollisionDetector.use_masks
+    simulation = crowded_game(stone_count, missile_count)
+    state = simulation.state
+    first = simulation.snapshot()
+
+    # 채우기를 반복해 부서지는 수와 채우는 수가 비슷해진 상태에서 시작
+    rng = random.Random(1)
+    for _ in range(200):
+        top_up(simulation, rng, stone_count, missile_count)
+        simulation.step(0)
+    steady = simulation.snapshot()
+
+    def detect():
+        return CollisionDetector.check_all_collisions(
+            simulation.player, state.missiles, state.stones, state.enemies, state.enemy_projectiles,
+            state.powerup_manager.get_active_powerups(), state.stone_grid
+        )
+
+    def play(start: bytes, count: int) -> dict:
+        """start 상태에서 count 프레임 진행 (마스크 사용), 모드별 충돌 감지 시간과 step() 시간 합계"""
+        simulation.restore(start)
+        rng.seed(2)
+        totals = {False: 0.0, True: 0.0, "step": 0.0, "hits": 0}
+        for _ in range(count):
+            if count > 1:
+                top_up(simulation, rng, stone_count, missile_count)
+            state.index_threats()
+            for use_masks in (False, True):
+                CollisionDetector.use_masks = use_masks
+                totals[use_masks] += min(timeit.repeat(detect, number=1, repeat=5))
+            hits = state.missiles_hit
+            began = time.perf_counter()
+            simulation.step(0)
+            totals["step"] += time.perf_counter() - began
+            totals["hits"] += state.missiles_hit - hits
+        return totals
+
+    for name, start, count, repeat in (("steady", steady, frames, rounds), ("first frame", first, 1, rounds * 20)):
+        best = {}
+        for _ in range(repeat):
+            for key, value in play(start, count).items():
+                best[key] = min(best.get(key, value), value)
+        step_time = best["step"] / count
+        added = (best[True] - best[False]) / count
+
+        print(f"{name} ({stone_count} stones, {missile_count} missiles, "
+              f"{best['hits'] / count:.1f} missile hits/frame):")
+        print(f"  step: {step_time * 1000:.3f} ms/frame (masks on)")
+        for use_masks in (False, True):
+            label = "masks" if use_masks else "rects"
+            print(f"{label:>6}: collision detection {best[use_masks] / count * 1000:.3f} ms/frame")
+        print(f" added: {added * 1000:.3f} ms/frame = {added / step_time * 100:.1f}% of step(), "
+              f"{added * FPS * 100:.1f}% of the {FPS} FPS budget")
+    CollisionDetector.use_masks = enabled
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
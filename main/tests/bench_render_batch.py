@@ -0,0 +1,50 @@
+"""
+엔티티 레이어 그리기 마이크로 벤치마크 (pytest 수집 대상 아님)
+
+실행: cd main && SDL_VIDEODRIVER=dummy python -m tests.bench_render_batch [엔티티 수]
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import timeit
+import pygame
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.entities import Missile, Stone
+from game.render_batch import blit_layer
+
+
+def main(count: int = 1000, frames: int = 200):
+    """엔티티별 draw()와 blit_layer()의 프레임당 시간 비교"""
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    stone_img = pygame.Surface((40, 40))
+    missile_img = pygame.Surface((8, 20))
+    entities = [
+        Stone(stone_img, x=i % (SCREEN_WIDTH - 40), y=(i * 7) % SCREEN_HEIGHT) if i % 2
+        else Missile(missile_img, i % SCREEN_WIDTH, (i * 13) % SCREEN_HEIGHT)
+        for i in range(count)
+    ]
+
+    def per_entity():
+        for entity in entities:
+            entity.update()
+            entity.draw(screen)
+
+    def batched():
+        layer = []
+        for entity in entities:
+            entity.update()
+            layer.append((entity.image, entity.rect))
+        blit_layer(screen, layer)
+
+    for name, frame in (("draw() per entity", per_entity), ("blit_layer", batched)):
+        seconds = min(timeit.repeat(frame, number=frames, repeat=3))
+        print(f"{name:>18}: {seconds / frames * 1000:.3f} ms/frame ({count} entities)")
+
+    pygame.display.quit()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
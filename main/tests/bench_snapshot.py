@@ -0,0 +1,34 @@
+"""
+게임 스냅샷 저장/복원 마이크로 벤치마크 (pytest 수집 대상 아님)
+
+실행: cd main && SDL_VIDEODRIVER=dummy python -m tests.bench_snapshot [진행 프레임 수]
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import sys
+import timeit
+import zlib
+import pygame
+from game.simulation import GameSimulation, Sprites
+from tests.test_simulation import SETTINGS, play, round_sprite
+
+
+def main(frames: int = 400, repeat: int = 2000):
+    """frames 프레임 진행한 게임의 스냅샷 크기와 저장/복원 시간"""
+    sprites = Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+    simulation = play(GameSimulation(sprites, seed=42, settings=SETTINGS), frames)
+    state = simulation.state
+    data = simulation.snapshot()
+
+    take = timeit.timeit(simulation.snapshot, number=repeat) / repeat
+    restore = timeit.timeit(lambda: simulation.restore(data), number=repeat) / repeat
+
+    print(f"프레임 {state.current_frame}: 운석 {len(state.stones)}, 미사일 {len(state.missiles)}, "
+          f"적 {len(state.enemies)}, 파워업 {len(state.powerup_manager.active_powerups)}")
+    print(f"스냅샷 {len(data)} 바이트 (deflate {len(zlib.compress(data, 9))} 바이트)")
+    print(f"저장 {take * 1e6:.0f}us, 복원 {restore * 1e6:.0f}us")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
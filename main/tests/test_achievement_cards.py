@@ -0,0 +1,76 @@
+"""Achievement card renderer tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from game.achievements import AchievementChecker
+from game.achievement_notification import (
+    AchievementCardRenderer, AchievementNotification, AchievementNotificationManager
+)
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((500, 800))
+    pygame.display.quit()
+
+
+@pytest.fixture
+def checker():
+    """오프라인 업적 체커"""
+    return AchievementChecker()
+
+
+class TestAchievementCardRenderer:
+    """업적 카드 렌더러 테스트"""
+
+    def test_fonts_loaded_once_per_size(self, screen):
+        """같은 크기의 폰트는 한 번만 로드"""
+        renderer = AchievementCardRenderer()
+        assert renderer.font(26) is renderer.font(26)
+
+    def test_missing_font_file_falls_back(self, screen):
+        """폰트 파일이 없으면 기본 폰트 사용"""
+        renderer = AchievementCardRenderer('/nonexistent/font.ttf')
+        assert renderer.render_card("이름", "설명").get_size() == (400, 100)
+
+    def test_summary_height_follows_item_count(self, screen, checker):
+        """요약 박스 높이는 표시 개수(최대 4)에 비례"""
+        renderer = AchievementCardRenderer()
+        assert renderer.render_summary(['a'], checker).get_size() == (420, 105)
+        assert renderer.render_summary(['a', 'b', 'c', 'd', 'e', 'f'], checker).get_height() == 60 + 4 * 45
+
+
+class TestAchievementNotification:
+    """업적 알림 카드 테스트"""
+
+    def test_card_built_once_and_blitted_at_position(self, screen, checker, monkeypatch):
+        """카드는 생성 시 한 번 합성되고 그리기는 현재 위치에 blit"""
+        notification = AchievementNotification('first_game', checker)
+        card = notification.card
+
+        renders = []
+        monkeypatch.setattr(AchievementCardRenderer, 'render_card', lambda *a, **k: renders.append(a))
+
+        for _ in range(60):
+            notification.update()
+            rect = notification.draw(screen)
+
+        assert notification.card is card
+        assert renders == []
+        assert rect == pygame.Rect(notification.target_x, notification.target_y, 400, 100)
+
+    def test_manager_shares_renderer(self, screen, checker):
+        """관리자가 만든 알림은 같은 렌더러(폰트)를 사용"""
+        manager = AchievementNotificationManager(checker)
+        manager.add_achievement('first_game')
+        manager.add_achievement('score_1000')
+
+        assert manager.draw(screen) is None
+        manager.update()
+        assert manager.draw(screen) is not None
+        assert len(manager.renderer._fonts) == 2
@@ -0,0 +1,115 @@
+"""Achievement rule engine tests"""
+import pytest
+from game.achievement_rules import AchievementRuleSet, DEFAULT_CATALOG
+from game.achievements import AchievementChecker
+from game.statistics import GameStatistics
+
+
+@pytest.fixture
+def rules():
+    """기본 카탈로그 규칙 픽스처"""
+    return AchievementRuleSet(DEFAULT_CATALOG)
+
+
+class TestAchievementRuleSet:
+    """업적 규칙 모음 테스트"""
+
+    def test_compile_catalog(self, rules):
+        """카탈로그 컴파일"""
+        assert set(rules.rules) == {entry['code'] for entry in DEFAULT_CATALOG}
+        assert rules.get('combo_master').name == '콤보 마스터'
+
+    def test_unknown_condition_type_skipped(self):
+        """알 수 없는 조건 타입은 건너뜀"""
+        rules = AchievementRuleSet([
+            {'code': 'mystery', 'name': '?', 'description': '?', 'condition_type': 'unknown', 'condition_value': 1}
+        ])
+
+        assert rules.get('mystery') is None
+
+    def test_rules_for_changed_metrics(self, rules):
+        """바뀐 지표에 의존하는 규칙만 조회"""
+        codes = {rule.code for rule in rules.rules_for({'max_combo'})}
+
+        assert codes == {'combo_master'}
+
+    def test_evaluate_all_skips_missing_metrics(self, rules):
+        """필요한 지표가 없는 규칙은 건너뜀"""
+        stats = GameStatistics('hard')
+        metrics = stats.to_dict()
+        metrics['final_score'] = 2500
+
+        achieved = rules.evaluate_all(metrics)
+
+        assert 'expert_player' in achieved
+        assert 'immortal' in achieved
+        # 누적 지표가 없으므로 판정하지 않음
+        assert 'first_game' not in achieved
+
+    def test_accuracy_requires_min_shots(self, rules):
+        """명중률 업적은 최소 발사 수 필요"""
+        stats = GameStatistics()
+        stats.on_missile_fired(5)
+        for _ in range(5):
+            stats.on_missile_hit()
+        metrics = stats.to_dict()
+        metrics['final_score'] = 0
+
+        assert 'perfect_aim' not in rules.evaluate_all(metrics)
+
+
+class TestAchievementChecker:
+    """업적 체커 테스트"""
+
+    def test_realtime_only_rechecks_changed_rules(self, rules):
+        """실시간 체크는 바뀐 지표만 다시 판정"""
+        checker = AchievementChecker(rules=rules)
+        stats = GameStatistics()
+
+        stats.on_combo_update(100)
+        checker.check_realtime_achievements(stats, 0)
+
+        assert checker.pop_notification() == 'combo_master'
+        assert not checker.has_notifications()
+
+        # 바뀐 지표가 없으면 아무것도 하지 않음
+        checker.check_realtime_achievements(stats, 0)
+        assert not checker.has_notifications()
+
+    def test_realtime_skips_final_only_rules(self, rules):
+        """게임 종료 전용 규칙은 실시간으로 판정하지 않음"""
+        checker = AchievementChecker(rules=rules)
+        stats = GameStatistics()
+        stats.on_missile_fired(20)
+        for _ in range(20):
+            stats.on_missile_hit()
+
+        checker.check_realtime_achievements(stats, 0)
+
+        assert 'perfect_aim' not in checker.unlocked_this_game
+        assert 'perfect_aim' in checker.check_achievements(stats, 0)
+
+    def test_final_check_does_not_duplicate_notifications(self, rules):
+        """실시간으로 달성한 업적은 다시 알리지 않음"""
+        checker = AchievementChecker(rules=rules)
+        stats = GameStatistics()
+        stats.on_stage_advanced(10)
+        checker.check_realtime_achievements(stats, 0)
+
+        achieved = checker.check_achievements(stats, 0)
+
+        assert 'stage_master' in achieved
+        assert checker.unlocked_this_game.count('stage_master') == 1
+        assert checker.notification_queue.count('stage_master') == 1
+
+    def test_display_name_from_catalog(self):
+        """표시 이름은 카탈로그에서 가져옴"""
+        rules = AchievementRuleSet([
+            {'code': 'new_one', 'name': '새 업적', 'description': '새 설명',
+             'condition_type': 'max_combo', 'condition_value': 5}
+        ])
+        checker = AchievementChecker(rules=rules)
+
+        assert checker.get_achievement_display_name('new_one') == '새 업적'
+        assert checker.get_achievement_description('new_one') == '새 설명'
+        assert checker.get_achievement_display_name('missing') == 'missing'
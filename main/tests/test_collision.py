@@ -3,7 +3,8 @@ import pytest
 import pygame
 from game.entities import Player, Stone, Missile
 from game.collision import CollisionDetector
-from config import PLAYER_START_X, PLAYER_START_Y
+from game.entity_list import EntityList
+from core.config import PLAYER_START_X, PLAYER_START_Y
 
 
 @pytest.fixture(scope="session")
@@ -20,6 +21,14 @@ def mock_image(pygame_init):
     return pygame.Surface((50, 50))
 
 
+def entity_list(*entities):
+    """핸들이 붙은 엔티티 컨테이너"""
+    container = EntityList()
+    for entity in entities:
+        container.add(entity)
+    return container
+
+
 @pytest.fixture
 def player(mock_image):
     """플레이어 픽스처"""
@@ -34,17 +43,17 @@ class TestCollisionDetector:
         missile = Missile(mock_image, x=100, y=100)
         stone = Stone(mock_image, x=100, y=100)
 
-        collisions = CollisionDetector.check_missile_stone_collision([missile], [stone])
+        collisions = CollisionDetector.check_missile_stone_collision(entity_list(missile), entity_list(stone))
 
         assert len(collisions) > 0
-        assert (0, 0) in collisions
+        assert (missile.handle, stone.handle) in collisions
 
     def test_missile_stone_no_collision(self, mock_image):
         """미사일과 운석 충돌 없음"""
         missile = Missile(mock_image, x=0, y=0)
         stone = Stone(mock_image, x=400, y=400)
 
-        collisions = CollisionDetector.check_missile_stone_collision([missile], [stone])
+        collisions = CollisionDetector.check_missile_stone_collision(entity_list(missile), entity_list(stone))
 
         assert len(collisions) == 0
 
@@ -56,8 +65,8 @@ class TestCollisionDetector:
         stone2 = Stone(mock_image, x=200, y=200)
 
         collisions = CollisionDetector.check_missile_stone_collision(
-            [missile1, missile2],
-            [stone1, stone2]
+            entity_list(missile1, missile2),
+            entity_list(stone1, stone2)
         )
 
         assert len(collisions) >= 2
@@ -67,16 +76,16 @@ class TestCollisionDetector:
         # 플레이어 위치로 운석 생성
         stone = Stone(mock_image, x=PLAYER_START_X, y=PLAYER_START_Y)
 
-        collisions = CollisionDetector.check_player_stone_collision(player, [stone])
+        collisions = CollisionDetector.check_player_stone_collision(player, entity_list(stone))
 
         assert len(collisions) > 0
-        assert 0 in collisions
+        assert stone.handle in collisions
 
     def test_player_stone_no_collision(self, mock_image, player):
         """플레이어와 운석 충돌 없음"""
         stone = Stone(mock_image, x=400, y=400)
 
-        collisions = CollisionDetector.check_player_stone_collision(player, [stone])
+        collisions = CollisionDetector.check_player_stone_collision(player, entity_list(stone))
 
         assert len(collisions) == 0
 
@@ -85,20 +94,20 @@ class TestCollisionDetector:
         missile1 = Missile(mock_image, x=100, y=-1)
         missile2 = Missile(mock_image, x=100, y=100)
 
-        out_of_bounds = CollisionDetector.check_missile_out_of_bounds([missile1, missile2])
+        out_of_bounds = CollisionDetector.check_missile_out_of_bounds(entity_list(missile1, missile2))
 
         assert len(out_of_bounds) == 1
-        assert 0 in out_of_bounds
+        assert missile1.handle in out_of_bounds
 
     def test_stone_out_of_bounds(self, mock_image):
         """운석 화면 범위 벗어남"""
         stone1 = Stone(mock_image, y=801)  # SCREEN_HEIGHT = 800
         stone2 = Stone(mock_image, y=400)
 
-        out_of_bounds = CollisionDetector.check_stone_out_of_bounds([stone1, stone2])
+        out_of_bounds = CollisionDetector.check_stone_out_of_bounds(entity_list(stone1, stone2))
 
         assert len(out_of_bounds) == 1
-        assert 0 in out_of_bounds
+        assert stone1.handle in out_of_bounds
 
     def test_check_all_collisions(self, mock_image, player):
         """모든 충돌 확인"""
@@ -109,8 +118,8 @@ class TestCollisionDetector:
 
         collisions = CollisionDetector.check_all_collisions(
             player,
-            [missile, out_of_bounds_missile],
-            [stone, out_of_bounds_stone]
+            entity_list(missile, out_of_bounds_missile),
+            entity_list(stone, out_of_bounds_stone)
         )
 
         assert 'missile_stone' in collisions
@@ -0,0 +1,81 @@
+"""Pixel-accurate collision tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import random
+import pygame
+import pytest
+from game.collision import CollisionDetector
+from game.entities import Player, Stone, Missile
+from game.entity_list import EntityList
+
+
+def round_sprite(size):
+    """투명 배경 위 원형 스프라이트"""
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (150, 120, 90), (size // 2, size // 2), size // 2)
+    return surface
+
+
+@pytest.fixture
+def use_masks(monkeypatch):
+    """픽셀 단위 충돌 켜기"""
+    monkeypatch.setattr(CollisionDetector, 'use_masks', True)
+
+
+@pytest.fixture
+def stone():
+    """(100, 100)에 놓인 원형 운석"""
+    random.seed(0)
+    stone = Stone(round_sprite(50), x=100, y=100)
+    stone.rect.topleft = (100, 100)
+    return stone
+
+
+def stones(*entities):
+    """핸들이 붙은 운석 컨테이너"""
+    container = EntityList()
+    for entity in entities:
+        container.add(entity)
+    return container
+
+
+class TestCollisionMasks:
+    """마스크 기반 충돌 테스트"""
+
+    def test_corner_overlap_is_not_a_hit(self, use_masks, stone):
+        """사각형 모서리만 겹치면 충돌 아님"""
+        player = Player(round_sprite(50))
+        player.rect.topleft = (stone.rect.right - 6, stone.rect.bottom - 6)
+        assert player.rect.colliderect(stone.rect)
+
+        assert CollisionDetector.check_player_stone_collision(player, stones(stone)) == []
+
+    def test_flag_off_uses_rects(self, monkeypatch, stone):
+        """플래그를 끄면 기존 사각형 충돌"""
+        monkeypatch.setattr(CollisionDetector, 'use_masks', False)
+        player = Player(round_sprite(50))
+        player.rect.topleft = (stone.rect.right - 6, stone.rect.bottom - 6)
+
+        assert CollisionDetector.check_player_stone_collision(player, stones(stone)) == [stone.handle]
+
+    def test_solid_overlap_is_a_hit(self, use_masks, stone):
+        """불투명 픽셀이 겹치면 충돌"""
+        missile = Missile(pygame.Surface((10, 30)), stone.rect.centerx - 5, stone.rect.bottom - 10)
+        container = stones(stone)
+        EntityList().add(missile)
+
+        assert CollisionDetector.check_missile_stone_collision([missile], container) == \
+            [(missile.handle, stone.handle)]
+
+    def test_masks_shared_per_sprite_size(self):
+        """같은 크기 운석은 마스크를 공유하고 마스크 크기는 이미지와 같음"""
+        image = round_sprite(50)
+        random.seed(1)
+        variants = [Stone(image) for _ in range(40)]
+
+        for entity in variants:
+            assert entity.mask.get_size() == entity.image.get_size()
+        by_size = {}
+        for entity in variants:
+            assert by_size.setdefault(entity.size, entity.mask) is entity.mask
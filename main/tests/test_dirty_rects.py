@@ -0,0 +1,129 @@
+"""Dirty-rect tracker tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from ui.dirty_rects import DirtyRectTracker
+
+
+BACKGROUND_COLOR = (10, 20, 30)
+SPRITE_COLOR = (255, 0, 0)
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.display.init()
+    yield pygame.display.set_mode((100, 100))
+    pygame.display.quit()
+
+
+@pytest.fixture
+def background():
+    """단색 배경"""
+    surface = pygame.Surface((100, 100))
+    surface.fill(BACKGROUND_COLOR)
+    return surface
+
+
+@pytest.fixture
+def updates(monkeypatch):
+    """display.update / flip 호출 기록"""
+    calls = []
+    monkeypatch.setattr(pygame.display, 'update', lambda rects=None: calls.append(list(rects)))
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append('flip'))
+    return calls
+
+
+def draw_sprite(screen, x, y):
+    """10x10 스프라이트를 그리고 영역 반환"""
+    return screen.fill(SPRITE_COLOR, (x, y, 10, 10))
+
+
+class TestDirtyRectTracker:
+    """더티 렉트 트래커 테스트"""
+
+    def test_first_frame_is_full(self, screen, background, updates):
+        """첫 프레임은 배경 전체 + flip"""
+        tracker = DirtyRectTracker(screen, background)
+        screen.fill((0, 0, 0))
+
+        tracker.begin_frame()
+        tracker.add(draw_sprite(screen, 0, 0))
+        tracker.present()
+
+        assert updates == ['flip']
+        assert tracker.last_frame_full
+        assert screen.get_at((50, 50))[:3] == BACKGROUND_COLOR
+
+    def test_moving_sprite_updates_old_and_new_rects(self, screen, background, updates):
+        """움직인 스프라이트는 이전/현재 위치만 갱신하고 이전 위치는 배경으로 지워짐"""
+        tracker = DirtyRectTracker(screen, background)
+        tracker.begin_frame()
+        tracker.add(draw_sprite(screen, 0, 0))
+        tracker.present()
+
+        tracker.begin_frame()
+        tracker.add(draw_sprite(screen, 50, 50))
+        tracker.present()
+
+        assert updates[-1] == [pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 10, 10)]
+        assert not tracker.last_frame_full
+        assert screen.get_at((5, 5))[:3] == BACKGROUND_COLOR
+        assert screen.get_at((55, 55))[:3] == SPRITE_COLOR
+
+    def test_large_dirty_area_falls_back_to_flip(self, screen, background, updates):
+        """갱신 면적이 임계값을 넘으면 전체 flip"""
+        tracker = DirtyRectTracker(screen, background, full_redraw_ratio=0.5)
+        tracker.begin_frame()
+        tracker.present()
+
+        tracker.begin_frame()
+        tracker.add(screen.fill(SPRITE_COLOR, (0, 0, 100, 60)))
+        tracker.present()
+
+        assert updates[-1] == 'flip'
+        assert tracker.last_frame_full
+
+    def test_rects_are_clipped_and_none_ignored(self, screen, background, updates):
+        """화면 밖 영역은 잘리고 None/빈 영역은 무시"""
+        tracker = DirtyRectTracker(screen, background)
+        tracker.begin_frame()
+        tracker.present()
+
+        tracker.begin_frame()
+        tracker.add(None)
+        tracker.add(pygame.Rect(200, 200, 10, 10))
+        tracker.add(pygame.Rect(95, 95, 10, 10))
+        tracker.present()
+
+        assert updates[-1] == [pygame.Rect(95, 95, 5, 5)]
+
+    def test_border_adds_edges_only(self, screen, background, updates):
+        """테두리는 네 변만 갱신"""
+        tracker = DirtyRectTracker(screen, background)
+        tracker.begin_frame()
+        tracker.present()
+
+        tracker.begin_frame()
+        tracker.add_border(screen.get_rect(), 5)
+        tracker.present()
+
+        assert len(updates[-1]) == 4
+        assert not any(rect.collidepoint(50, 50) for rect in updates[-1])
+        assert not tracker.last_frame_full
+
+    def test_invalidate_forces_full_frame(self, screen, background, updates):
+        """invalidate() 후 다음 프레임은 전체 갱신"""
+        tracker = DirtyRectTracker(screen, background)
+        tracker.begin_frame()
+        tracker.present()
+
+        tracker.invalidate()
+        screen.fill((0, 0, 0))
+        tracker.begin_frame()
+        tracker.present()
+
+        assert updates[-1] == 'flip'
+        assert screen.get_at((50, 50))[:3] == BACKGROUND_COLOR
@@ -0,0 +1,115 @@
+"""Batched enemy AI tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import random
+import pygame
+import pytest
+from game.enemy import Enemy, EnemyState
+from game.enemy_batch import EnemyBatchUpdater
+from game.entity_list import EntityList
+from game.spatial import SpatialGrid
+
+pytest.importorskip("numpy")
+
+
+class Body:
+    """rect만 가진 더미 엔티티 (플레이어/운석/미사일)"""
+
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+def make_enemies(count, seed):
+    """같은 시드면 같은 적 목록"""
+    random.seed(seed)
+    image = pygame.Surface((50, 50))
+    enemies = EntityList()
+    for index in range(count):
+        enemy = Enemy(image, enemy_speed=1.5 + index % 3, evasion_skill=0.7)
+        enemy.rect.y = random.randint(-50, 500)
+        enemies.add(enemy)
+    return enemies
+
+
+def threats(frame):
+    """프레임마다 결정적으로 움직이는 운석/미사일 인덱스"""
+    stones = EntityList()
+    missiles = EntityList()
+    for index in range(12):
+        stones.add(Body((index * 67 + frame) % 760, (index * 97 + frame * 3) % 640 - 40, 40, 40))
+        missiles.add(Body((index * 131 + frame * 2) % 790, 600 - (index * 53 + frame * 5) % 640, 10, 30))
+    return SpatialGrid.of(missiles), SpatialGrid.of(stones)
+
+
+def snapshot(enemy):
+    """비교용 적 상태"""
+    laser = enemy.laser
+    return (
+        tuple(enemy.rect), enemy.state, enemy.state_timer, enemy.horizontal_direction,
+        enemy.laser_charge_progress,
+        None if laser is None else (laser.start_x, laser.start_y, laser.angle, laser.timer)
+    )
+
+
+class TestEnemyBatchUpdater:
+    """배치 업데이트가 적마다 Enemy.update()를 호출한 결과와 같은지"""
+
+    @pytest.mark.parametrize("count", [3, 9, 40])
+    def test_matches_scalar_update(self, count):
+        scalar = make_enemies(count, seed=7)
+        batched = make_enemies(count, seed=7)
+        updater = EnemyBatchUpdater(min_batch=1)
+        player = Body(375, 520, 50, 50)
+        random.seed(11)
+        scalar_rng = random.getstate()
+        batched_rng = random.getstate()
+        seen_states = set()
+
+        for frame in range(600):
+            player.rect.x = 375 + int(300 * ((frame // 120) % 2 * 2 - 1) * ((frame % 120) / 120))
+            missiles, stones = threats(frame)
+
+            random.setstate(scalar_rng)
+            before = [enemy.state for enemy in scalar]
+            for enemy in scalar:
+                enemy.update(player, missiles, stones)
+            expected_events = [(enemy.state, enemy.handle) for enemy, state in zip(scalar, before)
+                               if enemy.state is not state]
+            scalar_rng = random.getstate()
+
+            random.setstate(batched_rng)
+            events = updater.update(batched, player, missiles, stones)
+            batched_rng = random.getstate()
+
+            assert [snapshot(enemy) for enemy in batched] == [snapshot(enemy) for enemy in scalar], frame
+            assert [(state, enemy.handle) for enemy, state in events] == expected_events
+            seen_states.update(enemy.state for enemy in batched)
+
+        # 모든 상태 전이 경로를 거쳤는지
+        assert seen_states == set(EnemyState)
+
+    def test_reports_state_changes(self):
+        """상태가 바뀐 적만 (적, 새 상태)로 보고"""
+        enemies = make_enemies(2, seed=1)
+        near, far = list(enemies)
+        near.rect.center = (400, 400)
+        far.rect.center = (100, 100)
+        player = Body(375, 425, 50, 50)
+
+        events = EnemyBatchUpdater(min_batch=1).update(enemies, player)
+
+        assert events == [(near, EnemyState.CHARGING)]
+
+    def test_falls_back_without_numpy(self, monkeypatch):
+        """NumPy가 없으면 적마다 Enemy.update()로 같은 결과"""
+        import game.enemy_batch as enemy_batch
+        monkeypatch.setattr(enemy_batch, "np", None)
+        enemies = make_enemies(40, seed=1)
+        enemy = next(iter(enemies))
+        enemy.rect.center = (400, 400)
+
+        events = EnemyBatchUpdater(min_batch=1).update(enemies, Body(375, 425, 50, 50))
+
+        assert not EnemyBatchUpdater.is_vectorized()
+        assert (enemy, EnemyState.CHARGING) in events
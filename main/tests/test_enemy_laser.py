@@ -0,0 +1,112 @@
+"""Enemy laser geometry and collision tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import math
+import pygame
+import pytest
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.enemy import EnemyLaser
+from game.collision import CollisionDetector
+from game.entity_list import EntityList
+
+
+class Shooter:
+    """레이저만 가진 더미 적"""
+
+    def __init__(self, laser):
+        self.laser = laser
+
+    def get_laser(self):
+        return self.laser
+
+
+class Target:
+    """더미 플레이어"""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+
+    def get_rect(self):
+        return self.rect
+
+
+@pytest.fixture
+def horizontal():
+    """(100, 300)에서 오른쪽으로 쏜 레이저"""
+    return EnemyLaser(100, 300, 0.0, 60)
+
+
+@pytest.fixture
+def diagonal():
+    """(0, 0)에서 오른쪽 아래 45도로 쏜 레이저"""
+    return EnemyLaser(0, 0, math.pi / 4, 60)
+
+
+class TestLaserGeometry:
+    """생성 시 계산한 빔 기하 테스트"""
+
+    def test_clipped_to_screen(self, horizontal, diagonal):
+        """빔 끝은 화면 경계에서 잘림"""
+        assert horizontal.end_x == pytest.approx(SCREEN_WIDTH)
+        assert horizontal.end_y == pytest.approx(300)
+        assert horizontal.length == pytest.approx(SCREEN_WIDTH - 100)
+
+        shortest = min(SCREEN_WIDTH, SCREEN_HEIGHT)
+        assert (diagonal.end_x, diagonal.end_y) == (pytest.approx(shortest), pytest.approx(shortest))
+
+        upward = EnemyLaser(100, 300, -math.pi / 2, 60)
+        assert upward.end_y == pytest.approx(0)
+
+    def test_collision_rect_is_precomputed(self, diagonal):
+        """바운딩 박스는 매번 새로 만들지 않고 선분 전체를 감쌈"""
+        bounds = diagonal.get_collision_rect()
+        assert diagonal.get_collision_rect() is bounds
+        assert bounds.collidepoint(1, 1)
+        assert bounds.collidepoint(int(diagonal.end_x) - 1, int(diagonal.end_y) - 1)
+
+
+class TestLaserCollision:
+    """분리축 검사 충돌 테스트"""
+
+    def test_diagonal_misses_far_rect_inside_bounding_box(self, diagonal):
+        """바운딩 박스 안이어도 빔에서 먼 사각형은 맞지 않음"""
+        far = pygame.Rect(400, 0, 50, 50)
+        assert diagonal.get_collision_rect().colliderect(far)
+        assert not diagonal.collides_with(far)
+
+    def test_diagonal_hits_rect_on_beam(self, diagonal):
+        assert diagonal.collides_with(pygame.Rect(275, 275, 50, 50))
+        # 모서리만 빔 두께 안에 걸친 경우
+        assert diagonal.collides_with(pygame.Rect(303, 200, 50, 100))
+
+    def test_beam_thickness(self, horizontal):
+        """빔 두께(반두께 4px) 경계: 닿기만 하면 충돌 아님"""
+        assert horizontal.collides_with(pygame.Rect(200, 303, 50, 50))
+        assert not horizontal.collides_with(pygame.Rect(200, 304, 50, 50))
+        assert horizontal.collides_with(pygame.Rect(200, 247, 50, 50))
+        assert not horizontal.collides_with(pygame.Rect(200, 246, 50, 50))
+
+    def test_nothing_behind_start(self, horizontal):
+        """시작점 뒤쪽은 맞지 않음"""
+        assert not horizontal.collides_with(pygame.Rect(40, 280, 50, 40))
+        assert horizontal.collides_with(pygame.Rect(60, 280, 50, 40))
+
+    def test_find_hits_batches_lasers(self, horizontal, diagonal):
+        """여러 레이저를 한 번에 확인해 맞은 인덱스 반환"""
+        rect = pygame.Rect(150, 150, 40, 40)
+        assert EnemyLaser.find_hits([horizontal, diagonal], rect) == [1]
+        assert EnemyLaser.find_hits([horizontal, diagonal], pygame.Rect(280, 280, 40, 40)) == [0, 1]
+        assert EnemyLaser.find_hits([], rect) == []
+
+    def test_detector_reports_enemy_handles(self, horizontal, diagonal):
+        """충돌 감지기는 활성 레이저만 확인해 적 핸들로 반환"""
+        finished = EnemyLaser(100, 300, 0.0, 0)
+        enemies = EntityList()
+        idle, first, second, done = (Shooter(None), Shooter(horizontal), Shooter(diagonal), Shooter(finished))
+        for enemy in (idle, first, second, done):
+            enemies.add(enemy)
+
+        hits = CollisionDetector.check_player_enemy_laser_collision(Target((280, 280, 40, 40)), enemies)
+
+        assert hits == [first.handle, second.handle]
@@ -0,0 +1,90 @@
+"""Entity container tests"""
+import pytest
+from game.entity_list import EntityList
+
+
+class Dummy:
+    """풀링 가능한 더미 엔티티"""
+
+    def __init__(self, value=0):
+        self.reset(value)
+
+    def reset(self, value=0):
+        self.value = value
+
+
+@pytest.fixture
+def entities():
+    """값 0~4 엔티티가 든 컨테이너"""
+    container = EntityList(Dummy)
+    for value in range(5):
+        container.spawn(value)
+    return container
+
+
+class TestEntityList:
+    """핸들 기반 엔티티 컨테이너 테스트"""
+
+    def test_handles_are_stable_and_unique(self, entities):
+        """핸들은 고유하고 compact 후에도 같은 엔티티를 가리킴"""
+        handles = [entity.handle for entity in entities]
+        assert len(set(handles)) == 5
+
+        entities.kill(handles[1])
+        entities.compact()
+
+        for value, handle in enumerate(handles):
+            entity = entities.get(handle)
+            assert entity is None if value == 1 else entity.value == value
+
+    def test_kill_tombstones_until_compact(self, entities):
+        """kill()은 표시만 하고 순회/길이에서 제외, 실제 제거는 compact()"""
+        handle = next(entity.handle for entity in entities if entity.value == 2)
+
+        assert entities.kill(handle)
+        assert not entities.kill(handle)  # 두 번째는 무시
+        assert not entities.is_alive(handle)
+        assert entities.get(handle) is not None
+        assert len(entities) == 4
+        assert sorted(entity.value for entity in entities) == [0, 1, 3, 4]
+
+        assert entities.compact() == 1
+        assert entities.get(handle) is None
+        assert not entities.kill(handle)
+
+    def test_compact_swap_removes_and_releases(self, entities):
+        """compact()는 마지막 원소로 자리를 채우고 풀로 반환"""
+        first = entities.get(1)
+        entities.kill(1)
+        entities.compact()
+
+        assert [entity.value for entity in entities] == [4, 1, 2, 3]
+        assert entities.pool.free_count == 1
+        assert entities.spawn(9) is first
+        assert first.value == 9 and first.handle == 6
+
+    def test_kill_last_and_many(self, entities):
+        """마지막 원소 포함 여러 개 제거"""
+        for handle in (5, 1, 3):
+            entities.kill(handle)
+        entities.compact()
+
+        assert sorted(entity.value for entity in entities) == [1, 3]
+        assert all(entities.get(entity.handle) is entity for entity in entities)
+
+    def test_clear(self, entities):
+        """clear()는 모두 즉시 지우고 풀로 반환"""
+        entities.clear()
+
+        assert len(entities) == 0
+        assert not entities
+        assert list(entities) == []
+        assert entities.pool.free_count == 5
+
+    def test_without_pool(self):
+        """풀 없이도 사용 가능"""
+        container = EntityList()
+        handle = container.add(Dummy(1))
+        container.kill(handle)
+        assert container.compact() == 1
+        assert container.pool is None
@@ -0,0 +1,129 @@
+"""Game-over screen tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from concurrent.futures import Future
+
+import pygame
+import pytest
+import screens.game_screen as game_screen
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.init()
+    yield pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.quit()
+
+
+class RecordingFont:
+    """render한 텍스트를 기록하는 폰트 래퍼"""
+
+    def __init__(self, size, rendered):
+        self.font = pygame.font.Font(None, size)
+        self.rendered = rendered
+
+    def render(self, text, *args, **kwargs):
+        self.rendered.append(text)
+        return self.font.render(text, *args, **kwargs)
+
+
+def done(result):
+    """완료된 Future"""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class FakeSession:
+    username = "tester"
+
+
+class FakeApiClient:
+    """저장 요청을 기록하는 API 클라이언트"""
+
+    def __init__(self, logged_in=True, save_result=(True, {}, None)):
+        self.logged_in = logged_in
+        self.save_result = save_result
+        self.session_manager = FakeSession()
+        self.calls = []
+
+    def is_logged_in(self):
+        return self.logged_in
+
+    def save_score_async(self, score):
+        self.calls.append(('save_score', score))
+        return done(self.save_result)
+
+    def get_my_stats_async(self):
+        self.calls.append(('get_my_stats',))
+        return done((True, {'rank': 3}, None))
+
+    def save_game_stat_async(self, stat_data):
+        self.calls.append(('save_game_stat', stat_data['final_score']))
+        return done((True, {}, None))
+
+    def upload_replay_async(self, score_id, path):
+        self.calls.append(('upload_replay', score_id, path))
+        return done((True, {'verification': 'pending'}, None))
+
+
+def run_game_over(screen, monkeypatch, api_client, statistics=None, replay_path=None):
+    """키 입력이 올 때까지 게임 오버 화면 실행 후 렌더링한 텍스트 반환"""
+    rendered = []
+    monkeypatch.setattr(game_screen, 'load_font', lambda path, size: RecordingFont(size, rendered))
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a), 300, 1)
+
+    result = game_screen.show_game_over_screen(
+        screen, RecordingFont(40, rendered), 100, pygame.Surface(screen.get_size()),
+        api_client, statistics=statistics, replay_path=replay_path
+    )
+    return result, rendered
+
+
+class TestGameOverScreen:
+    """게임 오버 화면 테스트"""
+
+    def test_offline_composed_once(self, screen, monkeypatch):
+        """오프라인이면 한 번만 합성하고 입력을 기다림"""
+        api_client = FakeApiClient(logged_in=False)
+        result, rendered = run_game_over(screen, monkeypatch, api_client)
+
+        assert result is False
+        assert rendered.count("GAME OVER") == 1
+        assert "오프라인 모드 (점수 저장 안됨)" in rendered
+        assert api_client.calls == []
+
+    def test_save_result_recomposes_with_rank(self, screen, monkeypatch):
+        """저장 결과가 도착하면 랭킹을 포함한 메시지로 다시 합성"""
+        from game.statistics import GameStatistics
+        api_client = FakeApiClient()
+        result, rendered = run_game_over(screen, monkeypatch, api_client, GameStatistics())
+
+        assert result is False
+        assert rendered.count("GAME OVER") == 2
+        assert rendered[-2] == "점수가 저장되었습니다! (#100) | 랭킹: 3위"
+        assert api_client.calls == [('save_score', 100), ('save_game_stat', 100), ('get_my_stats',)]
+
+    def test_failed_save_reports_error(self, screen, monkeypatch):
+        """저장 실패 튜플은 실패 메시지로 표시 (랭킹 조회 안 함)"""
+        api_client = FakeApiClient(save_result=(False, None, "서버 오류"))
+        result, rendered = run_game_over(screen, monkeypatch, api_client)
+
+        assert "점수 저장 실패 (서버 오류)" in rendered
+        assert ('get_my_stats',) not in api_client.calls
+
+    def test_replay_uploaded_with_saved_score_id(self, screen, monkeypatch):
+        """점수가 저장되면 그 점수 ID로 리플레이를 업로드"""
+        api_client = FakeApiClient(save_result=(True, {'id': 42}, None))
+        run_game_over(screen, monkeypatch, api_client, replay_path="replays/run.sgr")
+
+        assert ('upload_replay', 42, "replays/run.sgr") in api_client.calls
+
+    def test_no_replay_upload_without_file(self, screen, monkeypatch):
+        api_client = FakeApiClient(save_result=(True, {'id': 42}, None))
+        run_game_over(screen, monkeypatch, api_client)
+
+        assert not any(call[0] == 'upload_replay' for call in api_client.calls)
@@ -0,0 +1,155 @@
+"""Ghost replay tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import io
+import time
+import pygame
+import pytest
+from game.ghost import Ghost, GhostLoader
+from game.replay import ReplayStream, ReplayWriter
+from game.simulation import GameSimulation, Sprites
+from tests.test_simulation import SETTINGS, outcome, play, round_sprite
+
+
+@pytest.fixture(scope="module")
+def sprites():
+    return Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+
+
+def record(sprites, seed, settings, frames):
+    """frames 프레임 진행한 게임과 그 리플레이 바이트"""
+    buffer = io.BytesIO()
+    writer = ReplayWriter(buffer, seed, settings, keyframe_interval=200)
+    live = play(GameSimulation(sprites, seed=seed, settings=settings, recorder=writer), frames)
+    writer.close(live.state.score)
+    return live, buffer.getvalue()
+
+
+class FakeAPIClient:
+    """랭킹과 Range 응답을 메모리에서 돌려주는 API 클라이언트"""
+
+    def __init__(self, replays, chunk_delay=0.0):
+        self.replays = replays  # score_id -> (랭킹 항목, 리플레이 바이트)
+        self.chunk_delay = chunk_delay
+        self.requests = []
+
+    def get_top_scores(self, limit=10, window="all", difficulty=None, verified=False):
+        assert verified
+        return True, [entry for entry, _ in self.replays.values()][:limit], None
+
+    def get_replay_range(self, score_id, start, end):
+        self.requests.append((score_id, start, end))
+        time.sleep(self.chunk_delay)
+        data = self.replays[score_id][1]
+        return True, {"data": data[start:end + 1], "total": len(data)}, None
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestGhost:
+    """고스트 시뮬레이션은 원래 게임을 그대로 따라감"""
+
+    def test_follows_recorded_run(self, sprites):
+        live, data = record(sprites, 31, SETTINGS, 400)
+        stream = ReplayStream()
+        stream.feed(data)
+        ghost = Ghost(sprites, stream)
+
+        while not ghost.finished:
+            ghost.advance()
+
+        assert outcome(ghost.simulation) == outcome(live)
+        assert ghost.draw(pygame.Surface((800, 800))) is None
+
+    def test_waits_then_catches_up(self, sprites):
+        _, data = record(sprites, 8, SETTINGS, 300)
+        stream = ReplayStream()
+        stream.feed(data[:60])
+        ghost = Ghost(sprites, stream)
+
+        for _ in range(100):
+            ghost.advance()
+        behind = ghost.frames
+        assert behind < 100 and not ghost.finished
+
+        ghost.feed([data[60:]])
+        assert ghost.advance() == 2
+        for _ in range(100):
+            ghost.advance()
+        assert ghost.frames == ghost.target_frame == 201
+
+    def test_draws_translucent_ship(self, sprites):
+        _, data = record(sprites, 8, SETTINGS, 50)
+        stream = ReplayStream()
+        stream.feed(data)
+        pygame.font.init()
+        ghost = Ghost(sprites, stream, {"username": "ace", "score": 9}, pygame.font.Font(None, 18))
+        ghost.advance()
+
+        rect = ghost.draw(pygame.Surface((800, 800)))
+
+        assert rect.contains(ghost.simulation.player.rect)
+        assert ghost.image.get_alpha() < 255
+
+
+class TestGhostLoader:
+    """랭킹에서 고르고 Range 요청으로 이어 받기"""
+
+    def test_prefers_same_difficulty_and_streams_rest(self, sprites, monkeypatch):
+        monkeypatch.setattr("game.ghost.GHOST_CHUNK_BYTES", 16)
+        easy = dict(SETTINGS, difficulty="easy")
+        _, top = record(sprites, 1, easy, 200)
+        live, same = record(sprites, 2, SETTINGS, 600)
+        api = FakeAPIClient({
+            10: ({"username": "top", "score": 99, "score_id": 10}, top),
+            11: ({"username": "same", "score": 50, "score_id": 11}, same),
+        })
+
+        loader = GhostLoader(api, "hard")
+        wait_for(lambda: loader.done)
+        ghost = Ghost(sprites, loader.stream, loader.entry)
+        ghost.feed(loader.take_chunks())
+        while not ghost.finished:
+            ghost.advance()
+
+        assert loader.entry["score_id"] == 11
+        assert outcome(ghost.simulation) == outcome(live)
+        ends = [end for score_id, _, end in api.requests if score_id == 11]
+        assert len(ends) > 2 and ends[-2] < len(same) - 1 <= ends[-1]
+
+    def test_falls_back_to_top_run(self, sprites):
+        _, top = record(sprites, 1, dict(SETTINGS, difficulty="easy"), 100)
+        api = FakeAPIClient({10: ({"username": "top", "score": 99, "score_id": 10}, top)})
+
+        loader = GhostLoader(api, "hard")
+        wait_for(lambda: loader.done)
+
+        assert loader.entry["score_id"] == 10 and loader.stream.settings["difficulty"] == "easy"
+
+    def test_offline_leaves_no_ghost(self):
+        class Offline:
+            def get_top_scores(self, *args, **kwargs):
+                return False, None, "네트워크 오류"
+
+        loader = GhostLoader(Offline())
+        wait_for(lambda: loader.done)
+
+        assert loader.stream is None and loader.take_chunks() == []
+
+    def test_close_stops_download(self, sprites, monkeypatch):
+        monkeypatch.setattr("game.ghost.GHOST_CHUNK_BYTES", 16)
+        _, data = record(sprites, 3, SETTINGS, 300)
+        api = FakeAPIClient({1: ({"username": "a", "score": 1, "score_id": 1}, data)}, chunk_delay=0.02)
+
+        loader = GhostLoader(api)
+        wait_for(lambda: loader.stream is not None)
+        loader.close(timeout=1.0)
+
+        assert loader.done
+        assert len(api.requests) < -(-len(data) // 16)
@@ -0,0 +1,111 @@
+"""Paged loader tests"""
+from concurrent.futures import Future
+from services.paged_loader import PagedLoader
+
+
+def _completed(result) -> Future:
+    """완료된 Future 생성"""
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class FakePages:
+    """커서 -> 페이지 응답을 흉내내는 가짜 API"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def __call__(self, cursor):
+        self.requested.append(cursor)
+        return _completed(self.pages[cursor])
+
+
+class TestPagedLoader:
+    """지연 로더 테스트"""
+
+    def test_loads_next_page_only_near_end(self):
+        """목록 끝에 가까워질 때만 다음 페이지 요청"""
+        fetch = FakePages({
+            None: (True, {'items': list(range(10)), 'next_cursor': 'c1'}, None),
+            'c1': (True, {'items': list(range(10, 15)), 'next_cursor': None}, None),
+        })
+        loader = PagedLoader(fetch, prefetch_margin=3)
+
+        loader.request_more()
+        assert loader.poll()
+        assert len(loader.items) == 10
+
+        loader.ensure_visible(4)
+        assert fetch.requested == [None]
+
+        loader.ensure_visible(7)
+        assert loader.poll()
+        assert fetch.requested == [None, 'c1']
+        assert loader.items == list(range(15))
+        assert loader.exhausted
+
+        # 마지막 페이지 이후에는 요청하지 않음
+        loader.ensure_visible(14)
+        assert fetch.requested == [None, 'c1']
+
+    def test_single_request_in_flight(self):
+        """요청 중에는 중복 요청하지 않음"""
+        pending = Future()
+        calls = []
+
+        def fetch(cursor):
+            calls.append(cursor)
+            return pending
+
+        loader = PagedLoader(fetch)
+        loader.request_more()
+        loader.request_more()
+
+        assert calls == [None]
+        assert loader.loading
+        assert not loader.poll()
+
+    def test_failure_stops_loading(self):
+        """실패하면 에러를 기록하고 더 요청하지 않음"""
+        fetch = FakePages({None: (False, None, "네트워크 오류")})
+        loader = PagedLoader(fetch)
+
+        loader.request_more()
+        assert loader.poll()  # 실패도 요청이 끝난 것 - 화면이 "불러오는 중..." 을 지워야 함
+        assert not loader.loading
+        assert not loader.poll()
+        loader.request_more()
+
+        assert loader.error == "네트워크 오류"
+        assert loader.exhausted
+        assert fetch.requested == [None]
+
+    def test_empty_page_reports_finished(self):
+        """빈 페이지로 끝난 요청도 완료로 알려 화면이 다시 그려지도록"""
+        fetch = FakePages({None: (True, {'items': [], 'next_cursor': None}, None)})
+        loader = PagedLoader(fetch)
+
+        loader.request_more()
+        assert loader.loading
+
+        assert loader.poll()
+        assert not loader.loading
+        assert loader.items == []
+        assert loader.exhausted
+        assert not loader.poll()
+
+    def test_exception_reports_finished(self):
+        """요청 중 예외도 실패로 기록하고 완료로 알림"""
+        def fetch(cursor):
+            future = Future()
+            future.set_exception(ConnectionError("연결 끊김"))
+            return future
+
+        loader = PagedLoader(fetch)
+        loader.request_more()
+
+        assert loader.poll()
+        assert not loader.loading
+        assert loader.error == "연결 끊김"
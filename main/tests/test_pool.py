@@ -0,0 +1,154 @@
+"""Object pool tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from core.config import SCREEN_HEIGHT, STONE_MIN_SIZE, STONE_MAX_SIZE
+from game.entities import Missile, Stone
+from game.enemy import Enemy, EnemyState
+from game.pool import ObjectPool, gc_pressure
+from game.powerup import PowerUpManager, PowerUpType
+
+
+@pytest.fixture(autouse=True)
+def display():
+    """더미 디스플레이"""
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+
+class TestObjectPool:
+    """오브젝트 풀 테스트"""
+
+    def test_release_then_acquire_reuses_and_resets(self):
+        """반환된 객체는 재사용되고 상태가 다시 설정됨"""
+        pool = ObjectPool(Missile)
+        image = pygame.Surface((8, 20))
+
+        missile = pool.acquire(image, 10, 500)
+        missile.update()
+        pool.release(missile)
+        again = pool.acquire(image, 40, 300)
+
+        assert again is missile
+        assert (again.rect.x, again.rect.y, again.rect.size) == (40, 300, (8, 20))
+        assert pool.stats() == {"created": 1, "reused": 1, "released": 1, "discarded": 0, "free": 0}
+
+    def test_max_free_discards_overflow(self):
+        """보관 한도를 넘는 객체는 버림"""
+        pool = ObjectPool(Missile, max_free=2)
+        image = pygame.Surface((8, 20))
+        missiles = [pool.acquire(image, 0, 0) for _ in range(3)]
+
+        pool.release_all(missiles)
+
+        assert missiles == []
+        assert pool.free_count == 2
+        assert pool.discarded == 1
+
+    def test_stone_reset_shares_scaled_images(self):
+        """같은 크기의 운석은 축소 이미지를 공유"""
+        image = pygame.Surface((100, 100))
+        stones = [Stone(image) for _ in range(50)]
+        sizes = {stone.size for stone in stones}
+
+        assert all(STONE_MIN_SIZE <= size <= STONE_MAX_SIZE for size in sizes)
+        assert len({id(stone.image) for stone in stones}) == len(sizes)
+        assert all(stone.rect.size == (stone.size, stone.size) for stone in stones)
+
+    def test_enemy_reset_clears_ai_state(self):
+        """재사용된 적은 순찰 상태로 화면 위에서 다시 시작"""
+        pool = ObjectPool(Enemy)
+        image = pygame.Surface((40, 40))
+        enemy = pool.acquire(image, 2.0, 0.8)
+        enemy.state = EnemyState.FIRING
+        enemy.laser = object()
+        enemy.rect.y = 300
+
+        pool.release(enemy)
+        enemy = pool.acquire(image, 3.0, 0.5)
+
+        assert enemy.state == EnemyState.PATROL
+        assert enemy.laser is None
+        assert enemy.rect.y == -40
+        assert (enemy.speed, enemy.evasion_skill) == (3.0, 0.5)
+
+    def test_gc_pressure_keys(self):
+        """GC 압력 지표는 세대별 값을 포함"""
+        pressure = gc_pressure()
+        assert set(pressure) == {
+            "gen0_pending", "gen1_pending", "gen2_pending",
+            "gen0_collections", "gen1_collections", "gen2_collections",
+        }
+
+
+class TestPowerUpPool:
+    """파워업 풀 테스트"""
+
+    def test_off_screen_powerups_return_to_pool(self):
+        """화면 밖 파워업은 리스트를 새로 만들지 않고 풀로 반환"""
+        manager = PowerUpManager()
+        active = manager.active_powerups
+        kept = manager.spawn_random_powerup()
+        gone = manager.spawn_random_powerup()
+        gone.rect.y = SCREEN_HEIGHT + 1
+
+        manager.update_powerups()
+
+        assert manager.active_powerups is active
+        assert list(active) == [kept]
+        assert manager.spawn_random_powerup() is gone
+
+    def test_clear_returns_everything(self):
+        """clear_powerups는 모든 파워업을 풀로 반환"""
+        manager = PowerUpManager()
+        for _ in range(3):
+            manager.spawn_random_powerup()
+        manager.activate_powerup(PowerUpType.SHIELD)
+
+        manager.clear_powerups()
+
+        assert len(manager.active_powerups) == 0
+        assert manager.active_powerups.pool.free_count == 3
+        assert manager.active_effects == {}
+
+
+class TestGameStatePools:
+    """GameState 엔티티 풀 테스트"""
+
+    def test_reset_returns_entities_to_pools(self):
+        """reset()은 모든 엔티티를 풀로 반환하고 다음 게임에서 재사용"""
+        from game.game_state import GameState
+        state = GameState()
+        image = pygame.Surface((40, 40))
+        for _ in range(3):
+            state.spawn_stone(image)
+            state.spawn_missile(image, 0, 0)
+            state.spawn_enemy(image, 2.0, 0.8)
+        state.powerup_manager.spawn_random_powerup()
+
+        state.reset()
+
+        stats = state.allocation_stats()
+        assert (len(state.stones), len(state.missiles), len(state.enemies)) == (0, 0, 0)
+        assert [stats[name]["free"] for name in ("stone", "missile", "enemy", "powerup")] == [3, 3, 3, 1]
+
+        state.spawn_stone(image)
+        assert state.allocation_stats()["stone"]["reused"] == 1
+
+    def test_killed_entities_released_at_end_of_frame(self):
+        """제거 표시한 엔티티는 프레임 끝 정리 때 풀로 반환"""
+        from game.game_state import GameState
+        state = GameState()
+        image = pygame.Surface((40, 40))
+        first = state.spawn_missile(image, 0, 0)
+        second = state.spawn_missile(image, 10, 0)
+
+        state.missiles.kill(first.handle)
+        assert list(state.missiles) == [second]
+        assert state.missiles.pool.free_count == 0
+
+        state.end_frame()
+        assert state.spawn_missile(image, 20, 0) is first
@@ -0,0 +1,81 @@
+"""Power-up icon / timer label cache tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from game.powerup import PowerUp, PowerUpManager, PowerUpType
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((200, 300))
+    pygame.display.quit()
+
+
+class CountingFont:
+    """render 호출 횟수를 세는 폰트 래퍼"""
+
+    def __init__(self, size=18):
+        self.font = pygame.font.Font(None, size)
+        self.renders = 0
+
+    def render(self, *args, **kwargs):
+        self.renders += 1
+        return self.font.render(*args, **kwargs)
+
+
+class TestPowerUpIcons:
+    """파워업 아이콘 사전 렌더링 테스트"""
+
+    def test_spawned_powerups_share_baked_icon(self, screen):
+        """생성된 파워업은 타입별로 미리 그린 아이콘을 공유"""
+        manager = PowerUpManager()
+        font = CountingFont(20)
+        manager.bake_icons(font)
+        baked = font.renders
+
+        powerups = [manager.spawn_random_powerup() for _ in range(20)]
+
+        assert baked == 2 * len(PowerUpType)
+        for powerup in powerups:
+            assert powerup.image is manager.icons[powerup.type]
+
+        rects = manager.draw_powerups(screen)
+        assert rects == [powerup.rect for powerup in powerups]
+        assert font.renders == baked
+
+    def test_powerup_without_baked_icon(self, screen):
+        """아이콘 없이 만든 파워업도 그릴 수 있음"""
+        powerup = PowerUp(PowerUpType.SHIELD, x=50, y=50)
+        assert powerup.image.get_size() == (PowerUp.SIZE, PowerUp.SIZE)
+        assert powerup.draw(screen) == pygame.Rect(50, 50, PowerUp.SIZE, PowerUp.SIZE)
+
+    def test_timer_label_renders_once_per_second(self, screen):
+        """남은 시간 라벨은 초 값이 바뀔 때만 렌더링"""
+        manager = PowerUpManager()
+        font = CountingFont()
+        manager.activate_powerup(PowerUpType.SHIELD)
+
+        for _ in range(120):
+            manager.draw_active_effects_ui(screen, font)
+            manager.update_effects()
+
+        # 아이콘 1회 + 3s, 2s, 1s 라벨 (180 -> 61 프레임)
+        assert font.renders == 4
+
+    def test_active_effects_ui_rects(self, screen):
+        """활성 효과마다 아이콘/라벨 영역 반환"""
+        manager = PowerUpManager()
+        manager.bake_icons(CountingFont())
+        manager.activate_powerup(PowerUpType.SHIELD)
+        manager.activate_powerup(PowerUpType.MULTI_SHOT)
+
+        rects = manager.draw_active_effects_ui(screen, CountingFont(), 10, 100)
+
+        assert len(rects) == 4
+        assert rects[0] == pygame.Rect(10, 100, PowerUp.SIZE, PowerUp.SIZE)
+        assert rects[2].y == 135
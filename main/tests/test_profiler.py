@@ -0,0 +1,115 @@
+"""Frame profiler and overlay tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import csv
+import json
+import pygame
+import pytest
+from core.profiler import FrameProfiler, SECTIONS, TOTAL, percentile
+from game.simulation import GameSimulation, Sprites
+from tests.test_simulation import SETTINGS, play, round_sprite
+from ui.profiler_overlay import ProfilerOverlay
+
+
+def record(profiler, values, section="update"):
+    """구간 시간 대신 카운터 값으로 프레임 기록 (시간에 의존하지 않도록)"""
+    for value in values:
+        profiler.begin_frame()
+        profiler.lap(section)
+        profiler.count("stones", value)
+        profiler.end_frame()
+
+
+class TestFrameProfiler:
+    """링 버퍼와 백분위수"""
+
+    def test_percentile_nearest_rank(self):
+        ordered = list(range(1, 101))
+
+        assert [percentile(ordered, p) for p in (50, 95, 99, 100)] == [50, 95, 99, 100]
+        assert percentile([], 50) == 0.0
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        profiler = FrameProfiler(capacity=100)
+
+        record(profiler, range(250))
+
+        assert (profiler.frames, len(profiler)) == (250, 100)
+        assert profiler.samples("stones") == list(range(150, 250))
+        assert profiler.percentiles("stones") == {"p50": 199, "p95": 244, "p99": 248, "mean": 199.5}
+
+    def test_laps_add_up_to_sections(self):
+        profiler = FrameProfiler()
+
+        profiler.begin_frame()
+        profiler.lap("update")
+        profiler.lap("render")
+        profiler.lap("update")
+        profiler.end_frame()
+
+        total = profiler.samples(TOTAL)[0]
+        sections = sum(profiler.samples(name)[0] for name in SECTIONS)
+        assert 0 < sections <= total
+        assert profiler.samples("spawn") == [0.0]
+        with pytest.raises(KeyError):
+            profiler.lap("physics")
+
+    def test_count_delta_and_rate(self):
+        profiler = FrameProfiler()
+        for hits, misses in ((100, 5), (108, 6), (110, 6)):
+            profiler.begin_frame()
+            profiler.count_delta("text_hits", hits)
+            profiler.count_delta("text_misses", misses)
+            profiler.end_frame()
+
+        assert profiler.samples("text_hits") == [0, 8, 2]
+        assert profiler.rate("text_hits", "text_misses") == pytest.approx(10 / 11)
+        assert profiler.rate("surface_hits", "surface_misses") is None
+
+    def test_export(self, tmp_path):
+        profiler = FrameProfiler(capacity=10)
+        record(profiler, range(15))
+
+        profiler.export_csv(str(tmp_path / "trace.csv"))
+        profiler.export_json(str(tmp_path / "trace.json"), {"fps": 60})
+
+        with open(tmp_path / "trace.csv", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [int(row["frame"]) for row in rows] == list(range(5, 15))
+        assert [float(row["stones"]) for row in rows] == list(range(5, 15))
+        trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+        assert (trace["frames"], trace["window"], trace["fps"]) == (15, 10, 60)
+        assert set(SECTIONS) <= set(trace["summary"])
+
+
+class TestInstrumentation:
+    """시뮬레이션 구간 계측과 오버레이"""
+
+    def test_simulation_laps_sections(self):
+        sprites = Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+        simulation = GameSimulation(sprites, seed=42, settings=SETTINGS)
+        profiler = simulation.profiler = FrameProfiler()
+
+        for _ in range(200):
+            profiler.begin_frame()
+            play(simulation, 1)
+            profiler.end_frame()
+
+        for name in ("spawn", "update", "enemy_ai", "collision"):
+            assert sum(profiler.samples(name)) > 0
+        assert sum(profiler.samples("render")) == 0
+
+    def test_overlay_draws_only_when_visible(self):
+        pygame.font.init()
+        profiler = FrameProfiler()
+        record(profiler, [3, 4, 5])
+        overlay = ProfilerOverlay(profiler, pygame.font.Font(None, 18))
+        screen = pygame.Surface((800, 800))
+
+        assert overlay.draw(screen) is None
+        overlay.toggle()
+        rect = overlay.draw(screen)
+
+        assert rect is not None and rect.right == 790
+        assert len(overlay.rows()) == len(SECTIONS) + 4  # 머리글, 구간, total, 엔티티 수, 캐시
@@ -0,0 +1,47 @@
+"""Batched layer rendering tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from game.entities import Missile, Stone
+from game.render_batch import blit_layer
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.display.init()
+    yield pygame.display.set_mode((200, 200))
+    pygame.display.quit()
+
+
+def make_image(color, size=(10, 10)):
+    """단색 이미지"""
+    image = pygame.Surface(size)
+    image.fill(color)
+    return image
+
+
+class TestBlitLayer:
+    """레이어 배치 그리기 테스트"""
+
+    def test_matches_individual_draw(self, screen):
+        """배치 결과가 엔티티별 draw()와 같은 픽셀/영역"""
+        stones = [Stone(make_image((200, 100, 0)), x=x, y=x // 2) for x in range(0, 150, 30)]
+        missiles = [Missile(make_image((0, 200, 255), (4, 12)), x, 100) for x in range(5, 200, 40)]
+
+        screen.fill((0, 0, 0))
+        expected_rects = [entity.draw(screen) for entity in missiles + stones]
+        expected = pygame.image.tobytes(screen, 'RGB')
+
+        screen.fill((0, 0, 0))
+        rects = blit_layer(screen, [(m.image, m.rect) for m in missiles])
+        rects += blit_layer(screen, [(s.image, s.rect) for s in stones])
+
+        assert pygame.image.tobytes(screen, 'RGB') == expected
+        assert rects == expected_rects
+
+    def test_empty_layer(self, screen):
+        """빈 레이어는 아무것도 그리지 않음"""
+        assert blit_layer(screen, []) == []
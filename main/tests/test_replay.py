@@ -0,0 +1,230 @@
+"""Binary replay format tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import io
+import random
+import pygame
+import pytest
+from core.config import CLIENT_VERSION
+from game.replay import ReplayWriter, ReplayReader, ReplayStream, HEADER, prune_replays, strip_snapshots
+from game.simulation import (
+    GameSimulation, Sprites, replay,
+    INPUT_UP, INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE, INPUT_SKILL
+)
+
+SETTINGS = {"difficulty": "hard", "enemy_speed": 4.5, "enemy_spawn_chance": 4.0, "enemy_evasion_skill": 0.95}
+MOVES = (0, INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_LEFT | INPUT_UP)
+
+
+def player_inputs(frames, seed=1):
+    """사람처럼 방향키는 한동안 누르고 발사는 가끔 한 프레임씩"""
+    rng = random.Random(seed)
+    move, next_move, next_fire = 0, 0, 0
+    inputs = bytearray()
+    for frame in range(frames):
+        if frame >= next_move:
+            move, next_move = rng.choice(MOVES), frame + rng.randint(8, 90)
+        bits = move
+        if frame >= next_fire:
+            bits, next_fire = bits | INPUT_FIRE, frame + rng.randint(6, 30)
+        if rng.random() < 0.001:
+            bits |= INPUT_SKILL
+        inputs.append(bits)
+    return inputs
+
+
+def write(inputs, final_score=100, **kwargs):
+    """입력을 메모리 파일에 기록"""
+    buffer = io.BytesIO()
+    writer = ReplayWriter(buffer, 77, SETTINGS, **kwargs)
+    for bits in inputs:
+        writer.record(bits)
+    writer.close(final_score)
+    return buffer.getvalue()
+
+
+class TestReplayFormat:
+    """인코딩/디코딩"""
+
+    def test_round_trip_with_header(self):
+        inputs = player_inputs(5000) + bytes(range(64)) + bytes(64)
+        reader = ReplayReader(write(inputs, final_score=1234))
+
+        assert reader.inputs() == inputs
+        assert list(reader) == list(inputs)
+        assert (reader.seed, reader.settings, reader.client_version) == (77, SETTINGS, CLIENT_VERSION)
+        assert (reader.final_score, len(reader), reader.finished) == (1234, len(inputs), True)
+
+    def test_thirty_minute_run_is_a_few_kilobytes(self):
+        """30분(108000 프레임) 입력이 프레임당 1바이트보다 훨씬 작음"""
+        inputs = player_inputs(30 * 60 * 60)
+        data = write(inputs)
+
+        assert len(data) < 16 * 1024
+        assert ReplayReader(data).inputs() == inputs
+
+    def test_seek_decodes_one_segment(self):
+        """목표 프레임 이하 키프레임의 스냅샷과 그 뒤 입력만"""
+        inputs = player_inputs(1000)
+        reader = ReplayReader(write(inputs, keyframe_interval=300))
+
+        assert [frame for frame, _ in reader.keyframes] == [0, 300, 600, 900]
+        for target in (0, 1, 299, 300, 301, 750, 999, 1000):
+            keyframe, _, tail = reader.seek(target)
+            assert keyframe == target // 300 * 300
+            assert tail == inputs[keyframe:target]
+
+    def test_snapshot_taken_before_keyframe_frame(self):
+        """키프레임 스냅샷은 그 프레임 입력을 기록하기 전에 찍음"""
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 1, SETTINGS, keyframe_interval=10)
+        writer.snapshot = lambda: writer.frame_count.to_bytes(4, "little")
+        for bits in player_inputs(25):
+            writer.record(bits)
+        writer.close(0)
+
+        reader = ReplayReader(buffer.getvalue())
+        assert [int.from_bytes(reader.seek(frame)[1], "little") for frame in (5, 15, 24)] == [0, 10, 20]
+
+    def test_strip_snapshots_keeps_inputs_and_index(self):
+        """업로드용 파일은 스냅샷만 비우고 입력/헤더/키프레임 위치는 그대로"""
+        inputs = player_inputs(1000)
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 77, SETTINGS, keyframe_interval=300, snapshot=lambda: os.urandom(2500))
+        for bits in inputs:
+            writer.record(bits)
+        writer.close(4321)
+        original = buffer.getvalue()
+
+        stripped = strip_snapshots(original)
+        reader = ReplayReader(stripped)
+
+        assert len(stripped) < len(original) - 4 * 2500
+        assert reader.inputs() == inputs
+        assert (reader.seed, reader.settings, reader.final_score) == (77, SETTINGS, 4321)
+        assert [frame for frame, _ in reader.keyframes] == [0, 300, 600, 900]
+        assert reader.seek(750) == (600, b"", inputs[600:750])
+
+    def test_prune_keeps_most_recent_replays(self, tmp_path):
+        """최근 keep개만 남기고 리플레이가 아닌 파일(체크포인트 등)은 그대로"""
+        for age in range(5):
+            path = tmp_path / f"replay_{age}.sgr"
+            path.write_bytes(b"")
+            os.utime(path, (1000 - age, 1000 - age))
+        (tmp_path / "checkpoint.sgc").write_bytes(b"")
+
+        assert prune_replays(str(tmp_path), 2) == 3
+        assert sorted(os.listdir(tmp_path)) == ["checkpoint.sgc", "replay_0.sgr", "replay_1.sgr"]
+        assert prune_replays(str(tmp_path / "missing"), 2) == 0
+
+    def test_unfinished_file_reads_what_was_flushed(self):
+        """close() 전에 끝난 파일은 색인 없이 기록된 만큼만"""
+        inputs = player_inputs(700)
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 5, SETTINGS, keyframe_interval=300)
+        for bits in inputs:
+            writer.record(bits)
+
+        reader = ReplayReader(buffer.getvalue())
+
+        assert not reader.finished and reader.final_score is None
+        assert 300 <= len(reader.inputs()) <= len(inputs)
+        assert reader.inputs() == inputs[:len(reader.inputs())]
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            ReplayReader(b"\x89PNG" + bytes(HEADER.size))
+        with pytest.raises(ValueError):
+            ReplayReader(b"SGRP")
+
+    def test_max_frames_stops_run_bombs(self):
+        """믿을 수 없는 파일은 풀기 전에 프레임 수 상한 확인"""
+        data = write(bytes(5000))
+
+        assert len(ReplayReader(data, max_frames=5000).inputs()) == 5000
+        with pytest.raises(ValueError):
+            ReplayReader(data, max_frames=4999).inputs()
+
+    def test_writes_to_path(self, tmp_path):
+        path = tmp_path / "replays" / "run.sgr"
+        writer = ReplayWriter(str(path), 9, SETTINGS)
+        writer.record(INPUT_FIRE)
+        writer.close(3)
+
+        reader = ReplayReader.open(writer.path)
+        assert (list(reader), reader.final_score) == ([INPUT_FIRE], 3)
+
+
+def drain(stream):
+    """지금까지 받은 만큼의 입력을 모두 꺼내기"""
+    inputs = bytearray()
+    bits = stream.next_input()
+    while bits is not None:
+        inputs.append(bits)
+        bits = stream.next_input()
+    return inputs
+
+
+class TestReplayStream:
+    """받는 만큼씩 푸는 고스트용 디코더"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100, 4096])
+    def test_chunked_feed_matches_reader(self, chunk_size):
+        inputs = player_inputs(4000) + bytes(range(64))
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 77, SETTINGS, keyframe_interval=500)
+        writer.snapshot = lambda: bytes(300)
+        for bits in inputs:
+            writer.record(bits)
+        writer.close(42)
+        data = buffer.getvalue()
+
+        stream = ReplayStream()
+        decoded = bytearray()
+        for start in range(0, len(data), chunk_size):
+            stream.feed(data[start:start + chunk_size])
+            decoded += drain(stream)
+
+        assert decoded == inputs
+        assert stream.ended and stream.frames_read == len(inputs)
+        assert (stream.seed, stream.settings, stream.final_score) == (77, SETTINGS, 42)
+
+    def test_waits_for_more_data(self):
+        data = write(player_inputs(3000))
+        stream = ReplayStream()
+
+        stream.feed(data[:HEADER.size - 1])
+        assert not stream.ready and stream.next_input() is None
+
+        stream.feed(data[HEADER.size - 1:HEADER.size + 40])
+        partial = drain(stream)
+        assert stream.ready and not stream.ended
+        assert partial == player_inputs(3000)[:len(partial)]
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            ReplayStream().feed(b"\x89PNG" + bytes(HEADER.size))
+
+
+class TestReplayFileSimulation:
+    """게임 중 파일로 기록한 리플레이로 같은 점수 재현"""
+
+    def test_streamed_replay_reproduces_score(self):
+        sprites = Sprites(pygame.Surface((50, 50)), pygame.Surface((50, 50)),
+                          pygame.Surface((10, 30)), pygame.Surface((50, 50)))
+        buffer = io.BytesIO()
+        live = GameSimulation(sprites, seed=2024, settings=SETTINGS,
+                              recorder=ReplayWriter(buffer, 2024, SETTINGS, keyframe_interval=120))
+        for bits in player_inputs(3000, seed=3):
+            if live.state.game_over:
+                break
+            live.step(bits)
+        live.recorder.close(live.state.score)
+
+        reader = ReplayReader(buffer.getvalue())
+        replayed = replay(reader, sprites)
+
+        assert reader.final_score == live.state.score > 0
+        assert (replayed.state.score, replayed.state.current_frame) == \
+            (live.state.score, live.state.current_frame)
@@ -0,0 +1,80 @@
+"""Retained presenter tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from ui.retained import RetainedPresenter, HOVER_MARGIN
+
+
+@pytest.fixture
+def screen():
+    """더미 디스플레이 화면"""
+    pygame.display.init()
+    yield pygame.display.set_mode((100, 100))
+    pygame.display.quit()
+
+
+class RecordingRender:
+    """그리기 호출과 클립 영역 기록"""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.clips = []
+
+    def __call__(self):
+        self.clips.append(self.screen.get_clip())
+
+
+class TestRetainedPresenter:
+    """retained 모드 프레젠터 테스트"""
+
+    def test_first_frame_full_then_idle(self, screen):
+        """첫 프레임은 전체, 이후 변경이 없으면 그리지 않음"""
+        presenter = RetainedPresenter(screen)
+        render = RecordingRender(screen)
+
+        assert presenter.present(render)
+        assert not presenter.present(render)
+        assert render.clips == [screen.get_rect()]
+        assert screen.get_clip() == screen.get_rect()
+
+    def test_hover_change_invalidates_old_and_new(self, screen):
+        """호버가 바뀌면 이전/현재 버튼 영역만 다시 그림"""
+        presenter = RetainedPresenter(screen)
+        render = RecordingRender(screen)
+        presenter.present(render)
+
+        left, right = pygame.Rect(10, 10, 20, 20), pygame.Rect(60, 10, 20, 20)
+        presenter.track_hover([left, right], (15, 15))
+        presenter.present(render)
+        assert render.clips[-1] == left.inflate(HOVER_MARGIN, HOVER_MARGIN)
+
+        # 같은 버튼 위에서 움직이면 다시 그리지 않음
+        presenter.track_hover([left, right], (16, 16))
+        assert not presenter.present(render)
+
+        presenter.track_hover([left, right], (65, 15))
+        presenter.present(render)
+        expected = left.inflate(HOVER_MARGIN, HOVER_MARGIN).union(right.inflate(HOVER_MARGIN, HOVER_MARGIN))
+        assert render.clips[-1] == expected
+
+    def test_input_event_forces_full_redraw(self, screen):
+        """클릭 이벤트가 대기 중이면 전체를 다시 그리고 이벤트는 큐에 남김"""
+        presenter = RetainedPresenter(screen, idle_wait_ms=1)
+        presenter.present(RecordingRender(screen))
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        presenter.wait()
+
+        assert presenter.dirty
+        assert pygame.event.peek(pygame.KEYDOWN)
+
+    def test_idle_wait_times_out(self, screen):
+        """이벤트가 없으면 시간 제한 후 반환"""
+        pygame.event.clear()
+        presenter = RetainedPresenter(screen, idle_wait_ms=5)
+        presenter.present(RecordingRender(screen))
+
+        presenter.wait()
+        assert not presenter.dirty
@@ -0,0 +1,122 @@
+"""Deterministic simulation and input replay tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import random
+import pygame
+import pytest
+from game.simulation import (
+    GameSimulation, InputRecorder, Sprites, read_input, replay,
+    INPUT_UP, INPUT_DOWN, INPUT_LEFT, INPUT_RIGHT, INPUT_FIRE, INPUT_SKILL
+)
+
+SETTINGS = {"difficulty": "hard", "enemy_speed": 4.5, "enemy_spawn_chance": 4.0, "enemy_evasion_skill": 0.95}
+
+
+def round_sprite(size):
+    """투명 배경 위 원형 스프라이트"""
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (150, 120, 90), (size // 2, size // 2), size // 2)
+    return surface
+
+
+@pytest.fixture(scope="module")
+def sprites():
+    return Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+
+
+def play(simulation, frames, seed=5):
+    """입력 시드로 정한 조작(이동 + 연사 + 스킬)으로 진행"""
+    inputs_rng = random.Random(seed)
+    moves = (INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN, 0)
+    move = 0
+    for frame in range(frames):
+        if simulation.state.game_over:
+            break
+        if frame % 30 == 0:
+            move = inputs_rng.choice(moves)
+        inputs = move
+        if frame % 6 == 0:
+            inputs |= INPUT_FIRE
+        if simulation.state.skill_available and inputs_rng.random() < 0.05:
+            inputs |= INPUT_SKILL
+        simulation.step(inputs)
+    return simulation
+
+
+def outcome(simulation):
+    """비교용 게임 결과"""
+    state = simulation.state
+    return (
+        state.score, state.health, state.current_frame, state.game_over,
+        state.missiles_fired, state.missiles_hit, state.enemies_destroyed,
+        state.statistics.stones_destroyed, state.combo_system.get_max_combo(),
+        state.stage_manager.current_stage_number, tuple(simulation.player.rect),
+        [tuple(stone.rect) for stone in state.stones],
+        [(tuple(enemy.rect), enemy.state) for enemy in state.enemies],
+    )
+
+
+class TestReplay:
+    """시드 + 입력 기록으로 같은 게임 재현"""
+
+    def test_replay_reproduces_score(self, sprites):
+        live = play(GameSimulation(sprites, seed=1234, settings=SETTINGS), 3000)
+
+        replayed = replay(live.recorder, sprites)
+
+        assert live.state.score > 0
+        assert live.state.statistics.skills_used > 0
+        assert len(live.recorder) == live.state.current_frame
+        assert outcome(replayed) == outcome(live)
+
+    def test_seed_changes_the_game(self, sprites):
+        first = play(GameSimulation(sprites, seed=1, settings=SETTINGS), 300)
+        second = play(GameSimulation(sprites, seed=2, settings=SETTINGS), 300)
+
+        assert outcome(first) != outcome(second)
+
+    def test_global_random_untouched(self, sprites):
+        """게임 난수는 전역 random 모듈을 쓰지 않음"""
+        random.seed(99)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(99)
+        play(GameSimulation(sprites, seed=7, settings=SETTINGS), 600)
+
+        assert [random.random() for _ in range(3)] == expected
+
+    def test_recorder_keeps_seed_and_settings(self, sprites):
+        simulation = GameSimulation(sprites, seed=42, settings=SETTINGS)
+        simulation.step(INPUT_FIRE | INPUT_LEFT)
+        simulation.step(0)
+
+        recorder = simulation.recorder
+        assert (recorder.seed, recorder.settings) == (42, SETTINGS)
+        assert list(recorder) == [INPUT_FIRE | INPUT_LEFT, 0]
+
+    def test_replay_stops_at_game_over(self, sprites):
+        recording = InputRecorder(3, SETTINGS)
+        for _ in range(20000):
+            recording.record(0)
+
+        simulation = replay(recording, sprites)
+
+        assert simulation.state.game_over
+        assert len(simulation.recorder) < len(recording)
+
+
+class TestReadInput:
+    """pygame 입력 -> 입력 비트"""
+
+    def test_held_keys_and_pressed_events(self):
+        keys = {pygame.K_UP: True, pygame.K_DOWN: False, pygame.K_LEFT: False, pygame.K_RIGHT: True}
+        events = [
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, unicode=" "),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, unicode=" "),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UNKNOWN, unicode="ㄹ"),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1),
+        ]
+
+        assert read_input(events, keys) == INPUT_UP | INPUT_RIGHT | INPUT_FIRE | INPUT_SKILL
+        assert read_input([], {key: False for key in keys}) == 0
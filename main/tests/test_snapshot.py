@@ -0,0 +1,204 @@
+"""Game snapshot, replay seeking and checkpoint tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import io
+import pygame
+import pytest
+import screens.game_screen as game_screen
+from game.checkpoint import CheckpointWriter, load_checkpoint, write_checkpoint
+from game.powerup import PowerUpType
+from game.replay import ReplayReader, ReplayWriter
+from game.simulation import GameSimulation, Sprites, replay, seek, INPUT_FIRE
+from game.snapshot import HEADER, MAGIC
+from tests.test_simulation import SETTINGS, outcome, play, round_sprite
+
+
+@pytest.fixture(scope="module")
+def sprites():
+    return Sprites(round_sprite(50), round_sprite(70), pygame.Surface((10, 30)), round_sprite(50))
+
+
+def play_until_laser(simulation):
+    """적이 레이저를 쏘는 프레임까지 진행 (적 AI 상태/레이저까지 스냅샷에 들어가도록)"""
+    while not any(enemy.laser for enemy in simulation.state.enemies):
+        assert not simulation.state.game_over
+        simulation.step(INPUT_FIRE if simulation.state.current_frame % 6 == 0 else 0)
+    return simulation
+
+
+def full_state(simulation):
+    """outcome()에 rng와 파워업/콤보/통계까지 더한 비교용 상태"""
+    state = simulation.state
+    return outcome(simulation) + (
+        state.rng.getstate(), dict(state.powerup_manager.active_effects),
+        [(powerup.handle, tuple(powerup.rect)) for powerup in state.powerup_manager.active_powerups],
+        [stone.handle for stone in state.stones], [enemy.handle for enemy in state.enemies],
+        state.combo_system.combo_count, state.combo_system.last_hit_frame,
+        state.statistics.missiles_fired, state.statistics.damage_taken,
+    )
+
+
+class TestSnapshot:
+    """스냅샷에서 이어 가면 끊김 없이 진행한 것과 같은 게임"""
+
+    def test_restored_game_continues_identically(self, sprites):
+        live = play_until_laser(GameSimulation(sprites, seed=42, settings=SETTINGS))
+        live.state.apply_powerup(PowerUpType.MULTI_SHOT)
+        live.state.powerup_manager.spawn_random_powerup()
+        data = live.snapshot()
+
+        restored = GameSimulation.from_snapshot(sprites, data)
+
+        assert full_state(restored) == full_state(live)
+        assert restored.settings == SETTINGS
+        play(live, 600, seed=3)
+        play(restored, 600, seed=3)
+        assert full_state(restored) == full_state(live)
+
+    def test_rewind_in_place(self, sprites):
+        simulation = play(GameSimulation(sprites, seed=7, settings=SETTINGS), 200)
+        data = simulation.snapshot()
+        first = full_state(play(simulation, 300, seed=11))
+
+        simulation.restore(data)
+
+        assert full_state(play(simulation, 300, seed=11)) == first
+
+    def test_rng_stays_shared(self, sprites):
+        """복원 후에도 파워업 관리자와 적은 게임 rng 하나를 공유"""
+        live = play_until_laser(GameSimulation(sprites, seed=42, settings=SETTINGS))
+
+        restored = GameSimulation.from_snapshot(sprites, live.snapshot())
+
+        state = restored.state
+        assert state.powerup_manager.rng is state.rng
+        assert all(enemy.rng is state.rng for enemy in state.enemies)
+
+    def test_snapshot_is_compact(self, sprites):
+        simulation = play(GameSimulation(sprites, seed=7, settings=SETTINGS), 300)
+
+        assert len(simulation.snapshot()) < 8 * 1024
+
+    def test_rejects_foreign_data(self, sprites):
+        simulation = GameSimulation(sprites, seed=1, settings=SETTINGS)
+        data = simulation.snapshot()
+
+        with pytest.raises(ValueError):
+            simulation.restore(b"SGRP" + data[4:])
+        with pytest.raises(ValueError):
+            simulation.restore(MAGIC + bytes([99]) + data[5:])
+        with pytest.raises(ValueError):
+            simulation.restore(data[:HEADER.size + 10])
+
+
+class TestSeek:
+    """키프레임 스냅샷으로 리플레이 중간부터 탐색"""
+
+    def test_seek_matches_full_replay(self, sprites):
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 99, SETTINGS, keyframe_interval=120)
+        live = GameSimulation(sprites, seed=99, settings=SETTINGS, recorder=writer)
+        writer.snapshot = live.snapshot
+        play(live, 500, seed=4)
+        writer.close(live.state.score)
+        reader = ReplayReader(buffer.getvalue())
+
+        target = 430
+        expected = GameSimulation(sprites, 99, SETTINGS)
+        for bits in reader.inputs()[:target]:
+            expected.step(bits)
+
+        assert len(reader.keyframes) > 3
+        assert outcome(seek(reader, target, sprites)) == outcome(expected)
+        assert outcome(seek(reader, len(reader), sprites)) == outcome(replay(reader, sprites))
+
+    def test_seek_without_snapshots_replays_from_start(self, sprites):
+        buffer = io.BytesIO()
+        writer = ReplayWriter(buffer, 5, SETTINGS, keyframe_interval=100)
+        live = play(GameSimulation(sprites, seed=5, settings=SETTINGS, recorder=writer), 300)
+        writer.close(live.state.score)
+
+        sought = seek(ReplayReader(buffer.getvalue()), live.state.current_frame, sprites)
+
+        assert outcome(sought) == outcome(live)
+
+
+class TestCheckpoint:
+    """체크포인트 파일"""
+
+    def test_writer_keeps_latest(self, tmp_path):
+        path = str(tmp_path / "checkpoint.sgc")
+        writer = CheckpointWriter(path)
+
+        writer.submit(b"first", "a.sgr")
+        writer.submit(b"second", "b.sgr")
+        assert writer.flush(timeout=5)
+        writer.close()
+
+        assert load_checkpoint(path) == (b"second", "b.sgr")
+
+    def test_close_discard_removes_file(self, tmp_path):
+        path = str(tmp_path / "checkpoint.sgc")
+        write_checkpoint(path, b"state")
+        writer = CheckpointWriter(path)
+
+        writer.close(discard=True)
+
+        assert load_checkpoint(path) is None
+        assert not os.path.exists(path)
+
+    def test_broken_file_is_ignored(self, tmp_path):
+        path = tmp_path / "checkpoint.sgc"
+        path.write_bytes(b"garbage")
+
+        assert load_checkpoint(str(path)) is None
+
+
+class FakeDifficulty:
+    """고른 난이도만 흉내내는 난이도 관리자"""
+
+    def __init__(self, name):
+        self.current_difficulty = name
+
+    def get_current_settings(self):
+        return SETTINGS
+
+
+class TestResumeFromCheckpoint:
+    """체크포인트에서 이어서 시작"""
+
+    @pytest.fixture
+    def checkpoint(self, tmp_path, monkeypatch, sprites):
+        """hard 난이도로 100프레임 진행한 체크포인트 (리플레이 없음)"""
+        path = str(tmp_path / "checkpoint.sgc")
+        monkeypatch.setattr(game_screen, "CHECKPOINT_PATH", path)
+        monkeypatch.setattr(game_screen, "REPLAY_DIR", str(tmp_path / "replays"))
+        simulation = GameSimulation(sprites, 3, SETTINGS)
+        play(simulation, 100)
+        write_checkpoint(path, simulation.snapshot())
+        return path
+
+    def test_resumes_when_confirmed(self, checkpoint, sprites):
+        asked = []
+
+        resumed = game_screen._resume_from_checkpoint(
+            sprites, FakeDifficulty("hard"), confirm=lambda simulation: asked.append(simulation) or True)
+
+        assert resumed is not None and asked == [resumed]
+        assert resumed.state.current_frame == 100
+
+    def test_declined_discards_checkpoint(self, checkpoint, sprites):
+        resumed = game_screen._resume_from_checkpoint(sprites, FakeDifficulty("hard"), confirm=lambda _: False)
+
+        assert resumed is None
+        assert not os.path.exists(checkpoint)
+
+    def test_other_difficulty_starts_new_game_without_asking(self, checkpoint, sprites):
+        asked = []
+
+        resumed = game_screen._resume_from_checkpoint(
+            sprites, FakeDifficulty("easy"), confirm=lambda simulation: asked.append(simulation) or True)
+
+        assert resumed is None and asked == []
+        assert not os.path.exists(checkpoint)
@@ -0,0 +1,125 @@
+"""Spatial index tests"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from game.spatial import SpatialGrid
+from game.enemy import Enemy
+from game.collision import CollisionDetector
+from game.entity_list import EntityList
+
+
+class Box:
+    """rect만 가진 더미 엔티티"""
+
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+    def get_rect(self):
+        return self.rect
+
+
+def boxes(*positions):
+    """핸들이 붙은 더미 엔티티 컨테이너"""
+    container = EntityList()
+    for x, y in positions:
+        container.add(Box(x, y))
+    return container
+
+
+@pytest.fixture
+def enemy():
+    """(200, 200) 중심의 적"""
+    enemy = Enemy(pygame.Surface((20, 20)))
+    enemy.rect.center = (200, 200)
+    return enemy
+
+
+class TestSpatialGrid:
+    """균일 격자 공간 인덱스 테스트"""
+
+    def test_query_rect_returns_nearby_candidates_once(self):
+        """주변 셀의 후보만 한 번씩, 셀 경계를 넘어 겹치는 엔티티도 포함"""
+        entities = boxes((95, 95), (500, 500))
+        grid = SpatialGrid.of(entities)
+        near = next(iter(entities))  # 중심 (100, 100) - 셀 (1, 1)
+
+        assert grid.query_rect(pygame.Rect(80, 80, 40, 40)) == [near]
+        assert grid.query_rect(pygame.Rect(90, 90, 6, 6)) == [near]  # 셀 (0, 0)에서 겹침
+        assert grid.query_rect(pygame.Rect(300, 0, 10, 10)) == []
+        assert len(grid) == 2
+
+    def test_query_rect_never_misses_overlap(self):
+        """격자 후보에 실제로 겹치는 엔티티가 모두 포함됨"""
+        entities = boxes(*[(x * 37 % 700, x * 53 % 500) for x in range(50)])
+        grid = SpatialGrid.of(entities)
+
+        for query in (pygame.Rect(x * 61 % 700, x * 43 % 500, 30, 30) for x in range(50)):
+            expected = {e.handle for e in entities if e.rect.colliderect(query)}
+            assert expected <= {e.handle for e in grid.query_rect(query)}
+
+    def test_nearest_uses_squared_radius(self):
+        """반경 경계(거리 == 반경)는 제외하고 가장 가까운 엔티티 선택"""
+        entities = boxes((25, -5), (65, -5), (-5, 55))  # 중심 (30,0), (70,0), (0,60)
+        grid = SpatialGrid.of(entities)
+
+        entity, distance_sq = grid.nearest(0, 0, 100)
+        assert entity.rect.center == (30, 0)
+        assert distance_sq == 900
+        assert grid.nearest(0, 0, 30) is None
+
+    def test_nearest_is_deterministic_on_ties(self):
+        """같은 거리면 핸들이 작은 쪽 (셀 순서와 무관)"""
+        entities = boxes((45, -5), (-55, -5))  # 중심 (50,0), (-50,0) - 서로 다른 셀
+        grid = SpatialGrid.of(entities)
+
+        entity, _ = grid.nearest(0, 0, 100)
+        assert entity.handle == 1
+
+    def test_nearest_with_accept(self):
+        """조건을 통과한 엔티티 중 가장 가까운 것"""
+        grid = SpatialGrid.of(boxes((5, 5), (40, 40)))
+
+        entity, _ = grid.nearest(0, 0, 100, lambda e: e.rect.x > 10)
+        assert entity.rect.x == 40
+
+
+class TestEnemyDangerDetection:
+    """공간 인덱스 기반 적 위험 감지 테스트"""
+
+    def test_nearest_threat_above(self, enemy):
+        """위쪽 위협 중 가장 가까운 것, 아래쪽은 무시"""
+        stones = boxes((195, 140), (195, 160), (195, 230))
+        danger = enemy._detect_danger(SpatialGrid(), SpatialGrid.of(stones))
+        assert danger.rect.center == (200, 165)
+
+    def test_closer_missile_wins_over_stone(self, enemy):
+        """운석보다 가까운 미사일을 위협으로 선택"""
+        stones = SpatialGrid.of(boxes((195, 130)))
+        missiles = SpatialGrid.of(boxes((205, 160)))
+        assert enemy._detect_danger(missiles, stones).rect.center == (210, 165)
+
+    def test_missile_needs_horizontal_proximity(self, enemy):
+        """수평 거리가 먼 미사일은 위험이 아님"""
+        missiles = SpatialGrid.of(boxes((255, 180)))
+        assert enemy._detect_danger(missiles, SpatialGrid()) is None
+
+    def test_accepts_plain_lists(self, enemy):
+        """리스트를 넘겨도 동작"""
+        assert enemy._detect_danger([], list(boxes((195, 150)))) is not None
+
+
+class TestGridCollision:
+    """공간 인덱스를 쓴 충돌 감지가 전체 비교와 같은 결과인지"""
+
+    def test_matches_brute_force(self):
+        stones = boxes(*[(x * 37 % 780, x * 53 % 580) for x in range(60)])
+        missiles = boxes(*[(x * 41 % 790, x * 29 % 590) for x in range(40)])
+        grid = SpatialGrid.of(stones)
+
+        brute = CollisionDetector.check_missile_stone_collision(missiles, stones)
+        indexed = CollisionDetector.check_missile_stone_collision(missiles, stones, grid)
+
+        assert brute
+        assert sorted(indexed) == sorted(brute)
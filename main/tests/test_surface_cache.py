@@ -0,0 +1,122 @@
+"""Surface cache tests"""
+import pygame
+from ui import surface_cache
+from ui.text_cache import TextCache
+
+
+class TestSurfaceCache:
+    """미리 그린 서피스 캐시 테스트"""
+
+    def setup_method(self):
+        surface_cache.clear()
+
+    def test_same_key_reuses_surface(self):
+        """같은 크기/색상이면 같은 서피스 재사용"""
+        first = surface_cache.get_panel((40, 20), (10, 20, 30, 120))
+        assert surface_cache.get_panel((40, 20), (10, 20, 30, 120)) is first
+        assert surface_cache.get_panel((40, 20), (10, 20, 30, 121)) is not first
+        assert first.get_at((5, 5)) == pygame.Color(10, 20, 30, 120)
+
+    def test_glow_sizes_quantized(self):
+        """연속적으로 변하는 크기는 몇 개의 스프라이트로 묶임"""
+        sprites = {
+            id(surface_cache.get_glow_sprite(3 + step / 100, (0, 229, 255)))
+            for step in range(0, 100)
+        }
+        assert len(sprites) <= int(1 / surface_cache.GLOW_SIZE_STEP) + 1
+
+    def test_stats_count_hits_and_misses(self):
+        before = surface_cache.stats()
+
+        surface_cache.get_overlay((10, 10))
+        surface_cache.get_overlay((10, 10))
+
+        after = surface_cache.stats()
+        assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (1, 1)
+        assert after["entries"] == 1
+
+    def test_quantize_alpha_bounds(self):
+        """알파 양자화 범위"""
+        assert surface_cache.quantize_alpha(-10) == 0
+        assert surface_cache.quantize_alpha(300) == 255
+        levels = {surface_cache.quantize_alpha(a) for a in range(256)}
+        assert len(levels) == surface_cache.ALPHA_LEVELS
+
+    def test_backdrop_composited_once(self):
+        """배경 + 오버레이는 배경마다 한 번만 합성"""
+        background = pygame.Surface((30, 30))
+        background.fill((200, 100, 0))
+
+        backdrop = surface_cache.get_backdrop(background, (0, 0, 0), 255)
+        assert surface_cache.get_backdrop(background, (0, 0, 0), 255) is backdrop
+        assert backdrop is not background
+        assert backdrop.get_at((0, 0)) == pygame.Color(0, 0, 0)
+        assert background.get_at((0, 0)) == pygame.Color(200, 100, 0)
+
+    def test_revisited_background_reuses_backdrop(self, tmp_path):
+        """화면에 다시 들어와 배경을 로드해도 배경/합성 서피스가 늘지 않음"""
+        path = str(tmp_path / "background.png")
+        image = pygame.Surface((40, 30))
+        image.fill((200, 100, 0))
+        pygame.image.save(image, path)
+
+        first = surface_cache.get_backdrop(surface_cache.get_image(path, (20, 15)), (0, 0, 0), 200)
+        entries = surface_cache.stats()["entries"]
+        for _ in range(3):
+            background = surface_cache.get_image(path, (20, 15))
+            assert surface_cache.get_backdrop(background, (0, 0, 0), 200) is first
+
+        assert background.get_size() == (20, 15)
+        assert surface_cache.stats()["entries"] == entries
+
+    def test_new_game_reuses_stone_sizes_and_masks(self, tmp_path):
+        """게임마다 스프라이트를 다시 로드해도 크기별 운석 이미지/마스크가 늘지 않음"""
+        from game.entities import Stone
+
+        path = str(tmp_path / "stone.png")
+        pygame.image.save(pygame.Surface((60, 60)), path)
+
+        def play_game():
+            stone_img = surface_cache.get_image(path, (60, 60))
+            return [Stone(stone_img, 0, 0, size=size) for size in range(20, 41)]
+
+        first = play_game()
+        entries = surface_cache.stats()["entries"]
+        second = play_game()
+
+        assert surface_cache.stats()["entries"] == entries
+        assert all(a.image is b.image and a.mask is b.mask for a, b in zip(first, second))
+
+    def test_overlay_uses_surface_alpha(self):
+        """오버레이는 서피스 알파로 반투명"""
+        overlay = surface_cache.get_overlay((10, 10), (0, 0, 0), 150)
+        assert overlay.get_alpha() == 150
+        assert surface_cache.get_overlay((10, 10), (0, 0, 0), 150) is overlay
+
+
+class TestTextCache:
+    """HUD 텍스트 캐시 테스트"""
+
+    def setup_method(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+
+    def test_same_text_reuses_surface(self):
+        cache = TextCache()
+
+        first = cache.render(self.font, "Score: 10", (255, 255, 255))
+
+        assert cache.render(self.font, "Score: 10", (255, 255, 255)) is first
+        assert cache.render(self.font, "Score: 10", (255, 0, 0)) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_bounded_by_least_recently_used(self):
+        cache = TextCache(max_entries=2)
+        kept = cache.render(self.font, "BACK", (255, 255, 255))
+        cache.render(self.font, "Score: 1", (255, 255, 255))
+        cache.render(self.font, "BACK", (255, 255, 255))
+
+        cache.render(self.font, "Score: 2", (255, 255, 255))
+
+        assert cache.stats()["entries"] == 2
+        assert cache.render(self.font, "BACK", (255, 255, 255)) is kept
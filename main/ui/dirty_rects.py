@@ -0,0 +1,103 @@
+"""Dirty-rectangle tracker for gameplay rendering"""
+import pygame
+from typing import Iterable, List, Optional
+
+# 지울/갱신할 면적이 화면의 이 비율을 넘으면 전체 배경 + flip으로 전환
+FULL_REDRAW_RATIO = 0.5
+
+
+class DirtyRectTracker:
+    """
+    변경된 영역만 지우고 화면에 반영하는 트래커
+
+    매 프레임 모든 엔티티/HUD를 다시 그리되, 배경 복원과 화면 갱신은
+    지난 프레임과 이번 프레임에 그린 영역으로 한정합니다.
+    그린 영역은 blit/draw 함수가 돌려주는 Rect를 add()로 전달받습니다.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface,
+                 full_redraw_ratio: float = FULL_REDRAW_RATIO):
+        """
+        DirtyRectTracker 초기화
+
+        Args:
+            screen: pygame 화면
+            background: 배경 이미지 (화면 크기)
+            full_redraw_ratio: 전체 갱신으로 전환할 면적 비율 (0~1)
+        """
+        self.screen = screen
+        self.background = background
+        self.screen_rect = screen.get_rect()
+        self.full_redraw_limit = self.screen_rect.width * self.screen_rect.height * full_redraw_ratio
+        self._previous: List[pygame.Rect] = []
+        self._current: List[pygame.Rect] = []
+        self._force_full = True  # 첫 프레임은 전체
+        self.last_frame_full = True  # 마지막 프레임이 전체 갱신이었는지 (프로파일러용)
+
+    def _area(self, rects: Iterable[pygame.Rect]) -> int:
+        """사각형 면적 합 (겹침은 중복 계산 - 보수적)"""
+        return sum(rect.width * rect.height for rect in rects)
+
+    def invalidate(self):
+        """다음 프레임을 전체 다시 그리도록 표시 (화면을 다른 곳에서 덮어쓴 경우)"""
+        self._force_full = True
+
+    def begin_frame(self):
+        """지난 프레임에 그린 영역을 배경으로 지움"""
+        if self._force_full or self._area(self._previous) > self.full_redraw_limit:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._previous:
+                self.screen.blit(self.background, rect, rect)
+
+    def add(self, rect: Optional[pygame.Rect]):
+        """
+        이번 프레임에 그린 영역 추가
+
+        Args:
+            rect: 그린 영역 (None이면 무시)
+        """
+        if rect:
+            clipped = pygame.Rect(rect).clip(self.screen_rect)
+            if clipped:
+                self._current.append(clipped)
+
+    def add_all(self, rects: Iterable[Optional[pygame.Rect]]):
+        """
+        이번 프레임에 그린 영역 여러 개 추가
+
+        Args:
+            rects: 그린 영역 목록
+        """
+        for rect in rects:
+            self.add(rect)
+
+    def add_border(self, rect: pygame.Rect, width: int):
+        """
+        테두리 선의 네 변만 추가 (내부는 갱신하지 않음)
+
+        Args:
+            rect: 테두리 사각형
+            width: 선 두께
+        """
+        rect = pygame.Rect(rect)
+        self.add_all([
+            pygame.Rect(rect.left, rect.top, rect.width, width),
+            pygame.Rect(rect.left, rect.bottom - width, rect.width, width),
+            pygame.Rect(rect.left, rect.top, width, rect.height),
+            pygame.Rect(rect.right - width, rect.top, width, rect.height),
+        ])
+
+    def present(self):
+        """지난 프레임과 이번 프레임에 그린 영역만 화면에 반영 (넓으면 전체 flip)"""
+        dirty = self._previous + self._current
+        self.last_frame_full = self._force_full or self._area(dirty) > self.full_redraw_limit
+
+        if self.last_frame_full:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+
+        self._previous = self._current
+        self._current = []
+        self._force_full = False
@@ -0,0 +1,117 @@
+"""In-game frame profiler overlay"""
+from typing import List, Optional, Tuple
+import pygame
+from core.config import FPS, WHITE
+from core.profiler import FrameProfiler, TOTAL
+from ui import surface_cache
+
+# 오버레이 텍스트를 다시 만드는 간격 (프레임) - 매 프레임 백분위 정렬/렌더하지 않도록
+REFRESH_FRAMES = 15
+
+FRAME_BUDGET_MS = 1000 / FPS  # 60 FPS면 16.7ms
+PANEL_COLOR = (0, 0, 0, 180)
+HEADER_COLOR = (150, 200, 255)
+OVER_BUDGET_COLOR = (255, 90, 90)
+PADDING = 8
+COLUMNS = (0, 90, 150, 210)  # 이름, p50, p95, p99 열 위치
+
+# 엔티티 수 표시 (카운터 이름, 라벨)
+ENTITY_COUNTERS = (
+    ("stones", "운석"), ("missiles", "미사일"), ("enemies", "적"),
+    ("projectiles", "발사체"), ("powerups", "아이템"),
+)
+
+
+class ProfilerOverlay:
+    """
+    프레임 프로파일러 결과를 화면 구석에 그리는 오버레이 (F3로 켜고 끔)
+
+    구간별 p50/p95/p99(ms), 최근 엔티티 수, 캐시 적중률과 전체 화면 갱신 비율을 보여주고
+    REFRESH_FRAMES마다 한 번만 다시 렌더합니다. p99가 프레임 예산을 넘는 구간은 빨간색입니다.
+    """
+
+    def __init__(self, profiler: FrameProfiler, font: pygame.font.Font):
+        """
+        ProfilerOverlay 초기화 (처음에는 꺼진 상태)
+
+        Args:
+            profiler: 표시할 프로파일러
+            font: 텍스트 폰트
+        """
+        self.profiler = profiler
+        self.font = font
+        self.visible = False
+        self._surface: Optional[pygame.Surface] = None
+        self._rendered_at = 0  # 마지막으로 렌더한 profiler.frames
+
+    def toggle(self):
+        """켜고 끄기"""
+        self.visible = not self.visible
+        self._surface = None
+
+    def rows(self) -> List[Tuple[Tuple[str, ...], Tuple[int, int, int]]]:
+        """
+        표시할 줄 (열 값, 색상)
+
+        Returns:
+            List[Tuple[Tuple[str, ...], Tuple[int, int, int]]]: 줄마다 (열 문자열들, 색상)
+        """
+        profiler = self.profiler
+        rows = [(("ms", "p50", "p95", "p99"), HEADER_COLOR)]
+        for name in profiler.sections + (TOTAL,):
+            result = profiler.percentiles(name)
+            color = OVER_BUDGET_COLOR if result["p99"] > FRAME_BUDGET_MS else WHITE
+            rows.append(((name, f"{result['p50']:.2f}", f"{result['p95']:.2f}", f"{result['p99']:.2f}"), color))
+
+        counters = set(profiler.counters)
+        entities = [f"{label} {profiler.samples(name)[-1]:.0f}" for name, label in ENTITY_COUNTERS if name in counters]
+        if entities:
+            rows.append(((" ".join(entities),), WHITE))
+        caches = []
+        for prefix, label in (("text", "텍스트"), ("surface", "서피스")):
+            if f"{prefix}_hits" in counters:
+                rate = profiler.rate(f"{prefix}_hits", f"{prefix}_misses")
+                caches.append(f"{label} 캐시 {'-' if rate is None else format(rate, '.0%')}")
+        if "full_redraw" in counters:
+            caches.append(f"전체 갱신 {profiler.percentiles('full_redraw')['mean']:.0%}")
+        if caches:
+            rows.append((("  ".join(caches),), WHITE))
+        return rows
+
+    def render(self) -> pygame.Surface:
+        """
+        오버레이 서피스 만들기
+
+        Returns:
+            pygame.Surface: 반투명 패널 위에 그린 표
+        """
+        rows = self.rows()
+        line_height = self.font.get_linesize()
+        cells = [[self.font.render(text, True, color) for text in columns] for columns, color in rows]
+        width = max(COLUMNS[len(line) - 1] + line[-1].get_width() for line in cells) + PADDING * 2
+        height = line_height * len(cells) + PADDING * 2
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.blit(surface_cache.get_panel((width, height), PANEL_COLOR, 6), (0, 0))
+        for row, line in enumerate(cells):
+            for column, cell in enumerate(line):
+                surface.blit(cell, (PADDING + COLUMNS[column], PADDING + row * line_height))
+        return surface
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        오버레이 그리기 (오른쪽 위)
+
+        Args:
+            screen: 그릴 화면
+
+        Returns:
+            Optional[pygame.Rect]: 그린 영역 (꺼져 있거나 기록이 없으면 None)
+        """
+        if not self.visible or not len(self.profiler):
+            return None
+        if self._surface is None or self.profiler.frames - self._rendered_at >= REFRESH_FRAMES:
+            self._surface = self.render()
+            self._rendered_at = self.profiler.frames
+        rect = self._surface.get_rect(topright=(screen.get_width() - 10, 90))
+        return screen.blit(self._surface, rect)
@@ -0,0 +1,122 @@
+"""Retained-mode frame presenter"""
+import pygame
+from typing import Callable, Iterable, List, Optional
+
+# 다시 그릴 것이 없을 때 이벤트를 기다리는 최대 시간 (ms) - 로딩 폴링 주기
+IDLE_WAIT_MS = 250
+
+# 화면 상태를 바꿀 수 있어 전체를 다시 그리는 이벤트 (클릭, 스크롤, 키 입력, 창 복원)
+FULL_REDRAW_EVENTS = [
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+]
+
+# 호버 강조(테두리/글로우)가 버튼 밖으로 나가는 여유 (픽셀)
+HOVER_MARGIN = 16
+
+
+class RetainedPresenter:
+    """
+    변경된 영역만 다시 그려 화면에 반영하는 프레젠터
+
+    화면은 그대로 두고(retained) 호버 변경, 데이터 도착, 입력처럼 무효화된 영역만
+    클립을 걸고 다시 그린 뒤 pygame.display.update(rects)로 반영합니다.
+    바뀐 것이 없으면 이벤트가 올 때까지 대기하므로 멈춰 있는 메뉴는 CPU를 거의 쓰지 않습니다.
+    """
+
+    def __init__(self, screen: pygame.Surface, idle_wait_ms: int = IDLE_WAIT_MS):
+        """
+        RetainedPresenter 초기화
+
+        Args:
+            screen: pygame 화면
+            idle_wait_ms: 유휴 상태에서 이벤트를 기다리는 최대 시간 (ms)
+        """
+        self.screen = screen
+        self.idle_wait_ms = idle_wait_ms
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True  # 첫 프레임은 전체
+        self._hovered: Optional[pygame.Rect] = None
+
+    @property
+    def dirty(self) -> bool:
+        """다시 그릴 영역이 있는지 여부"""
+        return self._full_redraw or bool(self._dirty_rects)
+
+    def invalidate(self, rect: Optional[pygame.Rect] = None):
+        """
+        영역을 다시 그리도록 표시
+
+        Args:
+            rect: 다시 그릴 영역 (None이면 화면 전체)
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def track_hover(self, rects: Iterable[pygame.Rect], mouse_pos: tuple):
+        """
+        마우스가 올라간 영역이 바뀌면 이전/현재 영역을 무효화
+
+        Args:
+            rects: 호버 강조가 있는 영역 목록
+            mouse_pos: 마우스 위치
+        """
+        hovered = next((pygame.Rect(rect) for rect in rects if rect.collidepoint(mouse_pos)), None)
+        if hovered == self._hovered:
+            return
+
+        for rect in (self._hovered, hovered):
+            if rect is not None:
+                self.invalidate(rect.inflate(HOVER_MARGIN, HOVER_MARGIN))
+        self._hovered = hovered
+
+    def wait(self):
+        """
+        다시 그릴 것이 없으면 이벤트가 올 때까지 대기 (최대 idle_wait_ms)
+
+        받은 이벤트는 큐에 되돌려 화면의 이벤트 처리에서 그대로 읽을 수 있습니다.
+        """
+        if not self.dirty and not pygame.event.peek():
+            event = pygame.event.wait(self.idle_wait_ms)
+            if event.type != pygame.NOEVENT:
+                pygame.event.post(event)
+
+        if pygame.event.peek(FULL_REDRAW_EVENTS):
+            self.invalidate()
+
+    def present(self, render: Callable[[], None]) -> bool:
+        """
+        무효화된 영역만 다시 그려 화면에 반영
+
+        Args:
+            render: 화면 전체를 그리는 함수 (클립 밖 그리기는 무시됨)
+
+        Returns:
+            bool: 다시 그렸는지 여부
+        """
+        if not self.dirty:
+            return False
+
+        screen_rect = self.screen.get_rect()
+        if self._full_redraw:
+            rects = [screen_rect]
+        else:
+            rects = [rect.clip(screen_rect) for rect in self._dirty_rects]
+
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        try:
+            render()
+        finally:
+            self.screen.set_clip(None)
+
+        pygame.display.update(rects)
+        self._dirty_rects.clear()
+        self._full_redraw = False
+        return True
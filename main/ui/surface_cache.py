@@ -0,0 +1,225 @@
+"""Pre-rendered surface cache"""
+import pygame
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from utils import load_image
+
+# 글로우 스프라이트 크기 양자화 단위 (픽셀) - 크기가 연속적으로 변해도 스프라이트 수를 제한
+GLOW_SIZE_STEP = 0.25
+
+# 알파 양자화 단계 수 - 페이드 중인 패널도 몇 장만 만들어 재사용
+ALPHA_LEVELS = 16
+
+# 키 -> 미리 그린 서피스 (화면 간 공유)
+_surfaces: Dict[Hashable, pygame.Surface] = {}
+
+# 누적 적중/실패 수 (프로파일러용, clear()해도 유지)
+_stats = {"hits": 0, "misses": 0}
+
+
+def cached(key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """
+    키에 해당하는 서피스를 한 번만 만들어 재사용
+
+    반환된 서피스는 공유되므로 그리기 대상으로 수정하지 마세요.
+
+    Args:
+        key: 캐시 키
+        build: 캐시에 없을 때 서피스를 만드는 함수
+
+    Returns:
+        pygame.Surface: 캐시된 서피스
+    """
+    surface = _surfaces.get(key)
+    if surface is None:
+        _stats["misses"] += 1
+        surface = build()
+        _surfaces[key] = surface
+    else:
+        _stats["hits"] += 1
+    return surface
+
+
+def get_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+    """
+    서피스의 충돌 마스크 (서피스마다 한 번만 만들어 공유)
+
+    운석처럼 크기별 이미지를 캐시에서 공유하는 스프라이트는 마스크도 크기별로 하나씩만 생깁니다.
+
+    Args:
+        surface: 스프라이트 이미지 (알파 또는 컬러키로 투명 영역 표시)
+
+    Returns:
+        pygame.mask.Mask: 불투명 픽셀 마스크
+    """
+    return cached(("mask", surface), lambda: pygame.mask.from_surface(surface))
+
+
+def get_image(path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """
+    이미지 파일을 한 번만 로드/리사이즈해 공유
+
+    화면에 들어올 때마다 load_image()로 새 서피스를 만들면 서피스를 키로 쓰는 캐시
+    (배경 합성, 운석 크기별 이미지, 충돌 마스크)가 방문할 때마다 새 항목을 쌓습니다.
+    경로와 크기로 같은 서피스를 돌려주므로 그런 키가 프로세스 동안 고정됩니다.
+
+    Args:
+        path: 이미지 파일 경로
+        size: 리사이즈할 크기 (None이면 원본 크기)
+
+    Returns:
+        pygame.Surface: 캐시된 이미지
+
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않을 때
+        pygame.error: 이미지 로드 실패 시
+    """
+    return cached(("image", path, tuple(size) if size else None), lambda: load_image(path, size))
+
+
+def quantize_alpha(alpha: float) -> int:
+    """
+    알파 값을 ALPHA_LEVELS 단계로 양자화
+
+    Args:
+        alpha: 0~255 알파 값
+
+    Returns:
+        int: 양자화된 알파 값 (0~255)
+    """
+    step = 255 / (ALPHA_LEVELS - 1)
+    return int(round(max(0.0, min(255.0, alpha)) / step) * step)
+
+
+def get_glow_sprite(size: float, color: Tuple[int, int, int], max_alpha: int = 30) -> pygame.Surface:
+    """
+    방사형 글로우 스프라이트 (크기는 GLOW_SIZE_STEP 단위로 양자화)
+
+    Args:
+        size: 파티클 크기 (글로우 반지름은 size * 4)
+        color: RGB 색상
+        max_alpha: 중심부 최대 알파
+
+    Returns:
+        pygame.Surface: (size * 8) 정사각형 SRCALPHA 서피스
+    """
+    size = max(GLOW_SIZE_STEP, round(size / GLOW_SIZE_STEP) * GLOW_SIZE_STEP)
+
+    def build() -> pygame.Surface:
+        glow_radius = size * 4
+        surface = pygame.Surface((size * 8, size * 8), pygame.SRCALPHA)
+        for r in range(int(glow_radius), 0, -1):
+            alpha = int(max_alpha * (1 - r / glow_radius))
+            pygame.draw.circle(surface, (*color, alpha), (glow_radius, glow_radius), r)
+        return surface
+
+    return cached(("glow", size, tuple(color), max_alpha), build)
+
+
+def get_panel(size: Tuple[int, int], color: Tuple[int, int, int, int], border_radius: int = 0) -> pygame.Surface:
+    """
+    반투명 단색 패널 (둥근 모서리 선택)
+
+    Args:
+        size: (너비, 높이)
+        color: RGBA 색상
+        border_radius: 모서리 반지름 (0이면 사각형)
+
+    Returns:
+        pygame.Surface: SRCALPHA 서피스
+    """
+    def build() -> pygame.Surface:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        if border_radius:
+            pygame.draw.rect(surface, color, surface.get_rect(), border_radius=border_radius)
+        else:
+            surface.fill(color)
+        return surface
+
+    return cached(("panel", tuple(size), tuple(color), border_radius), build)
+
+
+def get_overlay(size: Tuple[int, int], color: Tuple[int, int, int] = (0, 0, 0), alpha: int = 200) -> pygame.Surface:
+    """
+    반투명 단색 오버레이 (서피스 알파 사용)
+
+    Args:
+        size: (너비, 높이)
+        color: RGB 색상
+        alpha: 서피스 알파 (0~255)
+
+    Returns:
+        pygame.Surface: set_alpha가 적용된 서피스
+    """
+    def build() -> pygame.Surface:
+        surface = pygame.Surface(size)
+        surface.set_alpha(alpha)
+        surface.fill(color)
+        return surface
+
+    return cached(("overlay", tuple(size), tuple(color), alpha), build)
+
+
+def get_backdrop(background: pygame.Surface, color: Tuple[int, int, int] = (0, 0, 0),
+                 alpha: int = 200) -> pygame.Surface:
+    """
+    배경 이미지와 반투명 오버레이를 미리 합성한 서피스
+
+    메뉴 화면은 배경과 오버레이가 매 프레임 같으므로 한 번만 합성해 blit 한 번으로 그립니다.
+    배경 서피스 자체를 키로 사용하므로 배경은 get_image()로 로드해 같은 서피스를 넘기고,
+    배경 내용을 바꾼 경우 clear()를 호출하세요.
+
+    Args:
+        background: 배경 이미지
+        color: 오버레이 RGB 색상
+        alpha: 오버레이 알파 (0~255)
+
+    Returns:
+        pygame.Surface: 합성된 서피스
+    """
+    def build() -> pygame.Surface:
+        backdrop = background.copy()
+        backdrop.blit(get_overlay(backdrop.get_size(), color, alpha), (0, 0))
+        return backdrop
+
+    return cached(("backdrop", background, tuple(color), alpha), build)
+
+
+def get_vertical_gradient(size: Tuple[int, int], top: Tuple[int, int, int],
+                          bottom: Tuple[int, int, int], alpha: int = 255) -> pygame.Surface:
+    """
+    세로 그라데이션 패널
+
+    Args:
+        size: (너비, 높이)
+        top: 위쪽 RGB 색상
+        bottom: 아래쪽 RGB 색상
+        alpha: 알파 값
+
+    Returns:
+        pygame.Surface: SRCALPHA 서피스
+    """
+    def build() -> pygame.Surface:
+        width, height = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for y in range(height):
+            progress = y / height
+            color = tuple(int(t * (1 - progress) + b * progress) for t, b in zip(top, bottom))
+            pygame.draw.line(surface, (*color, alpha), (0, y), (width, y))
+        return surface
+
+    return cached(("gradient", tuple(size), tuple(top), tuple(bottom), alpha), build)
+
+
+def stats() -> Dict[str, int]:
+    """
+    캐시 통계
+
+    Returns:
+        Dict[str, int]: entries (보관 중인 서피스 수), hits, misses (누적)
+    """
+    return {"entries": len(_surfaces), "hits": _stats["hits"], "misses": _stats["misses"]}
+
+
+def clear():
+    """캐시 비우기 (디스플레이 모드 변경 시)"""
+    _surfaces.clear()
@@ -0,0 +1,63 @@
+"""Bounded cache of rendered HUD text"""
+from collections import OrderedDict
+from typing import Dict, Tuple
+import pygame
+
+# 보관할 최대 텍스트 수 - 점수처럼 계속 바뀌는 텍스트가 있어도 메모리가 늘지 않도록
+MAX_ENTRIES = 128
+
+
+class TextCache:
+    """
+    같은 폰트/문자열/색상의 렌더 결과를 재사용하는 LRU 캐시
+
+    HUD 텍스트는 대부분 프레임마다 같으므로 (스테이지, 스킬, BACK, 바뀌기 전까지의 점수)
+    font.render()는 내용이 바뀐 프레임에만 부릅니다. 반환된 서피스는 공유되므로 수정하지 마세요.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        """
+        TextCache 초기화
+
+        Args:
+            max_entries: 보관할 최대 텍스트 수 (넘으면 가장 오래 안 쓴 것부터 버림)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """
+        텍스트 렌더 (안티앨리어싱)
+
+        Args:
+            font: 폰트
+            text: 문자열
+            color: 색상
+
+        Returns:
+            pygame.Surface: 렌더된 텍스트
+        """
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict[str, int]: entries, hits, misses (누적)
+        """
+        return {"entries": len(self._surfaces), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,265 @@
+"""업적 규칙 엔진
+
+업적 카탈로그의 condition_type / condition_value 를 판정 함수로 한 번만 컴파일합니다.
+서버는 저장된 게임 통계와 누적 통계 요약을 합친 지표로 전체 규칙을 일괄 판정합니다.
+
+조건 타입 어휘와 지표 이름은 클라이언트(main/game/achievement_rules.py)와 동일하며,
+지표 이름은 GameStatCreate 와 UserStatsSummary 의 필드 이름을 따릅니다.
+"""
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 백발백중 판정에 필요한 최소 발사 수
+MIN_SHOTS_FOR_ACCURACY = 20
+
+# 스피드러너 목표 점수
+SPEEDRUN_SCORE = 1000
+
+
+class ConditionType:
+    """
+    조건 타입 정의
+
+    inputs 에 나열된 지표가 바뀔 때만 규칙을 다시 확인합니다.
+    realtime 이 False 인 조건은 게임 도중 값이 다시 나빠질 수 있으므로
+    (예: 명중률) 게임 종료 시에만 판정합니다.
+    progress 가 있는 조건(누적 업적)은 달성 전 진행도(%)를 계산할 수 있습니다.
+    """
+
+    def __init__(self, inputs: Iterable[str], check: Callable[[Dict, int], bool], realtime: bool = True,
+                 progress: Optional[Callable[[Dict, int], int]] = None):
+        """
+        조건 타입 초기화
+
+        Args:
+            inputs: 판정에 필요한 지표 이름
+            check: 판정 함수 (지표 딕셔너리, condition_value) -> bool
+            realtime: 게임 중 실시간 판정 가능 여부
+            progress: 진행도 함수 (지표 딕셔너리, condition_value) -> 0-100 (선택사항)
+        """
+        self.inputs = tuple(inputs)
+        self.check = check
+        self.realtime = realtime
+        self.progress = progress
+
+
+def _at_least(metric: str) -> ConditionType:
+    """한 게임의 지표가 condition_value 이상이면 달성하는 조건 타입 생성"""
+    return ConditionType((metric,), lambda m, v: m[metric] >= v)
+
+
+def _cumulative(metric: str) -> ConditionType:
+    """누적 지표가 condition_value 이상이면 달성하는 조건 타입 생성 (진행도 제공)"""
+    return ConditionType(
+        (metric,),
+        lambda m, v: m[metric] >= v,
+        realtime=False,
+        progress=lambda m, v: min(100, m[metric] * 100 // v) if v > 0 else 100
+    )
+
+
+# 조건 타입 어휘 (클라이언트와 동일하게 유지 - tests/test_achievement_rules_sync.py 에서 확인)
+CONDITION_TYPES: Dict[str, ConditionType] = {
+    # 한 게임 기준
+    'accuracy': ConditionType(
+        ('accuracy', 'missiles_fired'),
+        lambda m, v: m['accuracy'] >= v and m['missiles_fired'] >= MIN_SHOTS_FOR_ACCURACY,
+        realtime=False
+    ),
+    'no_damage': ConditionType(
+        ('damage_taken', 'final_score'),
+        lambda m, v: m['damage_taken'] == 0 and m['final_score'] >= v
+    ),
+    # play_time 은 매 프레임 바뀌므로 점수가 바뀔 때만 함께 확인합니다
+    'score_time': ConditionType(
+        ('final_score', 'play_time'),
+        lambda m, v: m['final_score'] >= SPEEDRUN_SCORE and m['play_time'] <= v
+    ),
+    'hard_score': ConditionType(
+        ('difficulty', 'final_score'),
+        lambda m, v: m['difficulty'] == 'hard' and m['final_score'] >= v
+    ),
+    'max_combo': _at_least('max_combo'),
+    'stones_destroyed': _at_least('stones_destroyed'),
+    'enemies_destroyed': _at_least('enemies_destroyed'),
+    'items_collected': _at_least('items_collected'),
+    'max_stage': _at_least('max_stage_reached'),
+
+    # 누적 기준 (통계 요약 지표 필요)
+    'games_played': _cumulative('total_games'),
+    'total_stones': _cumulative('total_stones_destroyed'),
+    'total_enemies': _cumulative('total_enemies_destroyed'),
+    'bosses_defeated': _cumulative('bosses_defeated_count'),
+}
+
+
+# 업적 카탈로그 (초기 데이터, 클라이언트 기본 카탈로그와 동일)
+ACHIEVEMENT_CATALOG: List[Dict] = [
+    {'code': 'first_game', 'name': '첫 걸음', 'description': '첫 게임을 플레이하세요',
+     'condition_type': 'games_played', 'condition_value': 1,
+     'category': 'basic', 'rarity': 'common'},
+    {'code': 'perfect_aim', 'name': '백발백중', 'description': '미사일 명중률 90% 이상 달성',
+     'condition_type': 'accuracy', 'condition_value': 90,
+     'category': 'combat', 'rarity': 'rare'},
+    {'code': 'immortal', 'name': '불사신', 'description': '체력을 잃지 않고 500점 달성',
+     'condition_type': 'no_damage', 'condition_value': 500,
+     'category': 'survival', 'rarity': 'epic'},
+    {'code': 'speedrunner', 'name': '스피드러너', 'description': '3분 안에 1000점 달성',
+     'condition_type': 'score_time', 'condition_value': 180,
+     'category': 'time', 'rarity': 'rare'},
+    {'code': 'combo_master', 'name': '콤보 마스터', 'description': '100 콤보 달성',
+     'condition_type': 'max_combo', 'condition_value': 100,
+     'category': 'combo', 'rarity': 'epic'},
+    {'code': 'stone_breaker', 'name': '운석 파괴자', 'description': '누적 1000개 운석 파괴',
+     'condition_type': 'total_stones', 'condition_value': 1000,
+     'category': 'combat', 'rarity': 'common'},
+    {'code': 'stone_breaker_single', 'name': '운석 헌터', 'description': '한 게임에서 100개 운석 파괴',
+     'condition_type': 'stones_destroyed', 'condition_value': 100,
+     'category': 'combat', 'rarity': 'rare'},
+    {'code': 'enemy_hunter', 'name': '적 사냥꾼', 'description': '누적 100명 적 처치',
+     'condition_type': 'total_enemies', 'condition_value': 100,
+     'category': 'combat', 'rarity': 'common'},
+    {'code': 'enemy_hunter_single', 'name': '적 킬러', 'description': '한 게임에서 50명 적 처치',
+     'condition_type': 'enemies_destroyed', 'condition_value': 50,
+     'category': 'combat', 'rarity': 'rare'},
+    {'code': 'boss_slayer', 'name': '보스 학살자', 'description': '보스를 10번 처치',
+     'condition_type': 'bosses_defeated', 'condition_value': 10,
+     'category': 'boss', 'rarity': 'rare'},
+    {'code': 'stage_master', 'name': '스테이지 마스터', 'description': '스테이지 10에 도달',
+     'condition_type': 'max_stage', 'condition_value': 10,
+     'category': 'stage', 'rarity': 'epic'},
+    {'code': 'expert_player', 'name': '고수', 'description': '하드 난이도에서 2000점 달성',
+     'condition_type': 'hard_score', 'condition_value': 2000,
+     'category': 'difficulty', 'rarity': 'epic'},
+    {'code': 'item_collector', 'name': '아이템 수집가', 'description': '한 게임에서 20개 아이템 수집',
+     'condition_type': 'items_collected', 'condition_value': 20,
+     'category': 'item', 'rarity': 'rare'},
+]
+
+
+class AchievementRule:
+    """컴파일된 업적 규칙"""
+
+    def __init__(self, entry: Dict, condition: ConditionType):
+        """
+        규칙 초기화
+
+        Args:
+            entry: 카탈로그 항목 (code, name, description, condition_type, condition_value)
+            condition: 조건 타입 정의
+        """
+        self.code = entry['code']
+        self.name = entry.get('name') or self.code
+        self.description = entry.get('description') or '???'
+        self.condition_type = entry['condition_type']
+        self.condition_value = entry.get('condition_value') or 0
+        self.inputs = condition.inputs
+        self.realtime = condition.realtime
+        self.tracks_progress = condition.progress is not None
+        self._check = condition.check
+        self._progress = condition.progress
+
+    def evaluate(self, metrics: Dict) -> bool:
+        """
+        규칙 판정
+
+        Args:
+            metrics: 지표 딕셔너리 (inputs 의 모든 키를 포함해야 함)
+
+        Returns:
+            bool: 달성하면 True
+        """
+        return self._check(metrics, self.condition_value)
+
+    def progress(self, metrics: Dict) -> Optional[int]:
+        """
+        진행도 계산
+
+        Args:
+            metrics: 지표 딕셔너리
+
+        Returns:
+            Optional[int]: 진행도 (0-100), 진행도가 없는 조건이거나 지표가 없으면 None
+        """
+        if self._progress is None or any(metrics.get(metric) is None for metric in self.inputs):
+            return None
+        return self._progress(metrics, self.condition_value)
+
+
+class AchievementRuleSet:
+    """
+    컴파일된 업적 규칙 모음
+
+    규칙을 입력 지표별로 색인하여, 바뀐 지표에 의존하는 규칙만 찾을 수 있습니다.
+    """
+
+    def __init__(self, catalog: Iterable[Dict]):
+        """
+        카탈로그 컴파일
+
+        Args:
+            catalog: 업적 카탈로그 (code, name, description, condition_type, condition_value 딕셔너리)
+        """
+        self.rules: Dict[str, AchievementRule] = {}
+        self._rules_by_input: Dict[str, List[AchievementRule]] = {}
+
+        for entry in catalog:
+            condition = CONDITION_TYPES.get(entry.get('condition_type'))
+            if condition is None:
+                logger.warning(f"알 수 없는 업적 조건 타입: {entry.get('code')} ({entry.get('condition_type')})")
+                continue
+
+            rule = AchievementRule(entry, condition)
+            self.rules[rule.code] = rule
+            for metric in rule.inputs:
+                self._rules_by_input.setdefault(metric, []).append(rule)
+
+    def get(self, code: str) -> Optional[AchievementRule]:
+        """코드로 규칙 조회"""
+        return self.rules.get(code)
+
+    def rules_for(self, changed_metrics: Iterable[str]) -> List[AchievementRule]:
+        """
+        바뀐 지표에 의존하는 규칙 조회
+
+        Args:
+            changed_metrics: 바뀐 지표 이름
+
+        Returns:
+            List[AchievementRule]: 다시 확인해야 할 규칙 (중복 없음, 카탈로그 순서)
+        """
+        seen = set()
+        candidates = []
+        for metric in changed_metrics:
+            for rule in self._rules_by_input.get(metric, ()):
+                if rule.code not in seen:
+                    seen.add(rule.code)
+                    candidates.append(rule)
+        return candidates
+
+    def evaluate_all(self, metrics: Dict, skip: Iterable[str] = ()) -> List[str]:
+        """
+        전체 규칙 일괄 판정
+
+        필요한 지표가 metrics 에 없는 규칙은 건너뜁니다
+        (예: 저장되지 않는 damage_taken).
+
+        Args:
+            metrics: 지표 딕셔너리
+            skip: 판정에서 제외할 업적 코드
+
+        Returns:
+            List[str]: 달성한 업적 코드 리스트
+        """
+        skip = set(skip)
+        achieved = []
+        for rule in self.rules.values():
+            if rule.code in skip:
+                continue
+            if any(metrics.get(metric) is None for metric in rule.inputs):
+                continue
+            if rule.evaluate(metrics):
+                achieved.append(rule.code)
+        return achieved
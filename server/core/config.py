@@ -31,6 +31,13 @@ class Settings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 100  # 요청 개수
     RATE_LIMIT_PERIOD: int = 60  # 시간(초)
 
+    # 리플레이 검증 (클라이언트 game 패키지로 재시뮬레이션)
+    GAME_CLIENT_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "..", "main")
+    REPLAY_VERIFY_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)  # 워커 프로세스 수
+    REPLAY_VERIFY_MAX_PENDING: int = 64  # 대기 + 진행 중 리플레이 상한 (넘으면 업로드 거절)
+    REPLAY_MAX_BYTES: int = 256 * 1024  # 업로드 리플레이 크기 상한 (클라이언트가 스냅샷을 빼고 보내 30분 게임이 약 10KB)
+    REPLAY_BLANK_SPRITES: bool = False  # 텍스처 없이 같은 크기의 사각 스프라이트 사용 (테스트용)
+
     class Config:
         """설정 클래스"""
         env_file = ".env"
@@ -0,0 +1,63 @@
+"""기간별 리더보드 버킷 계산"""
+from datetime import datetime, timedelta
+
+# 전체 기간 (기존 최고 점수 랭킹)
+ALL_TIME = "all"
+
+# 기간별 리더보드 (버킷 단위로 최고 점수를 미리 계산)
+DAILY = "daily"
+WEEKLY = "weekly"
+SEASON = "season"
+WINDOWS = (DAILY, WEEKLY, SEASON)
+
+# 시즌 길이 (개월, 1월부터 시작)
+SEASON_MONTHS = 3
+
+
+def bucket_key(window: str, when: datetime) -> str:
+    """
+    시각이 속한 버킷 키 계산 (UTC 기준)
+
+    Args:
+        window: 리더보드 기간 (daily, weekly, season)
+        when: 기준 시각
+
+    Returns:
+        str: 버킷 키 (예: '2024-03-05', '2024-W10', '2024-S1')
+
+    Raises:
+        ValueError: 알 수 없는 기간인 경우
+    """
+    if window == DAILY:
+        return when.strftime("%Y-%m-%d")
+    if window == WEEKLY:
+        year, week, _ = when.isocalendar()
+        return f"{year}-W{week:02d}"
+    if window == SEASON:
+        return f"{when.year}-S{(when.month - 1) // SEASON_MONTHS + 1}"
+    raise ValueError(f"알 수 없는 리더보드 기간입니다: {window}")
+
+
+def bucket_start(window: str, when: datetime) -> datetime:
+    """
+    시각이 속한 버킷의 시작 시각 계산 (UTC 기준)
+
+    Args:
+        window: 리더보드 기간 (daily, weekly, season)
+        when: 기준 시각
+
+    Returns:
+        datetime: 버킷 시작 시각
+
+    Raises:
+        ValueError: 알 수 없는 기간인 경우
+    """
+    day = when.replace(hour=0, minute=0, second=0, microsecond=0)
+    if window == DAILY:
+        return day
+    if window == WEEKLY:
+        return day - timedelta(days=day.weekday())
+    if window == SEASON:
+        first_month = (when.month - 1) // SEASON_MONTHS * SEASON_MONTHS + 1
+        return day.replace(month=first_month, day=1)
+    raise ValueError(f"알 수 없는 리더보드 기간입니다: {window}")
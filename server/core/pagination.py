@@ -0,0 +1,102 @@
+"""커서 기반(keyset) 페이지네이션"""
+import base64
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.orm import Query
+
+# 다음 페이지 커서를 담는 응답 헤더 (목록 응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def clamp_page_size(limit: int) -> int:
+    """
+    페이지 크기를 1 ~ MAX_PAGE_SIZE 범위로 제한
+
+    Args:
+        limit: 요청한 페이지 크기
+
+    Returns:
+        int: 제한된 페이지 크기
+    """
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    (시각, id) 키를 불투명한 커서 문자열로 인코딩
+
+    Args:
+        timestamp: 마지막 행의 정렬 시각
+        row_id: 마지막 행의 id
+
+    Returns:
+        str: URL 안전한 커서 문자열
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (시각, id) 키로 디코딩
+
+    Args:
+        cursor: encode_cursor 로 만든 커서
+
+    Returns:
+        Tuple[datetime, int]: (시각, id)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("잘못된 커서입니다") from e
+
+
+def keyset_page(query: Query, time_column, id_column, limit: int,
+                cursor: Optional[str] = None) -> Tuple[List, Optional[str]]:
+    """
+    (시각, id) 내림차순 keyset 페이지 조회
+
+    OFFSET 없이 마지막으로 본 키 다음부터 limit + 1 개만 읽으므로,
+    기록이 아무리 많아도 페이지당 비용이 일정합니다.
+
+    Args:
+        query: 필터가 적용된 쿼리 (첫 번째 엔티티가 time_column/id_column 을 가진 모델)
+        time_column: 정렬 시각 컬럼
+        id_column: 동순위 정렬용 id 컬럼
+        limit: 페이지 크기
+        cursor: 이전 페이지의 다음 커서 (없으면 첫 페이지)
+
+    Returns:
+        Tuple[List, Optional[str]]: (행 목록, 다음 커서 또는 None)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    if cursor:
+        last_time, last_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            time_column < last_time,
+            and_(time_column == last_time, id_column < last_id)
+        ))
+
+    rows = query.order_by(desc(time_column), desc(id_column)).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        entity = last[0] if isinstance(last, tuple) or hasattr(last, "_fields") else last
+        next_cursor = encode_cursor(getattr(entity, time_column.key), getattr(entity, id_column.key))
+
+    return rows, next_cursor
@@ -0,0 +1,49 @@
+"""HTTP Range 요청 (단일 바이트 범위) 해석"""
+from typing import Optional, Tuple
+
+BYTES_UNIT = "bytes"
+
+
+class RangeNotSatisfiable(ValueError):
+    """요청한 범위가 리소스 밖에 있음 (416)"""
+
+
+def parse_byte_range(header: Optional[str], total: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더에서 바이트 범위 하나 해석 (RFC 9110)
+
+    형식이 틀렸거나 여러 범위를 요청하면 헤더가 없는 것처럼 전체를 돌려주도록 None을 반환합니다.
+
+    Args:
+        header: Range 헤더 값 (예: "bytes=0-16383", "bytes=16384-", "bytes=-500")
+        total: 리소스 전체 크기
+
+    Returns:
+        Optional[Tuple[int, int]]: (시작, 끝) - 끝 포함, 전체를 보내면 되면 None
+
+    Raises:
+        RangeNotSatisfiable: 시작 위치가 리소스 크기 이상일 때
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != BYTES_UNIT or "," in spec:
+        return None
+
+    first, dash, last = spec.strip().partition("-")
+    if not dash or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+
+    if not first:
+        # 접미 범위: 마지막 N바이트
+        length = int(last)
+        if length == 0 or total == 0:
+            raise RangeNotSatisfiable(f"요청 범위를 만족할 수 없습니다: {header}")
+        return max(total - length, 0), total - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= total:
+        raise RangeNotSatisfiable(f"요청 범위를 만족할 수 없습니다: {header}")
+    return start, min(int(last), total - 1) if last else total - 1
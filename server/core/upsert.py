@@ -0,0 +1,50 @@
+"""한 문장으로 끝나는 upsert (INSERT ... ON CONFLICT DO UPDATE)"""
+from typing import Dict, Iterable
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# ON CONFLICT DO UPDATE를 지원하는 방언의 insert()
+_CONFLICT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def upsert(db: Session, model, values: Dict, conflict: Iterable[str], changes: Dict) -> None:
+    """
+    행이 없으면 values로 추가하고, 있으면 changes로 갱신 (커밋하지 않음)
+
+    UPDATE 후 영향받은 행이 없을 때 INSERT하면 같은 키를 동시에 처음 저장하는 두 요청이
+    모두 INSERT해서 하나가 IntegrityError로 실패합니다. 지원하는 방언에서는 한 문장으로
+    처리하고, 그 밖의 방언에서는 세이브포인트 안에서 INSERT를 먼저 시도하고 충돌하면 UPDATE합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: ORM 모델
+        values: 새 행의 값
+        conflict: 충돌을 판정할 기본 키/유니크 컬럼 이름
+        changes: 이미 있을 때 적용할 값 (모델 컬럼 식은 기존 행 값을 가리킴)
+    """
+    conflict = tuple(conflict)
+    conflict_insert = _CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if conflict_insert is not None:
+        db.execute(
+            conflict_insert(model)
+            .values(**values)
+            .on_conflict_do_update(index_elements=list(conflict), set_=changes)
+        )
+        return
+
+    try:
+        with db.begin_nested():
+            db.execute(insert(model).values(**values))
+    except IntegrityError:
+        db.execute(
+            update(model)
+            .where(*(getattr(model, name) == values[name] for name in conflict))
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        )
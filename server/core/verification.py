@@ -0,0 +1,18 @@
+"""점수 검증(리플레이 재시뮬레이션) 상태"""
+
+# 리플레이를 올리지 않은 점수 (기존 점수 포함)
+UNVERIFIED = "unverified"
+
+# 리플레이를 받아 워커 풀에서 재시뮬레이션 중
+PENDING = "pending"
+
+# 재시뮬레이션 결과가 저장된 점수/난이도와 일치
+VERIFIED = "verified"
+
+# 리플레이가 깨졌거나 결과가 다름
+REJECTED = "rejected"
+
+STATUSES = (UNVERIFIED, PENDING, VERIFIED, REJECTED)
+
+# 리플레이 파일의 난이도 값 중 서버 난이도 설정과 비교하는 항목
+CHECKED_SETTINGS = ("enemy_speed", "enemy_spawn_chance", "enemy_evasion_skill")
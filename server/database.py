@@ -1,9 +1,12 @@
 """데이터베이스 설정"""
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, create_engine, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 # 데이터베이스 URL (SQLite 사용)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./spacegame.db")
 
@@ -38,18 +41,125 @@ def init_db():
     from models.achievement import Achievement
     from models.user_achievement import UserAchievement
     from models.difficulty_setting import DifficultySetting
+    from models.user_stat_rollup import UserStatRollup
+    from models.leaderboard_entry import LeaderboardEntry
+    from models.difficulty_best import DifficultyBest
+    from models.score_replay import ScoreReplay
 
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
 
+    # 기존 테이블에 나중에 추가된 컬럼 생성
+    _add_missing_columns()
+
+    # 초 단위로 저장된 예전 시각을 마이크로초 형식으로 맞춤 (keyset 커서 비교용)
+    normalize_timestamps(engine)
+
+    # 기존 테이블에 나중에 추가된 인덱스 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
     # 초기 데이터 삽입 (난이도 설정, 업적)
     _insert_initial_data()
 
 
+def _add_missing_columns():
+    """기존 테이블에 없는 컬럼 추가 (문자열 server_default가 있는 컬럼만 대상)"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                default = getattr(column.server_default, "arg", None)
+                if column.name in existing or not isinstance(default, str):
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type} "
+                    f"NOT NULL DEFAULT '{default}'"
+                ))
+
+
+def normalize_timestamps(bind) -> int:
+    """
+    SQLite에 초 단위로 저장된 시각을 마이크로초 형식으로 맞춤
+
+    SQLite는 시각을 문자열로 저장하고 비교합니다. server_default(CURRENT_TIMESTAMP)로 들어간 행은
+    'YYYY-MM-DD HH:MM:SS', SQLAlchemy가 넣은 행과 커서 비교값은 'YYYY-MM-DD HH:MM:SS.ffffff'라서
+    같은 시각이어도 초 단위 행이 더 작게 비교되어 keyset 페이지에서 행이 반복되거나 빠집니다.
+    다른 DB는 시각을 값으로 비교하므로 바꾸지 않습니다.
+
+    Args:
+        bind: 엔진 (테이블이 모두 만들어진 상태)
+
+    Returns:
+        int: 바꾼 행 수
+    """
+    if bind.dialect.name != "sqlite":
+        return 0
+
+    changed = 0
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for column in table.columns:
+                if not isinstance(column.type, DateTime):
+                    continue
+                changed += connection.execute(text(
+                    f"UPDATE {table.name} SET {column.name} = {column.name} || '.000000' "
+                    f"WHERE length({column.name}) = 19"
+                )).rowcount
+    if changed:
+        logger.info(f"초 단위 시각 {changed}개를 마이크로초 형식으로 변환")
+    return changed
+
+
+# 카탈로그가 바뀌면 기존 DB에도 반영하는 업적 필드 (판정 규칙이 카탈로그에서 만들어지므로)
+CATALOG_SYNC_FIELDS = ('condition_type', 'condition_value', 'description')
+
+
+def sync_achievement_catalog(db):
+    """
+    업적 카탈로그를 DB에 반영
+
+    DB에 없는 업적은 추가하고, 이미 있는 업적은 CATALOG_SYNC_FIELDS가 카탈로그와 다르면
+    갱신합니다. 클라이언트가 서버 카탈로그로 판정 규칙을 만들기 때문에 예전 조건이 남아 있으면
+    (예: immortal의 condition_value=1) 잘못 달성됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 추가하거나 갱신한 업적 수
+    """
+    from models.achievement import Achievement
+    from core.achievement_rules import ACHIEVEMENT_CATALOG
+
+    existing = {achievement.code: achievement for achievement in db.query(Achievement).all()}
+    changed = 0
+    for entry in ACHIEVEMENT_CATALOG:
+        achievement = existing.get(entry['code'])
+        if achievement is None:
+            db.add(Achievement(**entry))
+            changed += 1
+            continue
+        stale = [field for field in CATALOG_SYNC_FIELDS if getattr(achievement, field) != entry[field]]
+        for field in stale:
+            setattr(achievement, field, entry[field])
+        if stale:
+            logger.info(f"업적 카탈로그 갱신: {entry['code']} ({', '.join(stale)})")
+            changed += 1
+    if changed:
+        db.commit()
+    return changed
+
+
 def _insert_initial_data():
     """초기 데이터 삽입"""
     from models.difficulty_setting import DifficultySetting
-    from models.achievement import Achievement
+    from repositories.user_stat_rollup_repository import UserStatRollupRepository
+    from repositories.leaderboard_repository import LeaderboardRepository
+    from repositories.difficulty_leaderboard_repository import DifficultyLeaderboardRepository
 
     db = SessionLocal()
     try:
@@ -96,84 +206,17 @@ def _insert_initial_data():
             db.add_all(difficulties)
             db.commit()
 
-        # 업적이 없으면 추가
-        if db.query(Achievement).count() == 0:
-            achievements = [
-                Achievement(
-                    code="first_game",
-                    name="첫 걸음",
-                    description="첫 게임을 플레이하세요",
-                    category="basic",
-                    condition_type="games_played",
-                    condition_value=1,
-                    rarity="common"
-                ),
-                Achievement(
-                    code="perfect_aim",
-                    name="백발백중",
-                    description="미사일 명중률 90% 이상 달성",
-                    category="combat",
-                    condition_type="accuracy",
-                    condition_value=90,
-                    rarity="rare"
-                ),
-                Achievement(
-                    code="immortal",
-                    name="불사신",
-                    description="체력을 잃지 않고 게임 클리어",
-                    category="survival",
-                    condition_type="no_damage",
-                    condition_value=1,
-                    rarity="epic"
-                ),
-                Achievement(
-                    code="speedrunner",
-                    name="스피드러너",
-                    description="3분 안에 1000점 달성",
-                    category="time",
-                    condition_type="score_time",
-                    condition_value=180,
-                    rarity="rare"
-                ),
-                Achievement(
-                    code="combo_master",
-                    name="콤보 마스터",
-                    description="100 콤보 달성",
-                    category="combo",
-                    condition_type="max_combo",
-                    condition_value=100,
-                    rarity="epic"
-                ),
-                Achievement(
-                    code="stone_breaker",
-                    name="운석 파괴자",
-                    description="누적 1000개 운석 파괴",
-                    category="combat",
-                    condition_type="total_stones",
-                    condition_value=1000,
-                    rarity="common"
-                ),
-                Achievement(
-                    code="enemy_hunter",
-                    name="적 사냥꾼",
-                    description="누적 100명 적 처치",
-                    category="combat",
-                    condition_type="total_enemies",
-                    condition_value=100,
-                    rarity="common"
-                ),
-                Achievement(
-                    code="boss_slayer",
-                    name="보스 학살자",
-                    description="보스를 10번 처치",
-                    category="boss",
-                    condition_type="bosses_defeated",
-                    condition_value=10,
-                    rarity="rare"
-                )
-            ]
-            db.add_all(achievements)
-            db.commit()
+        # 업적 카탈로그 반영 (없는 업적 추가, 기존 업적의 조건/설명 갱신)
+        sync_achievement_catalog(db)
+
+        # 누적 통계 테이블 도입 이전의 게임 기록 반영
+        UserStatRollupRepository.backfill_missing(db)
+
+        # 기간별 리더보드의 현재 버킷이 비어 있으면 채움
+        LeaderboardRepository.rebuild_current(db)
+
+        # 난이도별 최고 점수 테이블 도입 이전의 게임 기록 반영
+        DifficultyLeaderboardRepository.backfill_missing(db)
 
     finally:
         db.close()
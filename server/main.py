@@ -9,10 +9,12 @@ from slowapi.errors import RateLimitExceeded
 import uvicorn
 import traceback
 
-from database import init_db
+from database import init_db, SessionLocal
 from core.config import settings
 from core.logging_config import setup_logging
+from core.pagination import NEXT_CURSOR_HEADER
 from routers import auth, scores, game_stats, achievements, difficulties
+from services.replay_verifier import get_replay_verifier, shutdown_replay_verifier
 
 # 로깅 설정
 setup_logging(log_level=getattr(settings, "LOG_LEVEL", "INFO"))
@@ -56,6 +58,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # 라우터 등록
@@ -72,6 +75,21 @@ async def startup_event():
     init_db()
     logger.info("✅ 데이터베이스 초기화 완료")
 
+    # 재시작 전에 끝나지 않은 리플레이 검증 다시 예약
+    db = SessionLocal()
+    try:
+        resumed = get_replay_verifier().resume_pending(db)
+    finally:
+        db.close()
+    if resumed:
+        logger.info(f"리플레이 검증 {resumed}건 다시 예약")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 리플레이 검증 워커 풀 정리"""
+    shutdown_replay_verifier()
+
 
 @app.get("/")
 async def root():
@@ -0,0 +1,30 @@
+"""난이도별 최고 점수 모델"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from database import Base
+
+
+class DifficultyBest(Base):
+    """
+    난이도별 사용자 최고 점수 테이블
+
+    (난이도, 사용자)마다 한 행이며 게임 통계 저장 시 같은 트랜잭션에서 갱신됩니다.
+    랭킹과 순위 조회는 game_stats를 집계하지 않고 이 테이블의 인덱스만 읽습니다.
+    """
+    __tablename__ = "difficulty_bests"
+
+    difficulty = Column(String(20), primary_key=True)  # 'easy', 'medium', 'hard'
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    best_score = Column(Integer, nullable=False)
+    achieved_at = Column(DateTime, nullable=False)  # 최고 점수 달성 시각 (동점 정렬용)
+
+    # 관계
+    user = relationship("User")
+
+    __table_args__ = (
+        Index('ix_difficulty_bests_rank', 'difficulty', 'best_score', 'achieved_at'),
+    )
+
+    def __repr__(self):
+        return f"<DifficultyBest(difficulty={self.difficulty}, user_id={self.user_id}, best_score={self.best_score})>"
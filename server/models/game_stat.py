@@ -1,7 +1,8 @@
 """게임 통계 모델"""
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, TIMESTAMP, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from datetime import datetime
 from database import Base
 
 
@@ -13,7 +14,8 @@ class GameStat(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # 기본 정보
-    game_date = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+    # 파이썬 기본값을 함께 두어 keyset 커서와 같은 정밀도로 저장
+    game_date = Column(TIMESTAMP, default=datetime.utcnow, server_default=func.now(), nullable=False)
     difficulty = Column(String(20), nullable=False)  # 'easy', 'medium', 'hard'
     final_score = Column(Integer, nullable=False)
 
@@ -39,6 +41,11 @@ class GameStat(Base):
     # 관계
     user = relationship("User", back_populates="game_stats")
 
+    # keyset 페이지네이션용 인덱스
+    __table_args__ = (
+        Index('ix_game_stats_user_date', 'user_id', 'game_date', 'id'),
+    )
+
     def calculate_accuracy(self):
         """명중률 계산"""
         if self.missiles_fired > 0:
@@ -0,0 +1,31 @@
+"""기간별 리더보드 모델"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from database import Base
+
+
+class LeaderboardEntry(Base):
+    """
+    기간별 최고 점수 테이블
+
+    (기간, 버킷, 사용자)마다 한 행이며 점수 저장 시 같은 트랜잭션에서 갱신됩니다.
+    조회는 현재 버킷만 읽으므로 scores 테이블을 날짜로 필터링하지 않습니다.
+    """
+    __tablename__ = "leaderboard_entries"
+
+    window = Column(String(20), primary_key=True)  # 'daily', 'weekly', 'season'
+    bucket = Column(String(20), primary_key=True)  # '2024-03-05', '2024-W10', '2024-S1'
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    best_score = Column(Integer, nullable=False)
+    achieved_at = Column(DateTime, nullable=False)  # 최고 점수 달성 시각 (동점 정렬용)
+
+    # 관계
+    user = relationship("User")
+
+    __table_args__ = (
+        Index('ix_leaderboard_entries_rank', 'window', 'bucket', 'best_score', 'achieved_at'),
+    )
+
+    def __repr__(self):
+        return f"<LeaderboardEntry(window={self.window}, bucket={self.bucket}, user_id={self.user_id})>"
@@ -1,8 +1,9 @@
 """점수 데이터베이스 모델"""
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
+from core.verification import UNVERIFIED
 
 
 class Score(Base):
@@ -13,9 +14,19 @@ class Score(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     score = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 리플레이 검증 상태 (core.verification)
+    verification = Column(String(16), default=UNVERIFIED, server_default=UNVERIFIED, nullable=False)
 
     # 관계 설정
     user = relationship("User", back_populates="scores")
+    replay = relationship("ScoreReplay", back_populates="score", uselist=False, cascade="all, delete-orphan")
+
+    # keyset 페이지네이션용 인덱스 (내 기록 / 전체 최근 기록), 검증된 점수 랭킹용 인덱스
+    __table_args__ = (
+        Index('ix_scores_user_created', 'user_id', 'created_at', 'id'),
+        Index('ix_scores_created', 'created_at', 'id'),
+        Index('ix_scores_verification_score', 'verification', 'score'),
+    )
 
     def __repr__(self):
         return f"<Score(user_id={self.user_id}, score={self.score})>"
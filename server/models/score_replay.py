@@ -0,0 +1,25 @@
+"""점수 리플레이 모델"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from database import Base
+
+
+class ScoreReplay(Base):
+    """
+    점수마다 업로드된 리플레이 파일 (클라이언트 game.replay 형식 그대로)
+
+    목록 조회에서 바이트를 읽지 않도록 scores 테이블과 분리해 둡니다.
+    """
+    __tablename__ = "score_replays"
+
+    score_id = Column(Integer, ForeignKey("scores.id", ondelete="CASCADE"), primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    size = Column(Integer, nullable=False)
+    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # 관계
+    score = relationship("Score", back_populates="replay")
+
+    def __repr__(self):
+        return f"<ScoreReplay(score_id={self.score_id}, size={self.size})>"
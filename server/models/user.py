@@ -18,6 +18,7 @@ class User(Base):
     scores = relationship("Score", back_populates="user", cascade="all, delete-orphan")
     game_stats = relationship("GameStat", back_populates="user", cascade="all, delete-orphan")
     user_achievements = relationship("UserAchievement", back_populates="user", cascade="all, delete-orphan")
+    stat_rollup = relationship("UserStatRollup", back_populates="user", uselist=False, cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<User(username={self.username})>"
@@ -0,0 +1,34 @@
+"""사용자 누적 통계 모델"""
+from sqlalchemy import Column, Integer, Float, ForeignKey, TIMESTAMP
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from database import Base
+
+
+class UserStatRollup(Base):
+    """
+    사용자 누적 통계 테이블
+
+    게임 통계가 저장될 때 같은 트랜잭션에서 증분 갱신되므로,
+    통계 요약과 누적 업적 판정에서 game_stats 전체를 집계하지 않아도 됩니다.
+    """
+    __tablename__ = "user_stat_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    total_games = Column(Integer, default=0, nullable=False)
+    total_play_time = Column(Integer, default=0, nullable=False)
+    highest_score = Column(Integer, default=0, nullable=False)
+    total_stones_destroyed = Column(Integer, default=0, nullable=False)
+    total_enemies_destroyed = Column(Integer, default=0, nullable=False)
+    accuracy_sum = Column(Float, default=0.0, nullable=False)  # 평균 명중률 계산용
+    best_combo = Column(Integer, default=0, nullable=False)
+    total_skills_used = Column(Integer, default=0, nullable=False)
+    total_items_collected = Column(Integer, default=0, nullable=False)
+    max_stage_ever = Column(Integer, default=1, nullable=False)
+    bosses_defeated_count = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # 관계
+    user = relationship("User", back_populates="stat_rollup")
@@ -2,7 +2,7 @@
 from sqlalchemy.orm import Session, joinedload
 from models.achievement import Achievement
 from models.user_achievement import UserAchievement
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 
 class AchievementRepository:
@@ -68,3 +68,22 @@ class AchievementRepository:
         ).first()
 
         return user_achievement is not None
+
+    @staticmethod
+    def get_completed_codes(db: Session, user_id: int) -> Set[str]:
+        """사용자가 완료한 업적 코드 조회"""
+        rows = db.query(Achievement.code).join(
+            UserAchievement, UserAchievement.achievement_id == Achievement.id
+        ).filter(
+            UserAchievement.user_id == user_id,
+            UserAchievement.completed == True
+        ).all()
+        return {row.code for row in rows}
+
+    @staticmethod
+    def get_progress_by_code(db: Session, user_id: int) -> Dict[str, int]:
+        """사용자의 업적별 진행도 조회"""
+        rows = db.query(Achievement.code, UserAchievement.progress).join(
+            UserAchievement, UserAchievement.achievement_id == Achievement.id
+        ).filter(UserAchievement.user_id == user_id).all()
+        return {row.code: row.progress or 0 for row in rows}
@@ -32,18 +32,21 @@ class BaseRepository(Generic[T]):
         """
         return self.db.query(self.model).filter(self.model.id == id).first()
 
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
+    def get_all(self, limit: int = 100, after_id: Optional[int] = None) -> List[T]:
         """
-        모든 항목 조회
+        모든 항목 조회 (id 순, keyset 페이지)
 
         Args:
             limit: 조회할 개수
-            offset: 시작 위치
+            after_id: 이전 페이지의 마지막 id (없으면 처음부터)
 
         Returns:
             List[T]: 조회된 항목 목록
         """
-        return self.db.query(self.model).limit(limit).offset(offset).all()
+        query = self.db.query(self.model)
+        if after_id is not None:
+            query = query.filter(self.model.id > after_id)
+        return query.order_by(self.model.id).limit(limit).all()
 
     def create(self, obj: T) -> T:
         """
@@ -0,0 +1,148 @@
+"""난이도별 리더보드 레포지토리"""
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, desc, func, or_
+from core.upsert import upsert
+from models.difficulty_best import DifficultyBest
+from models.game_stat import GameStat
+from models.user import User
+
+
+class DifficultyLeaderboardRepository:
+    """난이도별 리더보드 데이터 액세스"""
+
+    @staticmethod
+    def record_game(db: Session, user_id: int, difficulty: str, score: int, achieved_at: datetime) -> None:
+        """
+        게임 결과를 난이도별 최고 점수에 반영 (커밋하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            difficulty: 난이도 이름
+            score: 최종 점수
+            achieved_at: 게임 기록 시각 (UTC)
+        """
+        improved = DifficultyBest.best_score < score
+        upsert(
+            db, DifficultyBest,
+            values=dict(difficulty=difficulty, user_id=user_id, best_score=score, achieved_at=achieved_at),
+            conflict=('difficulty', 'user_id'),
+            changes=dict(
+                best_score=case((improved, score), else_=DifficultyBest.best_score),
+                achieved_at=case((improved, achieved_at), else_=DifficultyBest.achieved_at)
+            ),
+        )
+
+    @staticmethod
+    def get_top(db: Session, difficulty: str, limit: int = 10) -> List[dict]:
+        """
+        난이도별 상위 점수 조회
+
+        Args:
+            db: 데이터베이스 세션
+            difficulty: 난이도 이름
+            limit: 조회할 개수
+
+        Returns:
+            List[dict]: 순위, 사용자, 점수 목록
+        """
+        rows = (
+            db.query(DifficultyBest, User.username)
+            .join(User, DifficultyBest.user_id == User.id)
+            .filter(DifficultyBest.difficulty == difficulty)
+            .order_by(desc(DifficultyBest.best_score), DifficultyBest.achieved_at)
+            .limit(limit)
+            .all()
+        )
+
+        return [
+            {
+                "rank": rank,
+                "user_id": entry.user_id,
+                "username": username,
+                "score": entry.best_score,
+                "created_at": entry.achieved_at
+            }
+            for rank, (entry, username) in enumerate(rows, start=1)
+        ]
+
+    @staticmethod
+    def get_rank(db: Session, user_id: int, difficulty: str) -> Optional[dict]:
+        """
+        난이도별 사용자 순위 조회
+
+        앞선 사용자 수를 (난이도, 점수, 달성 시각) 인덱스 범위로 셉니다.
+        동점이면 먼저 달성한 사용자가 앞 순위입니다 (get_top과 같은 정렬).
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            difficulty: 난이도 이름
+
+        Returns:
+            Optional[dict]: 순위, 사용자, 점수 (기록이 없으면 None)
+        """
+        row = (
+            db.query(DifficultyBest, User.username)
+            .join(User, DifficultyBest.user_id == User.id)
+            .filter(DifficultyBest.difficulty == difficulty, DifficultyBest.user_id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+
+        entry, username = row
+        ahead = db.query(func.count()).select_from(DifficultyBest).filter(
+            DifficultyBest.difficulty == difficulty,
+            or_(
+                DifficultyBest.best_score > entry.best_score,
+                and_(
+                    DifficultyBest.best_score == entry.best_score,
+                    DifficultyBest.achieved_at < entry.achieved_at
+                )
+            )
+        ).scalar()
+
+        return {
+            "rank": ahead + 1,
+            "user_id": entry.user_id,
+            "username": username,
+            "score": entry.best_score,
+            "created_at": entry.achieved_at
+        }
+
+    @staticmethod
+    def backfill_missing(db: Session) -> int:
+        """
+        최고 점수 행이 없는 (사용자, 난이도)를 기존 게임 기록으로 채움 (기존 DB 호환용)
+
+        Returns:
+            int: 생성한 행 수
+        """
+        existing = set(db.query(DifficultyBest.user_id, DifficultyBest.difficulty).all())
+        bests = (
+            db.query(GameStat.user_id, GameStat.difficulty, func.max(GameStat.final_score))
+            .group_by(GameStat.user_id, GameStat.difficulty)
+            .all()
+        )
+
+        created = 0
+        for user_id, difficulty, best_score in bests:
+            if (user_id, difficulty) in existing:
+                continue
+            achieved_at = db.query(func.min(GameStat.game_date)).filter(
+                GameStat.user_id == user_id,
+                GameStat.difficulty == difficulty,
+                GameStat.final_score == best_score
+            ).scalar()
+            db.add(DifficultyBest(
+                difficulty=difficulty, user_id=user_id,
+                best_score=best_score, achieved_at=achieved_at
+            ))
+            created += 1
+
+        if created:
+            db.commit()
+        return created
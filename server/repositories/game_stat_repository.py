@@ -1,8 +1,12 @@
 """게임 통계 레포지토리"""
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, cast, Integer
 from models.game_stat import GameStat
-from typing import List, Optional
+from repositories.user_stat_rollup_repository import UserStatRollupRepository
+from repositories.difficulty_leaderboard_repository import DifficultyLeaderboardRepository
+from core.pagination import keyset_page
+from typing import List, Optional, Tuple
 
 
 class GameStatRepository:
@@ -10,24 +14,30 @@ class GameStatRepository:
 
     @staticmethod
     def create(db: Session, user_id: int, stat_data: dict) -> GameStat:
-        """게임 통계 생성"""
+        """게임 통계 생성 (누적 통계와 난이도별 최고 점수도 같은 트랜잭션에서 갱신)"""
         stat = GameStat(user_id=user_id, **stat_data)
+        if stat.game_date is None:
+            stat.game_date = datetime.utcnow()
         stat.calculate_accuracy()
         db.add(stat)
+        UserStatRollupRepository.apply_game(db, stat)
+        DifficultyLeaderboardRepository.record_game(
+            db, user_id, stat.difficulty, stat.final_score, stat.game_date
+        )
         db.commit()
         db.refresh(stat)
         return stat
 
     @staticmethod
-    def get_by_user(db: Session, user_id: int, limit: int = 10) -> List[GameStat]:
-        """사용자의 게임 통계 조회"""
-        return db.query(GameStat).filter(
-            GameStat.user_id == user_id
-        ).order_by(desc(GameStat.game_date)).limit(limit).all()
+    def get_by_user(db: Session, user_id: int, limit: int = 10,
+                    cursor: Optional[str] = None) -> Tuple[List[GameStat], Optional[str]]:
+        """사용자의 게임 통계 조회 (최신순, keyset 페이지)"""
+        query = db.query(GameStat).filter(GameStat.user_id == user_id)
+        return keyset_page(query, GameStat.game_date, GameStat.id, limit, cursor)
 
     @staticmethod
     def get_user_summary(db: Session, user_id: int) -> dict:
-        """사용자 통계 요약"""
+        """사용자 통계 요약 (game_stats 전체 집계, 누적 통계 백필용)"""
         stats = db.query(
             func.count(GameStat.id).label('total_games'),
             func.sum(GameStat.play_time).label('total_play_time'),
@@ -39,7 +49,7 @@ class GameStatRepository:
             func.sum(GameStat.skills_used).label('total_skills'),
             func.sum(GameStat.items_collected).label('total_items'),
             func.max(GameStat.max_stage_reached).label('max_stage'),
-            func.sum(func.cast(GameStat.boss_defeated, db.bind.dialect.NUMERIC)).label('bosses_defeated')
+            func.sum(cast(GameStat.boss_defeated, Integer)).label('bosses_defeated')
         ).filter(GameStat.user_id == user_id).first()
 
         return {
@@ -0,0 +1,227 @@
+"""기간별 리더보드 레포지토리"""
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, desc, func, or_
+from core.upsert import upsert
+from core.leaderboard import WINDOWS, bucket_key, bucket_start
+from models.leaderboard_entry import LeaderboardEntry
+from models.score import Score
+from models.user import User
+
+# 기간별로 마지막으로 정리한 버킷 (버킷이 바뀔 때 한 번만 정리)
+_purged_buckets: Dict[str, str] = {}
+
+
+class LeaderboardRepository:
+    """기간별 리더보드 데이터 액세스"""
+
+    @staticmethod
+    def record_score(db: Session, user_id: int, score: int, achieved_at: datetime) -> None:
+        """
+        점수를 모든 기간의 현재 버킷에 반영 (커밋하지 않음)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            score: 점수
+            achieved_at: 점수 기록 시각 (UTC)
+        """
+        for window in WINDOWS:
+            bucket = bucket_key(window, achieved_at)
+            LeaderboardRepository._purge_if_rolled_over(db, window, bucket)
+
+            improved = LeaderboardEntry.best_score < score
+            upsert(
+                db, LeaderboardEntry,
+                values=dict(window=window, bucket=bucket, user_id=user_id,
+                            best_score=score, achieved_at=achieved_at),
+                conflict=('window', 'bucket', 'user_id'),
+                changes=dict(
+                    best_score=case((improved, score), else_=LeaderboardEntry.best_score),
+                    achieved_at=case((improved, achieved_at), else_=LeaderboardEntry.achieved_at)
+                ),
+            )
+
+    @staticmethod
+    def _purge_if_rolled_over(db: Session, window: str, current_bucket: str) -> None:
+        """버킷이 바뀌었으면 지난 버킷 삭제 (기간당 한 번)"""
+        if _purged_buckets.get(window) == current_bucket:
+            return
+
+        db.execute(
+            delete(LeaderboardEntry)
+            .where(LeaderboardEntry.window == window, LeaderboardEntry.bucket != current_bucket)
+            .execution_options(synchronize_session=False)
+        )
+        _purged_buckets[window] = current_bucket
+
+    @staticmethod
+    def get_top(db: Session, window: str, limit: int = 10, now: Optional[datetime] = None) -> List[dict]:
+        """
+        현재 버킷의 상위 점수 조회
+
+        Args:
+            db: 데이터베이스 세션
+            window: 리더보드 기간
+            limit: 조회할 개수
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            List[dict]: 순위, 사용자, 점수 목록
+        """
+        bucket = bucket_key(window, now or datetime.utcnow())
+        rows = (
+            db.query(LeaderboardEntry, User.username)
+            .join(User, LeaderboardEntry.user_id == User.id)
+            .filter(LeaderboardEntry.window == window, LeaderboardEntry.bucket == bucket)
+            .order_by(desc(LeaderboardEntry.best_score), LeaderboardEntry.achieved_at)
+            .limit(limit)
+            .all()
+        )
+
+        return [
+            {
+                "rank": rank,
+                "user_id": entry.user_id,
+                "username": username,
+                "score": entry.best_score,
+                "created_at": entry.achieved_at
+            }
+            for rank, (entry, username) in enumerate(rows, start=1)
+        ]
+
+    @staticmethod
+    def get_rank(db: Session, user_id: int, window: str, now: Optional[datetime] = None) -> Optional[dict]:
+        """
+        현재 버킷에서 사용자 순위 조회 (동점이면 먼저 달성한 사용자가 앞 순위)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            window: 리더보드 기간
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            Optional[dict]: 순위, 사용자, 점수 (기록이 없으면 None)
+        """
+        bucket = bucket_key(window, now or datetime.utcnow())
+        row = (
+            db.query(LeaderboardEntry, User.username)
+            .join(User, LeaderboardEntry.user_id == User.id)
+            .filter(
+                LeaderboardEntry.window == window,
+                LeaderboardEntry.bucket == bucket,
+                LeaderboardEntry.user_id == user_id
+            )
+            .first()
+        )
+        if row is None:
+            return None
+
+        entry, username = row
+        ahead = db.query(func.count()).select_from(LeaderboardEntry).filter(
+            LeaderboardEntry.window == window,
+            LeaderboardEntry.bucket == bucket,
+            or_(
+                LeaderboardEntry.best_score > entry.best_score,
+                and_(
+                    LeaderboardEntry.best_score == entry.best_score,
+                    LeaderboardEntry.achieved_at < entry.achieved_at
+                )
+            )
+        ).scalar()
+
+        return {
+            "rank": ahead + 1,
+            "user_id": entry.user_id,
+            "username": username,
+            "score": entry.best_score,
+            "created_at": entry.achieved_at
+        }
+
+    @staticmethod
+    def refresh_user(db: Session, user_id: int, now: Optional[datetime] = None) -> None:
+        """
+        사용자의 현재 버킷 최고 점수를 scores 테이블로 다시 계산 (점수 삭제 후, 커밋하지 않음)
+
+        사용자 한 명의 현재 기간 기록만 (user_id, created_at) 인덱스로 읽습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            now: 기준 시각 (기본값: 현재 UTC)
+        """
+        now = now or datetime.utcnow()
+
+        for window in WINDOWS:
+            bucket = bucket_key(window, now)
+            best = (
+                db.query(Score.score, Score.created_at)
+                .filter(Score.user_id == user_id, Score.created_at >= bucket_start(window, now))
+                .order_by(desc(Score.score), Score.created_at)
+                .first()
+            )
+
+            entry = db.query(LeaderboardEntry).filter(
+                LeaderboardEntry.window == window,
+                LeaderboardEntry.bucket == bucket,
+                LeaderboardEntry.user_id == user_id
+            ).first()
+
+            if best is None:
+                if entry is not None:
+                    db.delete(entry)
+            elif entry is None:
+                db.add(LeaderboardEntry(
+                    window=window, bucket=bucket, user_id=user_id,
+                    best_score=best.score, achieved_at=best.created_at
+                ))
+            else:
+                entry.best_score = best.score
+                entry.achieved_at = best.created_at
+
+    @staticmethod
+    def rebuild_current(db: Session, now: Optional[datetime] = None) -> int:
+        """
+        현재 버킷이 비어 있는 기간을 scores 테이블로 다시 채움 (서버 시작 시 한 번)
+
+        Args:
+            db: 데이터베이스 세션
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            int: 생성한 행 수
+        """
+        now = now or datetime.utcnow()
+        created = 0
+
+        for window in WINDOWS:
+            bucket = bucket_key(window, now)
+            exists = db.query(LeaderboardEntry).filter(
+                LeaderboardEntry.window == window, LeaderboardEntry.bucket == bucket
+            ).first()
+            if exists:
+                continue
+
+            bests = (
+                db.query(Score.user_id, func.max(Score.score).label('best_score'))
+                .filter(Score.created_at >= bucket_start(window, now))
+                .group_by(Score.user_id)
+                .all()
+            )
+            for user_id, best_score in bests:
+                achieved_at = db.query(func.min(Score.created_at)).filter(
+                    Score.user_id == user_id,
+                    Score.score == best_score,
+                    Score.created_at >= bucket_start(window, now)
+                ).scalar()
+                db.add(LeaderboardEntry(
+                    window=window, bucket=bucket, user_id=user_id,
+                    best_score=best_score, achieved_at=achieved_at
+                ))
+                created += 1
+
+        if created:
+            db.commit()
+        return created
@@ -1,9 +1,14 @@
 """Score repository for data access"""
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from models.user import User
 from models.score import Score
+from models.score_replay import ScoreReplay
+from core.verification import UNVERIFIED, PENDING, VERIFIED
+from core.pagination import keyset_page
+from repositories.leaderboard_repository import LeaderboardRepository
 from .base import BaseRepository
 
 
@@ -19,47 +24,82 @@ class ScoreRepository(BaseRepository[Score]):
         """
         super().__init__(db, Score)
 
-    def get_user_scores(self, user_id: int, limit: int = 100) -> List[Score]:
+    def get_user_scores(self, user_id: int, limit: int = 20,
+                        cursor: Optional[str] = None) -> Tuple[List[Score], Optional[str]]:
         """
-        특정 사용자의 점수 조회
+        특정 사용자의 점수 조회 (최신순, keyset 페이지)
 
         Args:
             user_id: 사용자 ID
             limit: 조회할 개수
+            cursor: 이전 페이지의 다음 커서
 
         Returns:
-            List[Score]: 사용자의 점수 목록
+            Tuple[List[Score], Optional[str]]: (사용자의 점수 목록, 다음 커서)
         """
-        return (
-            self.db.query(Score)
+        query = self.db.query(Score).filter(Score.user_id == user_id)
+        return keyset_page(query, Score.created_at, Score.id, limit, cursor)
+
+    def get_recent_scores(self, limit: int = 20,
+                          cursor: Optional[str] = None) -> Tuple[List[tuple], Optional[str]]:
+        """
+        전체 최근 점수 조회 (최신순, keyset 페이지)
+
+        Args:
+            limit: 조회할 개수
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            Tuple[List[tuple], Optional[str]]: ((점수, 사용자명) 목록, 다음 커서)
+        """
+        query = self.db.query(Score, User.username).join(User, Score.user_id == User.id)
+        return keyset_page(query, Score.created_at, Score.id, limit, cursor)
+
+    def get_user_score_summary(self, user_id: int) -> Tuple[int, Optional[int], Optional[float]]:
+        """
+        사용자의 점수 집계 (게임 수, 최고 점수, 평균 점수)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            Tuple[int, Optional[int], Optional[float]]: (게임 수, 최고 점수, 평균 점수)
+        """
+        total, best, average = (
+            self.db.query(func.count(Score.id), func.max(Score.score), func.avg(Score.score))
             .filter(Score.user_id == user_id)
-            .order_by(desc(Score.created_at))
-            .limit(limit)
-            .all()
+            .one()
         )
+        return total, best, average
 
-    def get_top_scores(self, limit: int = 10) -> List[dict]:
+    def _scores(self, query, verified_only: bool):
+        """검증된 점수만 보는 경우 필터 추가"""
+        if verified_only:
+            return query.filter(Score.verification == VERIFIED)
+        return query
+
+    def get_top_scores(self, limit: int = 10, verified_only: bool = False) -> List[dict]:
         """
         상위 점수 조회 (각 사용자의 최고 점수 기준)
 
         Args:
             limit: 조회할 개수
+            verified_only: True면 리플레이로 검증된 점수만
 
         Returns:
             List[dict]: 상위 점수 및 사용자 정보
         """
-        subquery = (
+        subquery = self._scores(
             self.db.query(
                 Score.user_id,
                 func.max(Score.score).label('best_score'),
                 func.max(Score.created_at).label('latest_date')
-            )
-            .group_by(Score.user_id)
-            .subquery()
-        )
+            ),
+            verified_only
+        ).group_by(Score.user_id).subquery()
 
         scores = (
-            self.db.query(Score, User.username)
+            self._scores(self.db.query(Score, User.username), verified_only)
             .join(User, Score.user_id == User.id)
             .join(
                 subquery,
@@ -78,7 +118,8 @@ class ScoreRepository(BaseRepository[Score]):
                 "user_id": score.user_id,
                 "username": username,
                 "score": score.score,
-                "created_at": score.created_at
+                "created_at": score.created_at,
+                "score_id": score.id
             })
 
         return ranking
@@ -100,25 +141,44 @@ class ScoreRepository(BaseRepository[Score]):
         )
         return result
 
-    def get_user_rank(self, user_id: int, best_score: int) -> int:
+    def get_user_best(self, user_id: int, verified_only: bool = False) -> Optional[Tuple[Score, str]]:
+        """
+        사용자의 최고 점수 기록 조회 (동점이면 먼저 기록한 점수)
+
+        Args:
+            user_id: 사용자 ID
+            verified_only: True면 리플레이로 검증된 점수만
+
+        Returns:
+            Optional[Tuple[Score, str]]: (점수, 사용자 이름) 또는 None
+        """
+        return (
+            self._scores(self.db.query(Score, User.username), verified_only)
+            .join(User, Score.user_id == User.id)
+            .filter(Score.user_id == user_id)
+            .order_by(desc(Score.score), Score.created_at)
+            .first()
+        )
+
+    def get_user_rank(self, user_id: int, best_score: int, verified_only: bool = False) -> int:
         """
         사용자의 랭킹 조회
 
         Args:
             user_id: 사용자 ID
             best_score: 사용자의 최고 점수
+            verified_only: True면 리플레이로 검증된 점수만
 
         Returns:
             int: 사용자의 랭킹
         """
-        subquery = (
+        subquery = self._scores(
             self.db.query(
                 Score.user_id,
                 func.max(Score.score).label('best_score')
-            )
-            .group_by(Score.user_id)
-            .subquery()
-        )
+            ),
+            verified_only
+        ).group_by(Score.user_id).subquery()
 
         higher_count = (
             self.db.query(func.count(subquery.c.user_id))
@@ -130,7 +190,7 @@ class ScoreRepository(BaseRepository[Score]):
 
     def create_score(self, user_id: int, score: int) -> Score:
         """
-        새로운 점수 생성
+        새로운 점수 생성 (기간별 리더보드도 같은 트랜잭션에서 갱신)
 
         Args:
             user_id: 사용자 ID
@@ -139,5 +199,80 @@ class ScoreRepository(BaseRepository[Score]):
         Returns:
             Score: 생성된 점수
         """
-        new_score = Score(user_id=user_id, score=score)
-        return self.create(new_score)
+        new_score = Score(user_id=user_id, score=score, created_at=datetime.utcnow())
+        self.db.add(new_score)
+        LeaderboardRepository.record_score(self.db, user_id, score, new_score.created_at)
+        self.db.commit()
+        self.db.refresh(new_score)
+        return new_score
+
+    def attach_replay(self, score: Score, data: bytes) -> None:
+        """
+        리플레이 저장 및 검증 대기 상태로 변경
+
+        Args:
+            score: 점수
+            data: 리플레이 파일 내용
+        """
+        score.replay = ScoreReplay(data=data, size=len(data), uploaded_at=datetime.utcnow())
+        score.verification = PENDING
+        self.db.commit()
+
+    def detach_replay(self, score: Score) -> None:
+        """
+        리플레이 삭제 및 미검증 상태로 되돌림
+
+        Args:
+            score: 점수
+        """
+        score.replay = None
+        score.verification = UNVERIFIED
+        self.db.commit()
+
+    def get_replay_size(self, score_id: int, verified_only: bool = True) -> Optional[int]:
+        """
+        점수에 붙은 리플레이 크기 (바이트는 읽지 않음)
+
+        Args:
+            score_id: 점수 ID
+            verified_only: True면 검증된 점수의 리플레이만
+
+        Returns:
+            Optional[int]: 리플레이 크기 (없으면 None)
+        """
+        return (
+            self._scores(self.db.query(ScoreReplay.size), verified_only)
+            .join(Score, Score.id == ScoreReplay.score_id)
+            .filter(ScoreReplay.score_id == score_id)
+            .scalar()
+        )
+
+    def read_replay(self, score_id: int, start: int, end: int) -> bytes:
+        """
+        리플레이의 일부 바이트 (DB에서 잘라 필요한 만큼만 읽음)
+
+        Args:
+            score_id: 점수 ID
+            start: 시작 위치
+            end: 끝 위치 (포함)
+
+        Returns:
+            bytes: start부터 end까지의 바이트
+        """
+        data = (
+            self.db.query(func.substr(ScoreReplay.data, start + 1, end - start + 1))
+            .filter(ScoreReplay.score_id == score_id)
+            .scalar()
+        )
+        return bytes(data or b"")
+
+    def set_verification(self, score: Score, status: str) -> None:
+        """
+        검증 상태 기록
+
+        Args:
+            score: 점수
+            status: 검증 상태 (core.verification)
+        """
+        score.verification = status
+        self.db.commit()
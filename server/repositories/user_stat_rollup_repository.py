@@ -0,0 +1,125 @@
+"""사용자 누적 통계 레포지토리"""
+from sqlalchemy.orm import Session
+from sqlalchemy import case, func
+from core.upsert import upsert
+from models.game_stat import GameStat
+from models.user_stat_rollup import UserStatRollup
+
+
+def _greatest(column, value):
+    """DB 방언에 관계없이 동작하는 max(column, value) 식"""
+    return case((column < value, value), else_=column)
+
+
+class UserStatRollupRepository:
+    """사용자 누적 통계 데이터 액세스"""
+
+    @staticmethod
+    def apply_game(db: Session, stat: GameStat) -> None:
+        """
+        게임 한 판을 누적 통계에 반영 (커밋하지 않음)
+
+        증분은 SQL 식으로 적용하고 첫 게임의 행 생성도 upsert 한 문장이므로
+        같은 사용자의 동시 저장에서도 값이 유실되거나 중복 INSERT로 실패하지 않습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            stat: 저장할 게임 통계 (flush 전이어도 됨)
+        """
+        boss = 1 if stat.boss_defeated else 0
+        upsert(
+            db, UserStatRollup,
+            values=dict(
+                user_id=stat.user_id,
+                total_games=1,
+                total_play_time=stat.play_time,
+                highest_score=stat.final_score,
+                total_stones_destroyed=stat.stones_destroyed or 0,
+                total_enemies_destroyed=stat.enemies_destroyed or 0,
+                accuracy_sum=stat.accuracy or 0.0,
+                best_combo=stat.max_combo or 0,
+                total_skills_used=stat.skills_used or 0,
+                total_items_collected=stat.items_collected or 0,
+                max_stage_ever=stat.max_stage_reached or 1,
+                bosses_defeated_count=boss,
+            ),
+            conflict=('user_id',),
+            changes=dict(
+                total_games=UserStatRollup.total_games + 1,
+                total_play_time=UserStatRollup.total_play_time + stat.play_time,
+                highest_score=_greatest(UserStatRollup.highest_score, stat.final_score),
+                total_stones_destroyed=UserStatRollup.total_stones_destroyed + (stat.stones_destroyed or 0),
+                total_enemies_destroyed=UserStatRollup.total_enemies_destroyed + (stat.enemies_destroyed or 0),
+                accuracy_sum=UserStatRollup.accuracy_sum + (stat.accuracy or 0.0),
+                best_combo=_greatest(UserStatRollup.best_combo, stat.max_combo or 0),
+                total_skills_used=UserStatRollup.total_skills_used + (stat.skills_used or 0),
+                total_items_collected=UserStatRollup.total_items_collected + (stat.items_collected or 0),
+                max_stage_ever=_greatest(UserStatRollup.max_stage_ever, stat.max_stage_reached or 1),
+                bosses_defeated_count=UserStatRollup.bosses_defeated_count + boss,
+                updated_at=func.now(),
+            ),
+        )
+
+    @staticmethod
+    def get_summary(db: Session, user_id: int) -> dict:
+        """
+        사용자 통계 요약 (누적 통계 한 행 조회)
+
+        Returns:
+            dict: UserStatsSummary 형식의 요약
+        """
+        rollup = db.query(UserStatRollup).filter(UserStatRollup.user_id == user_id).first()
+        if rollup is None:
+            return {
+                'total_games': 0,
+                'total_play_time': 0,
+                'highest_score': 0,
+                'total_stones_destroyed': 0,
+                'total_enemies_destroyed': 0,
+                'average_accuracy': 0.0,
+                'best_combo': 0,
+                'total_skills_used': 0,
+                'total_items_collected': 0,
+                'max_stage_ever': 1,
+                'bosses_defeated_count': 0
+            }
+
+        average_accuracy = rollup.accuracy_sum / rollup.total_games if rollup.total_games else 0.0
+        return {
+            'total_games': rollup.total_games,
+            'total_play_time': rollup.total_play_time,
+            'highest_score': rollup.highest_score,
+            'total_stones_destroyed': rollup.total_stones_destroyed,
+            'total_enemies_destroyed': rollup.total_enemies_destroyed,
+            'average_accuracy': round(average_accuracy, 2),
+            'best_combo': rollup.best_combo,
+            'total_skills_used': rollup.total_skills_used,
+            'total_items_collected': rollup.total_items_collected,
+            'max_stage_ever': rollup.max_stage_ever,
+            'bosses_defeated_count': rollup.bosses_defeated_count
+        }
+
+    @staticmethod
+    def backfill_missing(db: Session) -> int:
+        """
+        누적 통계가 없는 사용자를 기존 게임 기록으로 채움 (기존 DB 호환용)
+
+        Returns:
+            int: 생성한 누적 통계 수
+        """
+        from repositories.game_stat_repository import GameStatRepository
+
+        user_ids = [
+            user_id for (user_id,) in db.query(GameStat.user_id).distinct().filter(
+                ~GameStat.user_id.in_(db.query(UserStatRollup.user_id))
+            ).all()
+        ]
+
+        for user_id in user_ids:
+            summary = GameStatRepository.get_user_summary(db, user_id)
+            summary['accuracy_sum'] = summary.pop('average_accuracy') * summary['total_games']
+            db.add(UserStatRollup(user_id=user_id, **summary))
+
+        if user_ids:
+            db.commit()
+        return len(user_ids)
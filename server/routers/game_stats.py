@@ -1,5 +1,5 @@
 """게임 통계 API 라우터"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from database import get_db
 from core.dependencies import get_current_user
@@ -7,7 +7,8 @@ from models.user import User
 from schemas.game_stat import GameStatCreate, GameStatResponse, UserStatsSummary
 from services.game_stat_service import GameStatService
 from services.achievement_service import AchievementService
-from typing import List
+from core.pagination import NEXT_CURSOR_HEADER, clamp_page_size
+from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -52,16 +53,28 @@ def save_game_stats(
 
 @router.get("/my", response_model=List[GameStatResponse])
 def get_my_game_stats(
+    response: Response,
     limit: int = 10,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     내 게임 기록 조회
 
-    최근 게임 기록을 조회합니다.
+    최근 게임 기록을 최신순으로 조회합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 로 전달합니다.
     """
-    return GameStatService.get_user_games(db, current_user.id, limit)
+    try:
+        games, next_cursor = GameStatService.get_user_games(
+            db, current_user.id, clamp_page_size(limit), cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return games
 
 
 @router.get("/summary", response_model=UserStatsSummary)
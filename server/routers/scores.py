@@ -1,16 +1,21 @@
 """점수 관련 API 라우트"""
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database import get_db
+from core.pagination import NEXT_CURSOR_HEADER, clamp_page_size
+from core.leaderboard import ALL_TIME
+from core.ranges import RangeNotSatisfiable, parse_byte_range
 from models.user import User
+from core.config import settings
 from schemas.score import (
-    ScoreCreate, ScoreResponse, RankingResponse, UserStatsResponse
+    ScoreCreate, ScoreResponse, RankingResponse, UserStatsResponse, VerificationStatsResponse
 )
 from services.score_service import ScoreService
+from services.replay_verifier import ReplayVerifier, get_replay_verifier
 from .auth import get_current_user
 
 router = APIRouter(prefix="/api/scores", tags=["점수"])
@@ -34,44 +39,212 @@ async def create_score(
     return score_service.create_score(current_user.id, score_data.score)
 
 
+@router.post("/{score_id}/replay", response_model=ScoreResponse, status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit("30/minute")
+async def upload_replay(
+    request: Request,
+    score_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    verifier: ReplayVerifier = Depends(get_replay_verifier)
+):
+    """
+    점수의 리플레이 업로드 (로그인 필요, 본인의 점수만)
+
+    요청 본문은 게임이 남긴 리플레이 파일(.sgr) 그대로입니다 (application/octet-stream).
+    서버가 워커 프로세스에서 게임을 다시 진행해 점수가 같으면 verified, 다르면 rejected가 됩니다.
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.REPLAY_MAX_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="리플레이 파일이 너무 큽니다")
+    data = await request.body()
+    if len(data) > settings.REPLAY_MAX_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="리플레이 파일이 너무 큽니다")
+    if not data:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="리플레이 파일이 비어 있습니다")
+
+    score_service = ScoreService(db)
+    try:
+        score = score_service.attach_replay(current_user.id, score_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    if not score:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="점수를 찾을 수 없거나 본인의 점수가 아닙니다"
+        )
+
+    if not verifier.submit(score_id, data):
+        score_service.detach_replay(score_id)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="검증 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+        )
+
+    return score
+
+
+@router.get("/{score_id}/replay")
+@limiter.limit("120/minute")
+async def download_replay(
+    request: Request,
+    score_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    검증된 점수의 리플레이 다운로드 (고스트 재생용)
+
+    Range 헤더(bytes=시작-끝)로 일부만 받을 수 있어, 클라이언트는 앞부분부터 받아 가며 바로 재생합니다.
+    검증된 점수만 공개하며, 검증된 리플레이는 바뀌지 않으므로 캐시해도 됩니다.
+    """
+    score_service = ScoreService(db)
+    total = score_service.get_replay_size(score_id)
+    if total is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="공개된 리플레이가 없습니다"
+        )
+
+    headers = {"Accept-Ranges": "bytes", "Cache-Control": "public, max-age=86400"}
+    try:
+        byte_range = parse_byte_range(request.headers.get("range"), total)
+    except RangeNotSatisfiable as e:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail=str(e),
+            headers={"Content-Range": f"bytes */{total}"}
+        )
+
+    if byte_range is None:
+        data = score_service.read_replay(score_id, 0, total - 1) if total else b""
+        return Response(content=data, media_type="application/octet-stream", headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+    return Response(
+        content=score_service.read_replay(score_id, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="application/octet-stream",
+        headers=headers
+    )
+
+
+@router.get("/verification", response_model=VerificationStatsResponse)
+async def get_verification_stats(verifier: ReplayVerifier = Depends(get_replay_verifier)):
+    """
+    리플레이 검증 처리량 (서버 시작 이후)
+
+    - **replays_per_core_second**: 워커 CPU 1초당 검증한 리플레이 수
+    """
+    return verifier.stats()
+
+
 @router.get("/top", response_model=List[RankingResponse])
-async def get_top_scores(limit: int = 10, db: Session = Depends(get_db)):
+async def get_top_scores(
+    limit: int = 10,
+    window: str = ALL_TIME,
+    difficulty: Optional[str] = None,
+    verified: bool = False,
+    db: Session = Depends(get_db)
+):
     """
     상위 점수 조회 (각 사용자의 최고 점수 기준)
 
     - **limit**: 조회할 개수 (기본값: 10, 최대: 100)
+    - **window**: 기간 (all, daily, weekly, season / 기본값: all)
+    - **difficulty**: 난이도 (easy, medium, hard / 지정하면 해당 난이도의 전체 기간 랭킹)
+    - **verified**: true면 리플레이로 검증된 점수만 (전체 기간 랭킹만 지원)
     """
     if limit > 100:
         limit = 100
 
     score_service = ScoreService(db)
-    return score_service.get_top_scores(limit)
+    try:
+        return score_service.get_top_scores(limit, window, difficulty, verified)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/rank", response_model=RankingResponse)
+async def get_my_rank(
+    window: str = ALL_TIME,
+    difficulty: Optional[str] = None,
+    verified: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    리더보드에서 내 순위 조회 (로그인 필요)
+
+    - **window**: 기간 (all, daily, weekly, season / 기본값: all)
+    - **difficulty**: 난이도 (easy, medium, hard / 지정하면 해당 난이도의 전체 기간 랭킹)
+    - **verified**: true면 리플레이로 검증된 점수만 (전체 기간 랭킹만 지원)
+    """
+    score_service = ScoreService(db)
+    try:
+        rank = score_service.get_rank(current_user.id, window, difficulty, verified)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not rank:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이 랭킹에 아직 기록이 없습니다"
+        )
+
+    return rank
 
 
 @router.get("/recent", response_model=List[ScoreResponse])
-async def get_recent_scores(limit: int = 20, db: Session = Depends(get_db)):
+async def get_recent_scores(
+    response: Response,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """
     최근 점수 조회
 
     - **limit**: 조회할 개수 (기본값: 20, 최대: 100)
+    - **cursor**: 이전 응답의 X-Next-Cursor 헤더 값 (다음 페이지)
     """
-    if limit > 100:
-        limit = 100
-
     score_service = ScoreService(db)
-    return score_service.get_recent_scores(limit)
+    try:
+        scores, next_cursor = score_service.get_recent_scores_page(clamp_page_size(limit), cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return scores
 
 
 @router.get("/my", response_model=List[ScoreResponse])
 async def get_my_scores(
+    response: Response,
+    limit: int = 20,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    내 점수 기록 조회 (로그인 필요)
+    내 점수 기록 조회 (로그인 필요, 최신순)
+
+    - **limit**: 조회할 개수 (기본값: 20, 최대: 100)
+    - **cursor**: 이전 응답의 X-Next-Cursor 헤더 값 (다음 페이지)
     """
     score_service = ScoreService(db)
-    return score_service.get_user_scores(current_user.id)
+    try:
+        scores, next_cursor = score_service.get_user_scores_page(
+            current_user.id, clamp_page_size(limit), cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return scores
 
 
 @router.get("/stats", response_model=UserStatsResponse)
@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
+from core.verification import UNVERIFIED
 
 
 class ScoreCreate(BaseModel):
@@ -15,6 +16,7 @@ class ScoreResponse(BaseModel):
     user_id: int
     score: int
     created_at: datetime
+    verification: str = UNVERIFIED  # 리플레이 검증 상태 (unverified, pending, verified, rejected)
     username: Optional[str] = None  # 조인으로 추가되는 필드
 
     class Config:
@@ -28,6 +30,7 @@ class RankingResponse(BaseModel):
     username: str
     score: int
     created_at: datetime
+    score_id: Optional[int] = None  # 점수 ID (전체 기간 랭킹만, 리플레이 다운로드용)
 
 
 class UserStatsResponse(BaseModel):
@@ -38,3 +41,13 @@ class UserStatsResponse(BaseModel):
     best_score: int
     average_score: float
     rank: Optional[int] = None
+
+
+class VerificationStatsResponse(BaseModel):
+    """리플레이 검증 처리량 응답"""
+    workers: int
+    pending: int
+    verified: int
+    rejected: int
+    cpu_seconds: float
+    replays_per_core_second: float
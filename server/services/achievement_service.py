@@ -1,8 +1,13 @@
 """업적 서비스"""
 from sqlalchemy.orm import Session
 from repositories.achievement_repository import AchievementRepository
+from repositories.user_stat_rollup_repository import UserStatRollupRepository
+from core.achievement_rules import AchievementRuleSet
 from schemas.achievement import AchievementResponse, UserAchievementResponse
-from typing import List
+from typing import Dict, List, Tuple
+
+# 카탈로그 시그니처 -> 컴파일된 규칙
+_rule_set_cache: Dict[Tuple, AchievementRuleSet] = {}
 
 
 class AchievementService:
@@ -32,42 +37,69 @@ class AchievementService:
         )
         return UserAchievementResponse.model_validate(user_achievement)
 
+    @staticmethod
+    def get_rule_set(db: Session) -> AchievementRuleSet:
+        """
+        업적 카탈로그를 규칙으로 컴파일 (카탈로그가 바뀌지 않으면 재사용)
+
+        Returns:
+            AchievementRuleSet: 컴파일된 규칙 모음
+        """
+        achievements = AchievementRepository.get_all(db)
+        signature = tuple(
+            (ach.code, ach.condition_type, ach.condition_value) for ach in achievements
+        )
+
+        cached = _rule_set_cache.get(signature)
+        if cached is None:
+            _rule_set_cache.clear()
+            cached = AchievementRuleSet(
+                {
+                    'code': ach.code,
+                    'name': ach.name,
+                    'description': ach.description,
+                    'condition_type': ach.condition_type,
+                    'condition_value': ach.condition_value,
+                }
+                for ach in achievements
+            )
+            _rule_set_cache[signature] = cached
+        return cached
+
     @staticmethod
     def check_and_unlock_achievements(db: Session, user_id: int, game_stats: dict) -> List[str]:
         """
         게임 통계를 기반으로 업적 체크 및 언락
 
+        이번 게임 통계와 누적 통계(user_stat_rollups 한 행)를 합쳐 카탈로그의 모든 규칙을
+        일괄 판정하고, 달성하지 못한 누적 업적은 진행도를 갱신합니다.
+
         Returns:
             List[str]: 새로 언락된 업적 코드 목록
         """
+        rule_set = AchievementService.get_rule_set(db)
+        progress_by_code = AchievementRepository.get_progress_by_code(db, user_id)
+        completed = {code for code, progress in progress_by_code.items() if progress >= 100}
+
+        metrics = dict(game_stats)
+        metrics.update(UserStatRollupRepository.get_summary(db, user_id))
+        achieved = set(rule_set.evaluate_all(metrics, skip=completed))
+
         unlocked = []
+        for rule in rule_set.rules.values():
+            if rule.code in completed:
+                continue
 
-        # 첫 게임
-        if not AchievementRepository.check_achievement_unlocked(db, user_id, "first_game"):
-            AchievementRepository.unlock_achievement(
-                db, user_id,
-                AchievementRepository.get_by_code(db, "first_game").id
-            )
-            unlocked.append("first_game")
-
-        # 백발백중 (명중률 90% 이상)
-        if game_stats.get('accuracy', 0) >= 90 and game_stats.get('missiles_fired', 0) >= 20:
-            if not AchievementRepository.check_achievement_unlocked(db, user_id, "perfect_aim"):
-                AchievementRepository.unlock_achievement(
-                    db, user_id,
-                    AchievementRepository.get_by_code(db, "perfect_aim").id
-                )
-                unlocked.append("perfect_aim")
-
-        # 콤보 마스터 (100 콤보)
-        if game_stats.get('max_combo', 0) >= 100:
-            if not AchievementRepository.check_achievement_unlocked(db, user_id, "combo_master"):
-                AchievementRepository.unlock_achievement(
-                    db, user_id,
-                    AchievementRepository.get_by_code(db, "combo_master").id
-                )
-                unlocked.append("combo_master")
-
-        # TODO: 더 많은 업적 체크 로직 추가
+            if rule.code in achieved:
+                progress = 100
+            else:
+                progress = rule.progress(metrics)
+                if progress is None or progress == progress_by_code.get(rule.code, 0):
+                    continue
+
+            achievement = AchievementRepository.get_by_code(db, rule.code)
+            AchievementRepository.unlock_achievement(db, user_id, achievement.id, progress)
+            if progress >= 100:
+                unlocked.append(rule.code)
 
         return unlocked
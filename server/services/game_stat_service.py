@@ -1,8 +1,9 @@
 """게임 통계 서비스"""
 from sqlalchemy.orm import Session
 from repositories.game_stat_repository import GameStatRepository
+from repositories.user_stat_rollup_repository import UserStatRollupRepository
 from schemas.game_stat import GameStatCreate, GameStatResponse, UserStatsSummary
-from typing import List
+from typing import List, Optional, Tuple
 
 
 class GameStatService:
@@ -16,13 +17,14 @@ class GameStatService:
         return GameStatResponse.model_validate(game_stat)
 
     @staticmethod
-    def get_user_games(db: Session, user_id: int, limit: int = 10) -> List[GameStatResponse]:
-        """사용자의 게임 기록 조회"""
-        stats = GameStatRepository.get_by_user(db, user_id, limit)
-        return [GameStatResponse.model_validate(stat) for stat in stats]
+    def get_user_games(db: Session, user_id: int, limit: int = 10,
+                       cursor: Optional[str] = None) -> Tuple[List[GameStatResponse], Optional[str]]:
+        """사용자의 게임 기록 조회 (게임 기록 목록, 다음 커서)"""
+        stats, next_cursor = GameStatRepository.get_by_user(db, user_id, limit, cursor)
+        return [GameStatResponse.model_validate(stat) for stat in stats], next_cursor
 
     @staticmethod
     def get_user_summary(db: Session, user_id: int) -> UserStatsSummary:
         """사용자 통계 요약 조회"""
-        summary = GameStatRepository.get_user_summary(db, user_id)
+        summary = UserStatRollupRepository.get_summary(db, user_id)
         return UserStatsSummary(**summary)
@@ -0,0 +1,212 @@
+"""리플레이 검증 워커 풀"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.verification import PENDING, VERIFIED
+from database import SessionLocal
+from models.score import Score
+from models.score_replay import ScoreReplay
+from services.replay_worker import init_worker, verify_replay
+from services.score_service import ScoreService
+
+logger = logging.getLogger(__name__)
+
+# 2시간 게임 (60 FPS) 이상의 리플레이는 재시뮬레이션하지 않음
+MAX_REPLAY_FRAMES = 2 * 60 * 60 * 60
+
+
+class ReplayVerifier:
+    """
+    업로드된 리플레이를 별도 프로세스에서 재시뮬레이션해 점수 검증
+
+    요청 처리 중에는 대기열에 넣기만 하고, 결과는 워커가 끝난 뒤
+    새 DB 세션으로 반영합니다. 대기 + 진행 중 리플레이 수는 max_pending으로 제한합니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 workers: int = settings.REPLAY_VERIFY_WORKERS,
+                 max_pending: int = settings.REPLAY_VERIFY_MAX_PENDING,
+                 client_dir: str = settings.GAME_CLIENT_DIR,
+                 blank_sprites: bool = settings.REPLAY_BLANK_SPRITES):
+        """
+        ReplayVerifier 초기화 (워커 프로세스는 첫 검증 요청 때 시작)
+
+        Args:
+            session_factory: 결과 반영에 쓸 DB 세션 생성 함수
+            workers: 워커 프로세스 수
+            max_pending: 대기 + 진행 중 리플레이 상한
+            client_dir: 게임 클라이언트 디렉토리
+            blank_sprites: 텍스처 대신 같은 크기의 사각형 사용 여부
+        """
+        self.session_factory = session_factory
+        self.workers = workers
+        self.max_pending = max_pending
+        self.client_dir = client_dir
+        self.blank_sprites = blank_sprites
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._idle = threading.Condition()
+        self.pending = 0
+        self.verified = 0
+        self.rejected = 0
+        self.cpu_seconds = 0.0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """워커 풀 (없으면 생성)"""
+        if self._executor is None:
+            # fork는 서버 스레드/DB 연결을 복제하므로 항상 새 인터프리터로 시작
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.client_dir, self.blank_sprites),
+            )
+        return self._executor
+
+    def submit(self, score_id: int, data: bytes) -> bool:
+        """
+        리플레이 검증 예약
+
+        Args:
+            score_id: 검증할 점수 ID (상태가 pending이어야 함)
+            data: 리플레이 파일 내용
+
+        Returns:
+            bool: 대기열이 가득 차서 받지 못했으면 False
+        """
+        with self._idle:
+            if self.pending >= self.max_pending:
+                return False
+            self.pending += 1
+
+        try:
+            future = self._pool().submit(verify_replay, data, MAX_REPLAY_FRAMES)
+        except Exception:
+            with self._idle:
+                self.pending -= 1
+                self._idle.notify_all()
+            raise
+        future.add_done_callback(partial(self._finish, score_id))
+        return True
+
+    def resume_pending(self, db: Session) -> int:
+        """
+        서버가 재시작되기 전에 끝나지 않은 검증 다시 예약
+
+        Args:
+            db: SQLAlchemy 세션
+
+        Returns:
+            int: 다시 예약한 리플레이 수
+        """
+        rows = (
+            db.query(ScoreReplay.score_id, ScoreReplay.data)
+            .join(Score, Score.id == ScoreReplay.score_id)
+            .filter(Score.verification == PENDING)
+            .order_by(ScoreReplay.score_id)
+            .limit(self.max_pending)
+            .all()
+        )
+        return sum(1 for score_id, data in rows if self.submit(score_id, data))
+
+    def _finish(self, score_id: int, future: Future):
+        """워커 결과를 DB에 반영 (워커 풀 관리 스레드에서 호출)"""
+        if future.cancelled():
+            # 종료 중 취소: pending으로 남겨 재시작 때 다시 예약
+            with self._idle:
+                self.pending -= 1
+                self._idle.notify_all()
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:
+            # 워커 프로세스가 죽은 경우 (풀은 다음 요청 때 새로 만듦)
+            logger.error(f"리플레이 검증 워커 오류: score_id={score_id}, error={e}")
+            self._executor = None
+            result = {"error": f"검증 워커 오류: {e}", "cpu_seconds": 0.0}
+
+        status = None
+        db = self.session_factory()
+        try:
+            status = ScoreService(db).apply_verification(score_id, result)
+        except Exception as e:
+            logger.error(f"리플레이 검증 결과 저장 실패: score_id={score_id}, error={e}", exc_info=True)
+        finally:
+            db.close()
+
+        with self._idle:
+            self.pending -= 1
+            self.cpu_seconds += result.get("cpu_seconds", 0.0)
+            if status == VERIFIED:
+                self.verified += 1
+            else:
+                self.rejected += 1
+            self._idle.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        예약된 검증이 모두 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간(초)
+
+        Returns:
+            bool: 모두 끝났으면 True
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self.pending == 0, timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        검증 처리량
+
+        Returns:
+            Dict: 워커 수, 대기 중/검증/거절 수, 워커 CPU 시간, 코어-초당 검증한 리플레이 수
+        """
+        with self._idle:
+            done = self.verified + self.rejected
+            return {
+                "workers": self.workers,
+                "pending": self.pending,
+                "verified": self.verified,
+                "rejected": self.rejected,
+                "cpu_seconds": round(self.cpu_seconds, 3),
+                "replays_per_core_second": round(done / self.cpu_seconds, 2) if self.cpu_seconds else 0.0,
+            }
+
+    def shutdown(self):
+        """워커 풀 종료 (대기 중인 검증은 pending으로 남아 재시작 때 다시 예약)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+_verifier: Optional[ReplayVerifier] = None
+
+
+def get_replay_verifier() -> ReplayVerifier:
+    """
+    서버 전체에서 공유하는 검증 워커 풀 (의존성)
+
+    Returns:
+        ReplayVerifier: 검증 워커 풀
+    """
+    global _verifier
+    if _verifier is None:
+        _verifier = ReplayVerifier()
+    return _verifier
+
+
+def shutdown_replay_verifier():
+    """서버 종료 시 검증 워커 풀 정리"""
+    global _verifier
+    if _verifier is not None:
+        _verifier.shutdown()
+        _verifier = None
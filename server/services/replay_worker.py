@@ -0,0 +1,82 @@
+"""
+리플레이 재시뮬레이션 워커 (검증 워커 프로세스에서 실행)
+
+클라이언트(main/)의 game 패키지로 게임을 처음부터 다시 진행합니다.
+클라이언트의 core 패키지는 서버 core와 이름이 같으므로 이 모듈은 서버 모듈을 import하지 않고,
+워커 초기화 때 클라이언트 디렉토리를 sys.path 맨 앞에 두고 서버 core를 sys.modules에서 내립니다.
+"""
+import os
+import sys
+import time
+from typing import Any, Dict, Optional
+
+# 워커 프로세스마다 한 번 로드하는 스프라이트 (충돌 크기/마스크가 결과에 영향을 줌)
+_sprites = None
+
+
+def init_worker(client_dir: str, blank_sprites: bool = False) -> None:
+    """
+    워커 프로세스 초기화 (ProcessPoolExecutor initializer)
+
+    Args:
+        client_dir: 게임 클라이언트 디렉토리 (game, core 패키지가 있는 곳)
+        blank_sprites: True면 텍스처 대신 같은 크기의 사각형 사용 (텍스처가 없는 환경/테스트용)
+
+    Raises:
+        FileNotFoundError: 텍스처 파일이 존재하지 않을 때
+    """
+    global _sprites
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    for name in [name for name in sys.modules if name == "core" or name.startswith("core.")]:
+        del sys.modules[name]
+    sys.path.insert(0, os.path.abspath(client_dir))
+
+    from game.simulation import Sprites
+    _sprites = Sprites.blank() if blank_sprites else Sprites.load()
+
+
+def verify_replay(data: bytes, max_frames: Optional[int] = None) -> Dict[str, Any]:
+    """
+    리플레이를 처음부터 재시뮬레이션
+
+    점수/난이도 비교는 DB를 가진 서버 프로세스에서 합니다.
+
+    Args:
+        data: 리플레이 파일 내용
+        max_frames: 재시뮬레이션할 최대 프레임 수
+
+    Returns:
+        Dict: settings, final_score(파일에 기록된 점수), score(재시뮬레이션 점수),
+            frames, error(문제가 없으면 None), cpu_seconds(이 워커가 쓴 CPU 시간)
+    """
+    from core.config import CLIENT_VERSION
+    from game.replay import ReplayReader
+    from game.simulation import replay
+
+    start = time.process_time()
+    result = {"settings": None, "final_score": None, "score": None, "frames": 0, "error": None}
+
+    try:
+        reader = ReplayReader(data, max_frames)
+        result["settings"] = reader.settings
+        result["final_score"] = reader.final_score
+
+        if not reader.finished:
+            result["error"] = "끝나지 않은 리플레이입니다"
+        elif reader.client_version != CLIENT_VERSION:
+            result["error"] = f"클라이언트 버전이 다릅니다: {reader.client_version}"
+        else:
+            state = replay(reader, _sprites).state
+            result["score"] = state.score
+            result["frames"] = state.current_frame
+            if not state.game_over or state.current_frame != len(reader):
+                result["error"] = "입력 기록과 게임 진행이 맞지 않습니다"
+    except Exception as e:
+        # 믿을 수 없는 파일이므로 어떤 오류든 거절 사유로 돌려줌 (워커는 계속 사용)
+        result["error"] = f"재시뮬레이션 실패: {e}"
+
+    result["cpu_seconds"] = time.process_time() - start
+    return result
@@ -1,11 +1,19 @@
 """점수 비즈니스 로직"""
-from typing import List, Optional, Dict, Any
+import logging
+import math
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from repositories.score_repository import ScoreRepository
+from repositories.leaderboard_repository import LeaderboardRepository
+from repositories.difficulty_leaderboard_repository import DifficultyLeaderboardRepository
+from repositories.difficulty_repository import DifficultyRepository
+from core.leaderboard import ALL_TIME, WINDOWS
+from core.verification import UNVERIFIED, PENDING, VERIFIED, REJECTED, CHECKED_SETTINGS
 from models.user import User
 from models.score import Score
 
+logger = logging.getLogger(__name__)
+
 
 class ScoreService:
     """점수 서비스"""
@@ -39,12 +47,13 @@ class ScoreService:
             "user_id": score_obj.user_id,
             "score": score_obj.score,
             "created_at": score_obj.created_at,
+            "verification": score_obj.verification,
             "username": user.username if user else "Unknown"
         }
 
-    def get_user_scores(self, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_user_scores(self, user_id: int, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        사용자의 점수 목록 조회
+        사용자의 최근 점수 목록 조회 (첫 페이지)
 
         Args:
             user_id: 사용자 ID
@@ -53,7 +62,25 @@ class ScoreService:
         Returns:
             List[Dict]: 사용자의 점수 목록
         """
-        scores = self.score_repo.get_user_scores(user_id, limit)
+        return self.get_user_scores_page(user_id, limit)[0]
+
+    def get_user_scores_page(self, user_id: int, limit: int = 20,
+                             cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        사용자의 점수 목록 페이지 조회
+
+        Args:
+            user_id: 사용자 ID
+            limit: 조회할 개수
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (사용자의 점수 목록, 다음 커서)
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        scores, next_cursor = self.score_repo.get_user_scores(user_id, limit, cursor)
         user = self.db.query(User).filter(User.id == user_id).first()
 
         result = []
@@ -63,26 +90,94 @@ class ScoreService:
                 "user_id": score.user_id,
                 "score": score.score,
                 "created_at": score.created_at,
+                "verification": score.verification,
                 "username": user.username if user else "Unknown"
             })
 
-        return result
+        return result, next_cursor
 
-    def get_top_scores(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_top_scores(self, limit: int = 10, window: str = ALL_TIME,
+                       difficulty: Optional[str] = None, verified: bool = False) -> List[Dict[str, Any]]:
         """
         상위 점수 조회
 
         Args:
             limit: 조회할 개수
+            window: 리더보드 기간 ('all', 'daily', 'weekly', 'season')
+            difficulty: 난이도 이름 (지정하면 해당 난이도의 전체 기간 랭킹)
+            verified: True면 리플레이로 검증된 점수만 (전체 기간 랭킹만 지원)
 
         Returns:
             List[Dict]: 상위 점수 목록
+
+        Raises:
+            ValueError: 알 수 없는 기간/난이도이거나 난이도, 검증 필터와 기간을 함께 지정한 경우
+        """
+        self._check_board(window, difficulty, verified)
+        if difficulty:
+            return DifficultyLeaderboardRepository.get_top(self.db, difficulty, limit)
+        if window == ALL_TIME:
+            return self.score_repo.get_top_scores(limit, verified)
+        return LeaderboardRepository.get_top(self.db, window, limit)
+
+    def get_rank(self, user_id: int, window: str = ALL_TIME,
+                 difficulty: Optional[str] = None, verified: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        리더보드에서 사용자의 순위 조회
+
+        Args:
+            user_id: 사용자 ID
+            window: 리더보드 기간 ('all', 'daily', 'weekly', 'season')
+            difficulty: 난이도 이름 (지정하면 해당 난이도의 전체 기간 랭킹)
+            verified: True면 리플레이로 검증된 점수만 (전체 기간 랭킹만 지원)
+
+        Returns:
+            Optional[Dict]: 순위, 사용자, 점수 (기록이 없으면 None)
+
+        Raises:
+            ValueError: 알 수 없는 기간/난이도이거나 난이도, 검증 필터와 기간을 함께 지정한 경우
+        """
+        self._check_board(window, difficulty, verified)
+        if difficulty:
+            return DifficultyLeaderboardRepository.get_rank(self.db, user_id, difficulty)
+        if window != ALL_TIME:
+            return LeaderboardRepository.get_rank(self.db, user_id, window)
+
+        best = self.score_repo.get_user_best(user_id, verified)
+        if best is None:
+            return None
+
+        score, username = best
+        return {
+            "rank": self.score_repo.get_user_rank(user_id, score.score, verified),
+            "user_id": user_id,
+            "username": username,
+            "score": score.score,
+            "created_at": score.created_at,
+            "score_id": score.id
+        }
+
+    def _check_board(self, window: str, difficulty: Optional[str], verified: bool = False) -> None:
+        """
+        리더보드 선택값 검증
+
+        Raises:
+            ValueError: 알 수 없는 기간/난이도이거나 난이도, 검증 필터와 기간을 함께 지정한 경우
         """
-        return self.score_repo.get_top_scores(limit)
+        if window != ALL_TIME and window not in WINDOWS:
+            raise ValueError(f"알 수 없는 리더보드 기간입니다: {window}")
+        if verified and (window != ALL_TIME or difficulty is not None):
+            raise ValueError("검증된 점수 랭킹은 전체 기간만 지원합니다")
+        if difficulty is None:
+            return
+        if window != ALL_TIME:
+            raise ValueError("난이도별 랭킹은 전체 기간만 지원합니다")
+        if DifficultyRepository.get_by_name(self.db, difficulty) is None:
+            raise ValueError(f"알 수 없는 난이도입니다: {difficulty}")
 
     def get_recent_scores(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        최근 점수 조회
+        최근 점수 조회 (첫 페이지)
 
         Args:
             limit: 조회할 개수
@@ -90,13 +185,24 @@ class ScoreService:
         Returns:
             List[Dict]: 최근 점수 목록
         """
-        scores = (
-            self.db.query(Score, User.username)
-            .join(User, Score.user_id == User.id)
-            .order_by(desc(Score.created_at))
-            .limit(limit)
-            .all()
-        )
+        return self.get_recent_scores_page(limit)[0]
+
+    def get_recent_scores_page(self, limit: int = 20,
+                               cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        최근 점수 페이지 조회
+
+        Args:
+            limit: 조회할 개수
+            cursor: 이전 페이지의 다음 커서
+
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (최근 점수 목록, 다음 커서)
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        scores, next_cursor = self.score_repo.get_recent_scores(limit, cursor)
 
         result = []
         for score, username in scores:
@@ -105,10 +211,11 @@ class ScoreService:
                 "user_id": score.user_id,
                 "score": score.score,
                 "created_at": score.created_at,
+                "verification": score.verification,
                 "username": username
             })
 
-        return result
+        return result, next_cursor
 
     def get_user_statistics(self, user_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -124,18 +231,12 @@ class ScoreService:
         if not user:
             return None
 
-        # 사용자의 모든 점수 조회
-        user_scores = self.score_repo.get_user_scores(user_id, limit=1000)
+        # 행을 읽지 않고 DB에서 집계
+        total_games, best_score, average_score = self.score_repo.get_user_score_summary(user_id)
 
-        if not user_scores:
+        if not total_games:
             return None
 
-        # 통계 계산
-        scores_values = [s.score for s in user_scores]
-        total_games = len(scores_values)
-        best_score = max(scores_values)
-        average_score = sum(scores_values) / total_games
-
         # 랭킹 계산
         rank = self.score_repo.get_user_rank(user_id, best_score)
 
@@ -163,4 +264,118 @@ class ScoreService:
         if not score or score.user_id != user_id:
             return False
 
-        return self.score_repo.delete(score_id)
+        self.db.delete(score)
+        self.db.flush()
+        LeaderboardRepository.refresh_user(self.db, user_id)
+        self.db.commit()
+        return True
+
+    def attach_replay(self, user_id: int, score_id: int, data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        점수에 리플레이를 붙이고 검증 대기(pending) 상태로 변경 (본인의 점수만 가능)
+
+        Args:
+            user_id: 사용자 ID
+            score_id: 점수 ID
+            data: 리플레이 파일 내용
+
+        Returns:
+            Optional[Dict]: 점수 정보 (점수가 없거나 본인의 점수가 아니면 None)
+
+        Raises:
+            ValueError: 이미 리플레이가 올라온 점수인 경우
+        """
+        score = self.score_repo.get_by_id(score_id)
+        if not score or score.user_id != user_id:
+            return None
+        if score.verification != UNVERIFIED:
+            raise ValueError("이미 리플레이가 업로드된 점수입니다")
+
+        self.score_repo.attach_replay(score, data)
+        return {
+            "id": score.id,
+            "user_id": score.user_id,
+            "score": score.score,
+            "created_at": score.created_at,
+            "verification": score.verification,
+            "username": score.user.username
+        }
+
+    def detach_replay(self, score_id: int) -> None:
+        """
+        검증을 예약하지 못한 리플레이 제거 (다시 업로드할 수 있도록 unverified로 되돌림)
+
+        Args:
+            score_id: 점수 ID
+        """
+        score = self.score_repo.get_by_id(score_id)
+        if score:
+            self.score_repo.detach_replay(score)
+
+    def get_replay_size(self, score_id: int) -> Optional[int]:
+        """
+        공개된(검증된 점수의) 리플레이 크기
+
+        Args:
+            score_id: 점수 ID
+
+        Returns:
+            Optional[int]: 리플레이 크기 (없거나 검증되지 않은 점수면 None)
+        """
+        return self.score_repo.get_replay_size(score_id, verified_only=True)
+
+    def read_replay(self, score_id: int, start: int, end: int) -> bytes:
+        """
+        리플레이의 바이트 범위 (get_replay_size로 공개 여부를 확인한 뒤 호출)
+
+        Args:
+            score_id: 점수 ID
+            start: 시작 위치
+            end: 끝 위치 (포함)
+
+        Returns:
+            bytes: 범위의 바이트
+        """
+        return self.score_repo.read_replay(score_id, start, end)
+
+    def apply_verification(self, score_id: int, result: Dict[str, Any]) -> Optional[str]:
+        """
+        재시뮬레이션 결과를 저장된 점수/난이도 설정과 비교해 검증 상태 기록
+
+        Args:
+            score_id: 점수 ID
+            result: 워커 결과 (services.replay_worker.verify_replay)
+
+        Returns:
+            Optional[str]: 기록한 상태 (verified, rejected / 그사이 점수가 삭제됐으면 None)
+        """
+        score = self.score_repo.get_by_id(score_id)
+        if not score or score.verification != PENDING:
+            return None
+
+        error = result.get("error") or self._compare_replay(score, result)
+        status = REJECTED if error else VERIFIED
+        if error:
+            logger.warning(f"리플레이 검증 실패: score_id={score_id}, reason={error}")
+        self.score_repo.set_verification(score, status)
+        return status
+
+    def _compare_replay(self, score: Score, result: Dict[str, Any]) -> Optional[str]:
+        """
+        재시뮬레이션 결과와 저장된 점수, 서버 난이도 설정 비교
+
+        Returns:
+            Optional[str]: 다른 점 (일치하면 None)
+        """
+        if result["score"] != score.score or result["final_score"] != score.score:
+            return (f"점수가 다릅니다: 저장 {score.score}, 기록 {result['final_score']}, "
+                    f"재시뮬레이션 {result['score']}")
+
+        settings = result["settings"]
+        difficulty = DifficultyRepository.get_by_name(self.db, settings["difficulty"])
+        if difficulty is None:
+            return f"알 수 없는 난이도입니다: {settings['difficulty']}"
+        for name in CHECKED_SETTINGS:
+            if not math.isclose(settings[name], getattr(difficulty, name), rel_tol=1e-9):
+                return f"난이도 설정이 다릅니다: {name}={settings[name]}"
+        return None
@@ -0,0 +1,54 @@
+"""
+리플레이 검증 처리량 벤치마크 (pytest 수집 대상 아님)
+
+실제 게임으로 만든 리플레이를 검증 워커 풀(ReplayVerifier와 같은 spawn 풀)로
+재시뮬레이션해 코어-초당 검증한 리플레이 수와 프레임당 비용을 출력합니다.
+
+실행: cd server && python -m tests.bench_replay_verify [리플레이 수] [워커 수]
+"""
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.config import settings
+from services.replay_worker import init_worker, verify_replay
+from services.replay_verifier import MAX_REPLAY_FRAMES
+from tests.replays import record_replays
+
+
+def main(count: int = 40, workers: int = os.cpu_count() or 1):
+    """리플레이 count개를 workers개 프로세스로 검증"""
+    replays = record_replays(1000, count)
+    size = sum(len(data) for _, data in replays)
+    print(f"리플레이 {count}개 생성 (평균 {size / count:.0f} 바이트)")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(settings.GAME_CLIENT_DIR, True),
+    ) as pool:
+        # 워커 시작(인터프리터 + pygame 로드)은 측정에서 제외
+        list(pool.map(verify_replay, [replays[0][1]] * workers))
+
+        start = time.perf_counter()
+        results = list(pool.map(verify_replay, [data for _, data in replays], [MAX_REPLAY_FRAMES] * count))
+        wall = time.perf_counter() - start
+
+    mismatched = sum(1 for (score, _), result in zip(replays, results)
+                     if result["error"] or result["score"] != score)
+    cpu = sum(result["cpu_seconds"] for result in results)
+    frames = sum(result["frames"] for result in results)
+
+    print(f"워커 {workers}개, 불일치 {mismatched}개")
+    print(f"재시뮬레이션 프레임 {frames} (리플레이당 평균 {frames / count:.0f}, 약 {frames / count / 60:.1f}초 게임)")
+    print(f"워커 CPU {cpu:.2f}s, 경과 {wall:.2f}s")
+    print(f"코어-초당 리플레이 {count / cpu:.1f}개, 코어-초당 프레임 {frames / cpu:.0f} "
+          f"(프레임당 {cpu / frames * 1e6:.0f}us, 실시간의 {frames / cpu / 60:.0f}배)")
+    print(f"경과 시간 기준 초당 리플레이 {count / wall:.1f}개")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
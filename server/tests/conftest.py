@@ -8,7 +8,11 @@ from main import app
 from database import Base, get_db
 from models.user import User
 from models.score import Score
-from core.security import get_password_hash
+from models.achievement import Achievement
+from models.difficulty_setting import DifficultySetting
+from models.score_replay import ScoreReplay
+from core.achievement_rules import ACHIEVEMENT_CATALOG
+from core.security import get_password_hash, create_access_token
 
 # 테스트 데이터베이스 설정
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -69,6 +73,13 @@ def test_user_token(client: TestClient, db: Session) -> str:
     return response.json()["access_token"]
 
 
+@pytest.fixture
+def auth_headers(test_user: User) -> dict:
+    """테스트용 사용자 인증 헤더 (회원가입 엔드포인트를 거치지 않음)"""
+    token = create_access_token(data={"sub": test_user.username})
+    return {"Authorization": f"Bearer {token}"}
+
+
 @pytest.fixture
 def test_score(db: Session, test_user: User) -> Score:
     """테스트용 점수 생성"""
@@ -115,3 +126,28 @@ def multiple_scores(db: Session, multiple_users: list) -> list:
         db.refresh(score)
 
     return scores
+
+
+@pytest.fixture
+def achievements(db: Session) -> list:
+    """테스트용 업적 카탈로그 생성"""
+    achievements = [Achievement(**entry) for entry in ACHIEVEMENT_CATALOG]
+    db.add_all(achievements)
+    db.commit()
+    return achievements
+
+
+@pytest.fixture
+def difficulties(db: Session) -> list:
+    """테스트용 난이도 설정 생성"""
+    difficulties = [
+        DifficultySetting(
+            name=name, display_name=display_name,
+            stone_speed=2.0, stone_spawn_interval=80, enemy_spawn_chance=0.2,
+            enemy_speed=3.0, enemy_evasion_skill=0.8, enemy_attack_rate=90
+        )
+        for name, display_name in (("easy", "초급"), ("medium", "중급"), ("hard", "고급"))
+    ]
+    db.add_all(difficulties)
+    db.commit()
+    return difficulties
@@ -0,0 +1,80 @@
+"""
+테스트/벤치마크용 리플레이 생성 (클라이언트 game 패키지로 실제 게임을 진행)
+
+클라이언트 core 패키지가 서버 core와 이름이 같아서 별도 프로세스에서 만듭니다.
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+from core.config import settings
+
+# 테스트 DB의 'hard' 난이도 설정 (conftest의 difficulties 픽스처와 같은 값)
+HARD_SETTINGS = {"difficulty": "hard", "enemy_speed": 3.0, "enemy_spawn_chance": 0.2, "enemy_evasion_skill": 0.8}
+
+_SCRIPT = """
+import io, json, os, sys
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+from game.replay import ReplayWriter
+from game.simulation import GameSimulation, Sprites, INPUT_FIRE, INPUT_LEFT, INPUT_RIGHT
+
+seed, settings = int(sys.argv[1]), json.loads(sys.argv[2])
+sprites = Sprites.blank()
+for seed in range(seed, seed + int(sys.argv[3])):
+    buffer = io.BytesIO()
+    simulation = GameSimulation(sprites, seed=seed, settings=settings, recorder=ReplayWriter(buffer, seed, settings))
+    frame = 0
+    while not simulation.state.game_over:
+        bits = (INPUT_LEFT, 0, INPUT_RIGHT, 0)[frame // 45 % 4]
+        if frame % 8 == 0:
+            bits |= INPUT_FIRE
+        simulation.step(bits)
+        frame += 1
+    simulation.recorder.close(simulation.state.score)
+    data = buffer.getvalue()
+    sys.stdout.buffer.write(simulation.state.score.to_bytes(4, 'little') + len(data).to_bytes(4, 'little') + data)
+"""
+
+
+def record_replays(seed: int, count: int = 1, game_settings: dict = HARD_SETTINGS) -> list:
+    """
+    시드마다 같은 조작(좌우 이동 + 연사)으로 게임 오버까지 진행한 리플레이
+
+    Args:
+        seed: 첫 게임 시드 (seed, seed + 1, ... 로 count개)
+        count: 게임 수
+        game_settings: 리플레이에 기록할 난이도 값
+
+    Returns:
+        list: (최종 점수, 리플레이 파일 내용) 목록
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, str(seed), json.dumps(game_settings), str(count)],
+        cwd=os.path.abspath(settings.GAME_CLIENT_DIR), capture_output=True, check=True
+    ).stdout
+
+    replays = []
+    pos = 0
+    while pos < len(output):
+        score = int.from_bytes(output[pos:pos + 4], "little")
+        size = int.from_bytes(output[pos + 4:pos + 8], "little")
+        replays.append((score, output[pos + 8:pos + 8 + size]))
+        pos += 8 + size
+    return replays
+
+
+def record_replay(seed: int, game_settings: dict = HARD_SETTINGS) -> Tuple[int, bytes]:
+    """
+    리플레이 하나 생성
+
+    Args:
+        seed: 게임 시드
+        game_settings: 리플레이에 기록할 난이도 값
+
+    Returns:
+        Tuple[int, bytes]: (최종 점수, 리플레이 파일 내용)
+    """
+    return record_replays(seed, 1, game_settings)[0]
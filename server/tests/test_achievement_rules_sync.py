@@ -0,0 +1,97 @@
+"""Achievement rules: client/server copies stay in sync, catalog changes reach existing databases"""
+import importlib.util
+import itertools
+import os
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core import achievement_rules as server_rules
+from database import sync_achievement_catalog
+from models.achievement import Achievement
+
+CLIENT_RULES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "main", "game", "achievement_rules.py"
+)
+
+
+@pytest.fixture(scope="module")
+def client_rules():
+    """클라이언트 규칙 모듈 (표준 라이브러리만 쓰므로 파일 경로로 따로 로드)"""
+    spec = importlib.util.spec_from_file_location("client_achievement_rules", CLIENT_RULES_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def sample_metrics():
+    """조건 경계를 넘나드는 지표 조합"""
+    values = {
+        'accuracy': (0, 89.9, 90, 100),
+        'missiles_fired': (0, 19, 20),
+        'damage_taken': (0, 1),
+        'final_score': (0, 499, 500, 999, 1000, 2000),
+        'play_time': (0, 180, 181),
+        'difficulty': ('easy', 'hard'),
+    }
+    for combination in itertools.product(*values.values()):
+        metrics = dict(zip(values, combination))
+        for count in (0, 9, 10, 20, 50, 100, 1000):
+            yield dict(metrics, max_combo=count, stones_destroyed=count, enemies_destroyed=count,
+                       items_collected=count, max_stage_reached=count, total_games=count,
+                       total_stones_destroyed=count, total_enemies_destroyed=count,
+                       bosses_defeated_count=count)
+
+
+class TestRulesInSync:
+    """server/core/achievement_rules.py 와 main/game/achievement_rules.py 가 같은 규칙"""
+
+    def test_same_constants(self, client_rules):
+        assert client_rules.MIN_SHOTS_FOR_ACCURACY == server_rules.MIN_SHOTS_FOR_ACCURACY
+        assert client_rules.SPEEDRUN_SCORE == server_rules.SPEEDRUN_SCORE
+
+    def test_same_condition_types(self, client_rules):
+        assert client_rules.CONDITION_TYPES.keys() == server_rules.CONDITION_TYPES.keys()
+        for name, server_type in server_rules.CONDITION_TYPES.items():
+            client_type = client_rules.CONDITION_TYPES[name]
+            assert client_type.inputs == server_type.inputs, name
+            assert client_type.realtime == server_type.realtime, name
+            assert (client_type.progress is None) == (server_type.progress is None), name
+
+    def test_same_verdicts(self, client_rules):
+        server_set = server_rules.AchievementRuleSet(server_rules.ACHIEVEMENT_CATALOG)
+        client_set = client_rules.AchievementRuleSet(server_rules.ACHIEVEMENT_CATALOG)
+
+        for metrics in sample_metrics():
+            assert client_set.evaluate_all(metrics) == server_set.evaluate_all(metrics), metrics
+            for code, rule in server_set.rules.items():
+                assert client_set.get(code).progress(metrics) == rule.progress(metrics), (code, metrics)
+
+    def test_client_default_catalog_matches_server(self, client_rules):
+        fields = ('code', 'name', 'description', 'condition_type', 'condition_value')
+        server_catalog = [{field: entry[field] for field in fields} for entry in server_rules.ACHIEVEMENT_CATALOG]
+        client_catalog = [{field: entry[field] for field in fields} for entry in client_rules.DEFAULT_CATALOG]
+
+        assert client_catalog == server_catalog
+
+
+class TestCatalogSync:
+    """기존 DB의 업적 조건이 카탈로그를 따라감"""
+
+    def test_updates_stale_conditions(self, db: Session):
+        db.add(Achievement(code='immortal', name='불사신', description='체력을 잃지 않고 1점 달성',
+                           condition_type='no_damage', condition_value=1,
+                           category='survival', rarity='epic'))
+        db.commit()
+
+        changed = sync_achievement_catalog(db)
+
+        immortal = db.query(Achievement).filter(Achievement.code == 'immortal').one()
+        assert (immortal.condition_value, immortal.description) == (500, '체력을 잃지 않고 500점 달성')
+        assert db.query(Achievement).count() == len(server_rules.ACHIEVEMENT_CATALOG)
+        assert changed == len(server_rules.ACHIEVEMENT_CATALOG)
+
+    def test_second_sync_changes_nothing(self, db: Session):
+        sync_achievement_catalog(db)
+
+        assert sync_achievement_catalog(db) == 0
@@ -0,0 +1,227 @@
+"""리플레이 업로드 및 점수 검증 테스트"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from main import app
+from core.verification import UNVERIFIED, PENDING, VERIFIED, REJECTED
+from models.score import Score
+from models.score_replay import ScoreReplay
+from models.user import User
+from services.replay_verifier import ReplayVerifier, get_replay_verifier
+from services.score_service import ScoreService
+from tests.conftest import TestingSessionLocal
+from tests.replays import HARD_SETTINGS, record_replay, record_replays
+
+OCTET_STREAM = {"Content-Type": "application/octet-stream"}
+
+
+@pytest.fixture(scope="module")
+def replays() -> list:
+    """실제 게임을 진행해 만든 (점수, 리플레이) 두 개"""
+    return record_replays(1, 2)
+
+
+@pytest.fixture
+def verifier(client: TestClient):
+    """테스트 DB에 결과를 반영하는 워커 1개짜리 검증 풀"""
+    verifier = ReplayVerifier(TestingSessionLocal, workers=1, max_pending=4, blank_sprites=True)
+    app.dependency_overrides[get_replay_verifier] = lambda: verifier
+    yield verifier
+    verifier.shutdown()
+
+
+def add_score(db: Session, user: User, value: int) -> Score:
+    """점수 직접 저장"""
+    score = Score(user_id=user.id, score=value)
+    db.add(score)
+    db.commit()
+    db.refresh(score)
+    return score
+
+
+def upload(client: TestClient, score_id: int, data: bytes, headers: dict):
+    """리플레이 업로드 요청"""
+    return client.post(f"/api/scores/{score_id}/replay", content=data, headers={**headers, **OCTET_STREAM})
+
+
+def status_of(score_id: int) -> str:
+    """다른 세션에서 본 검증 상태 (워커 결과는 별도 세션으로 저장됨)"""
+    db = TestingSessionLocal()
+    try:
+        return db.query(Score.verification).filter(Score.id == score_id).scalar()
+    finally:
+        db.close()
+
+
+class TestReplayVerification:
+    """워커 풀 재시뮬레이션으로 점수 검증"""
+
+    def test_matching_replay_is_verified(self, client, db, test_user, auth_headers,
+                                         difficulties, verifier, replays):
+        value, data = replays[0]
+        score = add_score(db, test_user, value)
+
+        response = upload(client, score.id, data, auth_headers)
+
+        assert response.status_code == 202
+        assert response.json()["verification"] == PENDING
+        assert verifier.wait_idle(timeout=60)
+        assert status_of(score.id) == VERIFIED
+
+        stats = client.get("/api/scores/verification").json()
+        assert (stats["verified"], stats["rejected"], stats["pending"]) == (1, 0, 0)
+        assert stats["replays_per_core_second"] > 0
+
+    def test_spoofed_score_is_rejected(self, client, db, test_user, auth_headers,
+                                       difficulties, verifier, replays):
+        """리플레이는 진짜여도 저장된 점수가 다르면 거절"""
+        value, data = replays[0]
+        score = add_score(db, test_user, value + 1000)
+
+        assert upload(client, score.id, data, auth_headers).status_code == 202
+        assert verifier.wait_idle(timeout=60)
+
+        assert status_of(score.id) == REJECTED
+
+    def test_other_difficulty_values_are_rejected(self, client, db, test_user, auth_headers,
+                                                  difficulties, verifier):
+        """서버 난이도 설정과 다른 값으로 플레이한 리플레이는 거절"""
+        value, data = record_replay(7, {**HARD_SETTINGS, "enemy_spawn_chance": 0.0})
+        score = add_score(db, test_user, value)
+
+        assert upload(client, score.id, data, auth_headers).status_code == 202
+        assert verifier.wait_idle(timeout=60)
+
+        assert status_of(score.id) == REJECTED
+
+    def test_broken_file_is_rejected(self, client, db, test_user, auth_headers,
+                                     difficulties, verifier, replays):
+        value, data = replays[1]
+        score = add_score(db, test_user, value)
+
+        assert upload(client, score.id, data[:len(data) // 2], auth_headers).status_code == 202
+        assert verifier.wait_idle(timeout=60)
+
+        assert status_of(score.id) == REJECTED
+        assert verifier.stats()["rejected"] == 1
+
+
+class TestReplayUpload:
+    """업로드 요청 검증 (워커 풀을 쓰지 않음)"""
+
+    def test_only_own_score(self, client, db, multiple_users, auth_headers):
+        score = add_score(db, multiple_users[0], 10)
+
+        response = upload(client, score.id, b"SGRP", auth_headers)
+
+        assert response.status_code == 403
+        assert status_of(score.id) == UNVERIFIED
+
+    def test_second_upload_conflicts(self, client, db, test_user, auth_headers):
+        score = add_score(db, test_user, 10)
+        ScoreService(db).attach_replay(test_user.id, score.id, b"SGRP")
+
+        response = upload(client, score.id, b"SGRP", auth_headers)
+
+        assert response.status_code == 409
+
+    def test_full_queue_rolls_back(self, client, db, test_user, auth_headers):
+        """대기열이 가득 차면 503, 리플레이를 지우고 다시 올릴 수 있게 되돌림"""
+        full = ReplayVerifier(TestingSessionLocal, workers=1, max_pending=0)
+        app.dependency_overrides[get_replay_verifier] = lambda: full
+        score = add_score(db, test_user, 10)
+
+        response = upload(client, score.id, b"SGRP", auth_headers)
+
+        assert response.status_code == 503
+        assert status_of(score.id) == UNVERIFIED
+        assert db.query(ScoreReplay).count() == 0
+
+    def test_empty_and_oversized_body(self, client, db, test_user, auth_headers, monkeypatch):
+        from core.config import settings
+        monkeypatch.setattr(settings, "REPLAY_MAX_BYTES", 16)
+        score = add_score(db, test_user, 10)
+
+        assert upload(client, score.id, b"", auth_headers).status_code == 400
+        assert upload(client, score.id, bytes(17), auth_headers).status_code == 413
+
+
+class TestVerifiedLeaderboard:
+    """검증된 점수만 보는 리더보드"""
+
+    def test_top_and_rank_filter_verified(self, client, db, multiple_users, auth_headers, test_user):
+        spoofed = add_score(db, multiple_users[0], 900)
+        honest = add_score(db, multiple_users[1], 300)
+        mine = add_score(db, test_user, 100)
+        for score, status in ((spoofed, REJECTED), (honest, VERIFIED), (mine, VERIFIED)):
+            score.verification = status
+        db.commit()
+
+        everyone = client.get("/api/scores/top").json()
+        verified = client.get("/api/scores/top", params={"verified": True}).json()
+        rank = client.get("/api/scores/rank", params={"verified": True}, headers=auth_headers).json()
+
+        assert everyone[0]["score"] == 900
+        assert [entry["score"] for entry in verified] == [300, 100]
+        assert (rank["rank"], rank["score"]) == (2, 100)
+
+    def test_verified_filter_is_all_time_only(self, client):
+        response = client.get("/api/scores/top", params={"verified": True, "window": "daily"})
+
+        assert response.status_code == 400
+
+    def test_unverified_scores_have_status(self, client, test_score, auth_headers):
+        response = client.get("/api/scores/my", headers=auth_headers)
+
+        assert response.json()[0]["verification"] == UNVERIFIED
+
+
+class TestReplayDownload:
+    """검증된 리플레이 다운로드 (고스트용 Range 요청)"""
+
+    def verified_replay(self, db, user, data: bytes) -> Score:
+        """리플레이가 붙은 검증된 점수"""
+        score = add_score(db, user, 500)
+        ScoreService(db).attach_replay(user.id, score.id, data)
+        score.verification = VERIFIED
+        db.commit()
+        return score
+
+    def test_full_and_ranged_download(self, client, db, test_user):
+        data = bytes(range(256)) * 4
+        score = self.verified_replay(db, test_user, data)
+        url = f"/api/scores/{score.id}/replay"
+
+        full = client.get(url)
+        head = client.get(url, headers={"Range": "bytes=0-99"})
+        tail = client.get(url, headers={"Range": "bytes=1000-"})
+        suffix = client.get(url, headers={"Range": "bytes=-24"})
+
+        assert (full.status_code, full.content, full.headers["accept-ranges"]) == (200, data, "bytes")
+        assert (head.status_code, head.content) == (206, data[:100])
+        assert head.headers["content-range"] == "bytes 0-99/1024"
+        assert (tail.content, tail.headers["content-range"]) == (data[1000:], "bytes 1000-1023/1024")
+        assert suffix.content == data[-24:]
+
+    def test_range_past_end(self, client, db, test_user):
+        score = self.verified_replay(db, test_user, b"SGRP" * 4)
+
+        response = client.get(f"/api/scores/{score.id}/replay", headers={"Range": "bytes=16-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */16"
+
+    def test_only_verified_replays_are_public(self, client, db, test_user):
+        score = add_score(db, test_user, 10)
+        ScoreService(db).attach_replay(test_user.id, score.id, b"SGRP")
+
+        assert client.get(f"/api/scores/{score.id}/replay").status_code == 404
+        assert client.get("/api/scores/999999/replay").status_code == 404
+
+    def test_ranking_links_score(self, client, db, test_user):
+        score = self.verified_replay(db, test_user, b"SGRP")
+
+        top = client.get("/api/scores/top", params={"verified": True}).json()
+
+        assert top[0]["score_id"] == score.id
@@ -2,6 +2,8 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from models.score import Score
+
 
 class TestCreateScore:
     """점수 저장 테스트"""
@@ -260,3 +262,76 @@ class TestDeleteScore:
         )
 
         assert delete_response.status_code == 403
+
+
+class TestScorePagination:
+    """점수 기록 커서 페이지네이션 테스트"""
+
+    def test_my_scores_pages(self, client: TestClient, db, test_user, auth_headers: dict):
+        """커서로 모든 기록을 중복 없이 순회"""
+        for value in range(25):
+            db.add(Score(user_id=test_user.id, score=value))
+        db.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 10}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/scores/my", params=params, headers=auth_headers)
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+        # 최신순 (같은 시각이면 id 내림차순)
+        assert seen == sorted(seen, reverse=True)
+
+    def test_last_page_has_no_cursor(self, client: TestClient, test_score, auth_headers: dict):
+        """마지막 페이지에는 다음 커서가 없음"""
+        response = client.get("/api/scores/my", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """잘못된 커서는 400"""
+        response = client.get("/api/scores/my", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+
+        assert response.status_code == 400
+
+
+class TestRankLookup:
+    """순위 조회 테스트"""
+
+    def test_difficulty_board_and_rank(self, client: TestClient, test_user, auth_headers: dict, difficulties):
+        """난이도별 랭킹과 내 순위 조회"""
+        response = client.post(
+            "/api/stats",
+            json={"difficulty": "hard", "final_score": 1200, "play_time": 60},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+
+        response = client.get("/api/scores/top", params={"difficulty": "hard"})
+        assert response.status_code == 200
+        assert [r["score"] for r in response.json()] == [1200]
+
+        response = client.get("/api/scores/rank", params={"difficulty": "hard"}, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["rank"] == 1
+
+    def test_rank_without_record(self, client: TestClient, auth_headers: dict, difficulties):
+        """기록이 없으면 404"""
+        response = client.get("/api/scores/rank", params={"difficulty": "easy"}, headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_unknown_difficulty(self, client: TestClient, difficulties):
+        """알 수 없는 난이도는 400"""
+        response = client.get("/api/scores/top", params={"difficulty": "nightmare"})
+        assert response.status_code == 400
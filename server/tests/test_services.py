@@ -1,11 +1,26 @@
 """서비스 레이어 테스트"""
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from services.auth_service import AuthService
 from services.score_service import ScoreService
+from services.achievement_service import AchievementService
+from repositories.game_stat_repository import GameStatRepository
+from repositories.achievement_repository import AchievementRepository
+from repositories.user_stat_rollup_repository import UserStatRollupRepository
+from services.game_stat_service import GameStatService
+from repositories.leaderboard_repository import LeaderboardRepository
+from models.leaderboard_entry import LeaderboardEntry
+from repositories.difficulty_leaderboard_repository import DifficultyLeaderboardRepository
+from models.difficulty_best import DifficultyBest
+from models.score import Score
+from datetime import datetime, timedelta
 from models.user import User
+from models.user_stat_rollup import UserStatRollup
 from core.security import verify_password
+from database import normalize_timestamps
+from tests.conftest import TestingSessionLocal
 
 
 class TestAuthService:
@@ -226,3 +241,301 @@ class TestScoreService:
         assert stats_500["rank"] == 1
         assert stats_400["rank"] == 2
         assert stats_300["rank"] == 3
+
+
+def _game_stats(**overrides) -> dict:
+    """GameStatCreate.model_dump() 형식의 게임 통계"""
+    stats = {
+        'difficulty': 'medium', 'final_score': 100, 'play_time': 300,
+        'stones_destroyed': 0, 'enemies_destroyed': 0,
+        'missiles_fired': 0, 'missiles_hit': 0, 'max_combo': 0,
+        'skills_used': 0, 'items_collected': 0,
+        'max_stage_reached': 1, 'boss_defeated': False,
+    }
+    stats.update(overrides)
+    return stats
+
+
+class TestAchievementService:
+    """업적 서비스 테스트"""
+
+    def _save_and_check(self, db: Session, user_id: int, **overrides) -> list:
+        stats = _game_stats(**overrides)
+        GameStatRepository.create(db, user_id, stats)
+        stats['accuracy'] = (stats['missiles_hit'] / stats['missiles_fired'] * 100) if stats['missiles_fired'] > 0 else 0
+        return AchievementService.check_and_unlock_achievements(db, user_id, stats)
+
+    def test_first_game_unlocked_once(self, db: Session, test_user: User, achievements: list):
+        """첫 게임 업적은 한 번만 언락"""
+        assert self._save_and_check(db, test_user.id) == ['first_game']
+        assert self._save_and_check(db, test_user.id) == []
+
+    def test_catalog_rules_evaluated(self, db: Session, test_user: User, achievements: list):
+        """카탈로그의 규칙을 일괄 판정"""
+        unlocked = self._save_and_check(
+            db, test_user.id,
+            difficulty='hard', final_score=2500, play_time=120,
+            missiles_fired=20, missiles_hit=19, max_combo=120, max_stage_reached=10
+        )
+
+        assert set(unlocked) == {
+            'first_game', 'perfect_aim', 'speedrunner', 'combo_master',
+            'stage_master', 'expert_player'
+        }
+
+    def test_cumulative_rules_use_totals(self, db: Session, test_user: User, achievements: list):
+        """누적 업적은 전체 게임 합계로 판정"""
+        for _ in range(9):
+            self._save_and_check(db, test_user.id, boss_defeated=True)
+        assert 'boss_slayer' not in AchievementRepository.get_completed_codes(db, test_user.id)
+
+        unlocked = self._save_and_check(db, test_user.id, boss_defeated=True)
+
+        assert unlocked == ['boss_slayer']
+
+
+    def test_cumulative_progress_tracked(self, db: Session, test_user: User, achievements: list):
+        """누적 업적은 달성 전 진행도를 기록"""
+        self._save_and_check(db, test_user.id, stones_destroyed=250)
+
+        progress = AchievementRepository.get_progress_by_code(db, test_user.id)
+
+        assert progress['stone_breaker'] == 25
+        assert 'stone_breaker' not in AchievementRepository.get_completed_codes(db, test_user.id)
+
+
+class TestUserStatRollup:
+    """누적 통계 테스트"""
+
+    def test_rollup_matches_full_scan(self, db: Session, test_user: User):
+        """증분 누적 통계는 전체 집계와 같음"""
+        games = [
+            _game_stats(difficulty='easy', final_score=300, play_time=60, stones_destroyed=10,
+                 missiles_fired=10, missiles_hit=5, max_combo=7, max_stage_reached=2),
+            _game_stats(difficulty='hard', final_score=900, play_time=120, enemies_destroyed=4,
+                 missiles_fired=4, missiles_hit=4, max_combo=3, boss_defeated=True, max_stage_reached=5),
+            _game_stats(difficulty='medium', final_score=500, play_time=90, items_collected=2, skills_used=1),
+        ]
+        for game in games:
+            GameStatRepository.create(db, test_user.id, game)
+
+        assert UserStatRollupRepository.get_summary(db, test_user.id) == \
+            GameStatRepository.get_user_summary(db, test_user.id)
+
+    def test_summary_without_games(self, db: Session, test_user: User):
+        """게임 기록이 없으면 빈 요약"""
+        summary = GameStatService.get_user_summary(db, test_user.id)
+
+        assert summary.total_games == 0
+        assert summary.max_stage_ever == 1
+
+    def test_backfill_missing(self, db: Session, test_user: User):
+        """누적 통계 도입 이전 기록 백필"""
+        GameStatRepository.create(db, test_user.id, _game_stats(final_score=100))
+        GameStatRepository.create(db, test_user.id, _game_stats(final_score=200))
+        db.query(UserStatRollup).delete()
+        db.commit()
+
+        assert UserStatRollupRepository.backfill_missing(db) == 1
+        assert UserStatRollupRepository.get_summary(db, test_user.id) == \
+            GameStatRepository.get_user_summary(db, test_user.id)
+
+
+    def test_first_game_row_created_by_another_request(self, db: Session, test_user: User):
+        """다른 요청이 먼저 행을 만들어도 INSERT 충돌 없이 누적 (upsert)"""
+        other = TestingSessionLocal()
+        GameStatRepository.create(other, test_user.id, _game_stats(final_score=100))
+        other.close()
+
+        GameStatRepository.create(db, test_user.id, _game_stats(final_score=250))
+
+        summary = UserStatRollupRepository.get_summary(db, test_user.id)
+        assert (summary['total_games'], summary['highest_score']) == (2, 250)
+
+    def test_fallback_retries_update_on_conflict(self, db: Session, test_user: User, monkeypatch):
+        """ON CONFLICT를 모르는 방언에서도 이미 있는 행은 갱신"""
+        monkeypatch.setattr("core.upsert._CONFLICT_INSERTS", {})
+
+        GameStatRepository.create(db, test_user.id, _game_stats(final_score=100))
+        GameStatRepository.create(db, test_user.id, _game_stats(final_score=50))
+
+        summary = UserStatRollupRepository.get_summary(db, test_user.id)
+        assert (summary['total_games'], summary['highest_score']) == (2, 100)
+
+
+class TestGameStatService:
+    """게임 통계 서비스 테스트"""
+
+    def test_game_history_pages(self, db: Session, test_user: User):
+        """게임 기록 커서 페이지 순회"""
+        for score in range(7):
+            GameStatRepository.create(db, test_user.id, _game_stats(final_score=score))
+
+        first, cursor = GameStatService.get_user_games(db, test_user.id, limit=5)
+        second, last_cursor = GameStatService.get_user_games(db, test_user.id, limit=5, cursor=cursor)
+
+        assert [g.final_score for g in first + second] == [6, 5, 4, 3, 2, 1, 0]
+        assert last_cursor is None
+
+    def test_invalid_cursor(self, db: Session, test_user: User):
+        """잘못된 커서"""
+        with pytest.raises(ValueError):
+            GameStatService.get_user_games(db, test_user.id, cursor="@@@")
+
+    def test_pages_across_second_precision_rows(self, db: Session, test_user: User):
+        """server_default로 초 단위 시각이 저장된 예전 행과 섞여도 반복/누락 없이 순회"""
+        games = [GameStatRepository.create(db, test_user.id, _game_stats(final_score=score)) for score in range(6)]
+        stored = ['2026-01-01 12:00:00', '2026-01-01 12:00:00', '2026-01-01 12:00:00',
+                  '2026-01-01 12:00:00.500000', '2026-01-01 12:00:01', '2026-01-01 12:00:01.250000']
+        for game, game_date in zip(games, stored):
+            db.execute(text("UPDATE game_stats SET game_date = :game_date WHERE id = :id"),
+                       {"game_date": game_date, "id": game.id})
+        db.commit()
+
+        normalize_timestamps(db.get_bind())
+        assert {len(value) for value in db.execute(text("SELECT game_date FROM game_stats")).scalars()} == {26}
+
+        seen, cursor = [], None
+        for _ in range(len(games)):  # 커서가 되돌아가도 끝나도록 페이지 수 제한
+            page, cursor = GameStatService.get_user_games(db, test_user.id, limit=2, cursor=cursor)
+            seen += [g.final_score for g in page]
+            if cursor is None:
+                break
+        assert seen == [5, 4, 3, 2, 1, 0]
+
+
+class TestLeaderboard:
+    """기간별 리더보드 테스트"""
+
+    def test_window_boards_keep_best_per_user(self, db: Session, multiple_users: list):
+        """기간별 보드는 사용자별 최고 점수 유지"""
+        service = ScoreService(db)
+        service.create_score(multiple_users[0].id, 300)
+        service.create_score(multiple_users[0].id, 100)
+        service.create_score(multiple_users[1].id, 200)
+
+        for window in ("daily", "weekly", "season"):
+            top = service.get_top_scores(10, window)
+            assert [(r["username"], r["score"]) for r in top] == [
+                (multiple_users[0].username, 300),
+                (multiple_users[1].username, 200),
+            ]
+            assert [r["rank"] for r in top] == [1, 2]
+
+    def test_unknown_window(self, db: Session):
+        """알 수 없는 기간"""
+        with pytest.raises(ValueError):
+            ScoreService(db).get_top_scores(10, "monthly")
+
+    def test_rollover_purges_old_buckets(self, db: Session, test_user: User):
+        """버킷이 바뀌면 지난 버킷 삭제"""
+        yesterday = datetime.utcnow() - timedelta(days=1)
+        LeaderboardRepository.record_score(db, test_user.id, 500, yesterday)
+        db.commit()
+
+        LeaderboardRepository.record_score(db, test_user.id, 50, datetime.utcnow())
+        db.commit()
+
+        daily = db.query(LeaderboardEntry).filter(LeaderboardEntry.window == "daily").all()
+        assert len(daily) == 1
+        assert daily[0].best_score == 50
+
+    def test_delete_refreshes_board(self, db: Session, test_user: User):
+        """최고 점수를 삭제하면 보드 갱신"""
+        service = ScoreService(db)
+        best = service.create_score(test_user.id, 900)
+        service.create_score(test_user.id, 400)
+
+        service.delete_score(test_user.id, best["id"])
+
+        assert service.get_top_scores(10, "daily")[0]["score"] == 400
+
+    def test_entry_created_by_another_request(self, db: Session, test_user: User):
+        """다른 요청이 같은 버킷 행을 먼저 만들어도 INSERT 충돌 없이 최고 점수 유지 (upsert)"""
+        now = datetime.utcnow()
+        other = TestingSessionLocal()
+        LeaderboardRepository.record_score(other, test_user.id, 300, now)
+        other.commit()
+        other.close()
+
+        LeaderboardRepository.record_score(db, test_user.id, 200, now)
+        LeaderboardRepository.record_score(db, test_user.id, 450, now)
+        db.commit()
+
+        entries = db.query(LeaderboardEntry).filter(LeaderboardEntry.user_id == test_user.id).all()
+        assert len(entries) == 3
+        assert {entry.best_score for entry in entries} == {450}
+
+    def test_rebuild_current(self, db: Session, test_user: User):
+        """현재 버킷을 scores 테이블로 다시 채움"""
+        db.add(Score(user_id=test_user.id, score=700))
+        db.add(Score(user_id=test_user.id, score=250))
+        db.commit()
+
+        assert LeaderboardRepository.rebuild_current(db) == 3
+        assert ScoreService(db).get_top_scores(10, "weekly")[0]["score"] == 700
+
+
+class TestDifficultyLeaderboard:
+    """난이도별 리더보드 테스트"""
+
+    def test_boards_per_difficulty(self, db: Session, multiple_users: list, difficulties: list):
+        """게임 통계 저장 시 난이도별 최고 점수 유지"""
+        first, second = multiple_users[0], multiple_users[1]
+        GameStatRepository.create(db, first.id, _game_stats(difficulty='hard', final_score=800))
+        GameStatRepository.create(db, first.id, _game_stats(difficulty='hard', final_score=300))
+        GameStatRepository.create(db, second.id, _game_stats(difficulty='hard', final_score=500))
+        GameStatRepository.create(db, second.id, _game_stats(difficulty='easy', final_score=900))
+
+        service = ScoreService(db)
+        hard = service.get_top_scores(10, difficulty='hard')
+        assert [(r["username"], r["score"], r["rank"]) for r in hard] == [
+            (first.username, 800, 1),
+            (second.username, 500, 2),
+        ]
+        assert [r["score"] for r in service.get_top_scores(10, difficulty='easy')] == [900]
+        assert service.get_top_scores(10, difficulty='medium') == []
+
+    def test_entry_created_by_another_request(self, db: Session, test_user: User):
+        """다른 요청이 같은 난이도 행을 먼저 만들어도 INSERT 충돌 없이 최고 점수 유지 (upsert)"""
+        now = datetime.utcnow()
+        other = TestingSessionLocal()
+        DifficultyLeaderboardRepository.record_game(other, test_user.id, 'hard', 600, now)
+        other.commit()
+        other.close()
+
+        DifficultyLeaderboardRepository.record_game(db, test_user.id, 'hard', 400, now)
+        db.commit()
+
+        entry = db.query(DifficultyBest).filter(DifficultyBest.user_id == test_user.id).one()
+        assert entry.best_score == 600
+
+    def test_rank_lookup(self, db: Session, multiple_users: list, difficulties: list):
+        """난이도별 순위 조회 (동점이면 먼저 달성한 사용자가 앞)"""
+        for user, score in zip(multiple_users, (400, 700, 400)):
+            GameStatRepository.create(db, user.id, _game_stats(difficulty='hard', final_score=score))
+
+        service = ScoreService(db)
+        assert service.get_rank(multiple_users[1].id, difficulty='hard')["rank"] == 1
+        assert service.get_rank(multiple_users[0].id, difficulty='hard')["rank"] == 2
+        assert service.get_rank(multiple_users[2].id, difficulty='hard')["rank"] == 3
+        assert service.get_rank(multiple_users[0].id, difficulty='easy') is None
+
+    def test_invalid_board(self, db: Session, difficulties: list):
+        """알 수 없는 난이도 또는 난이도와 기간을 함께 지정"""
+        service = ScoreService(db)
+        with pytest.raises(ValueError):
+            service.get_top_scores(10, difficulty='nightmare')
+        with pytest.raises(ValueError):
+            service.get_top_scores(10, window='daily', difficulty='hard')
+
+    def test_backfill_missing(self, db: Session, test_user: User):
+        """기존 게임 기록으로 최고 점수 채움"""
+        GameStatRepository.create(db, test_user.id, _game_stats(difficulty='hard', final_score=600))
+        GameStatRepository.create(db, test_user.id, _game_stats(difficulty='hard', final_score=200))
+        db.query(DifficultyBest).delete()
+        db.commit()
+
+        assert DifficultyLeaderboardRepository.backfill_missing(db) == 1
+        assert DifficultyLeaderboardRepository.backfill_missing(db) == 0
+        assert db.query(DifficultyBest).one().best_score == 600